@@ -0,0 +1,67 @@
+"""
+Compare playing a whole set of solver moves one click at a time through
+handle_click() against the batch calls flag_many() and reveal_many():
+flag every mine, then reveal every safe cell.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_batch [--games 50]
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple
+from board import Board
+
+CASES: List[Tuple[int, int, int]] = [(16, 30, 99), (200, 200, 8000)]
+
+
+def layout(rows: int, cols: int, count: int, seed: int
+           ) -> List[Tuple[int, int]]:
+    """ Random mine positions. """
+    return [divmod(index, cols) for index in random.Random(seed).sample(
+        range(rows * cols), count)]
+
+
+def one_by_one(board: Board, mines: List[Tuple[int, int]],
+               safe: List[Tuple[int, int]]) -> None:
+    """ Flag and reveal with one handle_click() per cell. """
+    for position in mines:
+        board.handle_click(board.get_piece(position), True)
+    for position in safe:
+        board.handle_click(board.get_piece(position), False)
+
+
+def batched(board: Board, mines: List[Tuple[int, int]],
+            safe: List[Tuple[int, int]]) -> None:
+    """ Flag and reveal with one batch call each. """
+    board.flag_many(mines)
+    board.reveal_many(safe)
+
+
+def main() -> None:
+    """ Print one row per board size. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'board':>11} {'one by one (ms)':>16} {'batched (ms)':>13}")
+    for rows, cols, count in CASES:
+        timings: List[float] = [0.0, 0.0]
+        for seed in range(args.games):
+            mines: List[Tuple[int, int]] = layout(rows, cols, count, seed)
+            mine_set = set(mines)
+            safe: List[Tuple[int, int]] = [
+                (row, col) for row in range(rows) for col in range(cols)
+                if (row, col) not in mine_set]
+            for slot, play in enumerate((one_by_one, batched)):
+                board: Board = Board((rows, cols), count)
+                board.initialize_mines(mines)
+                start: float = time.perf_counter()
+                play(board, mines, safe)
+                timings[slot] += time.perf_counter() - start
+                assert board.get_won()
+        print(f"{rows:>5}x{cols:<5} {timings[0] / args.games * 1e3:>16.3f} "
+              + f"{timings[1] / args.games * 1e3:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Time a single opening click on sparse boards (1% mines) of growing size.
+Time per revealed cell should stay flat as the opening grows.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_flood [--sizes 250,500,1000,2000]
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple, Type
+import numpy as np
+from arrayboard import ArrayBoard
+from board import Board
+
+DEFAULT_SIZES: str = "250,500,1000,2000"
+DENSITY: float = 0.01
+
+
+def opening_click(board_class: Type[Board], side: int, seed: int
+                  ) -> Tuple[int, float]:
+    """
+    Build a side x side board and click its first empty cell.
+    Returns tuple - (cells revealed, seconds spent in handle_click)
+    """
+    rng = random.Random(seed)
+    cells: int = side * side
+    mines: int = int(cells * DENSITY)
+    positions: List[Tuple[int, int]] = [
+        divmod(index, side) for index in rng.sample(range(cells), mines)]
+    board: Board = board_class((side, side), mines)
+    board.initialize_mines(positions)
+    mask: np.ndarray = np.zeros((side, side), dtype=bool)
+    for row, col in positions:
+        mask[row, col] = True
+    start_cell: int = int(np.flatnonzero(~mask & (board_around(
+        board, side) == 0))[0])
+    piece = board.get_piece(divmod(start_cell, side))
+    start: float = time.perf_counter()
+    revealed: List[Tuple[int, int]] = board.handle_click(piece, False)
+    return len(revealed), time.perf_counter() - start
+
+
+def board_around(board: Board, side: int) -> np.ndarray:
+    """ Mine counts of every cell, whichever backend holds them. """
+    if isinstance(board, ArrayBoard):
+        return board.around
+    return np.array([[piece.get_num_around() for piece in row]
+                     for row in board.get_board()])
+
+
+def main() -> None:
+    """ Print one row per board size and backend. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--list-max", type=int, default=1000,
+                        help="largest side to run on the list backend")
+    args = parser.parse_args()
+
+    print(f"{'board':>11} {'backend':>8} {'revealed':>10} {'time (s)':>9} "
+          + f"{'us/cell':>8}")
+    for side in (int(size) for size in args.sizes.split(",")):
+        backends: List[Tuple[str, Type[Board]]] = [("array", ArrayBoard)]
+        if side <= args.list_max:
+            backends.insert(0, ("list", Board))
+        for name, board_class in backends:
+            revealed, elapsed = opening_click(board_class, side, 100)
+            print(f"{side:>5}x{side:<5} {name:>8} {revealed:>10} "
+                  + f"{elapsed:>9.3f} {elapsed / revealed * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Time a speculative hypothesis (flag a handful of cells, then read their
+neighborhoods) played on a fork, on a full board copy and through a
+snapshot/restore pair, for boards of growing size. The fork's cost should
+stay flat as the board grows.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_fork [--sizes 100,500,1000,2000]
+"""
+import argparse
+import copy
+import random
+import time
+from typing import Callable, List, Tuple, Type
+from arrayboard import ArrayBoard
+from board import Board
+
+DEFAULT_SIZES: str = "100,500,1000,2000"
+TOUCHED: int = 32  # Cells flagged by each hypothesis
+REPEATS: int = 20
+
+
+def play(board: Board, cells: List[Tuple[int, int]]) -> int:
+    """ Flag the cells and count the flags around each of them. """
+    for cell in cells:
+        board.handle_click(board.get_piece(cell), True)
+    flags: int = 0
+    for row, col in cells:
+        for neighbor in board.get_neighbors(row * board.size[1] + col):
+            flags += neighbor.get_flagged()
+    return flags + board.count_flags()
+
+
+def on_fork(board: Board, cells: List[Tuple[int, int]]) -> int:
+    """ Play the hypothesis on a copy-on-write fork. """
+    return play(board.fork(), cells)
+
+
+def on_copy(board: Board, cells: List[Tuple[int, int]]) -> int:
+    """ Play the hypothesis on a deep copy of the board. """
+    return play(copy.deepcopy(board), cells)
+
+
+def on_snapshot(board: Board, cells: List[Tuple[int, int]]) -> int:
+    """ Play the hypothesis on the board itself, then restore it. """
+    saved = board.snapshot()
+    flags: int = play(board, cells)
+    board.restore(saved)
+    return flags
+
+
+def time_per_hypothesis(board: Board,
+                        run: Callable[[Board, List[Tuple[int, int]]], int],
+                        rng: random.Random) -> float:
+    """ Microseconds per hypothesis, averaged over REPEATS runs. """
+    rows, cols = board.size
+    elapsed: float = 0.0
+    for _ in range(REPEATS):
+        cells: List[Tuple[int, int]] = [
+            divmod(index, cols) for index in rng.sample(range(rows * cols),
+                                                        TOUCHED)]
+        start: float = time.perf_counter()
+        run(board, cells)
+        elapsed += time.perf_counter() - start
+    return elapsed / REPEATS * 1e6
+
+
+def main() -> None:
+    """ Print one row per board size and backend. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--copy-max", type=int, default=100,
+                        help="largest side to deep copy")
+    args = parser.parse_args()
+
+    print(f"{'board':>11} {'backend':>8} {'fork (us)':>10} "
+          + f"{'snapshot (us)':>14} {'deepcopy (us)':>14}")
+    for side in (int(size) for size in args.sizes.split(",")):
+        backends: List[Tuple[str, Type[Board]]] = [("array", ArrayBoard)]
+        if side <= 500:
+            backends.insert(0, ("list", Board))
+        for name, board_class in backends:
+            rng = random.Random(side)
+            mines: List[Tuple[int, int]] = [
+                divmod(index, side)
+                for index in rng.sample(range(side * side), side * side // 6)]
+            board: Board = board_class((side, side), len(mines))
+            board.initialize_mines(mines)
+            fork: float = time_per_hypothesis(board, on_fork, rng)
+            snapshot: float = time_per_hypothesis(board, on_snapshot, rng)
+            deep: float = float("nan")
+            if side <= args.copy_max:
+                deep = time_per_hypothesis(board, on_copy, rng)
+            print(f"{side:>5}x{side:<5} {name:>8} {fork:>10.1f} "
+                  + f"{snapshot:>14.1f} {deep:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Time AdvancedSolver.solve() at a fixed mine density on boards of growing
+size, keeping the frontier incrementally (the default) and rescanning the
+whole board for it on every round (as before), and the share of the time
+spent finding border cells.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_frontier [--sizes 20,40,80,160]
+"""
+import argparse
+import contextlib
+import io
+import time
+from typing import List, Set, Tuple, Type
+from advancedsolver import AdvancedSolver
+from board import Board
+from minegen import MineGenerator
+
+DEFAULT_SIZES: str = "20,40,80,160"
+DENSITY: float = 0.12
+
+
+class RescanningSolver(AdvancedSolver):
+    """ AdvancedSolver that scans the whole board for every frontier. """
+
+    def update_frontier(self) -> Set[int]:
+        """ Forget the frontier, so it is rebuilt from a full scan. """
+        self.frontier = None
+        return super().update_frontier()
+
+
+def timed_solve(side: int, solver_class: Type[AdvancedSolver]
+                ) -> Tuple[float, float, int]:
+    """
+    Solve a seeded board from an opening click.
+    Returns tuple - (solve seconds, seconds finding border cells, rounds)
+    """
+    generator = MineGenerator((side, side), int(side * side * DENSITY), side)
+    first: Tuple[int, int] = (side // 2, side // 2)
+    board: Board = Board((side, side), generator.mine_count)
+    board.initialize_mines(generator.positions(
+        generator.first_click_opening(first)))
+    board.handle_click(board.get_piece(first), False)
+    solver: AdvancedSolver = solver_class(board)
+    border_time: List[float] = []
+    find = solver.find_border_cells
+
+    def timed_find() -> List[Tuple[int, int]]:
+        start: float = time.perf_counter()
+        cells: List[Tuple[int, int]] = find()
+        border_time.append(time.perf_counter() - start)
+        return cells
+    solver.find_border_cells = timed_find  # type: ignore
+    start: float = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # Solver chatter
+        solver.solve()
+    return time.perf_counter() - start, sum(border_time), len(border_time)
+
+
+def main() -> None:
+    """ Print one row per board size and frontier strategy. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"{'board':>9} {'frontier':>11} {'rounds':>7} {'solve (ms)':>11} "
+          + f"{'border (ms)':>12}")
+    for side in (int(size) for size in args.sizes.split(",")):
+        for name, solver_class in (("rescan", RescanningSolver),
+                                   ("incremental", AdvancedSolver)):
+            total, border, rounds = timed_solve(side, solver_class)
+            print(f"{side:>4}x{side:<4} {name:>11} {rounds:>7} "
+                  + f"{total * 1e3:>11.1f} {border * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measure the shared neighbor tables: building a geometry against fetching
+the cached one, and a full neighbor sweep done with the old 3x3 bounds
+checked loop against the CSR table.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_geometry
+"""
+import time
+from typing import List, Tuple
+from advancedsolver import AdvancedSolver
+from board import Board
+from geometry import Geometry, geometries, get_geometry
+
+SIZES: List[Tuple[int, int]] = [(16, 30), (200, 200), (1000, 1000)]
+
+
+def legacy_sweep(size: Tuple[int, int]) -> int:
+    """ Visit every neighbor of every cell with the old offset loop. """
+    rows, cols = size
+    visited: int = 0
+    for x in range(rows):
+        for y in range(cols):
+            for dx in [-1, 0, 1]:
+                for dy in [-1, 0, 1]:
+                    if dx == 0 and dy == 0:
+                        continue
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < rows and 0 <= ny < cols:
+                        visited += 1
+    return visited
+
+
+def table_sweep(geometry: Geometry) -> int:
+    """ Visit every neighbor of every cell through the CSR table. """
+    visited: int = 0
+    neighbors = geometry.neighbors
+    for index in range(geometry.cell_count):
+        for _ in neighbors(index):
+            visited += 1
+    return visited
+
+
+def solver_sweep(size: Tuple[int, int]) -> None:
+    """ Count flags around every cell with AdvancedSolver. """
+    solver = AdvancedSolver(Board(size, 0))
+    for x in range(size[0]):
+        for y in range(size[1]):
+            solver.count_flags_around(x, y)
+
+
+def elapsed(start: float) -> float:
+    """ Milliseconds since start. """
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    """ Print one row per board size. """
+    print(f"{'board':>11} {'build (ms)':>11} {'cached (us)':>12} "
+          + f"{'legacy sweep':>13} {'table sweep':>12} {'solver (ms)':>12}")
+    for size in SIZES:
+        geometries.clear()
+        start: float = time.perf_counter()
+        geometry: Geometry = get_geometry(size)
+        if geometry.use_table:
+            geometry.build_table()  # Otherwise built by the first lookup
+        build: float = elapsed(start)
+        start = time.perf_counter()
+        for _ in range(1000):
+            get_geometry(size)
+        cached: float = elapsed(start)  # ms per 1000 calls = us per call
+        start = time.perf_counter()
+        legacy_visits: int = legacy_sweep(size)
+        legacy: float = elapsed(start)
+        start = time.perf_counter()
+        table_visits: int = table_sweep(geometry)
+        table: float = elapsed(start)
+        assert legacy_visits == table_visits
+        solver: float = float("nan")
+        if size[0] * size[1] <= 40000:
+            start = time.perf_counter()
+            solver_sweep(size)
+            solver = elapsed(start)
+        print(f"{size[0]:>5}x{size[1]:<5} {build:>11.2f} {cached:>12.3f} "
+              + f"{legacy:>10.2f} ms {table:>9.2f} ms {solver:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
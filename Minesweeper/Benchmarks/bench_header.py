@@ -0,0 +1,102 @@
+"""
+Time frames on an expert board (16 rows, 30 columns) with the cached
+header (pre-scaled smiley, memoized text, header composed only when the
+mine count changes) against drawing it as before: loading and scaling
+the smiley and rendering the count on every call. Two kinds of frame:
+the whole board redrawn every frame with the count unchanged, and one
+flag placed per frame (only the changed tiles redrawn, but the count
+changes every time). Uses the dummy SDL video driver unless another is
+set.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_header [--size 16x30] [--frames 300]
+"""
+import argparse
+import os
+import time
+from typing import List, Tuple, Type
+import pygame  # type: ignore
+from board import Board
+from minegen import MineGenerator
+from renderer import HEADER_HEIGHT, Renderer
+from space import MINE
+
+
+class UncachedRenderer(Renderer):
+    """ Renderer drawing its header as it did before the caches. """
+
+    def draw_header(self, mine_count: int, flags_placed: int) -> None:
+        """ Draw the header, loading and rendering everything afresh. """
+        header_rect: pygame.Rect = pygame.Rect(0, 0, self.screen_size[0],
+                                               HEADER_HEIGHT)
+        pygame.draw.rect(self.screen, (200, 200, 200), header_rect)
+        smiley_img: pygame.Surface = pygame.image.load('images/smiley.png')
+        smiley_img = pygame.transform.scale(smiley_img, (30, 30))
+        smiley_x: int = self.screen_size[0] // 2 - smiley_img.get_width() // 2
+        smiley_y: int = HEADER_HEIGHT // 2 - smiley_img.get_height() // 2
+        self.screen.blit(smiley_img, (smiley_x, smiley_y))
+        text: str = str(mine_count - flags_placed)
+        text_surface: pygame.Surface = self.font.render(text, True, (0, 0, 0))
+        text_y: int = HEADER_HEIGHT // 2 - text_surface.get_height() // 2
+        self.screen.blit(text_surface, (10, text_y))
+
+
+def frame_time(size: Tuple[int, int], frames: int,
+               renderer_class: Type[Renderer], flagging: bool) -> float:
+    """
+    Draw frames of a seeded expert-density board.
+    size (tuple): (rows, cols) of the board
+    frames (int): Frames to draw
+    renderer_class (type): Renderer to draw with
+    flagging (bool): Flag a mine every frame and redraw what changed;
+    otherwise redraw the whole unchanged board every frame
+    Returns float - mean seconds per frame
+    """
+    mines: int = size[0] * size[1] * 99 // 480
+    generator = MineGenerator(size, mines, 0)
+    board: Board = Board(size, mines)
+    board.initialize_mines(generator.positions(generator.uniform()))
+    renderer: Renderer = renderer_class(
+        size, (800 // size[1], 800 // size[0]))
+    renderer.draw_board(board)
+    renderer.update_display()
+    mine_cells: List[int] = [index
+                             for index in range(board.geometry.cell_count)
+                             if board.get_state_at(index) & MINE]
+    flags: int = 0
+    start: float = time.perf_counter()
+    for frame in range(frames):
+        if flagging:
+            index: int = mine_cells[frame % len(mine_cells)]
+            # Flag, then unflag once every mine is flagged
+            board.handle_click(board.get_piece(
+                board.geometry.position_of(index)), True)
+            flags = board.count_flags()
+        else:
+            renderer.clear_screen()
+        renderer.draw_board(board, flags_placed=flags)
+        renderer.update_display()
+    return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    """ Print the time per frame before and after the header caches. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", default="16x30")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    # Read by pygame when a Renderer starts it
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    rows, cols = (int(part) for part in args.size.split("x"))
+    for flagging, label in ((False, "full redraw"), (True, "flag per frame")):
+        before: float = frame_time((rows, cols), args.frames,
+                                   UncachedRenderer, flagging)
+        after: float = frame_time((rows, cols), args.frames, Renderer,
+                                  flagging)
+        print(f"{rows}x{cols} {label:>14}: before {before * 1e3:7.3f} "
+              + f"ms/frame, after {after * 1e3:7.3f} ms/frame, "
+              + f"{before / after:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Measure the undo journal: the cost of playing expert games (16x30, 99
+mines) with journaling off and on, and the time undo_to() and redo() take
+per change on the opening click of a large sparse board.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_journal [--games 300]
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+from typing import List, Tuple
+from arrayboard import ArrayBoard
+from board import Board
+
+EXPERT: Tuple[int, int, int] = (16, 30, 99)
+
+
+def random_game(seed: int) -> Tuple[Board, List[Tuple[int, int, bool]]]:
+    """ An expert board and a sequence of random clicks and flags. """
+    rng = random.Random(seed)
+    rows, cols, count = EXPERT
+    board: Board = Board((rows, cols), count)
+    board.initialize_mines([divmod(index, cols) for index in rng.sample(
+        range(rows * cols), count)])
+    moves: List[Tuple[int, int, bool]] = [
+        (rng.randrange(rows), rng.randrange(cols), rng.random() < 0.3)
+        for _ in range(200)]
+    return board, moves
+
+
+def play(games: List[Tuple[Board, List[Tuple[int, int, bool]]]],
+         journal: bool) -> float:
+    """ Play every game once; returns milliseconds per game. """
+    elapsed: float = 0.0
+    for board, moves in games:
+        saved = board.snapshot()
+        if journal:
+            board.enable_journal()
+        start: float = time.perf_counter()
+        for row, col, flag in moves:
+            board.handle_click(board.get_piece((row, col)), flag)
+        elapsed += time.perf_counter() - start
+        board.disable_journal()
+        board.restore(saved)
+    return elapsed / len(games) * 1e3
+
+
+def opening_undo(side: int) -> Tuple[int, float, float]:
+    """
+    Click the first empty cell of a sparse board, then undo and redo it.
+    Returns tuple - (changes, undo us per change, redo us per change)
+    """
+    rng = random.Random(side)
+    board: ArrayBoard = ArrayBoard((side, side), side * side // 100)
+    board.initialize_mines([divmod(index, side) for index in rng.sample(
+        range(side * side), side * side // 100)])
+    board.enable_journal()
+    start_cell: int = next(index for index in range(side * side)
+                           if board.flat_state[index] == 0
+                           and board.flat_around[index] == 0)
+    board.handle_click(board.get_piece(divmod(start_cell, side)), False)
+    start: float = time.perf_counter()
+    changes: int = board.undo_to(0)
+    undo: float = time.perf_counter() - start
+    start = time.perf_counter()
+    board.redo()
+    redo: float = time.perf_counter() - start
+    return changes, undo / changes * 1e6, redo / changes * 1e6
+
+
+def main() -> None:
+    """ Print the game timings, then the undo timings. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=300)
+    args = parser.parse_args()
+
+    games = [random_game(seed) for seed in range(args.games)]
+    with contextlib.redirect_stdout(io.StringIO()):  # Game over messages
+        disabled: float = play(games, False)
+        enabled: float = play(games, True)
+    print(f"expert games: journal off {disabled:.3f} ms, "
+          + f"journal on {enabled:.3f} ms per game")
+    for side in (250, 1000):
+        changes, undo, redo = opening_undo(side)
+        print(f"{side}x{side} opening: {changes} changes, undo "
+              + f"{undo:.2f} us, redo {redo:.2f} us per change")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Time LinearSolver.find_certain() against TankSolver.find_certain() on
+stuck positions of growing boards at expert density (99 mines per 480
+cells): seeded layouts opened with a safe first click and played with the
+single-number rules until none apply. Reports the frontier sizes, the
+time per position of the whole find_certain() call and of the reasoning
+alone (after the constraints are read off the board, which both share),
+and how many of the cells the tank solver proves the linear system proves
+too.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_linear [--sizes 16x30,100x100,200x200]
+        [--positions 10]
+"""
+import argparse
+import time
+from typing import Dict, List, Optional, Tuple
+from board import Board
+from linearsolver import LinearSolver
+from minegen import MineGenerator
+from propagation import Propagator
+from tanksolver import Constraint, TankSolver
+
+DENSITY: float = 99 / 480
+
+
+def stuck_position(size: Tuple[int, int], seed: int) -> Optional[Board]:
+    """
+    Play a seeded game until single numbers prove nothing more.
+    size (tuple): (rows, cols) of the board
+    seed (int): Seed of the mine layout
+    Returns Board - the stuck position, or None if the game was won
+    """
+    rows, cols = size
+    count: int = int(rows * cols * DENSITY)
+    generator = MineGenerator(size, count, seed)
+    first: Tuple[int, int] = (rows // 2, cols // 2)
+    board: Board = Board(size, count)
+    board.initialize_mines(generator.positions(
+        generator.first_click_opening(first)))
+    board.handle_click(board.get_piece(first), False)
+    Propagator(board).run()
+    return None if board.get_won() else board
+
+
+def main() -> None:
+    """ Print the timings and the share of cells proven for every size. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="16x30,100x100,200x200")
+    parser.add_argument("--positions", type=int, default=10)
+    args = parser.parse_args()
+
+    for text in args.sizes.split(","):
+        rows, cols = (int(part) for part in text.split("x"))
+        boards: List[Board] = []
+        seed: int = 0
+        while len(boards) < args.positions:
+            board: Optional[Board] = stuck_position((rows, cols), seed)
+            if board is not None:
+                boards.append(board)
+            seed += 1
+
+        timings: Dict[str, List[float]] = {
+            name: [] for name in ("linear", "tank", "linear reasoning",
+                                  "tank reasoning")}
+        frontiers: List[int] = []
+        linear_found: int = 0
+        tank_found: int = 0
+        for board in boards:
+            linear: LinearSolver = LinearSolver(board)
+            tank: TankSolver = TankSolver(board)
+            constraints: List[Constraint] = tank.find_constraints()
+            frontiers.append(len({cell for cells, _ in constraints
+                                  for cell in cells}))
+            start: float = time.perf_counter()
+            safe, mines = linear.find_certain()
+            timings["linear"].append(time.perf_counter() - start)
+            linear_found += len(safe) + len(mines)
+            start = time.perf_counter()
+            safe, mines = tank.find_certain()
+            timings["tank"].append(time.perf_counter() - start)
+            tank_found += len(safe) + len(mines)
+            start = time.perf_counter()
+            linear.deduce(linear.build_rows(constraints))
+            timings["linear reasoning"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            for component in tank.split_components(constraints):
+                tank.solve_component(component)
+            timings["tank reasoning"].append(time.perf_counter() - start)
+
+        print(f"{rows}x{cols}: {len(boards)} stuck positions, frontier "
+              + f"{min(frontiers)}-{max(frontiers)} cells")
+        for name, values in timings.items():
+            median: float = sorted(values)[len(values) // 2]
+            print(f"  {name:16}: median {median * 1e3:8.2f} ms, max "
+                  + f"{max(values) * 1e3:8.2f} ms")
+        print(f"  cells proven: linear {linear_found}, tank {tank_found}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure how fast MineGenerator makes mine layouts: uniform, first-click
+safe and first-click opening layouts for expert boards (16x30, 99 mines),
+a vectorized batch of expert layouts, and one layout for a 1000x1000
+board at expert density, each against the random.sample() baseline.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_minegen [--layouts 2000]
+"""
+import argparse
+import random
+import time
+from typing import Callable, List, Tuple
+from minegen import MineGenerator
+
+EXPERT: Tuple[int, int, int] = (16, 30, 99)
+LARGE: Tuple[int, int, int] = (1000, 1000, 206250)  # 99 / 480 density
+
+
+def per_layout(make: Callable[[], object], layouts: int) -> float:
+    """ Microseconds per call of make(), averaged over layouts calls. """
+    start: float = time.perf_counter()
+    for _ in range(layouts):
+        make()
+    return (time.perf_counter() - start) / layouts * 1e6
+
+
+def baseline(rows: int, cols: int, count: int, rng: random.Random
+             ) -> List[Tuple[int, int]]:
+    """ Mine positions drawn with random.sample(). """
+    return [divmod(index, cols)
+            for index in rng.sample(range(rows * cols), count)]
+
+
+def main() -> None:
+    """ Print one line per kind of layout. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layouts", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows, cols, count = EXPERT
+    generator = MineGenerator((rows, cols), count, seed=0)
+    rng = random.Random(0)
+    first: Tuple[int, int] = (rows // 2, cols // 2)
+    timings: List[Tuple[str, float]] = [
+        ("random.sample", per_layout(
+            lambda: baseline(rows, cols, count, rng), args.layouts)),
+        ("uniform", per_layout(generator.uniform, args.layouts)),
+        ("first_click_safe", per_layout(
+            lambda: generator.first_click_safe(first), args.layouts)),
+        ("first_click_opening", per_layout(
+            lambda: generator.first_click_opening(first), args.layouts)),
+        ("uniform_batch", per_layout(
+            lambda: generator.uniform_batch(args.layouts), 1)
+         / args.layouts),
+        ("uniform + positions", per_layout(
+            lambda: generator.positions(generator.uniform()),
+            args.layouts))]
+    print(f"expert {rows}x{cols}, {count} mines")
+    for name, micros in timings:
+        print(f"  {name:>20} {micros:>10.1f} us per layout")
+
+    rows, cols, count = LARGE
+    generator = MineGenerator((rows, cols), count, seed=0)
+    print(f"{rows}x{cols}, {count} mines")
+    large: List[Tuple[str, float]] = [
+        ("random.sample", per_layout(
+            lambda: baseline(rows, cols, count, rng), 3)),
+        ("first_click_opening", per_layout(
+            lambda: generator.first_click_opening((0, 0)), 3))]
+    for name, micros in large:
+        print(f"  {name:>20} {micros / 1e3:>10.1f} ms per layout")
+
+
+if __name__ == "__main__":
+    main()
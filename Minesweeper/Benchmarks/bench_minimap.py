@@ -0,0 +1,87 @@
+"""
+Time a live overview of a 2000x2000 board (NumPy-backed ArrayBoard) as a
+solver plays it, a batch of moves (numbered cells revealed, mines
+flagged) between frames: the minimap drawn incrementally (only the pixels
+of changed cells written and blitted, on the minimap already scaled to
+the view), the minimap built
+again from the whole board every frame, and, for scale, the tiles at the
+smallest zoom, which show only a corner of the board. Uses the dummy SDL
+video driver unless another is set.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_minimap [--size 2000] [--frames 50]
+        [--moves 200]
+"""
+import argparse
+import os
+import time
+import numpy as np
+from arrayboard import ArrayBoard
+from minegen import MineGenerator
+from renderer import MIN_PIECE_SIZE, Renderer
+from space import MINE
+
+# Mines per cell, as on an expert board
+DENSITY: float = 99 / 480
+
+
+def play(size: int, frames: int, moves: int, minimap: bool,
+         rebuild: bool) -> float:
+    """
+    Play frames on a fresh seeded board, drawing after every batch.
+    size (int): Rows and columns of the board
+    frames (int): Frames to play
+    moves (int): Moves between frames
+    minimap (bool): Draw the minimap rather than the tiles
+    rebuild (bool): Draw the whole board every frame
+    Returns float - mean seconds per frame
+    """
+    generator = MineGenerator((size, size), int(size * size * DENSITY), 0)
+    board: ArrayBoard = ArrayBoard((size, size), generator.mine_count)
+    board.initialize_mines(generator.positions(generator.uniform()))
+    renderer: Renderer = Renderer((size, size),
+                                  (MIN_PIECE_SIZE, MIN_PIECE_SIZE))
+    if minimap:
+        renderer.toggle_minimap()
+    else:
+        renderer.zoom_by(0.0)
+    renderer.draw_board(board)
+    renderer.update_display()
+    # Numbered cells and mines, so no move opens half the board
+    states, around = board.state_arrays()
+    picks: np.ndarray = np.random.default_rng(0).permutation(
+        np.flatnonzero((states & MINE) | around))[:frames * moves]
+    start: float = time.perf_counter()
+    for frame in range(frames):
+        for index in picks[frame * moves:(frame + 1) * moves].tolist():
+            board.handle_click(board.get_piece((index // size,
+                                                index % size)),
+                               bool(board.get_state_at(index) & MINE))
+        if rebuild:
+            renderer.clear_screen()
+        renderer.draw_board(board, flags_placed=board.count_flags())
+        renderer.update_display()
+    return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    """ Print the time per frame of every way of drawing. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--moves", type=int, default=200)
+    args = parser.parse_args()
+
+    # Read by pygame when a Renderer starts it
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    incremental: float = play(args.size, args.frames, args.moves, True,
+                              False)
+    rebuilt: float = play(args.size, args.frames, args.moves, True, True)
+    tiles: float = play(args.size, args.frames, args.moves, False, False)
+    print(f"{args.size}x{args.size}, {args.moves} moves per frame: minimap "
+          + f"{incremental * 1e3:7.2f} ms/frame, rebuilt every frame "
+          + f"{rebuilt * 1e3:7.2f} ms/frame ({rebuilt / incremental:.1f}x), "
+          + f"smallest tiles (a corner) {tiles * 1e3:7.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
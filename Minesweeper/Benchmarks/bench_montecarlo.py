@@ -0,0 +1,135 @@
+"""
+Accuracy and time curves of the Monte Carlo estimator. On hard expert
+positions (16x30, 99 mines, a share of the numbered safe cells revealed
+at random, as in bench_sat) sampling is forced on and compared with the
+exact probabilities, for growing sample counts and time budgets: mean
+and largest error over the hidden cells, and the share of them whose
+exact probability falls inside the confidence interval. Then a larger
+board at expert density, whose frontier is past the exact limit, is
+sampled under each time budget (no exact answer to compare with; the
+width of the intervals is reported instead).
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_montecarlo [--samples 50,100,200,400,800]
+        [--budgets 0.25,0.5,1,2] [--share 0.3] [--seeds 4]
+        [--large 50x100]
+"""
+import argparse
+import random
+import time
+from typing import List, Optional, Tuple
+import numpy as np
+from Benchmarks.bench_sat import MINES, SIZE, scattered_position
+from board import Board
+from minegen import MineGenerator
+from montecarlo import SampledProbabilities
+from probability import MineProbabilities
+from space import CLICKED, FLAGGED, MINE
+
+
+def large_position(size: Tuple[int, int], share: float, seed: int) -> Board:
+    """
+    Reveal a random share of the numbered safe cells of a seeded layout at
+    expert density.
+    size (tuple): (rows, cols) of the board
+    share (float): Share of the numbered safe cells to reveal
+    seed (int): Seed of the mine layout and of the cells revealed
+    Returns Board - the position
+    """
+    mines: int = size[0] * size[1] * MINES // (SIZE[0] * SIZE[1])
+    generator = MineGenerator(size, mines, seed)
+    board: Board = Board(size, mines)
+    board.initialize_mines(generator.positions(generator.uniform()))
+    numbered: List[int] = [
+        index for index in range(board.geometry.cell_count)
+        if not board.get_state_at(index) & MINE
+        and board.get_around_at(index) > 0]
+    chosen: List[int] = random.Random(seed).sample(
+        numbered, int(len(numbered) * share))
+    board.reveal_many(board.geometry.position_of(index) for index in chosen)
+    return board
+
+
+def measure(board: Board, exact: np.ndarray, samples: int,
+            budget: Optional[float], seed: int
+            ) -> Tuple[float, float, float, float]:
+    """
+    Sample one position and compare with the exact probabilities.
+    Returns tuple - (seconds, mean error, largest error, share of hidden
+    cells inside their interval)
+    """
+    engine = SampledProbabilities(board, samples=samples, time_budget=budget,
+                                  seed=seed, frontier_limit=0)
+    start: float = time.perf_counter()
+    probabilities: np.ndarray = engine.get_probabilities()
+    elapsed: float = time.perf_counter() - start
+    low, high = engine.get_intervals()
+    hidden: np.ndarray = engine.state_array() & (CLICKED | FLAGGED) == 0
+    error: np.ndarray = np.abs(probabilities - exact)[hidden]
+    inside: np.ndarray = ((low - 1e-9 <= exact)
+                          & (exact <= high + 1e-9))[hidden]
+    return elapsed, float(error.mean()), float(error.max()), \
+        float(inside.mean())
+
+
+def report(label: str, rows: List[Tuple[float, float, float, float]]
+           ) -> None:
+    """ Print the averages (largest error: the worst) over the positions. """
+    print(f"  {label:>12}: {np.mean([row[0] for row in rows]):7.2f} s, "
+          + f"mean error {np.mean([row[1] for row in rows]):.4f}, "
+          + f"max error {max(row[2] for row in rows):.3f}, "
+          + f"coverage {np.mean([row[3] for row in rows]):.3f}")
+
+
+def main() -> None:
+    """ Print the accuracy and time curves. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", default="50,100,200,400,800")
+    parser.add_argument("--budgets", default="0.25,0.5,1,2")
+    parser.add_argument("--share", type=float, default=0.3)
+    parser.add_argument("--seeds", type=int, default=4)
+    parser.add_argument("--large", default="50x100")
+    args = parser.parse_args()
+
+    sample_counts: List[int] = [int(part)
+                                for part in args.samples.split(",")]
+    budgets: List[float] = [float(part) for part in args.budgets.split(",")]
+    positions: List[Tuple[Board, np.ndarray]] = []
+    exact_time: float = 0.0
+    for seed in range(args.seeds):
+        board: Board = scattered_position(args.share, seed)
+        start: float = time.perf_counter()
+        positions.append((board, MineProbabilities(board).get_probabilities()))
+        exact_time += time.perf_counter() - start
+    print(f"{SIZE[0]}x{SIZE[1]}, share {args.share}, {args.seeds} positions: "
+          + f"exact {exact_time / args.seeds:.2f} s each")
+    for samples in sample_counts:
+        report(f"{samples} samples",
+               [measure(board, exact, samples, None, seed)
+                for seed, (board, exact) in enumerate(positions)])
+    for budget in budgets:
+        report(f"{budget:g} s budget",
+               [measure(board, exact, 0, budget, seed)
+                for seed, (board, exact) in enumerate(positions)])
+
+    rows, cols = (int(part) for part in args.large.split("x"))
+    large: Board = large_position((rows, cols), args.share, 0)
+    frontier: int = len({cell for group, _
+                         in MineProbabilities(large).tank.find_constraints()
+                         for cell in group})
+    print(f"{rows}x{cols}, share {args.share}: {frontier} frontier cells")
+    for budget in budgets:
+        engine = SampledProbabilities(large, time_budget=budget, seed=0,
+                                      frontier_limit=0)
+        start = time.perf_counter()
+        engine.get_probabilities()
+        elapsed: float = time.perf_counter() - start
+        low, high = engine.get_intervals()
+        width: np.ndarray = (high - low)[
+            engine.state_array() & (CLICKED | FLAGGED) == 0]
+        print(f"  {budget:>6g} s budget: {elapsed:7.2f} s, "
+              + f"{engine.sampled} samples, interval width "
+              + f"mean {width.mean():.3f}, max {width.max():.3f}")
+
+
+if __name__ == "__main__":
+    main()
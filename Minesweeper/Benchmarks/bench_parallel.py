@@ -0,0 +1,98 @@
+"""
+Time TankSolver.solve_components() with one worker process per core
+against solving every component in this process. The components are the
+large ones (at least TankSolver.PARALLEL_CELLS cells) of hard expert
+positions (16x30, 99 mines, a share of the numbered safe cells revealed
+at random, as in bench_sat), pooled into one position of several
+independent large components. The pool is started before timing, as it
+is kept for the life of the process.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_parallel [--components 2,4,8]
+        [--workers 2,4,8] [--share 0.25] [--repeat 3]
+"""
+import argparse
+import os
+import time
+from typing import List, Set
+from Benchmarks.bench_sat import scattered_position
+from board import Board
+from tanksolver import ComponentSolutions, Constraint, TankSolver, get_pool
+
+
+def large_components(wanted: int, share: float) -> List[List[Constraint]]:
+    """
+    Gather large components from seeded positions, each moved to its own
+    range of cell numbers so they stay independent.
+    wanted (int): Number of components
+    share (float): Share of the numbered safe cells revealed
+    Returns list - the constraints of each component
+    """
+    found: List[List[Constraint]] = []
+    seed: int = 0
+    while len(found) < wanted:
+        board: Board = scattered_position(share, seed)
+        tank: TankSolver = TankSolver(board)
+        offset: int = seed * board.geometry.cell_count
+        for component in tank.split_components(tank.find_constraints()):
+            cells: Set[int] = {cell for group, _ in component
+                               for cell in group}
+            # Very large ones take seconds each; keep the run short
+            if TankSolver.PARALLEL_CELLS <= len(cells) <= 150 \
+                    and len(found) < wanted:
+                found.append([(tuple(cell + offset for cell in group), need)
+                              for group, need in component])
+        seed += 1
+    return found
+
+
+def timed(tank: TankSolver, components: List[List[Constraint]],
+          repeat: int) -> float:
+    """
+    Best time of solve_components() over some runs.
+    Returns float - seconds
+    """
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        tank.solve_components(components)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """ Print the serial and parallel times for every component count. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", default="2,4,8")
+    parser.add_argument("--workers", default="2,4,8")
+    parser.add_argument("--share", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    worker_counts: List[int] = [int(part)
+                                for part in args.workers.split(",")]
+    print(f"{os.cpu_count()} cores")
+    for workers in worker_counts:
+        # Start the workers before timing anything
+        get_pool(workers).submit(int).result()
+    for text in args.components.split(","):
+        components: List[List[Constraint]] = large_components(
+            int(text), args.share)
+        sizes: List[int] = [len({cell for group, _ in component
+                                 for cell in group})
+                            for component in components]
+        serial: TankSolver = TankSolver(workers=1)
+        expected: List[ComponentSolutions] = serial.solve_components(
+            components)
+        base: float = timed(serial, components, args.repeat)
+        print(f"{len(components)} components of {min(sizes)}-{max(sizes)} "
+              + f"cells: serial {base * 1e3:8.1f} ms")
+        for workers in worker_counts:
+            parallel: TankSolver = TankSolver(workers=workers)
+            assert parallel.solve_components(components) == expected
+            elapsed: float = timed(parallel, components, args.repeat)
+            print(f"  {workers} workers: {elapsed * 1e3:8.1f} ms, "
+                  + f"{base / elapsed:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
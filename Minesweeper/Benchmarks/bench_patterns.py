@@ -0,0 +1,114 @@
+"""
+Time AdvancedSolver.solve() on seeded games at expert density (99 mines
+per 480 cells, opened with a safe first click) without the pattern tier,
+with a new pattern cache per game, with one cache shared by all the
+games of a size, and with a cache pre-warmed from a table saved after
+playing other expert games. Reports the solve time, the pattern cache
+hit rate and the window solving time the hits saved.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_patterns [--sizes 16x30,100x100]
+        [--games 20] [--warm-games 200] [--table patterns.json]
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from typing import Callable, List, Optional, Tuple
+from advancedsolver import AdvancedSolver
+from board import Board
+from minegen import MineGenerator
+from patterncache import CacheStats, PatternCache
+
+DENSITY: float = 99 / 480
+
+
+class UnpatternedSolver(AdvancedSolver):
+    """ AdvancedSolver without the pattern tier. """
+
+    def use_pattern_findings(self) -> bool:
+        """ Never find anything, so the linear system is tried first. """
+        return False
+
+
+def play(size: Tuple[int, int], seeds: range,
+         cache_for: Callable[[], Optional[PatternCache]],
+         patterns: bool = True) -> Tuple[float, List[CacheStats]]:
+    """
+    Solve a game per seed.
+    size (tuple): (rows, cols) of the boards
+    seeds (range): Seeds of the mine layouts
+    cache_for (callable): Gives the pattern cache of each game
+    patterns (bool): Whether to use the pattern tier
+    Returns tuple - (solve seconds, final stats of every cache used)
+    """
+    elapsed: float = 0.0
+    caches: List[PatternCache] = []
+    for seed in seeds:
+        count: int = int(size[0] * size[1] * DENSITY)
+        generator = MineGenerator(size, count, seed)
+        first: Tuple[int, int] = (size[0] // 2, size[1] // 2)
+        board: Board = Board(size, count)
+        board.initialize_mines(generator.positions(
+            generator.first_click_opening(first)))
+        board.handle_click(board.get_piece(first), False)
+        solver: AdvancedSolver = (AdvancedSolver if patterns
+                                  else UnpatternedSolver)(board, cache_for())
+        if solver.patterns.cache not in caches:
+            caches.append(solver.patterns.cache)
+        start: float = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # Solver chatter
+            solver.solve()
+        elapsed += time.perf_counter() - start
+    return elapsed, [cache.stats() for cache in caches]
+
+
+def main() -> None:
+    """ Print one row per board size and way of caching. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="16x30,100x100")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--warm-games", type=int, default=200)
+    parser.add_argument("--table", default=None,
+                        help="where to keep the warming table (a temporary"
+                        + " file if not given)")
+    args = parser.parse_args()
+
+    # Windows do not depend on the board size, so expert games warm all
+    table: str = args.table or os.path.join(tempfile.mkdtemp(),
+                                            "patterns.json")
+    warming: PatternCache = PatternCache()
+    play((16, 30), range(10 ** 6, 10 ** 6 + args.warm_games),
+         lambda: warming)
+    warming.save(table)
+    print(f"Warming table: {len(warming.entries)} patterns from "
+          + f"{args.warm_games} expert games, {os.path.getsize(table)} "
+          + "bytes")
+
+    seeds: range = range(args.games)
+    for text in args.sizes.split(","):
+        rows, cols = (int(part) for part in text.split("x"))
+        size: Tuple[int, int] = (rows, cols)
+        shared: PatternCache = PatternCache()
+        warm: PatternCache = PatternCache()
+        warm.load(table)
+        runs: List[Tuple[str, Tuple[float, List[CacheStats]]]] = [
+            ("no patterns", play(size, seeds, lambda: None, patterns=False)),
+            ("cache per game", play(size, seeds, PatternCache)),
+            ("shared cache", play(size, seeds, lambda: shared)),
+            ("warm cache", play(size, seeds, lambda: warm))]
+        print(f"{rows}x{cols}: {args.games} games")
+        for name, (elapsed, stats) in runs:
+            line: str = f"  {name:14}: {elapsed * 1e3:9.1f} ms"
+            if name != "no patterns":
+                hits: int = sum(item.hits for item in stats)
+                misses: int = sum(item.misses for item in stats)
+                saved: float = sum(item.saved for item in stats)
+                line += f", hit rate {hits / max(hits + misses, 1):6.1%}, " \
+                    + f"{saved * 1e3:7.1f} ms of window solving saved"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
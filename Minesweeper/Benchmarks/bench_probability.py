@@ -0,0 +1,83 @@
+"""
+Time MineProbabilities on expert boards (16x30, 99 mines): once on each
+stuck position of the bench_tank corpus, and after every move of whole
+games that always open the safest cell.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_probability [--positions 100] [--games 20]
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple
+from Benchmarks.bench_tank import EXPERT, corpus
+from board import Board
+from minegen import MineGenerator
+from probability import MineProbabilities
+
+
+def play(seed: int) -> Tuple[List[float], bool]:
+    """
+    Play a seeded expert game, always opening a safest cell and flagging
+    the cells that are sure to be mines.
+    Returns tuple - (seconds per probability computation, won)
+    """
+    rows, cols, count = EXPERT
+    generator = MineGenerator((rows, cols), count, seed)
+    first: Tuple[int, int] = (rows // 2, cols // 2)
+    board: Board = Board((rows, cols), count)
+    board.initialize_mines(generator.positions(
+        generator.first_click_opening(first)))
+    board.handle_click(board.get_piece(first), False)
+    engine = MineProbabilities(board)
+    rng = random.Random(seed)
+    timings: List[float] = []
+    while not board.get_won() and not board.get_lost():
+        start: float = time.perf_counter()
+        probabilities = engine.get_probabilities()
+        timings.append(time.perf_counter() - start)
+        board.flag_many([
+            board.geometry.position_of(index)
+            for index in range(board.geometry.cell_count)
+            if probabilities[index] == 1.0
+            and not board.get_piece(board.geometry.position_of(index))
+            .get_flagged()])
+        safest: List[Tuple[int, int]] = engine.safest_cells()
+        if not safest:
+            break
+        board.handle_click(board.get_piece(rng.choice(safest)), False)
+    return timings, board.get_won()
+
+
+def describe(timings: List[float]) -> str:
+    """ Median and maximum in milliseconds. """
+    ordered: List[float] = sorted(timings)
+    return f"median {ordered[len(ordered) // 2] * 1e3:.2f} ms, max " \
+        + f"{ordered[-1] * 1e3:.2f} ms"
+
+
+def main() -> None:
+    """ Print the timings over the corpus and the games. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=100)
+    parser.add_argument("--games", type=int, default=20)
+    args = parser.parse_args()
+
+    timings: List[float] = []
+    for board in corpus(args.positions):
+        start: float = time.perf_counter()
+        MineProbabilities(board).get_probabilities()
+        timings.append(time.perf_counter() - start)
+    print(f"{len(timings)} stuck expert positions: {describe(timings)}")
+
+    timings = []
+    wins: int = 0
+    for seed in range(args.games):
+        game_timings, won = play(seed)
+        timings.extend(game_timings)
+        wins += won
+    print(f"{args.games} expert games ({wins} won), {len(timings)} moves: "
+          + describe(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Time the single-number rules run to a fixed point on opened boards of
+growing size at a fixed mine density: with full-board sweeps until a
+sweep proves nothing, and with the worklist Propagator. The worklist's
+time should grow in proportion to the number of cells.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_propagation [--sizes 50,100,200,400]
+"""
+import argparse
+import time
+from typing import Callable, Tuple
+from board import Board
+from minegen import MineGenerator
+from propagation import Propagator
+from space import CLICKED
+
+DEFAULT_SIZES: str = "50,100,200,400"
+DENSITY: float = 0.12
+
+
+def opened_board(side: int) -> Board:
+    """ A seeded board opened with a safe click in the middle. """
+    generator = MineGenerator((side, side), int(side * side * DENSITY), side)
+    first: Tuple[int, int] = (side // 2, side // 2)
+    board: Board = Board((side, side), generator.mine_count)
+    board.initialize_mines(generator.positions(
+        generator.first_click_opening(first)))
+    board.handle_click(board.get_piece(first), False)
+    return board
+
+
+def full_sweeps(board: Board) -> int:
+    """
+    Look at every revealed cell until a sweep proves nothing.
+    Returns int - the number of sweeps
+    """
+    propagator: Propagator = Propagator(board)
+    sweeps: int = 0
+    while not board.get_lost() and not board.get_won():
+        sweeps += 1
+        safe, mines = propagator.deduce({
+            index for index in range(board.geometry.cell_count)
+            if board.get_state_at(index) & CLICKED})
+        room: int = board.get_total_mine_count() - board.count_flags()
+        flagged = board.flag_many(board.geometry.position_of(index)
+                                  for index in sorted(mines)[:room])
+        revealed = board.reveal_many(board.geometry.position_of(index)
+                                     for index in sorted(safe))
+        if not flagged and not revealed:
+            break
+    return sweeps
+
+
+def worklist(board: Board) -> int:
+    """
+    Run the Propagator to a fixed point.
+    Returns int - the number of cells it opened or flagged
+    """
+    revealed, flagged = Propagator(board).run()
+    return len(revealed) + len(flagged)
+
+
+def timed(run: Callable[[Board], int], side: int) -> Tuple[float, int]:
+    """ Seconds taken and result of one run on a fresh board. """
+    board: Board = opened_board(side)
+    start: float = time.perf_counter()
+    result: int = run(board)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """ Print one row per board size. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"{'board':>9} {'sweeps':>7} {'sweeping (ms)':>14} "
+          + f"{'worklist (ms)':>14} {'us per cell':>12}")
+    for side in (int(size) for size in args.sizes.split(",")):
+        sweep_time, sweeps = timed(full_sweeps, side)
+        work_time, _ = timed(worklist, side)
+        print(f"{side:>4}x{side:<4} {sweeps:>7} {sweep_time * 1e3:>14.1f} "
+              + f"{work_time * 1e3:>14.1f} "
+              + f"{work_time / (side * side) * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Time a frame of steady-state play with dirty-rectangle rendering against
+redrawing the whole board every frame (clear_screen() before each
+draw_board(), as the game loop used to). Every frame reveals one numbered
+cell or flags one mine, as a solver does between frames. Uses the dummy
+SDL video driver unless another is set, so it measures the drawing, not
+the display.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_render [--sizes 16x30,100x100]
+        [--frames 200]
+"""
+import argparse
+import os
+import random
+import time
+from typing import List, Tuple
+from board import Board
+from minegen import MineGenerator
+from renderer import Renderer
+from space import MINE
+
+# Mines per cell, as on an expert board
+DENSITY: float = 99 / 480
+
+
+def moves(board: Board, count: int) -> List[Tuple[int, bool]]:
+    """
+    Pick cells to play one per frame: numbered safe cells to reveal (so no
+    flood fill opens half the board) and mines to flag.
+    Returns list - (flat index, flag) per frame
+    """
+    picks: List[Tuple[int, bool]] = [
+        (index, bool(board.get_state_at(index) & MINE))
+        for index in range(board.geometry.cell_count)
+        if board.get_state_at(index) & MINE or board.get_around_at(index)]
+    return random.Random(0).sample(picks, min(count, len(picks)))
+
+
+def play(size: Tuple[int, int], frames: int, full: bool) -> float:
+    """
+    Play frames on a fresh board, drawing after every move.
+    size (tuple): (rows, cols) of the board
+    frames (int): Frames to play
+    full (bool): Redraw the whole board every frame
+    Returns float - mean seconds per frame
+    """
+    mines: int = int(size[0] * size[1] * DENSITY)
+    generator = MineGenerator(size, mines, 0)
+    board: Board = Board(size, mines)
+    board.initialize_mines(generator.positions(generator.uniform()))
+    piece_size: Tuple[int, int] = (max(1, 800 // size[1]),
+                                   max(1, 800 // size[0]))
+    renderer: Renderer = Renderer(size, piece_size)
+    renderer.draw_board(board)
+    renderer.update_display()
+    flags: int = 0
+    played: List[Tuple[int, bool]] = moves(board, frames)
+    start: float = time.perf_counter()
+    for index, flag in played:
+        board.handle_click(board.get_piece(board.geometry.position_of(index)),
+                           flag)
+        flags += flag
+        if full:
+            renderer.clear_screen()
+        renderer.draw_board(board, flags_placed=flags)
+        renderer.update_display()
+    return (time.perf_counter() - start) / len(played)
+
+
+def main() -> None:
+    """ Print the time per frame of both ways of drawing. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="16x30,100x100")
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    # Read by pygame when a Renderer starts it
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    for text in args.sizes.split(","):
+        rows, cols = (int(part) for part in text.split("x"))
+        full: float = play((rows, cols), args.frames, True)
+        dirty: float = play((rows, cols), args.frames, False)
+        print(f"{rows}x{cols}: full redraw {full * 1e3:8.3f} ms/frame, "
+              + f"dirty rectangles {dirty * 1e3:8.3f} ms/frame, "
+              + f"{full / dirty:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Time SatSolver.find_certain() against TankSolver.find_certain() on hard
+expert positions (16x30, 99 mines): a share of the numbered safe cells is
+revealed at random, so the frontier breaks into few, large, loosely
+constrained components whose layouts run into the millions. Reports the
+largest component, how many layouts fit it, the time of both solvers
+and, for components up to --enumerate-cells cells, the time of plain
+enumeration (the cost the SAT encoding avoids).
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_sat [--shares 0.1,0.2,0.3] [--seeds 4]
+        [--enumerate-cells 40]
+"""
+import argparse
+import random
+import time
+from typing import List, Optional, Set
+from board import Board
+from minegen import MineGenerator
+from satsolver import SatSolver
+from space import MINE
+from tanksolver import Constraint, TankSolver
+
+SIZE = (16, 30)
+MINES: int = 99
+
+
+def scattered_position(share: float, seed: int) -> Board:
+    """
+    Reveal a random share of the numbered safe cells of a seeded layout.
+    share (float): Share of the numbered safe cells to reveal
+    seed (int): Seed of the mine layout and of the cells revealed
+    Returns Board - the position
+    """
+    generator = MineGenerator(SIZE, MINES, seed)
+    board: Board = Board(SIZE, MINES)
+    board.initialize_mines(generator.positions(generator.uniform()))
+    numbered: List[int] = [
+        index for index in range(board.geometry.cell_count)
+        if not board.get_state_at(index) & MINE
+        and board.get_around_at(index) > 0]
+    chosen: List[int] = random.Random(seed).sample(
+        numbered, int(len(numbered) * share))
+    board.reveal_many(board.geometry.position_of(index) for index in chosen)
+    return board
+
+
+def main() -> None:
+    """ Print the timings for every share and seed. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shares", default="0.1,0.2,0.3")
+    parser.add_argument("--seeds", type=int, default=4)
+    parser.add_argument("--enumerate-cells", type=int, default=40)
+    args = parser.parse_args()
+
+    for text in args.shares.split(","):
+        share: float = float(text)
+        print(f"share {share}:")
+        for seed in range(args.seeds):
+            board: Board = scattered_position(share, seed)
+            tank: TankSolver = TankSolver(board)
+            components: List[List[Constraint]] = tank.split_components(
+                tank.find_constraints())
+            largest: List[Constraint] = max(
+                components, key=lambda component: len(
+                    {cell for cells, _ in component for cell in cells}),
+                default=[])
+            cells: Set[int] = {cell for cells, _ in largest
+                               for cell in cells}
+            layouts: int = sum(tank.count_component(largest).counts.values())
+
+            start: float = time.perf_counter()
+            sat_found = SatSolver(board).find_certain()
+            sat: float = time.perf_counter() - start
+            start = time.perf_counter()
+            tank_found = tank.find_certain()
+            dp: float = time.perf_counter() - start
+            assert sat_found == tank_found
+            enumerated: Optional[float] = None
+            if len(cells) <= args.enumerate_cells:
+                start = time.perf_counter()
+                tank.enumerate_component(largest)
+                enumerated = time.perf_counter() - start
+            enumerate_text: str = "skipped" if enumerated is None \
+                else f"{enumerated * 1e3:10.1f} ms"
+            print(f"  seed {seed}: largest component {len(cells):3} cells, "
+                  + f"{layouts:.3g} layouts; sat {sat * 1e3:8.1f} ms, tank "
+                  + f"{dp * 1e3:8.1f} ms, enumeration {enumerate_text}")
+
+
+if __name__ == "__main__":
+    main()
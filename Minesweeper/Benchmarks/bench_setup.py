@@ -0,0 +1,78 @@
+"""
+Time mine setup (Board.initialize_mines) against the old per-space
+neighbor-list path, on an expert board and on a 1000x1000 board at the same
+mine density.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_setup
+"""
+import random
+import time
+from typing import Callable, List, Tuple
+from arrayboard import ArrayBoard
+from board import Board
+
+# (rows, cols, mines, repetitions)
+CASES: List[Tuple[int, int, int, int]] = [
+    (16, 30, 99, 500),
+    (1000, 1000, 206250, 1),
+]
+
+
+def legacy_initialize_mines(board: Board, positions: List[Tuple[int, int]]
+                            ) -> None:
+    """ The setup path used before vectorization, kept for comparison. """
+    for row in board.board:
+        for space in row:
+            space.has_bomb = False
+            space.clicked = False
+            space.flagged = False
+            space.around = 0
+    for position in positions:
+        board.get_piece(position).has_bomb = True
+    board.set_neighbors()
+    for row in board.board:
+        for piece in row:
+            piece.set_num_around()
+    board.initialized = True
+
+
+def initialize_mines(board: Board, positions: List[Tuple[int, int]]) -> None:
+    """ The current setup path (vectorized on both backends). """
+    board.initialize_mines(positions)
+
+
+def time_setup(board: Board,
+               setup: Callable[[Board, List[Tuple[int, int]]], None],
+               positions: List[Tuple[int, int]], repetitions: int) -> float:
+    """ Average seconds per setup call. """
+    start: float = time.perf_counter()
+    for _ in range(repetitions):
+        setup(board, positions)
+    return (time.perf_counter() - start) / repetitions
+
+
+def main() -> None:
+    """ Print setup time per board for every case and path. """
+    rng = random.Random(100)
+    print(f"{'board':>16} {'legacy (ms)':>12} {'list (ms)':>10} "
+          + f"{'array (ms)':>11} {'speedup':>8}")
+    for rows, cols, mines, repetitions in CASES:
+        cells: List[Tuple[int, int]] = [(r, c) for r in range(rows)
+                                        for c in range(cols)]
+        positions: List[Tuple[int, int]] = rng.sample(cells, mines)
+        board: Board = Board((rows, cols), mines)
+        legacy: float = time_setup(board, legacy_initialize_mines, positions,
+                                   repetitions)
+        vectorized: float = time_setup(Board((rows, cols), mines),
+                                       initialize_mines, positions,
+                                       repetitions)
+        array: float = time_setup(ArrayBoard((rows, cols), mines),
+                                  initialize_mines, positions,
+                                  repetitions)
+        label: str = f"{rows}x{cols}/{mines}"
+        print(f"{label:>16} {legacy * 1e3:>12.3f} {vectorized * 1e3:>10.3f} "
+              + f"{array * 1e3:>11.3f} {legacy / vectorized:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Measure what a Space costs: bytes per cell of a set-up list board against
+the dict-based Space it replaced, and the time of solver passes over expert
+(16x30, 99 mines) boards.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_space [--side 300] [--games 200]
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+from advancedsolver import AdvancedSolver
+from board import Board
+from geometry import get_geometry
+
+EXPERT: Tuple[int, int, int] = (16, 30, 99)
+
+
+class LegacySpace:
+    """ The dict-based Space the slotted one replaced, for comparison. """
+
+    def __init__(self, has_bomb: bool) -> None:
+        self.has_bomb: bool = has_bomb
+        self.around: int = 0
+        self.clicked: bool = False
+        self.flagged: bool = False
+        self.neighbors: List["LegacySpace"] = []
+
+
+def legacy_grid(size: Tuple[int, int], mines: List[Tuple[int, int]]
+                ) -> List[List[LegacySpace]]:
+    """ Build and set up a grid the way the old board did. """
+    rows, cols = size
+    grid: List[List[LegacySpace]] = [[LegacySpace(False) for _ in range(cols)]
+                                     for _ in range(rows)]
+    for row, col in mines:
+        grid[row][col].has_bomb = True
+    for x in range(rows):
+        for y in range(cols):
+            piece: LegacySpace = grid[x][y]
+            for nx in range(max(x - 1, 0), min(x + 2, rows)):
+                for ny in range(max(y - 1, 0), min(y + 2, cols)):
+                    if (nx, ny) != (x, y):
+                        piece.neighbors.append(grid[nx][ny])
+            piece.around = sum(n.has_bomb for n in piece.neighbors)
+    return grid
+
+
+def board_grid(size: Tuple[int, int], mines: List[Tuple[int, int]]) -> Board:
+    """ Build and set up a list board. """
+    board: Board = Board(size, len(mines))
+    board.initialize_mines(mines)
+    return board
+
+
+def bytes_per_cell(build: Callable[[], object], cells: int) -> float:
+    """
+    Bytes still allocated per cell once a grid is built and set up.
+    Shared tables (the board geometry) should be built beforehand.
+    """
+    gc.collect()
+    tracemalloc.start()
+    grid: object = build()
+    gc.collect()
+    held: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del grid
+    return held / cells
+
+
+def random_mines(size: Tuple[int, int], count: int, rng: random.Random
+                 ) -> List[Tuple[int, int]]:
+    """ Pick count distinct mine positions. """
+    return [divmod(index, size[1])
+            for index in rng.sample(range(size[0] * size[1]), count)]
+
+
+def expert_board(seed: int) -> Board:
+    """ An expert board with its first opening revealed. """
+    rows, cols, count = EXPERT
+    board: Board = board_grid((rows, cols), random_mines(
+        (rows, cols), count, random.Random(seed)))
+    for row in board.get_board():
+        for piece in row:
+            if not piece.get_has_bomb() and piece.get_num_around() == 0:
+                board.handle_click(piece, False)
+                return board
+    return board
+
+
+def solver_pass(board: Board) -> int:
+    """ Count flags and hidden tiles around every border cell. """
+    solver = AdvancedSolver(board)
+    total: int = 0
+    for x, y in solver.find_border_cells():
+        total += solver.count_flags_around(x, y)
+        total += len(solver.find_hidden_tiles_around(x, y))
+    return total
+
+
+def getter_pass(board: Board) -> int:
+    """ Read every getter of every cell. """
+    total: int = 0
+    for row in board.get_board():
+        for piece in row:
+            total += piece.get_has_bomb() + piece.get_clicked() \
+                + piece.get_flagged() + piece.get_num_around()
+    return total
+
+
+def main() -> None:
+    """ Print bytes per cell, then solver pass timings. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--side", type=int, default=300)
+    parser.add_argument("--games", type=int, default=200)
+    args = parser.parse_args()
+
+    size: Tuple[int, int] = (args.side, args.side)
+    cells: int = args.side * args.side
+    mines: List[Tuple[int, int]] = random_mines(
+        size, cells // 5, random.Random(1))
+    get_geometry(size)  # Shared by every board of this size
+    legacy: float = bytes_per_cell(lambda: legacy_grid(size, mines), cells)
+    current: float = bytes_per_cell(lambda: board_grid(size, mines), cells)
+    print(f"{size[0]}x{size[1]} board: legacy {legacy:.1f} B/cell, "
+          + f"slotted {current:.1f} B/cell ({legacy / current:.1f}x less)")
+
+    boards: List[Board] = [expert_board(seed) for seed in range(args.games)]
+    for name, run in (("solver pass", solver_pass),
+                      ("getter pass", getter_pass)):
+        start: float = time.perf_counter()
+        for board in boards:
+            run(board)
+        elapsed: float = time.perf_counter() - start
+        print(f"{name:>12}: {elapsed / len(boards) * 1e3:.3f} ms per expert "
+              + "board")
+
+
+if __name__ == "__main__":
+    main()
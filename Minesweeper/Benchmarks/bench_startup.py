@@ -0,0 +1,75 @@
+"""
+Time loading the tiles at start-up for the piece sizes of common boards
+(800 pixels over the rows and columns, as Game does): building the atlas
+from the images (decode, convert and scale every image, as every start
+did before the cache), a cold start (building it and writing it to an
+empty cache) and a warm start (reading it back from the cache, with no
+decoding or scaling). Uses the dummy SDL video driver unless another is
+set.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_startup [--boards 9x9,16x16,16x30,100x100]
+        [--repeat 5]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from typing import Callable, Optional, Tuple
+import pygame  # type: ignore
+from atlas import TileAtlas, load_atlas
+
+
+def best_time(run: Callable[[], TileAtlas], repeat: int,
+              prepare: Optional[Callable[[], None]] = None) -> float:
+    """
+    Best time of a run over some repeats.
+    run (callable): Loads an atlas
+    repeat (int): Number of runs
+    prepare (callable): Called before each run, not timed
+    Returns float - seconds
+    """
+    best: float = float("inf")
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+        start: float = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """ Print the build, cold and warm times for every board's tiles. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", default="9x9,16x16,16x30,100x100")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Read by pygame when the display starts
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    folder: str = tempfile.mkdtemp()
+    try:
+        for text in args.boards.split(","):
+            rows, cols = (int(part) for part in text.split("x"))
+            size: Tuple[int, int] = (800 // cols, 800 // rows)
+            cache: str = os.path.join(folder, text)
+            built: float = best_time(
+                lambda: load_atlas(size, cache_dir=None), args.repeat)
+            cold: float = best_time(
+                lambda: load_atlas(size, cache_dir=cache), args.repeat,
+                lambda: shutil.rmtree(cache, ignore_errors=True))
+            assert load_atlas(size, cache_dir=cache).cached
+            warm: float = best_time(
+                lambda: load_atlas(size, cache_dir=cache), args.repeat)
+            print(f"{rows}x{cols} ({size[0]}x{size[1]} tiles): build "
+                  + f"{built * 1e3:7.2f} ms, cold {cold * 1e3:7.2f} ms, "
+                  + f"warm {warm * 1e3:7.2f} ms, {built / warm:5.1f}x")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare memory use and construction time of the two board backends.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_storage [--sizes 100x100,1000x1000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import List, Tuple, Type
+from arrayboard import ArrayBoard
+from board import Board
+
+DEFAULT_SIZES: str = "100x100,1000x1000,4000x4000"
+
+
+def parse_sizes(text: str) -> List[Tuple[int, int]]:
+    """ Parse a comma separated list of ROWSxCOLS sizes. """
+    sizes: List[Tuple[int, int]] = []
+    for item in text.split(","):
+        rows, cols = item.lower().split("x")
+        sizes.append((int(rows), int(cols)))
+    return sizes
+
+
+def measure(board_class: Type[Board], size: Tuple[int, int]
+            ) -> Tuple[float, int]:
+    """
+    Build one board and measure it.
+    Returns tuple - (construction seconds, peak bytes allocated)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    board: Board = board_class(size, 0)
+    elapsed: float = time.perf_counter() - start
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del board
+    return elapsed, peak
+
+
+def main() -> None:
+    """ Run the benchmark for every size and print one row per backend. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"{'size':>11} {'backend':>8} {'build (s)':>10} {'MiB':>9} "
+          + f"{'B/cell':>7}")
+    for size in parse_sizes(args.sizes):
+        cells: int = size[0] * size[1]
+        for name, board_class in (("list", Board), ("array", ArrayBoard)):
+            elapsed, peak = measure(board_class, size)
+            print(f"{size[0]:>5}x{size[1]:<5} {name:>8} {elapsed:>10.4f} "
+                  + f"{peak / 2 ** 20:>9.1f} {peak / cells:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Time TankSolver.find_certain() on a fixed corpus of stuck expert positions
+(16x30, 99 mines): seeded layouts opened with a safe first click and
+played with single-number deductions until none are left. Reports the
+frontier sizes and the time per position.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_tank [--positions 100]
+"""
+import argparse
+import time
+from typing import List, Optional, Tuple
+from board import Board
+from minegen import MineGenerator
+from tanksolver import TankSolver
+
+EXPERT: Tuple[int, int, int] = (16, 30, 99)
+
+
+def single_number_pass(board: Board, solver: TankSolver) -> bool:
+    """
+    Play every move a single number proves on its own.
+    Returns bool - True if a move was made
+    """
+    safe: List[Tuple[int, int]] = []
+    mines: List[Tuple[int, int]] = []
+    for cells, need in solver.find_constraints():
+        if need == 0:
+            safe.extend(board.geometry.position_of(cell) for cell in cells)
+        elif need == len(cells):
+            mines.extend(board.geometry.position_of(cell) for cell in cells)
+    board.flag_many(list(dict.fromkeys(mines)))
+    board.reveal_many(list(dict.fromkeys(safe)))
+    return bool(safe or mines)
+
+
+def stuck_position(seed: int) -> Optional[Board]:
+    """
+    Play a seeded expert game until single numbers prove nothing more.
+    Returns Board - the stuck position, or None if the game was won
+    """
+    rows, cols, count = EXPERT
+    generator = MineGenerator((rows, cols), count, seed)
+    first: Tuple[int, int] = (rows // 2, cols // 2)
+    board: Board = Board((rows, cols), count)
+    board.initialize_mines(generator.positions(
+        generator.first_click_opening(first)))
+    board.handle_click(board.get_piece(first), False)
+    solver: TankSolver = TankSolver(board)
+    while not board.get_won() and single_number_pass(board, solver):
+        pass
+    return None if board.get_won() else board
+
+
+def corpus(positions: int) -> List[Board]:
+    """ The first stuck positions of seeds 0, 1, 2, ... """
+    boards: List[Board] = []
+    seed: int = 0
+    while len(boards) < positions:
+        board: Optional[Board] = stuck_position(seed)
+        if board is not None:
+            boards.append(board)
+        seed += 1
+    return boards
+
+
+def main() -> None:
+    """ Print the frontier sizes and timings over the corpus. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=100)
+    args = parser.parse_args()
+
+    timings: List[float] = []
+    frontiers: List[int] = []
+    solved: int = 0
+    for board in corpus(args.positions):
+        solver: TankSolver = TankSolver(board)
+        start: float = time.perf_counter()
+        safe, mines = solver.find_certain()
+        timings.append(time.perf_counter() - start)
+        frontiers.append(len({cell for cells, _ in solver.find_constraints()
+                              for cell in cells}))
+        solved += bool(safe or mines)
+    largest: int = frontiers.index(max(frontiers))
+    print(f"{len(timings)} stuck expert positions, frontier "
+          + f"{min(frontiers)}-{max(frontiers)} cells "
+          + f"(mean {sum(frontiers) / len(frontiers):.1f})")
+    print(f"certain moves found in {solved} positions")
+    median: float = sorted(timings)[len(timings) // 2]
+    print(f"find_certain: median {median * 1e3:.2f} ms, max "
+          + f"{max(timings) * 1e3:.2f} ms, largest frontier "
+          + f"{timings[largest] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
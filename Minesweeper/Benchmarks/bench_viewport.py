@@ -0,0 +1,80 @@
+"""
+Time frames through the renderer's viewport on boards from 100x100 to
+5000x5000 (NumPy-backed ArrayBoards, 8-pixel tiles, an 800x800 view):
+panning (every tile in view drawn again), zooming in and out (the same,
+at another tile size) and steady play (one cell in view flagged per
+frame). Only tiles in view are drawn, so the times should not grow with
+the board. Uses the dummy SDL video driver unless another is set.
+Run from the Minesweeper directory:
+    python3 -m Benchmarks.bench_viewport [--sizes 100,1000,5000]
+        [--frames 50]
+"""
+import argparse
+import os
+import time
+from typing import Callable
+from arrayboard import ArrayBoard
+from minegen import MineGenerator
+from renderer import MIN_PIECE_SIZE, Renderer
+
+# Mines per cell
+DENSITY: float = 0.15
+
+
+def timed(renderer: Renderer, board: ArrayBoard, frames: int,
+          move: Callable[[int], None]) -> float:
+    """
+    Draw frames, making a move before each.
+    renderer (Renderer): Renderer with the board drawn
+    board (ArrayBoard): The board
+    frames (int): Frames to draw
+    move (callable): Called with the frame number before drawing it
+    Returns float - mean seconds per frame
+    """
+    start: float = time.perf_counter()
+    for frame in range(frames):
+        move(frame)
+        renderer.draw_board(board)
+        renderer.update_display()
+    return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    """ Print the time per frame of every kind of frame and board. """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--frames", type=int, default=50)
+    args = parser.parse_args()
+
+    # Read by pygame when a Renderer starts it
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    for text in args.sizes.split(","):
+        side: int = int(text)
+        generator = MineGenerator((side, side), int(side * side * DENSITY),
+                                  side)
+        board: ArrayBoard = ArrayBoard((side, side), generator.mine_count)
+        board.initialize_mines(generator.positions(generator.uniform()))
+        renderer: Renderer = Renderer((side, side),
+                                      (MIN_PIECE_SIZE, MIN_PIECE_SIZE))
+        renderer.draw_board(board)
+        renderer.update_display()
+        first_row, last_row, first_col, last_col = renderer.visible_range()
+        tiles: int = (last_row - first_row) * (last_col - first_col)
+        # Panning back and forth keeps the camera moving on small boards
+        pan: float = timed(renderer, board, args.frames, lambda frame:
+                           renderer.pan(100 if frame % 2 else -100, 100))
+        zoom: float = timed(renderer, board, args.frames, lambda frame:
+                            renderer.zoom_by(1.25 if frame % 2 else 0.8))
+
+        def flag(frame: int) -> None:
+            first_row, _, first_col, _ = renderer.visible_range()
+            board.handle_click(board.get_piece(
+                (first_row + frame % 10, first_col + frame // 10)), True)
+        steady: float = timed(renderer, board, args.frames, flag)
+        print(f"{side}x{side} ({tiles} tiles in view): pan "
+              + f"{pan * 1e3:6.2f} ms, zoom {zoom * 1e3:6.2f} ms, "
+              + f"steady {steady * 1e3:6.3f} ms per frame")
+
+
+if __name__ == "__main__":
+    main()
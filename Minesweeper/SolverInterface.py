@@ -1,24 +1,34 @@
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from advancedsolver import AdvancedSolver
+from patterncache import PatternCache
+from satsolver import SatSolver
+from tanksolver import TankSolver
 from trivialsolver import TrivialSolver
 from board import Board
 
+# Any of the solvers the interface can switch between
+AnySolver = AdvancedSolver | TrivialSolver | TankSolver | SatSolver
+
 
 class SolverInterface:
     def __init__(self, board: Board) -> None:
         """
         Initialize the Solver Interface.
-        Dictionary to hold different solver instances
+        Dictionary to build the different solvers; a solver is only built
+        when it is selected, since some follow every change to the board
         """
         self.board: Board = board
-        self.solvers: Dict[str, AdvancedSolver | TrivialSolver] = {
-            # Initialize TrivialSolver instance
-            'trivial': TrivialSolver(board),
-            # Initialize AdvancedSolver instance
-            'advanced': AdvancedSolver(board)
+        # Local deductions outlive the advanced solvers that find them
+        self.patterns: PatternCache = PatternCache()
+        self.solvers: Dict[str, Callable[[], AnySolver]] = {
+            'trivial': lambda: TrivialSolver(board),
+            'advanced': lambda: AdvancedSolver(board, self.patterns),
+            'tank': lambda: TankSolver(board),
+            'sat': lambda: SatSolver(board)
         }
-        # Currently selected solver (starts empty)
-        self.current_solver: Optional[AdvancedSolver | TrivialSolver] = None
+        # Currently selected solver and its key (starts empty)
+        self.current_solver: Optional[AnySolver] = None
+        self.current_key: Optional[str] = None
 
     def get_flags_placed(self) -> int:
         """ Get the number of flags placed by the current solver. """
@@ -35,11 +45,15 @@ class SolverInterface:
         solver_key (str): Key to select the solver (if it's in the dict)
         """
         # Change the solver based on the key provided
-        if solver_key in self.solvers:
-            self.current_solver = self.solvers[solver_key]
-            print(f"Switched to {solver_key} solver.")
-        else:
+        if solver_key not in self.solvers:
             raise ValueError(f"No solver found for key: {solver_key}")
+        if solver_key != self.current_key:
+            # The solver replaced stops following the board
+            if self.current_solver is not None:
+                self.current_solver.close()
+            self.current_solver = self.solvers[solver_key]()
+            self.current_key = solver_key
+        print(f"Switched to {solver_key} solver.")
 
     def solve(self) -> None:
         """ Delegate the solve method to the current solver. """
@@ -0,0 +1,32 @@
+from hypothesis import strategies as st  # type: ignore
+from typing import Tuple
+from board import Board
+from minegen import MineGenerator
+
+
+def one_two_one() -> Board:
+    """ A 3x3 board showing 1 2 1 under three hidden cells. """
+    board: Board = Board((3, 3), 2)
+    board.initialize_mines([(0, 0), (0, 2)])
+    board.handle_click(board.get_piece((2, 1)), False)
+    return board
+
+
+def first_click_board(rows: int, cols: int, data: st.DataObject) -> Board:
+    """
+    A board with a drawn mine count and seed, opened by a first click in
+    the middle that is never on a mine.
+    rows (int): Rows of the board
+    cols (int): Columns of the board
+    data (DataObject): Hypothesis data to draw the count and seed from
+    Returns the board after the first click
+    """
+    count: int = data.draw(st.integers(1, rows * cols // 3))
+    generator = MineGenerator((rows, cols), count,
+                              data.draw(st.integers(0, 2 ** 32)))
+    first: Tuple[int, int] = (rows // 2, cols // 2)
+    board: Board = Board((rows, cols), count)
+    board.initialize_mines(generator.positions(
+        generator.first_click_safe(first)))
+    board.handle_click(board.get_piece(first), False)
+    return board
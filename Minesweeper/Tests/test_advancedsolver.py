@@ -4,6 +4,8 @@ from hypothesis import given, strategies as st  # type: ignore
 from typing import List, Tuple
 from advancedsolver import AdvancedSolver
 from board import Board
+from patterncache import CacheStats, PatternCache
+from Tests.helpers import one_two_one
 
 
 class TestAdvancedSolver(unittest.TestCase):
@@ -121,6 +123,122 @@ class TestAdvancedSolver(unittest.TestCase):
         self.assertFalse(self.board.get_lost(),
                          "Game should not be lost due to guessing")
 
+    def test_solve_falls_back_on_tank_solver(self) -> None:
+        self.solver.find_border_cells = MagicMock(  # type: ignore
+            side_effect=[[(0, 0)], []])
+        self.solver.evaluate_border_cells = MagicMock(  # type: ignore
+            return_value=False)
+        self.solver.flag_mines = MagicMock(return_value=False)  # type: ignore
+
+        def findings() -> bool:
+            self.solver.tank.safe_squares_to_probe.append((0, 1))
+            self.solver.tank.mines_identified.append((0, 0))
+            return True
+        self.solver.tank.find_findings = findings  # type: ignore
+        acted: List[List[Tuple[int, int]]] = []
+        self.solver.act_on_findings = MagicMock(  # type: ignore
+            side_effect=lambda: acted.extend([
+                list(self.solver.safe_squares_to_probe),
+                list(self.solver.mines_identified)]))
+        self.solver.solve()
+        self.assertEqual(acted, [[(0, 1)], [(0, 0)]])
+        self.assertEqual(self.solver.tank.safe_squares_to_probe, [])
+
+    def test_solve_one_two_one(self) -> None:
+        board: Board = one_two_one()
+        solver: AdvancedSolver = AdvancedSolver(board)
+        solver.solve()
+        self.assertTrue(board.get_won())
+        self.assertFalse(board.get_lost())
+
+    def test_solve_counts_propagated_flags(self) -> None:
+        self.board.initialize_mines([(0, 0), (9, 9)])
+        with patch.object(self.solver.propagator, 'run', return_value=(
+                [(5, 5)], [(0, 0), (9, 9)])) as run:
+            self.solver.solve()
+        run.assert_called()
+        self.assertEqual(self.solver.flags_placed, 2 * run.call_count)
+
+    def test_solve_tries_linear_before_tank(self) -> None:
+        board: Board = Board((2, 4), 2)
+        board.initialize_mines([(0, 1), (0, 2)])
+        board.reveal_many([(1, 0), (1, 1), (1, 2), (1, 3)])
+        solver: AdvancedSolver = AdvancedSolver(board)
+        # The linear system proves 1 2 2 1 on its own: the tank solver is
+        # only asked once there is nothing left to prove
+        asked: List[bool] = []
+
+        def findings() -> bool:
+            asked.append(board.get_won())
+            return False
+        with patch.object(solver.tank, 'find_findings', side_effect=findings):
+            solver.solve()
+        self.assertTrue(board.get_won())
+        self.assertTrue(all(asked))
+
+    def test_solve_uses_patterns_first(self) -> None:
+        board: Board = one_two_one()
+        cache: PatternCache = PatternCache()
+        solver: AdvancedSolver = AdvancedSolver(board, cache)
+        # 1 2 1 fits in one window: the linear system is only asked once
+        # there is nothing left to prove
+        asked: List[bool] = []
+
+        def certain() -> Tuple[List[int], List[int]]:
+            asked.append(board.get_won())
+            return [], []
+        with patch.object(solver.linear, 'find_certain',
+                          side_effect=certain), \
+                patch('builtins.print') as mock_print:
+            solver.solve()
+        self.assertTrue(board.get_won())
+        self.assertTrue(all(asked))
+        self.assertIs(solver.patterns.cache, cache)
+        stats: CacheStats = solver.get_pattern_stats()
+        self.assertGreater(stats.misses, 0)
+        mock_print.assert_any_call(
+            f"Pattern cache: {stats.hits} hits, {stats.misses} misses "
+            + f"({stats.hit_rate:.0%}), {stats.saved * 1e3:.1f} ms saved")
+
+    def test_use_tank_findings_nothing_certain(self) -> None:
+        self.board.initialize_mines([(0, 0), (0, 1), (9, 9)])
+        self.assertFalse(self.solver.use_tank_findings())
+        self.assertEqual(self.solver.safe_squares_to_probe, [])
+        self.assertEqual(self.solver.mines_identified, [])
+
+    @given(st.lists(st.tuples(st.integers(0, 9), st.integers(0, 9),
+                              st.booleans()), max_size=20))  # type: ignore
+    def test_frontier_follows_moves(self, moves: List[Tuple[
+            int, int, bool]]) -> None:
+        self.board.initialize_mines([(0, 0), (4, 4), (5, 5), (9, 0)])
+        self.solver.find_border_cells()
+        for x, y, flag in moves:
+            if self.board.get_piece((x, y)).get_has_bomb() and not flag:
+                continue
+            self.board.handle_click(self.board.get_piece((x, y)), flag)
+            self.assertEqual(self.solver.find_border_cells(), [
+                (row, col) for row in range(10) for col in range(10)
+                if self.solver.is_border_cell(row, col)])
+
+    def test_frontier_scans_board_once(self) -> None:
+        self.board.initialize_mines([(0, 0), (9, 9)])
+        self.solver.find_border_cells()
+        with patch.object(self.solver, 'is_border_index',
+                          wraps=self.solver.is_border_index) as check:
+            self.board.handle_click(self.board.get_piece((0, 1)), False)
+            self.assertEqual(self.solver.find_border_cells(),
+                             [(0, 0), (0, 2), (1, 0), (1, 1), (1, 2)])
+        # The clicked cell and its five neighbors
+        self.assertEqual(check.call_count, 6)
+        # A new layout changes every cell, so the board is scanned again
+        self.board.initialize_mines([(0, 0)])
+        self.assertEqual(self.solver.find_border_cells(), [])
+
+    def test_close(self) -> None:
+        self.assertEqual(len(self.board.listeners), 3)
+        self.solver.close()
+        self.assertEqual(self.board.listeners, [])
+
     def test_game_over_handling(self) -> None:
         mine_positions: List[Tuple[int, int]] = [(0, 0)]
         self.board.initialize_mines(mine_positions)
@@ -197,16 +315,26 @@ class TestAdvancedSolver(unittest.TestCase):
     def test_act_on_findings(self) -> None:
         self.solver.mines_identified = [(1, 1)]
         self.solver.safe_squares_to_probe = [(1, 2)]
-        mine_cell = MagicMock(get_flagged=lambda: False)
-        safe_cell = MagicMock(get_clicked=lambda: False)
-        self.board.get_piece = MagicMock(  # type: ignore
-            side_effect=lambda x: mine_cell if x == (1, 1) else safe_cell)
+        moves: List[Tuple[str, List[Tuple[int, int]]]] = []
 
-        with patch.object(self.board, 'handle_click') as mock_handle_click:
+        def flag_many(positions: List[Tuple[int, int]]
+                      ) -> List[Tuple[int, int]]:
+            moves.append(("flag", list(positions)))
+            return positions
+
+        def reveal_many(positions: List[Tuple[int, int]]
+                        ) -> List[Tuple[int, int]]:
+            moves.append(("reveal", list(positions)))
+            return positions
+
+        with patch.object(self.board, 'flag_many', side_effect=flag_many), \
+                patch.object(self.board, 'reveal_many',
+                             side_effect=reveal_many):
             self.solver.act_on_findings()
-            expected_calls = [((mine_cell, True),), ((safe_cell, False),)]
-            mock_handle_click.assert_has_calls(expected_calls,  # type: ignore
-                                               any_order=True)
+        self.assertEqual(moves, [("flag", [(1, 1)]), ("reveal", [(1, 2)])])
+        self.assertEqual(self.solver.flags_placed, 1)
+        self.assertEqual(self.solver.mines_identified, [])
+        self.assertEqual(self.solver.safe_squares_to_probe, [])
 
     def test_flag_mines_places_flags_correctly(self) -> None:
         cell = MagicMock(get_clicked=lambda: True, get_flagged=lambda: False,
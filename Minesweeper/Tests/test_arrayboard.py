@@ -0,0 +1,181 @@
+import unittest
+from hypothesis import given, strategies as st  # type: ignore
+from typing import Tuple, List
+from arrayboard import ArrayBoard, CellView
+from board import Board, count_mines_around
+import numpy as np
+
+
+class TestArrayBoard(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board: ArrayBoard = ArrayBoard((5, 5), 5)
+
+    def test_storage_is_one_byte_per_cell(self) -> None:
+        self.assertEqual(self.board.state.shape, (5, 5))
+        self.assertEqual(self.board.state.dtype, np.uint8)
+        self.assertEqual(self.board.around.dtype, np.uint8)
+
+    def test_get_piece_returns_view(self) -> None:
+        piece = self.board.get_piece((1, 2))
+        self.assertIsInstance(piece, CellView)
+        self.assertEqual(piece, self.board.get_piece((1, 2)))
+        self.assertNotEqual(piece, self.board.get_piece((2, 1)))
+
+    def test_view_writes_through(self) -> None:
+        self.board.get_piece((0, 0)).toggle_flag()
+        self.assertTrue(self.board.get_piece((0, 0)).get_flagged())
+        self.board.get_piece((0, 0)).toggle_flag()
+        self.board.get_piece((0, 0)).handle_click()
+        self.assertTrue(self.board.get_piece((0, 0)).clicked)
+        self.assertFalse(self.board.get_piece((0, 0)).get_flagged())
+
+    def test_initialize_mines_valid(self) -> None:
+        positions: List[Tuple[int, int]] = [(0, 0), (1, 1), (2, 2)]
+        self.board.initialize_mines(positions)
+        for position in positions:
+            self.assertTrue(self.board.get_piece(position).has_bomb)
+        self.assertEqual(self.board.get_piece((0, 1)).get_num_around(), 2)
+
+    def test_initialize_mines_invalid(self) -> None:
+        with self.assertRaises(IndexError):
+            self.board.initialize_mines([(0, 0), (6, 6)])
+
+    def test_get_piece_off_board(self) -> None:
+        with self.assertRaises(IndexError):
+            self.board.get_piece((5, 0))
+
+    def test_neighbors(self) -> None:
+        self.assertEqual(len(self.board.get_piece((0, 0)).get_neighbors()), 3)
+        self.assertEqual(len(self.board.get_piece((2, 2)).get_neighbors()), 8)
+
+    def test_handle_click_cascade_and_win(self) -> None:
+        self.board.initialize_mines([(4, 4)])
+        self.board.handle_click(self.board.get_piece((0, 0)), False)
+        self.assertTrue(self.board.get_won())
+        self.assertTrue(self.board.is_board_opened())
+        self.assertFalse(self.board.get_piece((4, 4)).get_clicked())
+
+    def test_handle_click_large_opening(self) -> None:
+        board = ArrayBoard((400, 400), 1)
+        board.initialize_mines([(0, 399)])
+        revealed = board.handle_click(board.get_piece((399, 0)), False)
+        self.assertEqual(len(revealed), 400 * 400 - 1)
+        self.assertEqual(len(set(revealed)), len(revealed))
+        self.assertTrue(board.get_won())
+
+    def test_flood_fill_skips_flags(self) -> None:
+        self.board.initialize_mines([])
+        self.board.handle_click(self.board.get_piece((0, 4)), True)
+        revealed = self.board.handle_click(self.board.get_piece((4, 0)),
+                                           False)
+        self.assertNotIn((0, 4), revealed)
+        self.assertEqual(len(revealed), 24)
+
+    def test_handle_click_on_mine(self) -> None:
+        self.board.initialize_mines([(0, 0)])
+        self.board.handle_click(self.board.get_piece((0, 0)), False)
+        self.assertTrue(self.board.get_lost())
+
+    def test_count_flags(self) -> None:
+        self.board.handle_click(self.board.get_piece((0, 0)), True)
+        self.board.handle_click(self.board.get_piece((3, 3)), True)
+        self.assertEqual(self.board.count_flags(), 2)
+
+    def test_get_board_shape(self) -> None:
+        grid = self.board.get_board()
+        self.assertEqual(len(grid), 5)
+        self.assertEqual(len(grid[0]), 5)
+
+    def test_reveal_all_non_flagged_squares(self) -> None:
+        self.board.initialize_mines([(2, 2)])
+        self.board.handle_click(self.board.get_piece((2, 2)), True)
+        self.board.reveal_all_non_flagged_squares()
+        self.assertTrue(self.board.check_won())
+        self.assertFalse(self.board.get_lost())
+
+    @given(st.lists(st.tuples(st.integers(0, 4), st.integers(0, 4),
+                              st.booleans()), max_size=30))  # type: ignore
+    def test_counters_match_full_scan(self, moves: List[Tuple[int, int, bool]]
+                                      ) -> None:
+        board = ArrayBoard((5, 5), 2)
+        board.initialize_mines([(0, 4), (4, 0)])
+        board.debug = True
+        for row, col, flag in moves:
+            board.handle_click(board.get_piece((row, col)), flag)
+            board.verify_counts()
+            if board.get_lost():
+                break
+
+    @given(st.lists(st.tuples(st.integers(0, 5), st.integers(0, 6)),
+                    unique=True))  # type: ignore
+    def test_matches_list_backend(self, mines: List[Tuple[int, int]]
+                                  ) -> None:
+        array_board = ArrayBoard((6, 7), len(mines))
+        list_board = Board((6, 7), len(mines))
+        array_board.initialize_mines(mines)
+        list_board.initialize_mines(mines)
+        for row in range(6):
+            for col in range(7):
+                self.assertEqual(
+                    array_board.get_piece((row, col)).get_num_around(),
+                    list_board.get_piece((row, col)).get_num_around())
+
+    def test_count_mines_around(self) -> None:
+        mines = np.zeros((3, 3), dtype=bool)
+        mines[1, 1] = True
+        around = count_mines_around(mines)
+        self.assertEqual(int(around.sum()), 8)
+        self.assertEqual(int(around[1, 1]), 0)
+
+    def test_state_arrays_match_list_backend(self) -> None:
+        list_board = Board((5, 5), 5)
+        for board in (self.board, list_board):
+            board.initialize_mines([(0, 0), (4, 4), (2, 1)])
+            board.handle_click(board.get_piece((0, 4)), False)
+            board.handle_click(board.get_piece((4, 4)), True)
+        for array, listed in zip(self.board.state_arrays(),
+                                 list_board.state_arrays()):
+            np.testing.assert_array_equal(array, listed)
+        # The minimap reads the storage itself, with no copy per frame
+        states, around = self.board.state_arrays()
+        self.assertIs(states, self.board.state)
+        self.assertIs(around, self.board.around)
+
+    def test_snapshot_restore(self) -> None:
+        self.board.initialize_mines([(0, 0), (4, 4)])
+        saved = self.board.snapshot()
+        self.board.handle_click(self.board.get_piece((2, 2)), False)
+        self.board.handle_click(self.board.get_piece((0, 0)), False)
+        self.assertTrue(self.board.get_lost())
+        self.board.restore(saved)
+        self.assertFalse(self.board.get_lost())
+        self.assertEqual(self.board.safe_cells_left, 23)
+        self.assertEqual(self.board.snapshot(), saved)
+        self.board.verify_counts()
+
+    def test_undo_flood_fill(self) -> None:
+        self.board.initialize_mines([(0, 0), (4, 4)])
+        self.board.enable_journal()
+        start = self.board.snapshot()
+        revealed = self.board.handle_click(self.board.get_piece((0, 4)),
+                                           False)
+        self.assertTrue(self.board.get_won())
+        # Every revealed cell plus the won flag
+        self.assertEqual(self.board.undo_to(0), len(revealed) + 1)
+        self.assertEqual(self.board.snapshot(), start)
+        self.assertEqual(self.board.redo(), len(revealed) + 1)
+        self.board.verify_counts()
+
+    def test_flood_fill_feeds_changes(self) -> None:
+        self.board.initialize_mines([(0, 0), (4, 4)])
+        feed = self.board.track_changes()
+        revealed = self.board.handle_click(self.board.get_piece((0, 4)),
+                                           False)
+        self.assertEqual(feed.drain(), {row * 5 + col
+                                        for row, col in revealed})
+        self.board.restore(self.board.snapshot())
+        self.assertEqual(len(feed), 25)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pygame  # type: ignore
+from atlas import (IMAGES_DIR, TileAtlas, atlas_key, list_tiles, load_atlas,
+                   save_atlas)
+
+
+class TestTileAtlas(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def test_list_tiles(self) -> None:
+        names = list_tiles()
+        self.assertEqual(len(names), 16)
+        self.assertIn('flag', names)
+        self.assertEqual(names, sorted(names))
+
+    def test_build(self) -> None:
+        atlas: TileAtlas = load_atlas((8, 6), cache_dir=None)
+        self.assertFalse(atlas.cached)
+        self.assertEqual(atlas.surface.get_size(), (8 * 16, 6))
+        self.assertEqual(atlas.rects['0'], pygame.Rect(0, 0, 8, 6))
+        tiles = atlas.tiles()
+        self.assertEqual(set(tiles), set(list_tiles()))
+        self.assertEqual(tiles['flag'].get_size(), (8, 6))
+
+    def test_blit(self) -> None:
+        atlas: TileAtlas = load_atlas((8, 8), cache_dir=None)
+        target = pygame.Surface((20, 20))
+        atlas.blit(target, 'flag', (4, 6))
+        flag = atlas.tiles()['flag']
+        for x, y in ((0, 0), (3, 5), (7, 7)):
+            self.assertEqual(target.get_at((4 + x, 6 + y)),
+                             flag.get_at((x, y)))
+
+    def test_cache_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            built: TileAtlas = load_atlas((8, 8), cache_dir=folder)
+            self.assertFalse(built.cached)
+            self.assertEqual(len(os.listdir(folder)), 1)
+            read: TileAtlas = load_atlas((8, 8), cache_dir=folder)
+            self.assertTrue(read.cached)
+            self.assertEqual(pygame.image.tobytes(read.surface, "RGB"),
+                             pygame.image.tobytes(built.surface, "RGB"))
+            # Another size gets its own entry
+            self.assertFalse(load_atlas((9, 9), cache_dir=folder).cached)
+            self.assertEqual(len(os.listdir(folder)), 2)
+
+    def test_cache_follows_images(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            images: str = os.path.join(folder, "images")
+            cache: str = os.path.join(folder, "cache")
+            shutil.copytree(IMAGES_DIR, images)
+            load_atlas((8, 8), images, cache)
+            before: str = atlas_key(list_tiles(images), (8, 8), images)
+            info = os.stat(os.path.join(images, "flag.png"))
+            os.utime(os.path.join(images, "flag.png"),
+                     ns=(info.st_atime_ns, info.st_mtime_ns + 10 ** 9))
+            self.assertNotEqual(
+                atlas_key(list_tiles(images), (8, 8), images), before)
+            self.assertFalse(load_atlas((8, 8), images, cache).cached)
+            # The stale entry is dropped
+            self.assertEqual(len(os.listdir(cache)), 1)
+            self.assertTrue(load_atlas((8, 8), images, cache).cached)
+
+    def test_damaged_cache_rebuilt(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            key: str = atlas_key(list_tiles(), (8, 8))
+            with open(os.path.join(folder, key + ".raw"), "wb") as file:
+                file.write(b"not an atlas")
+            self.assertFalse(load_atlas((8, 8), cache_dir=folder).cached)
+            self.assertTrue(load_atlas((8, 8), cache_dir=folder).cached)
+
+    def test_unwritable_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            blocked: str = os.path.join(folder, "file")
+            with open(blocked, "w") as file:
+                file.write("")
+            atlas: TileAtlas = load_atlas((8, 8), cache_dir=blocked)
+            self.assertFalse(atlas.cached)
+            with self.assertRaises(OSError):
+                save_atlas(atlas, os.path.join(blocked, "atlas.raw"))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -23,6 +23,35 @@ class TestBoard(unittest.TestCase):
         with self.assertRaises(IndexError):
             self.board.initialize_mines(positions)
 
+    def test_initialize_mines_counts_around(self) -> None:
+        self.board.initialize_mines([(0, 0), (0, 2), (2, 2)])
+        self.assertEqual(self.board.get_piece((1, 1)).get_num_around(), 3)
+        self.assertEqual(self.board.get_piece((0, 1)).get_num_around(), 2)
+        self.assertEqual(self.board.get_piece((4, 4)).get_num_around(), 0)
+
+    def test_initialize_mines_resets_state(self) -> None:
+        self.board.get_piece((3, 3)).toggle_flag()
+        self.board.get_piece((1, 3)).handle_click()
+        self.board.initialize_mines([(0, 0)])
+        self.assertFalse(self.board.get_piece((3, 3)).get_flagged())
+        self.assertFalse(self.board.get_piece((1, 3)).get_clicked())
+
+    def test_neighbors_built_on_demand(self) -> None:
+        self.board.initialize_mines([])
+        corner = self.board.get_piece((0, 0)).get_neighbors()
+        self.assertEqual(self.board.get_piece((0, 0)).neighbors, corner)
+        self.assertEqual(len(corner), 3)
+        self.assertIn(self.board.get_piece((1, 1)), corner)
+        self.assertEqual(len(self.board.get_piece((2, 2)).get_neighbors()), 8)
+
+    @given(st.integers(min_value=0, max_value=24))  # type: ignore
+    def test_neighbor_indices(self, index: int) -> None:
+        row, col = divmod(index, 5)
+        expected = [r * 5 + c for r in range(row - 1, row + 2)
+                    for c in range(col - 1, col + 2)
+                    if (r, c) != (row, col) and 0 <= r < 5 and 0 <= c < 5]
+        self.assertEqual(list(self.board.neighbor_indices(index)), expected)
+
     @given(st.integers(min_value=0, max_value=4),
            st.integers(min_value=0, max_value=4))  # type: ignore
     def test_get_piece(self, row: int, col: int) -> None:
@@ -46,6 +75,219 @@ class TestBoard(unittest.TestCase):
         self.assertFalse(self.board.get_lost())
         self.assertTrue(self.board.get_piece((1, 1)).clicked)
 
+    def test_handle_click_returns_revealed(self) -> None:
+        self.board.initialize_mines([(4, 4)])
+        revealed = self.board.handle_click(self.board.get_piece((4, 3)),
+                                           False)
+        self.assertEqual(revealed, [(4, 3)])
+        revealed = self.board.handle_click(self.board.get_piece((0, 0)),
+                                           False)
+        self.assertEqual(len(revealed), 23)
+        self.assertEqual(revealed[0], (0, 0))
+        self.assertNotIn((4, 4), revealed)
+        self.assertNotIn((4, 3), revealed)
+        self.assertTrue(self.board.get_won())
+
+    def test_handle_click_flood_stops_at_flags(self) -> None:
+        self.board.initialize_mines([])
+        self.board.handle_click(self.board.get_piece((2, 2)), True)
+        revealed = self.board.handle_click(self.board.get_piece((0, 0)),
+                                           False)
+        self.assertEqual(len(revealed), 24)
+        self.assertFalse(self.board.get_piece((2, 2)).get_clicked())
+        self.assertFalse(self.board.get_won())
+
+    def test_handle_click_large_opening(self) -> None:
+        board = Board((150, 150), 1)
+        board.initialize_mines([(149, 149)])
+        revealed = board.handle_click(board.get_piece((0, 0)), False)
+        self.assertEqual(len(revealed), 150 * 150 - 1)
+        self.assertTrue(board.get_won())
+
+    def test_handle_click_ignored_returns_nothing(self) -> None:
+        self.board.initialize_mines([(0, 0)])
+        self.assertEqual(self.board.handle_click(self.board.get_piece(
+            (1, 1)), True), [])
+        self.assertEqual(self.board.handle_click(self.board.get_piece(
+            (1, 1)), False), [])
+
+    @given(st.lists(st.tuples(st.integers(0, 4), st.integers(0, 4),
+                              st.booleans()), max_size=30))  # type: ignore
+    def test_counters_match_full_scan(self, moves: List[Tuple[int, int, bool]]
+                                      ) -> None:
+        board = Board((5, 5), 3)
+        board.initialize_mines([(0, 4), (2, 2), (4, 0)])
+        board.debug = True
+        for row, col, flag in moves:
+            board.handle_click(board.get_piece((row, col)), flag)
+            board.verify_counts()
+            if board.get_lost():
+                break
+        safe_left, flags, opened = board.scan_counts()
+        self.assertEqual(board.count_flags(), flags)
+        self.assertEqual(board.check_won(), safe_left == 0)
+        self.assertEqual(board.is_board_opened(), opened > 0)
+
+    def test_counters_follow_direct_space_changes(self) -> None:
+        self.board.initialize_mines([(0, 0)])
+        self.board.get_piece((1, 1)).toggle_flag()
+        self.assertEqual(self.board.count_flags(), 1)
+        self.board.get_piece((1, 1)).toggle_flag()
+        self.assertEqual(self.board.count_flags(), 0)
+        self.board.get_piece((4, 4)).handle_click()
+        self.assertTrue(self.board.is_board_opened())
+        self.assertEqual(self.board.safe_cells_left, 23)
+
+    def test_verify_counts_detects_mismatch(self) -> None:
+        self.board.flag_count = 3
+        with self.assertRaises(RuntimeError):
+            self.board.verify_counts()
+        self.board.debug = True
+        with self.assertRaises(RuntimeError):
+            self.board.count_flags()
+
+    def test_snapshot_restore(self) -> None:
+        self.board.initialize_mines([(0, 0), (4, 4)])
+        saved = self.board.snapshot()
+        self.board.handle_click(self.board.get_piece((0, 1)), True)
+        self.board.handle_click(self.board.get_piece((2, 2)), False)
+        self.board.initialize_mines([(1, 1)])
+        self.board.restore(saved)
+        self.assertTrue(self.board.get_piece((4, 4)).get_has_bomb())
+        self.assertFalse(self.board.get_piece((2, 2)).get_clicked())
+        self.assertEqual(self.board.get_piece((1, 1)).get_num_around(), 1)
+        self.assertEqual(self.board.count_flags(), 0)
+        self.assertEqual(self.board.snapshot(), saved)
+        self.board.verify_counts()
+
+    def test_restore_other_size(self) -> None:
+        with self.assertRaises(ValueError):
+            self.board.restore(Board((4, 5), 0).snapshot())
+
+    @given(st.lists(st.tuples(st.integers(0, 4), st.integers(0, 4),
+                              st.booleans()), max_size=20),
+           st.integers(0, 20))  # type: ignore
+    def test_undo_redo(self, moves: List[Tuple[int, int, bool]], split: int
+                       ) -> None:
+        board = Board((5, 5), 3)
+        board.initialize_mines([(0, 4), (2, 2), (4, 0)])
+        board.enable_journal()
+        start = board.snapshot()
+        for row, col, flag in moves[:split]:
+            board.handle_click(board.get_piece((row, col)), flag)
+        middle, mark = board.snapshot(), board.mark()
+        for row, col, flag in moves[split:]:
+            board.handle_click(board.get_piece((row, col)), flag)
+        end = board.snapshot()
+        board.undo_to(mark)
+        self.assertEqual(board.snapshot(), middle)
+        board.undo_to(0)
+        self.assertEqual(board.snapshot(), start)
+        board.redo()
+        self.assertEqual(board.snapshot(), middle)
+        board.redo()
+        self.assertEqual(board.snapshot(), end)
+        self.assertEqual(board.redo(), 0)
+        board.verify_counts()
+
+    def test_undo_cost_follows_changes(self) -> None:
+        self.board.initialize_mines([(0, 0)])
+        self.board.enable_journal()
+        self.board.handle_click(self.board.get_piece((0, 1)), True)
+        mark = self.board.mark()
+        self.board.handle_click(self.board.get_piece((4, 4)), False)
+        self.assertEqual(self.board.undo_to(mark), 23)  # 22 cells, won flag
+        self.assertTrue(self.board.get_piece((0, 1)).get_flagged())
+        self.assertFalse(self.board.get_won())
+        self.board.handle_click(self.board.get_piece((0, 1)), True)
+        self.assertEqual(self.board.redo(), 0)  # A new change ends redo
+
+    def test_journal_disabled(self) -> None:
+        self.board.handle_click(self.board.get_piece((0, 1)), True)
+        self.assertIsNone(self.board.journal)
+        with self.assertRaises(RuntimeError):
+            self.board.mark()
+        with self.assertRaises(ValueError):
+            self.board.undo_to(0)
+        self.board.enable_journal()
+        with self.assertRaises(ValueError):
+            self.board.undo_to(1)
+        self.board.disable_journal()
+        self.assertEqual(self.board.redo(), 0)
+
+    def test_reveal_many(self) -> None:
+        self.board.initialize_mines([(0, 0), (0, 2)])
+        self.board.handle_click(self.board.get_piece((1, 1)), True)
+        revealed = self.board.reveal_many([(0, 1), (1, 1), (0, 1), (1, 0)])
+        self.assertEqual(revealed, [(0, 1), (1, 0)])
+        self.assertFalse(self.board.get_won())
+        self.assertEqual(self.board.reveal_many([(0, 0), (1, 2)]), [(0, 0)])
+        self.assertTrue(self.board.get_lost())
+        self.assertFalse(self.board.get_piece((1, 2)).get_clicked())
+        self.assertEqual(self.board.reveal_many([(1, 2)]), [])
+
+    def test_reveal_many_wins_once(self) -> None:
+        self.board.initialize_mines([(0, 0)])
+        with patch.object(self.board, 'check_won',
+                          return_value=True) as mocked_check_won:
+            self.board.reveal_many([(0, 1), (1, 0), (1, 1)])
+            mocked_check_won.assert_called_once()
+        self.assertTrue(self.board.get_won())
+
+    def test_flag_many(self) -> None:
+        self.board.initialize_mines([(0, 0)])
+        self.board.handle_click(self.board.get_piece((0, 1)), False)
+        self.board.handle_click(self.board.get_piece((1, 1)), True)
+        self.assertEqual(self.board.flag_many([(0, 0), (0, 1), (1, 1)]),
+                         [(0, 0)])
+        self.assertEqual(self.board.count_flags(), 2)
+
+    def test_chord(self) -> None:
+        self.board.initialize_mines([(0, 0), (2, 2)])
+        self.board.handle_click(self.board.get_piece((1, 1)), False)
+        self.assertEqual(self.board.chord((1, 1)), [])  # Not satisfied
+        self.assertEqual(self.board.chord((0, 4)), [])  # Not revealed
+        self.board.flag_many([(0, 0), (2, 2)])
+        revealed = self.board.chord((1, 1))
+        self.assertTrue({(0, 1), (0, 2), (1, 0), (1, 2), (2, 0),
+                         (2, 1)} <= set(revealed))
+        self.assertTrue(self.board.get_won())
+
+    def test_change_feed(self) -> None:
+        feed = self.board.track_changes()
+        self.board.initialize_mines([(0, 0)])
+        # A new layout flags the feed rather than listing every cell
+        self.assertEqual(len(feed), 25)
+        self.assertEqual(feed.dirty, set())
+        self.assertIsNone(feed.drain())
+        self.board.handle_click(self.board.get_piece((0, 1)), True)
+        self.assertEqual(feed.drain(), {1})
+        self.board.handle_click(self.board.get_piece((0, 1)), True)
+        revealed = self.board.handle_click(self.board.get_piece((4, 4)),
+                                           False)
+        self.assertEqual(feed.drain(), {1} | {row * 5 + col
+                                              for row, col in revealed})
+        self.assertEqual(len(feed), 0)
+
+    def test_change_subscribers(self) -> None:
+        self.board.enable_journal()
+        seen: List[int] = []
+        other = self.board.track_changes()
+        self.board.subscribe(seen.extend)
+        self.board.get_piece((2, 3)).toggle_flag()
+        self.board.undo_to(0)
+        self.assertEqual(seen, [13, 13])
+        self.assertEqual(other.drain(), {13})
+        self.board.unsubscribe(seen.extend)
+        self.board.redo()
+        self.assertEqual(seen, [13, 13])
+        self.assertEqual(other.drain(), {13})
+        # Listeners other than feeds still get every index of a restore
+        self.board.subscribe(seen.extend)
+        self.board.restore(self.board.snapshot())
+        self.assertEqual(seen[2:], list(range(25)))
+        self.assertIsNone(other.drain())
+
     def test_print_board(self) -> None:
         with patch("sys.stdout", new=io.StringIO()) as fake_out:
             self.board.print_board()
@@ -61,6 +303,16 @@ class TestBoard(unittest.TestCase):
         size = self.board.get_size()
         self.assertEqual(size, (5, 5))
 
+    def test_state_arrays(self) -> None:
+        board = Board((3, 4), 1)
+        board.initialize_mines([(2, 3)])
+        board.handle_click(board.get_piece((0, 3)), True)
+        states, around = board.state_arrays()
+        self.assertEqual(states.shape, (3, 4))
+        for index in range(12):
+            self.assertEqual(states.flat[index], board.get_state_at(index))
+            self.assertEqual(around.flat[index], board.get_around_at(index))
+
     def test_handle_click_uncover_safe_full_area(self) -> None:
         self.board.handle_click(self.board.get_piece((0, 0)), False)
         self.assertTrue(self.board.get_piece((0, 0)).clicked)
@@ -118,9 +370,10 @@ class TestBoard(unittest.TestCase):
             for space in row:
                 space.get_flagged.return_value = False  # type: ignore
                 space.get_clicked.return_value = False  # type: ignore
-        with patch.object(board, 'handle_click') as mocked_handle_click:
+        with patch.object(board, 'reveal_many') as mocked_reveal_many:
             board.reveal_all_non_flagged_squares()
-            self.assertEqual(mocked_handle_click.call_count, 9)
+            mocked_reveal_many.assert_called_once()
+            self.assertEqual(len(mocked_reveal_many.call_args[0][0]), 9)
 
     def test_count_flags(self) -> None:
         board = Board(size=(3, 3), mine_count=1)
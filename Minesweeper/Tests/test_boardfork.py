@@ -0,0 +1,124 @@
+import unittest
+from hypothesis import given, strategies as st  # type: ignore
+from typing import List, Tuple, Type
+from arrayboard import ArrayBoard
+from board import Board
+from boardfork import BoardFork, ForkCell
+
+MINES: List[Tuple[int, int]] = [(0, 4), (2, 2), (4, 0)]
+
+
+def make_board(board_class: Type[Board]) -> Board:
+    board: Board = board_class((5, 5), len(MINES))
+    board.initialize_mines(MINES)
+    return board
+
+
+class TestBoardFork(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board: Board = make_board(Board)
+        self.fork: BoardFork = self.board.fork()
+
+    def test_starts_as_copy(self) -> None:
+        self.assertEqual(self.fork.get_size(), (5, 5))
+        self.assertEqual(self.fork.changed, {})
+        self.assertIsInstance(self.fork.get_piece((1, 1)), ForkCell)
+        self.assertTrue(self.fork.get_piece((2, 2)).get_has_bomb())
+        self.assertEqual(self.fork.get_piece((1, 1)).get_num_around(), 1)
+        self.assertEqual(self.fork.get_piece((-1, -1)),
+                         self.fork.get_piece((4, 4)))
+        with self.assertRaises(IndexError):
+            self.fork.get_piece((5, 0))
+
+    def test_changes_stay_in_fork(self) -> None:
+        self.fork.handle_click(self.fork.get_piece((0, 0)), False)
+        self.fork.handle_click(self.fork.get_piece((4, 4)), True)
+        self.assertTrue(self.fork.get_piece((0, 0)).get_clicked())
+        self.assertFalse(self.board.get_piece((0, 0)).get_clicked())
+        self.assertEqual(self.fork.count_flags(), 1)
+        self.assertEqual(self.board.count_flags(), 0)
+        self.assertEqual(self.board.scan_counts(), (22, 0, 0))
+
+    def test_only_touched_cells_stored(self) -> None:
+        revealed = self.fork.handle_click(self.fork.get_piece((0, 0)), False)
+        self.assertEqual(len(self.fork.changed), len(revealed))
+        self.assertEqual(set(self.fork.changed),
+                         {row * 5 + col for row, col in revealed})
+
+    @given(st.lists(st.tuples(st.integers(0, 4), st.integers(0, 4),
+                              st.booleans()), max_size=15),
+           st.sampled_from([Board, ArrayBoard]))  # type: ignore
+    def test_plays_like_parent(self, moves: List[Tuple[int, int, bool]],
+                               board_class: Type[Board]) -> None:
+        board: Board = make_board(board_class)
+        fork: BoardFork = make_board(board_class).fork()
+        fork.debug = True
+        for row, col, flag in moves:
+            self.assertEqual(
+                fork.handle_click(fork.get_piece((row, col)), flag),
+                board.handle_click(board.get_piece((row, col)), flag))
+        self.assertEqual(fork.scan_counts(), board.scan_counts())
+        self.assertEqual((fork.get_won(), fork.get_lost()),
+                         (board.get_won(), board.get_lost()))
+        self.assertEqual(fork.count_flags(), board.count_flags())
+
+    def test_fork_of_fork(self) -> None:
+        self.fork.handle_click(self.fork.get_piece((4, 4)), True)
+        child: BoardFork = self.fork.fork()
+        self.assertIs(child.base, self.board)
+        child.handle_click(child.get_piece((4, 4)), True)
+        self.assertFalse(child.get_piece((4, 4)).get_flagged())
+        self.assertTrue(self.fork.get_piece((4, 4)).get_flagged())
+
+    def test_base_changed(self) -> None:
+        self.board.handle_click(self.board.get_piece((4, 4)), True)
+        with self.assertRaises(RuntimeError):
+            self.fork.get_piece((1, 1)).get_clicked()
+        with self.assertRaises(RuntimeError):
+            self.fork.fork()
+
+    def test_snapshot_restore(self) -> None:
+        saved = self.fork.snapshot()
+        self.fork.handle_click(self.fork.get_piece((2, 2)), False)
+        self.assertTrue(self.fork.get_lost())
+        self.fork.restore(saved)
+        self.assertFalse(self.fork.get_lost())
+        self.assertEqual(self.fork.changed, {})
+        self.assertFalse(self.fork.get_piece((2, 2)).get_clicked())
+        # A snapshot of a board holds all its cells, not a fork's changes
+        with self.assertRaises(ValueError):
+            self.fork.restore(self.board.snapshot())
+
+    def test_undo_in_fork(self) -> None:
+        self.fork.enable_journal()
+        self.fork.handle_click(self.fork.get_piece((0, 0)), False)
+        self.fork.undo_to(0)
+        self.assertFalse(self.fork.get_piece((0, 0)).get_clicked())
+        self.assertEqual(self.fork.scan_counts(), self.board.scan_counts())
+
+    def test_changes_feed(self) -> None:
+        feed = self.fork.track_changes()
+        saved = self.fork.snapshot()
+        self.fork.handle_click(self.fork.get_piece((1, 1)), False)
+        self.assertEqual(feed.drain(), {6})
+        self.fork.restore(saved)
+        self.assertEqual(feed.drain(), {6})
+
+    def test_mine_layout_is_shared(self) -> None:
+        with self.assertRaises(TypeError):
+            self.fork.initialize_mines([(1, 1)])
+        with self.assertRaises(TypeError):
+            self.fork.get_piece((1, 1)).around = 3
+        with self.assertRaises(TypeError):
+            self.fork.get_piece((1, 1)).reset(True, 0)
+
+    def test_reveal_all(self) -> None:
+        self.fork.handle_click(self.fork.get_piece((4, 4)), True)
+        self.fork.reveal_all_non_flagged_squares()
+        self.assertTrue(self.fork.get_lost())
+        self.assertFalse(self.fork.get_piece((4, 4)).get_clicked())
+        self.assertEqual(len(self.fork.get_board()[0]), 5)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
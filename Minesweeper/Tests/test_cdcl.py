@@ -0,0 +1,127 @@
+import itertools
+import unittest
+from hypothesis import given, settings, strategies as st  # type: ignore
+from typing import List, Tuple
+from cdcl import CdclSolver
+
+
+def satisfied(model: List[bool], clause: List[int]) -> bool:
+    """ Whether a model (by variable) makes a clause true. """
+    return any(model[abs(literal)] == (literal > 0) for literal in clause)
+
+
+class TestCdclSolver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.solver = CdclSolver()
+
+    def test_empty_formula(self) -> None:
+        self.assertTrue(self.solver.solve())
+
+    def test_unit_clauses(self) -> None:
+        first, second = self.solver.new_var(), self.solver.new_var()
+        self.solver.add_clause([first])
+        self.solver.add_clause([-first, -second])
+        self.assertTrue(self.solver.solve())
+        self.assertTrue(self.solver.model[first])
+        self.assertFalse(self.solver.model[second])
+        self.assertFalse(self.solver.add_clause([second]))
+        self.assertFalse(self.solver.solve())
+
+    def test_assumptions_keep_formula(self) -> None:
+        first, second = self.solver.new_var(), self.solver.new_var()
+        self.solver.add_clause([first, second])
+        self.assertFalse(self.solver.solve([-first, -second]))
+        self.assertTrue(self.solver.solve([-first]))
+        self.assertTrue(self.solver.model[second])
+        self.assertTrue(self.solver.solve())
+
+    def test_pigeonhole(self) -> None:
+        # Five pigeons do not fit in four holes
+        holes = [[self.solver.new_var() for _ in range(4)]
+                 for _ in range(5)]
+        for pigeon in holes:
+            self.solver.add_clause(pigeon)
+        for hole in range(4):
+            self.solver.add_at_most([pigeon[hole] for pigeon in holes], 1)
+        self.assertFalse(self.solver.solve())
+        self.assertGreater(self.solver.conflicts, 0)
+
+    def test_conflict_limit(self) -> None:
+        holes = [[self.solver.new_var() for _ in range(6)]
+                 for _ in range(7)]
+        for pigeon in holes:
+            self.solver.add_clause(pigeon)
+        for hole in range(6):
+            self.solver.add_at_most([pigeon[hole] for pigeon in holes], 1)
+        self.assertIsNone(self.solver.solve_within([], 5))
+        self.assertTrue(self.solver.consistent)
+
+    def test_totalizer_counts(self) -> None:
+        literals = [self.solver.new_var() for _ in range(9)]
+        outputs = self.solver.add_totalizer(literals, 4)
+        self.assertEqual(len(outputs), 4)
+        for literal in literals[:3]:
+            self.solver.add_clause([literal])
+        for literal in literals[3:]:
+            self.solver.add_clause([-literal])
+        self.assertFalse(self.solver.solve([outputs[3]]))
+        self.assertFalse(self.solver.solve([-outputs[2]]))
+        self.assertTrue(self.solver.solve([outputs[2], -outputs[3]]))
+
+    def test_large_cardinality(self) -> None:
+        literals = [self.solver.new_var() for _ in range(100)]
+        self.solver.add_exactly(literals, 37)
+        self.assertTrue(self.solver.solve())
+        self.assertEqual(sum(self.solver.model[literal]
+                             for literal in literals), 37)
+        self.assertFalse(self.solver.solve(literals[:38]))
+
+    def test_guarded_constraint(self) -> None:
+        literals = [self.solver.new_var() for _ in range(20)]
+        guard = self.solver.new_var(False)
+        self.solver.add_at_most(literals, 3, guard)
+        self.assertTrue(self.solver.solve(literals[:10]))
+        self.assertFalse(self.solver.solve([guard] + literals[:4]))
+
+    @settings(deadline=None)  # type: ignore
+    @given(st.integers(1, 7), st.data())  # type: ignore
+    def test_matches_brute_force(self, count: int,
+                                 data: st.DataObject) -> None:
+        solver: CdclSolver = CdclSolver()
+        variables = [solver.new_var() for _ in range(count)]
+        literal = st.sampled_from(variables).flatmap(
+            lambda var: st.sampled_from([var, -var]))
+        clauses: List[List[int]] = data.draw(st.lists(
+            st.lists(literal, min_size=1, max_size=3), max_size=20))
+        bounds: List[Tuple[List[int], int, bool]] = data.draw(st.lists(
+            st.tuples(st.lists(literal, min_size=1, unique=True),
+                      st.integers(-1, count + 1), st.booleans()),
+            max_size=2))
+        for clause in clauses:
+            solver.add_clause(clause)
+        for literals, bound, most in bounds:
+            if most:
+                solver.add_at_most(literals, bound)
+            else:
+                solver.add_at_least(literals, bound)
+        assumptions: List[int] = data.draw(st.lists(literal, max_size=3))
+
+        def fits(model: List[bool]) -> bool:
+            counts = [sum(satisfied(model, [literal]) for literal in literals)
+                      for literals, _, _ in bounds]
+            return all(satisfied(model, clause) for clause in clauses) \
+                and all(satisfied(model, [literal])
+                        for literal in assumptions) \
+                and all(total <= bound if most else total >= bound
+                        for total, (_, bound, most) in zip(counts, bounds))
+
+        expected: bool = any(
+            fits([False] + list(values))
+            for values in itertools.product([False, True], repeat=count))
+        self.assertEqual(solver.solve(assumptions), expected)
+        if expected:
+            self.assertTrue(fits(solver.model[:count + 1]))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
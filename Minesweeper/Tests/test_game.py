@@ -1,21 +1,27 @@
 import unittest
 from unittest.mock import MagicMock, patch, call, ANY
-from game import Game
+from arrayboard import ArrayBoard
+from board import Board
+from game import MINIMAP_KEY, PAN_STEP, ZOOM_STEP, Game
 from playingstate import PlayingState
 from gameoverstate import GameOverState
 from initializingstate import InitializingState
-from pygame import QUIT, MOUSEBUTTONDOWN, KEYDOWN  # type: ignore
+from pygame import (QUIT, MOUSEBUTTONDOWN, MOUSEWHEEL, KEYDOWN,  # type: ignore
+                    K_LEFT, K_MINUS)
 
 
 class TestGame(unittest.TestCase):
     def setUp(self) -> None:
         self.game = Game((5, 5), 5)
+        # The real renderer, with 160-pixel pieces, for hit-testing
+        self.renderer = self.game.renderer
         self.mock_state = MagicMock(spec=PlayingState)
         self.game.state = self.mock_state
         self.game.solver = MagicMock()  # type: ignore
         self.game.renderer = MagicMock()
         self.game.renderer.piece_size = (160, 160)
         self.game.renderer.screen_size = (800, 100)
+        self.game.renderer.minimap = False
         self.game.board = MagicMock()
         self.game.board.get_lost.return_value = False
 
@@ -47,12 +53,14 @@ class TestGame(unittest.TestCase):
         self.assertEqual(self.game.state, new_state)
 
     def test_convert_pixel_to_grid(self) -> None:
+        self.game.renderer = self.renderer
         pixel_position = (450, 300)
         expected_grid_position = (1, 2)
         self.assertEqual(self.game.convert_pixel_to_grid(pixel_position),
                          expected_grid_position)
 
     def test_handle_click(self) -> None:
+        self.game.renderer = self.renderer
         position = (450, 300)
         flag = True
         self.game.handleClick(position, flag)
@@ -84,12 +92,83 @@ class TestGame(unittest.TestCase):
             self.game.run()
             self.game.solver.move.assert_called()  # type: ignore
 
+    def test_handle_click_off_board(self) -> None:
+        self.game.renderer = self.renderer
+        self.game.handleClick((450, 20), False)
+        self.game.board.handle_click.assert_not_called()  # type: ignore
+        self.assertIsNone(self.game.convert_pixel_to_grid((450, 20)))
+
+    def test_pan_and_zoom_keys(self) -> None:
+        events = [MagicMock(type=KEYDOWN, key=K_LEFT),
+                  MagicMock(type=KEYDOWN, key=K_MINUS)]
+        with patch("pygame.event.get", return_value=events):
+            self.game.run()
+        self.game.renderer.pan.assert_called_once_with(  # type: ignore
+            -PAN_STEP, 0)
+        self.game.renderer.zoom_by.assert_called_once_with(  # type: ignore
+            1 / ZOOM_STEP)
+        self.game.solver.move.assert_not_called()  # type: ignore
+
+    def test_mouse_wheel_zooms(self) -> None:
+        events = [MagicMock(type=MOUSEWHEEL, y=2),
+                  MagicMock(type=MOUSEBUTTONDOWN, button=4)]
+        with patch("pygame.event.get", return_value=events), \
+                patch("pygame.mouse.get_pos", return_value=(100, 100)):
+            self.game.run()
+        self.game.renderer.zoom_by.assert_called_once_with(  # type: ignore
+            ZOOM_STEP ** 2, (100, 100))
+        # The wheel's button event is not a click
+        self.mock_state.handle_click.assert_not_called()
+
+    def test_minimap_key_and_click(self) -> None:
+        self.game.renderer = self.renderer
+        events = [MagicMock(type=KEYDOWN, key=MINIMAP_KEY)]
+        # Left running, to draw the minimap between the runs
+        with patch("pygame.quit"):
+            with patch("pygame.event.get", return_value=events):
+                self.game.run()
+            self.assertTrue(self.renderer.minimap)
+            self.game.solver.move.assert_not_called()  # type: ignore
+            # A click on the minimap goes back to the tiles around it, not
+            # to the board
+            self.renderer.draw_board(Board((5, 5), 5))
+            with patch("pygame.event.get", return_value=[
+                    MagicMock(type=MOUSEBUTTONDOWN, button=1)]), \
+                    patch("pygame.mouse.get_pos", return_value=(400, 450)):
+                self.game.run()
+        self.assertFalse(self.renderer.minimap)
+        self.mock_state.handle_click.assert_not_called()
+
+    def test_large_board_scrolls(self) -> None:
+        game = Game((200, 300), 10)
+        self.assertEqual(game.renderer.piece_size, (8, 8))
+        self.assertEqual(game.renderer.view.size, (800, 800))
+
+    def test_large_board_uses_arrays(self) -> None:
+        self.assertNotIsInstance(Game((200, 300), 10).board, ArrayBoard)
+        mines = [(row, 0) for row in range(10)]
+        game = Game((400, 300), 10, mines)
+        self.assertIsInstance(game.board, ArrayBoard)
+        self.assertIsInstance(game.state, PlayingState)
+        self.assertTrue(game.board.get_piece((9, 0)).get_has_bomb())
+        game.board.handle_click(game.board.get_piece((0, 1)), False)
+        self.assertEqual(game.board.get_piece((0, 1)).get_num_around(), 2)
+
     def test_initialize_board(self) -> None:
         self.game.initialize_board()
         self.game.board.initialize_mines.assert_called_with(  # type: ignore
             self.game.mine_positions)
         self.assertTrue(self.game.board.initialized)
 
+    def test_start_from_layout(self) -> None:
+        game = Game((5, 5), 2, [(0, 0), (3, 4)])
+        self.assertIsInstance(game.state, PlayingState)
+        self.assertTrue(game.board.initialized)
+        self.assertTrue(game.board.get_piece((3, 4)).get_has_bomb())
+        self.assertIn((0, 0), game.mine_positions)
+        with self.assertRaises(ValueError):
+            Game((5, 5), 3, [(0, 0)])
+
     def test_win(self) -> None:
         with patch('pygame.mixer.Sound') as mock_sound:
             with patch('time.sleep', return_value=None):
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import patch
+from hypothesis import given, strategies as st  # type: ignore
+from typing import List
+import geometry as geometry_module
+from geometry import Geometry, get_geometry
+from board import Board
+
+
+def expected_neighbors(rows: int, cols: int, row: int, col: int
+                       ) -> List[int]:
+    return [r * cols + c for r in range(row - 1, row + 2)
+            for c in range(col - 1, col + 2)
+            if (r, c) != (row, col) and 0 <= r < rows and 0 <= c < cols]
+
+
+class TestGeometry(unittest.TestCase):
+    @given(st.integers(1, 12), st.integers(1, 12), st.data())  # type: ignore
+    def test_table_matches_bounds_check(self, rows: int, cols: int,
+                                        data: st.DataObject) -> None:
+        geometry = Geometry((rows, cols))
+        row = data.draw(st.integers(0, rows - 1))
+        col = data.draw(st.integers(0, cols - 1))
+        self.assertEqual(list(geometry.neighbors(row * cols + col)),
+                         expected_neighbors(rows, cols, row, col))
+
+    def test_csr_layout(self) -> None:
+        geometry = Geometry((3, 4))
+        # Built on the first lookup
+        self.assertFalse(geometry.has_table)
+        self.assertEqual(list(geometry.neighbors(0)), [1, 4, 5])
+        self.assertTrue(geometry.has_table)
+        self.assertEqual(geometry.indices.typecode, 'i')
+        self.assertEqual(len(geometry.indptr), 13)
+        self.assertEqual(geometry.indptr[-1], len(geometry.indices))
+        self.assertEqual(list(geometry.indptr_array()[:4]), [0, 3, 8, 13])
+        self.assertEqual(len(geometry.indices_array()), 3 * 4 * 8 - 2 * 3 * 3
+                         - 2 * 4 * 3 + 4 * 1)
+
+    def test_shared_between_boards(self) -> None:
+        self.assertIs(get_geometry((7, 9)), get_geometry((7, 9)))
+        self.assertIs(Board((7, 9), 1).geometry, Board((7, 9), 2).geometry)
+        self.assertIsNot(get_geometry((7, 9)), get_geometry((9, 7)))
+
+    def test_cache_bounded_by_cells(self) -> None:
+        with patch.object(geometry_module, 'CACHE_CELLS', 100), \
+                patch.dict(geometry_module.geometries, clear=True):
+            first = get_geometry((6, 6))
+            get_geometry((5, 5))
+            # Using the 6x6 geometry makes the 5x5 one the oldest
+            self.assertIs(get_geometry((6, 6)), first)
+            get_geometry((7, 7))
+            self.assertEqual(list(geometry_module.geometries),
+                             [(6, 6), (7, 7)])
+            # Sizes past the table limit never hold a table, so cost nothing
+            with patch.object(Geometry, 'TABLE_LIMIT', 10):
+                get_geometry((30, 30))
+            self.assertEqual(len(geometry_module.geometries), 3)
+            # One geometry over the bound is kept on its own
+            get_geometry((20, 20))
+            self.assertEqual(list(geometry_module.geometries), [(20, 20)])
+
+    def test_without_table(self) -> None:
+        with patch.object(Geometry, 'TABLE_LIMIT', 10):
+            geometry = Geometry((5, 5))
+        self.assertEqual(list(geometry.neighbors(0)), [1, 5, 6])
+        self.assertEqual(len(geometry.neighbors(12)), 8)
+        self.assertFalse(geometry.has_table)
+
+    @given(st.integers(-3, 8), st.integers(-3, 8))  # type: ignore
+    def test_neighbors_of_any_position(self, row: int, col: int) -> None:
+        geometry = get_geometry((5, 5))
+        self.assertEqual(list(geometry.neighbors_of(row, col)),
+                         expected_neighbors(5, 5, row, col))
+
+    def test_index_conversion(self) -> None:
+        geometry = get_geometry((4, 6))
+        self.assertEqual(geometry.index_of((2, 3)), 15)
+        self.assertEqual(geometry.position_of(15), (2, 3))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
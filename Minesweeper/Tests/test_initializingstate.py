@@ -23,6 +23,11 @@ class TestInitializingState(unittest.TestCase):
         self.state.handle_click(position)
         self.assertEqual(len(self.game.mine_positions), 1)
 
+    def test_handle_click_off_board(self) -> None:
+        self.game.convert_pixel_to_grid.return_value = None
+        self.state.handle_click((100, 10))
+        self.assertEqual(self.game.mine_positions, [])
+
     def test_state_transition_to_playing(self) -> None:
         self.game.expected_mine_count = 1
         position = (100, 100)
@@ -0,0 +1,83 @@
+import unittest
+from hypothesis import given, settings, strategies as st  # type: ignore
+from board import Board
+from linearsolver import LinearSolver
+from space import MINE
+from tanksolver import TankSolver
+from Tests.helpers import first_click_board, one_two_one
+
+
+class TestLinearSolver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.solver = LinearSolver()
+
+    def one_two_two_one(self) -> Board:
+        """ A 2x4 board showing 1 2 2 1 under four hidden cells. """
+        board: Board = Board((2, 4), 2)
+        board.initialize_mines([(0, 1), (0, 2)])
+        board.reveal_many([(1, 0), (1, 1), (1, 2), (1, 3)])
+        return board
+
+    def test_find_certain_one_two_one(self) -> None:
+        board: Board = one_two_one()
+        self.assertEqual(LinearSolver(board).find_certain(), ([1], [0, 2]))
+
+    def test_find_certain_one_two_two_one(self) -> None:
+        board: Board = self.one_two_two_one()
+        self.assertEqual(LinearSolver(board).find_certain(), ([0, 3], [1, 2]))
+
+    def test_find_certain_without_board(self) -> None:
+        with self.assertRaises(ValueError):
+            self.solver.find_certain()
+
+    def test_wrong_flags_prove_nothing(self) -> None:
+        board: Board = self.one_two_two_one()
+        board.flag_many([(0, 0), (0, 1)])
+        self.assertEqual(LinearSolver(board).find_certain(), ([], []))
+
+    def test_row_reduce(self) -> None:
+        reduced = self.solver.row_reduce([
+            ({0: 1, 1: 1}, 1), ({0: 1, 1: 1, 2: 1}, 2), ({1: 1, 2: 1}, 1)])
+        self.assertEqual(sorted((sorted(row.items()), total)
+                                for row, total in (reduced or [])),
+                         [([(0, 1)], 1), ([(1, 1)], 0), ([(2, 1)], 1)])
+        # x0 + x1 = 1 and x0 + x1 = 2 cannot both hold
+        self.assertIsNone(self.solver.row_reduce([
+            ({0: 1, 1: 1}, 1), ({0: 1, 1: 1}, 2)]))
+
+    def test_bound_deductions(self) -> None:
+        # x0 - x1 = 1 forces x0 = 1 and x1 = 0
+        self.assertEqual(self.solver.bound_deductions([({0: 1, 1: -1}, 1)]),
+                         {0: 1, 1: 0})
+        # 2 x0 + x1 + x2 = 2 proves nothing
+        self.assertEqual(self.solver.bound_deductions([
+            ({0: 2, 1: 1, 2: 1}, 2)]), {})
+        # 2 x0 + x1 = 1 leaves x0 no room (x1 follows on the next round)
+        self.assertEqual(self.solver.bound_deductions([({0: 2, 1: 1}, 1)]),
+                         {0: 0})
+        self.assertIsNone(self.solver.bound_deductions([({0: 1}, 2)]))
+
+    def test_deduce_with_mine_count(self) -> None:
+        # Both mines are on the pairs, so cell 4 is clear
+        self.assertEqual(self.solver.deduce([
+            ({0: 1, 1: 1}, 1), ({2: 1, 3: 1}, 1),
+            ({0: 1, 1: 1, 2: 1, 3: 1, 4: 1}, 2)]), ([4], []))
+
+    @settings(deadline=None)  # type: ignore
+    @given(st.integers(3, 8), st.integers(3, 8), st.data())  # type: ignore
+    def test_certain_cells_are_right(self, rows: int, cols: int,
+                                     data: st.DataObject) -> None:
+        board: Board = first_click_board(rows, cols, data)
+        safe, mines = LinearSolver(board).find_certain()
+        for index in safe:
+            self.assertFalse(board.get_state_at(index) & MINE)
+        for index in mines:
+            self.assertTrue(board.get_state_at(index) & MINE)
+        # Everything the linear system proves, the tank solver proves too
+        certain_safe, certain_mines = TankSolver(board).find_certain()
+        self.assertLessEqual(set(safe), set(certain_safe))
+        self.assertLessEqual(set(mines), set(certain_mines))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from hypothesis import given, strategies as st  # type: ignore
+from typing import Tuple
+import numpy as np
+from board import Board
+from geometry import get_geometry
+from minegen import MineGenerator, MinePositions
+
+
+class TestMineGenerator(unittest.TestCase):
+    def assert_valid(self, generator: MineGenerator, layout: np.ndarray
+                     ) -> None:
+        self.assertEqual(len(layout), generator.mine_count)
+        self.assertEqual(len(np.unique(layout)), generator.mine_count)
+        self.assertTrue(np.all(np.diff(layout) > 0))
+        self.assertTrue(np.all((layout >= 0)
+                               & (layout < generator.cell_count)))
+
+    def test_seeded(self) -> None:
+        first = MineGenerator((16, 30), 99, seed=7)
+        second = MineGenerator((16, 30), 99, seed=7)
+        for _ in range(3):
+            np.testing.assert_array_equal(first.uniform(), second.uniform())
+        self.assertFalse(np.array_equal(first.uniform(),
+                                        MineGenerator((16, 30), 99, 8)
+                                        .uniform()))
+
+    @given(st.integers(1, 8), st.integers(1, 8), st.data())  # type: ignore
+    def test_first_click_safe(self, rows: int, cols: int,
+                              data: st.DataObject) -> None:
+        count: int = data.draw(st.integers(0, rows * cols - 1))
+        first: Tuple[int, int] = (data.draw(st.integers(0, rows - 1)),
+                                  data.draw(st.integers(0, cols - 1)))
+        generator = MineGenerator((rows, cols), count, data.draw(
+            st.integers(0, 2 ** 32)))
+        layout = generator.first_click_safe(first)
+        self.assert_valid(generator, layout)
+        self.assertNotIn(first[0] * cols + first[1], layout.tolist())
+
+    @given(st.integers(3, 8), st.integers(3, 8), st.data())  # type: ignore
+    def test_first_click_opening(self, rows: int, cols: int,
+                                 data: st.DataObject) -> None:
+        first: Tuple[int, int] = (data.draw(st.integers(0, rows - 1)),
+                                  data.draw(st.integers(0, cols - 1)))
+        index: int = first[0] * cols + first[1]
+        clear = {index, *get_geometry((rows, cols)).neighbors(index)}
+        count: int = data.draw(st.integers(0, rows * cols - len(clear)))
+        generator = MineGenerator((rows, cols), count, data.draw(
+            st.integers(0, 2 ** 32)))
+        layout = generator.first_click_opening(first)
+        self.assert_valid(generator, layout)
+        self.assertFalse(clear & set(layout.tolist()))
+        board = Board((rows, cols), count)
+        board.initialize_mines(generator.positions(layout))
+        self.assertEqual(board.get_piece(first).get_num_around(), 0)
+
+    def test_too_many_mines(self) -> None:
+        with self.assertRaises(ValueError):
+            MineGenerator((3, 3), 10)
+        with self.assertRaises(ValueError):
+            MineGenerator((3, 3), 9).first_click_safe((1, 1))
+        with self.assertRaises(ValueError):
+            MineGenerator((3, 3), 1).first_click_opening((1, 1))
+        with self.assertRaises(IndexError):
+            MineGenerator((3, 3), 1).first_click_safe((3, 0))
+
+    def test_uniform_batch(self) -> None:
+        generator = MineGenerator((16, 30), 99, seed=1)
+        batch = generator.uniform_batch(200)
+        self.assertEqual(batch.shape, (200, 99))
+        for layout in batch:
+            self.assert_valid(generator, layout)
+        self.assertEqual(MineGenerator((2, 2), 0).uniform_batch(3).shape,
+                         (3, 0))
+
+    def test_uniform_is_spread_evenly(self) -> None:
+        generator = MineGenerator((4, 5), 5, seed=3)
+        hits = np.zeros(20)
+        for _ in range(4000):
+            hits[generator.first_click_safe((0, 0))] += 1
+        self.assertEqual(hits[0], 0)
+        # Every other cell expects 4000 * 5 / 19 ~ 1053 hits
+        self.assertTrue(np.all(np.abs(hits[1:] - 4000 * 5 / 19) < 150))
+
+    def test_positions_and_mask(self) -> None:
+        generator = MineGenerator((3, 4), 2)
+        layout = np.array([1, 11])
+        self.assertEqual(generator.positions(layout), [(0, 1), (2, 3)])
+        mask = generator.mask(layout)
+        self.assertEqual(mask.shape, (3, 4))
+        self.assertEqual(int(mask.sum()), 2)
+        self.assertTrue(mask[2, 3])
+
+
+class TestMinePositions(unittest.TestCase):
+    def test_lookup_follows_list(self) -> None:
+        positions = MinePositions([(0, 0)])
+        positions.append((1, 1))
+        positions += [(2, 2)]
+        positions.insert(0, (3, 3))
+        self.assertEqual(positions, [(3, 3), (0, 0), (1, 1), (2, 2)])
+        self.assertIn((2, 2), positions)
+        positions.remove((2, 2))
+        self.assertEqual(positions.pop(), (1, 1))
+        positions[0] = (4, 4)
+        del positions[1]
+        self.assertEqual(positions, [(4, 4)])
+        self.assertEqual(positions.lookup, {(4, 4)})
+        positions.clear()
+        self.assertNotIn((4, 4), positions)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
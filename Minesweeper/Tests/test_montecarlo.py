@@ -0,0 +1,137 @@
+import math
+import random
+import time
+import unittest
+from hypothesis import given, settings, strategies as st  # type: ignore
+from typing import List, Tuple
+import numpy as np
+from board import Board
+from minegen import MineGenerator
+from montecarlo import BATCHES, LayoutChain, SampledProbabilities, erfinv
+from probability import MineProbabilities
+from space import CLICKED, FLAGGED, MINE
+from Tests.helpers import one_two_one
+
+
+class TestSampledProbabilities(unittest.TestCase):
+    def opened(self, seed: int) -> Board:
+        """ A seeded 8x8 board with 12 mines, opened in the middle. """
+        generator = MineGenerator((8, 8), 12, seed)
+        board: Board = Board((8, 8), 12)
+        board.initialize_mines(generator.positions(
+            generator.first_click_opening((4, 4))))
+        board.handle_click(board.get_piece((4, 4)), False)
+        return board
+
+    def scattered(self, seed: int) -> Board:
+        """ An expert board with 30% of its numbers revealed at random. """
+        generator = MineGenerator((16, 30), 99, seed)
+        board: Board = Board((16, 30), 99)
+        board.initialize_mines(generator.positions(generator.uniform()))
+        numbered: List[int] = [
+            index for index in range(board.geometry.cell_count)
+            if not board.get_state_at(index) & MINE
+            and board.get_around_at(index) > 0]
+        board.reveal_many(board.geometry.position_of(index) for index in
+                          random.Random(seed).sample(
+                              numbered, len(numbered) * 3 // 10))
+        return board
+
+    def test_erfinv(self) -> None:
+        self.assertAlmostEqual(math.sqrt(2) * erfinv(0.95), 1.959964, 5)
+        self.assertAlmostEqual(erfinv(0.0), 0.0)
+
+    def test_exact_below_limit(self) -> None:
+        board: Board = self.opened(0)
+        engine = SampledProbabilities(board)
+        probabilities = engine.get_probabilities()
+        np.testing.assert_allclose(
+            probabilities, MineProbabilities(board).get_probabilities())
+        low, high = engine.get_intervals()
+        np.testing.assert_array_equal(low, probabilities)
+        np.testing.assert_array_equal(high, probabilities)
+        self.assertEqual(engine.sampled, 0)
+
+    def test_certain_cells_sampled_exactly(self) -> None:
+        engine = SampledProbabilities(one_two_one(), samples=40,
+                                      seed=1, frontier_limit=0)
+        probabilities = engine.get_probabilities()
+        np.testing.assert_array_equal(probabilities[:3], [1.0, 0.0, 1.0])
+        low, high = engine.get_intervals()
+        np.testing.assert_array_equal(low[:3], high[:3])
+        self.assertEqual(engine.sampled, 40)
+
+    def test_estimates_near_exact(self) -> None:
+        board: Board = self.opened(3)
+        exact = MineProbabilities(board).get_probabilities()
+        engine = SampledProbabilities(board, samples=800, seed=2,
+                                      frontier_limit=0)
+        probabilities = engine.get_probabilities()
+        low, high = engine.get_intervals()
+        self.assertLess(float(np.abs(probabilities - exact).max()), 0.12)
+        self.assertTrue(np.all(low <= probabilities)
+                        and np.all(probabilities <= high))
+        # Most cells' exact probability is inside the interval
+        inside = (low - 1e-9 <= exact) & (exact <= high + 1e-9)
+        self.assertGreater(float(inside.mean()), 0.8)
+
+    def test_time_budget(self) -> None:
+        engine = SampledProbabilities(self.opened(3), time_budget=0.05,
+                                      chains=2, seed=0, frontier_limit=0)
+        start: float = time.perf_counter()
+        engine.get_probabilities()
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertGreaterEqual(engine.sampled, BATCHES)
+
+    def test_slow_count_goes_to_sampling(self) -> None:
+        # 480 cells are under the frontier limit, but counting this
+        # position takes seconds
+        engine = SampledProbabilities(self.scattered(0), time_budget=0.1,
+                                      seed=0)
+        start: float = time.perf_counter()
+        engine.get_probabilities()
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertGreater(engine.sampled, 0)
+        self.assertIsNone(engine.tank.deadline)
+
+    def test_contradiction(self) -> None:
+        board: Board = one_two_one()
+        board.flag_many([(0, 0), (0, 1)])
+        with self.assertRaises(ValueError):
+            SampledProbabilities(board, frontier_limit=0).get_probabilities()
+
+    @settings(deadline=None, max_examples=30)  # type: ignore
+    @given(st.integers(0, 2 ** 32), st.integers(1, 30))  # type: ignore
+    def test_chain_keeps_numbers_met(self, seed: int, steps: int) -> None:
+        board: Board = self.opened(seed % 50)
+        engine = SampledProbabilities(board)
+        constraints = [constraint for constraint
+                       in engine.tank.find_constraints() if constraint[0]]
+        cells: List[int] = sorted({cell for group, _ in constraints
+                                   for cell in group})
+        if not cells:
+            return
+        local = {cell: slot for slot, cell in enumerate(cells)}
+        hidden: int = int(np.count_nonzero(
+            engine.state_array() & (CLICKED | FLAGGED) == 0))
+        chain = LayoutChain([([local[cell] for cell in group], need)
+                             for group, need in constraints],
+                            len(cells), hidden - len(cells),
+                            12 - board.count_flags(), random.Random(seed))
+        chain.block_cells = 1 + seed % 8
+        layout: bytearray = chain.starting_layouts(1)[0]
+        sums: List[int] = [sum(layout[cell] for cell in group)
+                           for group in chain.members]
+        total: int = sum(layout)
+        for _ in range(steps):
+            total = chain.step(layout, sums, total)
+        self.assertEqual(total, sum(layout))
+        checks: List[Tuple[int, int]] = [
+            (sum(layout[cell] for cell in group), need)
+            for group, need in zip(chain.members, chain.needs)]
+        for found, need in checks:
+            self.assertEqual(found, need)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
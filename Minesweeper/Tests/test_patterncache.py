@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+from hypothesis import given, settings, strategies as st  # type: ignore
+from typing import Set
+from board import Board
+from patterncache import (SYMMETRIES, CacheStats, PatternCache,
+                          PatternSolver, canonical)
+from tanksolver import TankSolver
+from Tests.helpers import first_click_board, one_two_one
+
+# 1 2 1 under three hidden cells, read around the 2
+ONE_TWO_ONE: str = "....." "....." ".###." ".121." "....."
+
+
+class TestPatternCache(unittest.TestCase):
+    def test_symmetries(self) -> None:
+        self.assertEqual(len(set(SYMMETRIES)), 8)
+        for order in SYMMETRIES:
+            self.assertEqual(sorted(order), list(range(25)))
+
+    @given(st.text(alphabet=".#0123", min_size=25, max_size=25),
+           st.integers(0, 7))  # type: ignore
+    def test_canonical_ignores_orientation(self, key: str,
+                                           turn: int) -> None:
+        turned: str = "".join(key[source] for source in SYMMETRIES[turn])
+        form, order = canonical(key)
+        self.assertEqual(canonical(turned)[0], form)
+        self.assertEqual("".join(key[source] for source in order), form)
+
+    def test_solve_window_one_two_one(self) -> None:
+        self.assertEqual(PatternCache().solve_window(ONE_TWO_ONE),
+                         ((12,), (11, 13)))
+
+    def test_solve_window_contradiction(self) -> None:
+        cache: PatternCache = PatternCache()
+        self.assertEqual(cache.solve_window(
+            "....." "....." ".#..." ".3..." "....."), ((), ()))
+        self.assertEqual(cache.solve_window(
+            "....." "....." ".#..." ".!..." "....."), ((), ()))
+
+    def test_lookup_counts_hits(self) -> None:
+        cache: PatternCache = PatternCache()
+        first = cache.lookup(ONE_TWO_ONE)
+        self.assertEqual(cache.lookup(ONE_TWO_ONE), first)
+        stats: CacheStats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+        self.assertGreaterEqual(stats.saved, 0.0)
+        self.assertEqual(CacheStats(0, 0, 0, 0, 0.0).hit_rate, 0.0)
+
+    def test_least_recently_used_evicted(self) -> None:
+        cache: PatternCache = PatternCache(2)
+        keys = [ONE_TWO_ONE.replace("1", str(need)) for need in range(3)]
+        cache.lookup(keys[0])
+        cache.lookup(keys[1])
+        cache.lookup(keys[0])
+        cache.lookup(keys[2])
+        self.assertEqual(list(cache.entries), [keys[0], keys[2]])
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_capacity_zero_keeps_nothing(self) -> None:
+        cache: PatternCache = PatternCache(0)
+        self.assertEqual(cache.lookup(ONE_TWO_ONE), ((12,), (11, 13)))
+        self.assertEqual(cache.lookup(ONE_TWO_ONE), ((12,), (11, 13)))
+        self.assertEqual(cache.stats().misses, 2)
+        self.assertEqual(cache.stats().size, 0)
+
+    def test_save_and_load(self) -> None:
+        cache: PatternCache = PatternCache()
+        cache.lookup(ONE_TWO_ONE)
+        with tempfile.TemporaryDirectory() as folder:
+            path: str = os.path.join(folder, "patterns.json")
+            cache.save(path)
+            warm: PatternCache = PatternCache()
+            self.assertEqual(warm.load(path), 1)
+        self.assertEqual(warm.lookup(ONE_TWO_ONE), ((12,), (11, 13)))
+        self.assertEqual((warm.stats().hits, warm.stats().misses), (1, 0))
+
+    def test_load_other_window_size(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            path: str = os.path.join(folder, "patterns.json")
+            with open(path, "w") as file:
+                file.write('{"side": 3, "patterns": []}')
+            with self.assertRaises(ValueError):
+                PatternCache().load(path)
+
+    def test_solver_one_two_one(self) -> None:
+        solver: PatternSolver = PatternSolver(one_two_one())
+        self.assertEqual(solver.find_certain(), ([1], [0, 2]))
+
+    def test_solver_only_looks_at_changed_windows(self) -> None:
+        board: Board = one_two_one()
+        solver: PatternSolver = PatternSolver(board)
+        solver.find_certain()
+        self.assertEqual(solver.find_certain(), ([], []))
+        board.flag_many([(0, 0)])
+        self.assertEqual(solver.find_certain(), ([1], [2]))
+
+    def test_solver_shares_orientations(self) -> None:
+        cache: PatternCache = PatternCache()
+        PatternSolver(one_two_one(), cache).find_certain()
+        solved: int = cache.stats().misses
+        hits: int = cache.stats().hits
+        # The same position turned a quarter: 1 2 1 down the middle column
+        board: Board = Board((3, 3), 2)
+        board.initialize_mines([(0, 0), (2, 0)])
+        board.handle_click(board.get_piece((1, 2)), False)
+        self.assertEqual(PatternSolver(board, cache).find_certain(),
+                         ([3], [0, 6]))
+        self.assertEqual(cache.stats().misses, solved)
+        # One window per number, all seen before
+        self.assertEqual(cache.stats().hits, hits + 3)
+
+    @settings(deadline=None)  # type: ignore
+    @given(st.integers(3, 10), st.integers(3, 10), st.data())  # type: ignore
+    def test_solver_within_tank(self, rows: int, cols: int,
+                                data: st.DataObject) -> None:
+        board: Board = first_click_board(rows, cols, data)
+        safe, mines = PatternSolver(board).find_certain()
+        tank_safe, tank_mines = TankSolver(board).find_certain()
+        found: Set[int] = set(safe)
+        self.assertLessEqual(found, set(tank_safe))
+        self.assertLessEqual(set(mines), set(tank_mines))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,96 @@
+import itertools
+import math
+import unittest
+from hypothesis import given, strategies as st, settings  # type: ignore
+from typing import Dict, List, Tuple
+import numpy as np
+from board import Board
+from minegen import MineGenerator
+from probability import MineProbabilities, log_binomial
+from space import CLICKED, FLAGGED
+from tanksolver import TankSolver
+from Tests.helpers import one_two_one
+
+
+def enumerate_layouts(board: Board) -> Dict[int, float]:
+    """ Mine probability of every hidden cell by trying every layout. """
+    hidden: List[int] = [
+        index for index in range(board.geometry.cell_count)
+        if not board.get_state_at(index) & (CLICKED | FLAGGED)]
+    constraints = TankSolver(board).find_constraints()
+    hits: Dict[int, int] = dict.fromkeys(hidden, 0)
+    layouts: int = 0
+    for mines in itertools.combinations(
+            hidden, board.get_total_mine_count() - board.count_flags()):
+        chosen = set(mines)
+        if all(sum(cell in chosen for cell in cells) == need
+               for cells, need in constraints):
+            layouts += 1
+            for mine in mines:
+                hits[mine] += 1
+    return {index: count / layouts for index, count in hits.items()}
+
+
+class TestMineProbabilities(unittest.TestCase):
+    @given(st.integers(0, 60), st.data())  # type: ignore
+    def test_log_binomial(self, n: int, data: st.DataObject) -> None:
+        k: int = data.draw(st.integers(0, n))
+        self.assertAlmostEqual(log_binomial(n, k), math.log(math.comb(n, k)))
+
+    def test_nothing_revealed(self) -> None:
+        board: Board = Board((4, 5), 6)
+        board.initialize_mines([(0, i) for i in range(5)] + [(3, 3)])
+        probabilities = MineProbabilities(board).get_probabilities()
+        np.testing.assert_allclose(probabilities, np.full(20, 6 / 20))
+
+    def test_one_two_one(self) -> None:
+        board: Board = one_two_one()
+        engine = MineProbabilities(board)
+        np.testing.assert_allclose(engine.get_probabilities(),
+                                   [1, 0, 1, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(engine.probability_at((0, 0)), 1.0)
+        self.assertEqual(engine.safest_cells(), [(0, 1)])
+
+    def test_flags_and_cache(self) -> None:
+        board: Board = one_two_one()
+        engine = MineProbabilities(board)
+        first = engine.get_probabilities()
+        self.assertIs(engine.get_probabilities(), first)
+        board.handle_click(board.get_piece((0, 0)), True)
+        second = engine.get_probabilities()
+        self.assertIsNot(second, first)
+        np.testing.assert_allclose(second, first)
+        board.handle_click(board.get_piece((0, 1)), False)
+        self.assertEqual(engine.safest_cells(), [(0, 2)])
+        board.handle_click(board.get_piece((0, 2)), True)
+        self.assertEqual(engine.safest_cells(), [])
+
+    def test_contradiction(self) -> None:
+        board: Board = one_two_one()
+        board.flag_many([(0, 0), (0, 1)])
+        with self.assertRaises(ValueError):
+            MineProbabilities(board).get_probabilities()
+
+    @settings(deadline=None)  # type: ignore
+    @given(st.integers(2, 4), st.integers(2, 5), st.data())  # type: ignore
+    def test_matches_enumeration(self, rows: int, cols: int,
+                                 data: st.DataObject) -> None:
+        count: int = data.draw(st.integers(1, rows * cols - 1))
+        generator = MineGenerator((rows, cols), count,
+                                  data.draw(st.integers(0, 2 ** 32)))
+        board: Board = Board((rows, cols), count)
+        board.initialize_mines(generator.positions(
+            generator.first_click_safe((0, 0))))
+        clicks: List[Tuple[int, int]] = data.draw(st.lists(st.tuples(
+            st.integers(0, rows - 1), st.integers(0, cols - 1)),
+            max_size=3))
+        board.reveal_many([(0, 0)] + [
+            click for click in clicks
+            if not board.get_piece(click).get_has_bomb()])
+        probabilities = MineProbabilities(board).get_probabilities()
+        for index, expected in enumerate_layouts(board).items():
+            self.assertAlmostEqual(probabilities[index], expected)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
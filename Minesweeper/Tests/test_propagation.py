@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import patch
+from hypothesis import given, strategies as st  # type: ignore
+from typing import Set, Tuple
+from board import Board
+from minegen import MineGenerator
+from propagation import Propagator
+from space import CLICKED, FLAGGED
+from Tests.helpers import one_two_one
+
+
+def sweep_to_fixed_point(board: Board) -> None:
+    """ Apply the single-number rules with full-board sweeps. """
+    while not board.get_lost() and not board.get_won():
+        propagator: Propagator = Propagator(board)
+        safe, mines = propagator.deduce({
+            index for index in range(board.geometry.cell_count)
+            if board.get_state_at(index) & CLICKED})
+        room: int = board.get_total_mine_count() - board.count_flags()
+        flagged = board.flag_many(board.geometry.position_of(index)
+                                  for index in sorted(mines)[:room])
+        revealed = board.reveal_many(board.geometry.position_of(index)
+                                     for index in sorted(safe))
+        board.unsubscribe(propagator.changes)
+        if not flagged and not revealed:
+            break
+
+
+def opened_board(rows: int, cols: int, count: int, seed: int) -> Board:
+    """ A seeded board opened with a safe first click in the middle. """
+    generator = MineGenerator((rows, cols), count, seed)
+    first: Tuple[int, int] = (rows // 2, cols // 2)
+    board: Board = Board((rows, cols), count)
+    board.initialize_mines(generator.positions(
+        generator.first_click_opening(first)))
+    board.handle_click(board.get_piece(first), False)
+    return board
+
+
+class TestPropagator(unittest.TestCase):
+    def test_deduce(self) -> None:
+        # 1 2 1 under three hidden cells, with the left mine flagged
+        board: Board = one_two_one()
+        propagator: Propagator = Propagator(board)
+        self.assertEqual(propagator.deduce({3, 4, 5}), (set(), set()))
+        board.handle_click(board.get_piece((0, 0)), True)
+        self.assertEqual(propagator.deduce({3, 4, 5}), ({1}, set()))
+        board.handle_click(board.get_piece((0, 1)), False)
+        self.assertEqual(propagator.deduce({1}), (set(), {2}))
+
+    def test_run_one_two_one_after_a_flag(self) -> None:
+        board: Board = one_two_one()
+        board.handle_click(board.get_piece((0, 0)), True)
+        revealed, flagged = Propagator(board).run()
+        # Every safe cell is open, so the game is won before the last flag
+        self.assertEqual((revealed, flagged), ([(0, 1)], []))
+        self.assertTrue(board.get_won())
+
+    def test_only_changed_neighborhoods_are_examined(self) -> None:
+        board: Board = opened_board(16, 30, 99, 3)
+        propagator: Propagator = Propagator(board)
+        propagator.run()
+        hidden = [index for index in range(board.geometry.cell_count)
+                  if not board.get_state_at(index) & (CLICKED | FLAGGED)]
+        examined: Set[int] = set()
+
+        def deduce(cells: Set[int]) -> Tuple[Set[int], Set[int]]:
+            examined.update(cells)
+            return set(), set()
+        with patch.object(propagator, 'deduce', side_effect=deduce):
+            board.handle_click(board.get_piece(
+                board.geometry.position_of(hidden[0])), True)
+            propagator.run()
+        self.assertEqual(examined, {
+            neighbor for neighbor in board.geometry.neighbors(hidden[0])
+            if board.get_state_at(neighbor) & CLICKED})
+
+    def test_flags_capped_at_mine_count(self) -> None:
+        # The board claims fewer mines than the numbers prove
+        board: Board = Board((3, 3), 1)
+        board.initialize_mines([(0, 0), (0, 2)])
+        board.handle_click(board.get_piece((2, 1)), False)
+        board.handle_click(board.get_piece((0, 0)), True)
+        revealed, flagged = Propagator(board).run()
+        self.assertEqual(flagged, [])
+        self.assertEqual(board.count_flags(), 1)
+
+    @given(st.integers(5, 20), st.integers(5, 20), st.integers(0, 2 ** 32),
+           st.floats(0.05, 0.25))  # type: ignore
+    def test_matches_full_sweeps(self, rows: int, cols: int, seed: int,
+                                 density: float) -> None:
+        count: int = int(rows * cols * density)
+        expected: Board = opened_board(rows, cols, count, seed)
+        sweep_to_fixed_point(expected)
+        board: Board = opened_board(rows, cols, count, seed)
+        Propagator(board).run()
+        self.assertEqual(
+            [board.get_state_at(index)
+             for index in range(board.geometry.cell_count)],
+            [expected.get_state_at(index)
+             for index in range(board.geometry.cell_count)])
+        self.assertFalse(board.get_lost())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -4,8 +4,11 @@ from unittest.mock import Mock
 from hypothesis import given, strategies as st, settings  # type: ignore
 import pygame  # type: ignore
 from pygame import Surface
-from typing import List, Any
-from renderer import Renderer
+from typing import List, Any, Tuple
+from board import Board, ChangeFeed
+from renderer import (BOARD_VIEW, FLAG_CODE, HEADER_COLOR, HEADER_HEIGHT,
+                      HIDDEN_CODE, MINIMAP_COLORS, SHOWN_MINE_CODE,
+                      SMILEY_SIZE, TILE_SIZE_RANGE, Renderer)
 
 
 class TestRenderer(unittest.TestCase):
@@ -40,6 +43,18 @@ class TestRenderer(unittest.TestCase):
             def get_total_mine_count(self) -> int:
                 return len(mine_positions)
 
+            def track_changes(self) -> ChangeFeed:
+                return ChangeFeed()
+
+            def get_size(self) -> Tuple[int, int]:
+                return 10, 10
+
+            def get_state_at(self, index: int) -> int:
+                return 0
+
+            def get_around_at(self, index: int) -> int:
+                return 0
+
         class MockPiece:  # pragma: no cover
             def get_clicked(self) -> bool:
                 return False
@@ -83,6 +98,313 @@ class TestRenderer(unittest.TestCase):
         piece.get_flagged.return_value = False
         self.assertEqual(self.renderer.get_image_key(piece), 'empty-block')
 
+    def drawn_board(self) -> Board:
+        """ A 10x10 board with mines in the top row, drawn and shown. """
+        board: Board = Board((10, 10), 3)
+        board.initialize_mines([(0, 0), (0, 4), (0, 9)])
+        self.renderer.draw_board(board)
+        self.renderer.update_display()
+        return board
+
+    def test_draw_board_redraws_changed_cells(self) -> None:
+        board: Board = self.drawn_board()
+        board.handle_click(board.get_piece((5, 5)), True)
+        board.handle_click(board.get_piece((1, 1)), False)
+        with mock.patch.object(self.renderer, 'image_key_at',
+                               wraps=self.renderer.image_key_at) as drawn, \
+                mock.patch('pygame.display.update') as mock_update, \
+                mock.patch('pygame.display.flip') as mock_flip:
+            self.renderer.draw_board(board, flags_placed=1)
+            self.renderer.update_display()
+        self.assertEqual(drawn.call_count, 2)
+        mock_flip.assert_not_called()
+        rects = mock_update.call_args[0][0]
+        self.assertIn(pygame.Rect(5 * 32, HEADER_HEIGHT + 5 * 32, 32, 32),
+                      rects)
+        self.assertIn(pygame.Rect(32, HEADER_HEIGHT + 32, 32, 32), rects)
+        # The flag count changed the header
+        self.assertIn(pygame.Rect(0, 0, self.renderer.screen_size[0],
+                                  HEADER_HEIGHT), rects)
+
+    def test_draw_board_unchanged_draws_nothing(self) -> None:
+        board: Board = self.drawn_board()
+        with mock.patch.object(self.renderer, 'image_key_at',
+                               wraps=self.renderer.image_key_at) as drawn, \
+                mock.patch.object(self.renderer, 'draw_header') as header, \
+                mock.patch('pygame.display.update') as mock_update, \
+                mock.patch('pygame.display.flip') as mock_flip:
+            self.renderer.draw_board(board)
+            self.renderer.update_display()
+        drawn.assert_not_called()
+        header.assert_not_called()
+        mock_update.assert_not_called()
+        mock_flip.assert_not_called()
+
+    def test_draw_board_shows_mine_positions(self) -> None:
+        board: Board = Board((10, 10), 2)
+        self.renderer.draw_board(board, [(2, 3)])
+        self.renderer.update_display()
+        with mock.patch.object(self.renderer, 'screen') as mock_screen, \
+                mock.patch('pygame.display.update') as mock_update:
+            self.renderer.draw_board(board, [(2, 3), (4, 4), (20, 20)])
+            self.renderer.update_display()
+        mock_screen.blits.assert_called_once_with(
+            [(self.renderer.atlas.surface, (4 * 32, HEADER_HEIGHT + 4 * 32),
+              self.renderer.atlas.rects['unclicked-bomb'])], False)
+        self.assertEqual(len(mock_update.call_args[0][0]), 1)
+
+    def test_draw_board_full_after_clear(self) -> None:
+        board: Board = self.drawn_board()
+        self.renderer.clear_screen()
+        with mock.patch.object(self.renderer, 'image_key_at',
+                               wraps=self.renderer.image_key_at) as drawn, \
+                mock.patch('pygame.display.flip') as mock_flip:
+            self.renderer.draw_board(board)
+            self.renderer.update_display()
+        self.assertEqual(drawn.call_count, 100)
+        mock_flip.assert_called_once()
+
+    def test_draw_board_follows_new_board(self) -> None:
+        board: Board = self.drawn_board()
+        other: Board = Board((10, 10), 3)
+        other.initialize_mines([(9, 0), (9, 4), (9, 9)])
+        self.renderer.draw_board(other)
+        self.assertEqual(board.listeners, [])
+        self.assertEqual(len(other.listeners), 1)
+        # Cells changed on the new board are drawn
+        other.handle_click(other.get_piece((0, 0)), True)
+        with mock.patch.object(self.renderer, 'image_key_at',
+                               wraps=self.renderer.image_key_at) as drawn:
+            self.renderer.draw_board(other)
+        self.assertEqual(drawn.call_count, 1)
+
+    def test_load_header_assets(self) -> None:
+        assets = self.renderer.load_header_assets()
+        self.assertEqual(assets['smiley'].get_size(), SMILEY_SIZE)
+
+    def test_render_text_cached(self) -> None:
+        with mock.patch.object(self.renderer, 'font') as mock_font:
+            first = self.renderer.render_text('10', (0, 0, 0))
+            self.assertIs(self.renderer.render_text('10', (0, 0, 0)), first)
+            self.renderer.render_text('10', (255, 0, 0))
+            self.renderer.render_text('9', (0, 0, 0))
+        self.assertEqual(mock_font.render.call_count, 3)
+
+    def test_draw_header_composes_on_change(self) -> None:
+        with mock.patch.object(self.renderer, 'compose_header',
+                               wraps=self.renderer.compose_header
+                               ) as mock_compose, \
+                mock.patch('pygame.image.load') as mock_load:
+            self.renderer.draw_header(10, 0)
+            self.renderer.draw_header(10, 0)
+            self.assertEqual(mock_compose.call_count, 1)
+            self.renderer.draw_header(10, 1)
+            self.assertEqual(mock_compose.call_count, 2)
+            mock_compose.assert_called_with('9')
+        mock_load.assert_not_called()
+        self.assertEqual(self.renderer.screen.get_at((1, 1))[:3],
+                         HEADER_COLOR)
+
+    def large_board(self) -> Board:
+        """ A 100x100 board drawn through the 10x10-tile view. """
+        board: Board = Board((100, 100), 1)
+        board.initialize_mines([(99, 99)])
+        self.renderer.draw_board(board)
+        self.renderer.update_display()
+        return board
+
+    def test_screen_size_capped(self) -> None:
+        renderer = Renderer((1000, 1000), (8, 8))
+        self.assertEqual(renderer.screen_size,
+                         (BOARD_VIEW[0], BOARD_VIEW[1] + 100))
+        self.assertEqual(renderer.view.size, BOARD_VIEW)
+
+    def test_draw_board_culls_to_view(self) -> None:
+        board: Board = self.large_board()
+        self.renderer.pan(32 * 40 + 16, 32 * 50)
+        self.assertEqual(self.renderer.camera, (32 * 40 + 16, 32 * 50))
+        self.assertEqual(self.renderer.visible_range(), (50, 60, 40, 51))
+        with mock.patch.object(self.renderer, 'image_key_at',
+                               wraps=self.renderer.image_key_at) as drawn:
+            self.renderer.draw_board(board)
+        self.assertEqual(drawn.call_count, 10 * 11)
+        drawn.assert_any_call(board, 50 * 100 + 40)
+        # Changes out of view are not drawn
+        board.handle_click(board.get_piece((0, 0)), True)
+        board.handle_click(board.get_piece((55, 45)), True)
+        self.renderer.update_display()
+        with mock.patch.object(self.renderer, 'image_key_at',
+                               wraps=self.renderer.image_key_at) as drawn, \
+                mock.patch('pygame.display.update') as mock_update:
+            self.renderer.draw_board(board)
+            self.renderer.update_display()
+        drawn.assert_called_once_with(board, 55 * 100 + 45)
+        self.assertIn(pygame.Rect(5 * 32 - 16, HEADER_HEIGHT + 5 * 32, 32,
+                                  32), mock_update.call_args[0][0])
+
+    def test_edge_tiles_clipped_to_view(self) -> None:
+        board: Board = self.large_board()
+        self.renderer.pan(16, 16)
+        self.renderer.draw_board(board)
+        board.handle_click(board.get_piece((0, 0)), True)
+        self.renderer.update_display()
+        with mock.patch('pygame.display.update') as mock_update:
+            self.renderer.draw_board(board)
+            self.renderer.update_display()
+        self.assertEqual(mock_update.call_args[0][0],
+                         [pygame.Rect(0, HEADER_HEIGHT, 16, 16)])
+        # The header above the view is left alone
+        self.assertEqual(
+            self.renderer.screen.get_at((1, HEADER_HEIGHT - 1))[:3],
+            HEADER_COLOR)
+
+    def test_camera_clamped(self) -> None:
+        self.large_board()
+        self.renderer.pan(-50, -50)
+        self.assertEqual(self.renderer.camera, (0, 0))
+        self.renderer.pan(10 ** 6, 10 ** 6)
+        self.assertEqual(self.renderer.camera, (32 * 90, 32 * 90))
+        self.assertEqual(self.renderer.visible_range(), (90, 100, 90, 100))
+
+    def test_screen_to_cell(self) -> None:
+        self.large_board()
+        self.assertEqual(self.renderer.screen_to_cell((70, HEADER_HEIGHT)),
+                         (0, 2))
+        self.assertIsNone(self.renderer.screen_to_cell((70, 10)))
+        self.renderer.pan(100, 64)
+        self.assertEqual(self.renderer.screen_to_cell((0, HEADER_HEIGHT)),
+                         (2, 3))
+        small = Board((5, 5), 1)
+        self.renderer.draw_board(small)
+        # Inside the view, past the board
+        self.assertIsNone(self.renderer.screen_to_cell(
+            (6 * 32, HEADER_HEIGHT + 10)))
+
+    def test_zoom_keeps_anchor(self) -> None:
+        self.large_board()
+        self.renderer.pan(320, 320)
+        anchor = (100, HEADER_HEIGHT + 200)
+        before = self.renderer.screen_to_cell(anchor)
+        self.renderer.zoom_by(2.0, anchor)
+        self.assertEqual(self.renderer.tile_size, (64, 64))
+        self.assertEqual(self.renderer.atlas.tile_size, (64, 64))
+        self.assertEqual(self.renderer.screen_to_cell(anchor), before)
+        self.renderer.zoom_by(0.5, anchor)
+        self.assertEqual(self.renderer.tile_size, (32, 32))
+        self.assertEqual(self.renderer.screen_to_cell(anchor), before)
+
+    def test_zoom_limits(self) -> None:
+        self.large_board()
+        self.renderer.zoom_by(1000.0)
+        self.assertEqual(self.renderer.tile_size[0], TILE_SIZE_RANGE[1])
+        self.renderer.zoom_by(0.0001)
+        self.assertEqual(self.renderer.tile_size[0], TILE_SIZE_RANGE[0])
+        self.assertEqual(self.renderer.visible_range(), (0, 80, 0, 80))
+
+    def test_minimap(self) -> None:
+        board: Board = self.large_board()
+        board.handle_click(board.get_piece((0, 0)), True)
+        board.handle_click(board.get_piece((50, 50)), False)
+        self.renderer.toggle_minimap()
+        self.renderer.draw_board(board, [(99, 99)])
+        overview = self.renderer.overview
+        assert overview is not None
+        # The whole board fills the view, 3.2 pixels per cell
+        self.assertEqual(overview.get_size(), (320, 320))
+        self.assertEqual(overview.get_at((0, 0))[:3],
+                         MINIMAP_COLORS[FLAG_CODE])
+        self.assertEqual(overview.get_at((160, 160))[:3], MINIMAP_COLORS[0])
+        self.assertEqual(overview.get_at((314, 314))[:3], MINIMAP_COLORS[1])
+        self.assertEqual(overview.get_at((319, 319))[:3],
+                         MINIMAP_COLORS[SHOWN_MINE_CODE])
+        self.assertEqual(self.renderer.overview_rect, self.renderer.view)
+        self.assertEqual(self.renderer.screen.get_at(
+            (160, HEADER_HEIGHT + 160))[:3], MINIMAP_COLORS[0])
+        self.assertIsNone(self.renderer.screen_to_cell((160, 160)))
+
+    def test_minimap_updates_changed_cells(self) -> None:
+        board: Board = Board((100, 100), 1)
+        board.initialize_mines([(99, 99)])
+        self.renderer.toggle_minimap()
+        self.renderer.draw_board(board)
+        self.renderer.update_display()
+        overview = self.renderer.overview
+        assert overview is not None
+        # Cell (10, 20) covers pixels 64-67 across and 32-35 down
+        self.assertEqual(overview.get_at((64, 32))[:3],
+                         MINIMAP_COLORS[HIDDEN_CODE])
+        board.handle_click(board.get_piece((10, 20)), True)
+        with mock.patch('pygame.surfarray.blit_array') as mock_blit, \
+                mock.patch('pygame.transform.scale') as mock_scale, \
+                mock.patch('pygame.display.update') as mock_update:
+            self.renderer.draw_board(board)
+            self.renderer.update_display()
+        mock_blit.assert_not_called()
+        mock_scale.assert_not_called()
+        self.assertIs(self.renderer.overview, overview)
+        for pixel in [(64, 32), (67, 35)]:
+            self.assertEqual(overview.get_at(pixel)[:3],
+                             MINIMAP_COLORS[FLAG_CODE])
+        self.assertEqual(overview.get_at((68, 32))[:3],
+                         MINIMAP_COLORS[HIDDEN_CODE])
+        # Only the cell and the outline's edges go to the display
+        self.assertIn(pygame.Rect(64, HEADER_HEIGHT + 32, 4, 4),
+                      mock_update.call_args[0][0])
+        self.assertNotIn(self.renderer.overview_rect,
+                         mock_update.call_args[0][0])
+        # Nothing changed, nothing drawn
+        with mock.patch('pygame.display.update') as mock_update:
+            self.renderer.draw_board(board)
+            self.renderer.update_display()
+        mock_update.assert_not_called()
+        # Back to the tiles
+        self.renderer.toggle_minimap()
+        self.renderer.draw_board(board)
+        self.assertEqual(self.renderer.screen_to_cell((0, HEADER_HEIGHT)),
+                         (0, 0))
+
+    def test_minimap_updates_match_full_draw(self) -> None:
+        # Scaled up (3.2 pixels per cell) and down (0.32)
+        for side in (100, 1000):
+            renderer = Renderer((side, side), (8, 8))
+            renderer.view = pygame.Rect(0, HEADER_HEIGHT, 320, 320)
+            board: Board = Board((side, side), 2)
+            board.initialize_mines([(0, 0), (side - 1, 3)])
+            renderer.toggle_minimap()
+            renderer.draw_board(board)
+            mines: List[Tuple[int, int]] = []
+            for row, col in [(1, 1), (side - 1, side - 1), (5, 7), (6, 7),
+                             (7, 7), (side // 2, 3)]:
+                board.handle_click(board.get_piece((row, col)), row == 5)
+                mines = [(0, 0)] if row == 6 else []
+                renderer.draw_board(board, mines)
+            overview = renderer.overview
+            assert overview is not None
+            drawn = pygame.surfarray.array2d(overview)
+            renderer.clear_screen()
+            renderer.draw_board(board, mines)
+            assert renderer.overview is not None
+            self.assertIsNot(renderer.overview, overview)
+            self.assertTrue((pygame.surfarray.array2d(renderer.overview)
+                             == drawn).all())
+
+    def test_minimap_cell(self) -> None:
+        board: Board = Board((50, 100), 1)
+        self.assertIsNone(self.renderer.minimap_cell((0, HEADER_HEIGHT)))
+        self.renderer.toggle_minimap()
+        self.renderer.draw_board(board)
+        # A board twice as wide as tall sits in the middle of the view
+        self.assertEqual(self.renderer.overview_rect,
+                         pygame.Rect(0, HEADER_HEIGHT + 80, 320, 160))
+        self.assertIsNone(self.renderer.minimap_cell((0, HEADER_HEIGHT)))
+        self.assertEqual(
+            self.renderer.minimap_cell((319, HEADER_HEIGHT + 80)), (0, 99))
+        self.assertEqual(
+            self.renderer.minimap_cell((160, HEADER_HEIGHT + 160)), (25, 50))
+        self.renderer.center_on((25, 50))
+        self.assertEqual(self.renderer.camera, (32 * 50 + 16 - 160,
+                                                32 * 25 + 16 - 160))
+
     @mock.patch('pygame.display.flip')
     def test_update_display(self, mock_flip: Mock) -> None:
         self.renderer.update_display()
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import patch
+from hypothesis import given, settings, strategies as st  # type: ignore
+from typing import Tuple
+from board import Board
+from satsolver import SatSolver
+from solverstrategy import SolverStrategy
+from tanksolver import TankSolver
+from Tests.helpers import first_click_board, one_two_one
+
+
+class TestSatSolver(unittest.TestCase):
+    def test_is_solver_strategy(self) -> None:
+        self.assertIsInstance(SatSolver(), SolverStrategy)
+
+    def test_find_certain_one_two_one(self) -> None:
+        self.assertEqual(SatSolver(one_two_one()).find_certain(),
+                         ([1], [0, 2]))
+
+    def test_solve_wins(self) -> None:
+        board: Board = one_two_one()
+        solver: SatSolver = SatSolver(board)
+        solver.solve()
+        self.assertTrue(board.get_won())
+        self.assertEqual(solver.flags_placed, 2)
+
+    def test_wrong_flags_prove_nothing(self) -> None:
+        board: Board = one_two_one()
+        board.flag_many([(0, 0), (0, 1)])
+        self.assertEqual(SatSolver(board).find_certain(), ([], []))
+
+    def test_mine_count_clears_interior(self) -> None:
+        board: Board = Board((5, 5), 1)
+        board.initialize_mines([(0, 0)])
+        board.handle_click(board.get_piece((0, 0)), True)
+        self.assertEqual(SatSolver(board).find_certain(),
+                         (list(range(1, 25)), []))
+
+    def test_mine_count_fills_interior(self) -> None:
+        # The 1 under (0, 1) leaves two mines for the two cells behind it
+        board: Board = Board((3, 3), 3)
+        board.initialize_mines([(0, 0), (0, 1), (0, 2)])
+        board.reveal_many([(2, 0), (2, 1), (2, 2), (1, 1)])
+        board.flag_many([(0, 1)])
+        solver: SatSolver = SatSolver(board)
+        self.assertEqual(solver.find_certain(), ([], [0, 2]))
+
+    def test_mine_bounds(self) -> None:
+        solver: SatSolver = SatSolver()
+        # Every layout of this chain holds exactly two mines
+        fewest, most = solver.mine_bounds([
+            ((0, 1), 1), ((1, 2), 1), ((2, 3), 1)])
+        self.assertLessEqual(fewest, 2)
+        self.assertGreaterEqual(most, 2)
+        self.assertLessEqual(most, 4)
+        self.assertEqual(solver.mine_bounds([((0, 1), 2), ((5,), 0)]),
+                         (2, 2))
+        self.assertEqual(solver.mine_bounds([]), (0, 0))
+
+    def test_count_skipped_when_it_cannot_matter(self) -> None:
+        # The frontier holds all of row 3 but one mine is out of sight
+        board: Board = Board((9, 9), 10)
+        board.initialize_mines([(3, col) for col in range(9)] + [(8, 8)])
+        board.handle_click(board.get_piece((0, 0)), False)
+        solver: SatSolver = SatSolver(board)
+        with patch.object(solver, 'query_count') as query_count:
+            solver.find_certain()
+        query_count.assert_not_called()
+
+    @settings(deadline=None)  # type: ignore
+    @given(st.integers(3, 8), st.integers(3, 8), st.data())  # type: ignore
+    def test_matches_tank_solver(self, rows: int, cols: int,
+                                 data: st.DataObject) -> None:
+        board: Board = first_click_board(rows, cols, data)
+        solver: SatSolver = SatSolver(board)
+        tank: TankSolver = TankSolver(board)
+        while not board.get_won():
+            certain: Tuple[list[int], list[int]] = solver.find_certain()
+            self.assertEqual(certain, tank.find_certain())
+            if certain == ([], []):
+                break
+            solver.find_findings()
+            solver.act_on_findings()
+        self.assertFalse(board.get_lost())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -55,13 +55,17 @@ class TestSolver(unittest.TestCase):
         neighbors = [self.piece]
         self.piece.get_flagged.return_value = False
         self.solver.open_unflagged(neighbors)  # type: ignore
-        self.board.handle_click.assert_called_with(self.piece, False)
+        self.board.reveal_many.assert_called_once_with(
+            [self.board.geometry.position_of.return_value])
+        self.board.handle_click.assert_not_called()
 
     def test_flag_all(self) -> None:
         neighbors = [self.piece]
         self.piece.get_flagged.return_value = False
         self.solver.flag_all(neighbors)  # type: ignore
-        self.board.handle_click.assert_called_with(self.piece, True)
+        self.board.flag_many.assert_called_once_with(
+            [self.board.geometry.position_of.return_value])
+        self.board.handle_click.assert_not_called()
 
     def test_skip_unclicked_pieces(self) -> None:
         self.board.get_board.return_value = [[self.unclicked_piece,
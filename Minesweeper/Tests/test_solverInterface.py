@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 from hypothesis import given, strategies as st  # type: ignore
+from board import Board
 from SolverInterface import SolverInterface
 
 
@@ -18,7 +19,8 @@ class TestSolverInterface(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.solver_interface.set_solver('invalid_key')
 
-    @given(st.sampled_from(['trivial', 'advanced']))  # type: ignore
+    @given(st.sampled_from(['trivial', 'advanced', 'tank',
+                            'sat']))  # type: ignore
     def test_set_solver_hypothesis(self, solver_key) -> None:
         self.solver_interface.set_solver(solver_key)
         self.assertIsNotNone(self.solver_interface.current_solver,
@@ -47,6 +49,23 @@ class TestSolverInterface(unittest.TestCase):
         self.solver_interface.current_solver.\
             solve.assert_called_once()  # type: ignore
 
+    def test_switching_leaves_no_listeners(self) -> None:
+        board: Board = Board((5, 5), 3)
+        interface = SolverInterface(board)
+        before: int = len(board.listeners)
+        interface.set_solver('advanced')
+        following: int = len(board.listeners)
+        self.assertGreater(following, before)
+        for key in ['advanced', 'trivial', 'advanced', 'sat', 'advanced',
+                    'advanced']:
+            interface.set_solver(key)
+        self.assertEqual(len(board.listeners), following)
+        advanced = interface.current_solver
+        interface.set_solver('advanced')
+        self.assertIs(interface.current_solver, advanced)
+        interface.set_solver('tank')
+        self.assertEqual(len(board.listeners), before)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 from typing import List
 from hypothesis import given, strategies as st  # type: ignore
-from space import Space
+from arrayboard import ArrayBoard
+from board import Board
+from space import Space, MINE, CLICKED, FLAGGED
 
 
 class TestSpace(unittest.TestCase):
@@ -64,6 +66,60 @@ class TestSpace(unittest.TestCase):
         self.assertEqual(space.get_neighbors(), [neighbor1, neighbor2],
                          "Neighbors should match the ones set.")
 
+    def test_slotted(self) -> None:
+        space: Space = Space(has_bomb=False)
+        self.assertFalse(hasattr(space, "__dict__"))
+        with self.assertRaises(AttributeError):
+            space.extra = 1  # type: ignore[attr-defined]
+
+    @given(st.booleans(), st.integers(0, 8))  # type: ignore
+    def test_state_packing(self, has_bomb: bool, around: int) -> None:
+        space: Space = Space(has_bomb=False)
+        space.reset(has_bomb, around)
+        space.toggle_flag()
+        self.assertEqual(space.get_has_bomb(), has_bomb)
+        self.assertEqual(space.get_num_around(), around)
+        self.assertEqual(space.get_state(),
+                         (MINE if has_bomb else 0) | FLAGGED)
+        space.toggle_flag()
+        space.handle_click()
+        self.assertEqual(space.get_state(),
+                         (MINE if has_bomb else 0) | CLICKED)
+        self.assertEqual(space.get_num_around(), around)
+
+    def test_attributes_write_through(self) -> None:
+        space: Space = Space(has_bomb=False)
+        space.has_bomb = True
+        space.around = 5
+        space.flagged = True
+        self.assertEqual((space.has_bomb, space.clicked, space.flagged,
+                          space.around), (True, False, True, 5))
+        space.flagged = False
+        space.clicked = True
+        self.assertEqual(space.get_state(), MINE | CLICKED)
+        self.assertEqual(space.neighbors, [])
+
+    def test_neighbors_on_every_board(self) -> None:
+        list_board: Board = Board((3, 3), 1)
+        list_board.initialize_mines([(0, 0)])
+        array_board: ArrayBoard = ArrayBoard((3, 3), 1)
+        array_board.initialize_mines([(0, 0)])
+        for board in (list_board, array_board, list_board.fork()):
+            neighbors = board.get_piece((0, 1)).neighbors
+            self.assertEqual(len(neighbors), 5)
+            self.assertEqual(sum(n.get_has_bomb() for n in neighbors), 1)
+
+    def test_board_spaces_share_rows(self) -> None:
+        board: Board = Board((3, 400), 0)
+        row = board.get_board()[2]
+        self.assertIs(row[0]._row, row[399]._row)
+        self.assertIs(board.get_piece((0, 300))._col,
+                      board.get_piece((2, 300))._col)
+        self.assertEqual(row[399].get_index(), 2 * 400 + 399)
+        self.assertIs(row[399].get_board(), board)
+        row[399].has_bomb = True
+        self.assertEqual(board.safe_cells_left, 3 * 400 - 1)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
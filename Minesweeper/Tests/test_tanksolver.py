@@ -1,8 +1,12 @@
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from hypothesis import given, strategies as st  # type: ignore
-from typing import List
-from tanksolver import TankSolver
+from typing import List, Tuple
+from board import Board
+from space import MINE
+from tanksolver import Constraint, TankSolver, compact_component
+from Tests.helpers import first_click_board, one_two_one
 
 
 class TestTankSolver(unittest.TestCase):
@@ -25,6 +29,156 @@ class TestTankSolver(unittest.TestCase):
         self.solver.solve.assert_called_with(board_mock)
         self.assertEqual(result, "mocked return")
 
+    def test_find_certain_one_two_one(self) -> None:
+        board: Board = one_two_one()
+        solver: TankSolver = TankSolver(board)
+        self.assertEqual(solver.find_constraints(), [
+            ((0, 1), 1), ((0, 1, 2), 2), ((1, 2), 1)])
+        self.assertEqual(solver.find_certain(), ([1], [0, 2]))
+        self.assertEqual(TankSolver(board.fork()).find_certain(),
+                         ([1], [0, 2]))
+
+    def test_solve_wins(self) -> None:
+        board: Board = one_two_one()
+        solver: TankSolver = TankSolver(board)
+        solver.solve()
+        self.assertTrue(board.get_won())
+        self.assertEqual(solver.flags_placed, 2)
+        self.assertEqual(solver.safe_squares_to_probe, [])
+
+    def test_solve_without_board(self) -> None:
+        with self.assertRaises(ValueError):
+            TankSolver().solve()
+
+    def test_mine_count_clears_interior(self) -> None:
+        board: Board = Board((5, 5), 1)
+        board.initialize_mines([(0, 0)])
+        board.handle_click(board.get_piece((0, 0)), True)
+        safe, mines = TankSolver(board).find_certain()
+        self.assertEqual(safe, list(range(1, 25)))
+        self.assertEqual(mines, [])
+
+    def test_split_components(self) -> None:
+        solver: TankSolver = TankSolver()
+        components = solver.split_components([
+            ((0, 1), 1), ((5, 6), 1), ((1, 2), 1), ((6, 7), 0)])
+        self.assertEqual(sorted(components), [
+            [((0, 1), 1), ((1, 2), 1)], [((5, 6), 1), ((6, 7), 0)]])
+        self.assertEqual(solver.split_components([((), 1), ((2, 3), 1)]),
+                         [[((), 1)], [((2, 3), 1)]])
+
+    def test_wrong_flags_prove_nothing(self) -> None:
+        board: Board = one_two_one()
+        board.flag_many([(0, 0), (0, 1)])
+        solver: TankSolver = TankSolver(board)
+        self.assertIn(((), -1), solver.find_constraints())
+        self.assertEqual(solver.enumerate_component([((), -1)]).counts, {})
+        self.assertEqual(solver.find_certain(), ([], []))
+
+    def test_enumerate_component(self) -> None:
+        solver: TankSolver = TankSolver()
+        solutions = solver.enumerate_component([((1, 2, 3), 1)])
+        self.assertEqual(sorted(solutions.cells), [1, 2, 3])
+        self.assertEqual(solutions.counts, {1: 3})
+        self.assertEqual(solutions.hits, {1: [1, 1, 1]})
+        # 1 2 1 has a single solution
+        solutions = solver.enumerate_component([
+            ((0, 1), 1), ((0, 1, 2), 2), ((1, 2), 1)])
+        self.assertEqual(solutions.counts, {2: 1})
+        self.assertEqual(dict(zip(solutions.cells, solutions.hits[2])),
+                         {0: 1, 1: 0, 2: 1})
+        # No assignment fits
+        self.assertEqual(solver.enumerate_component([
+            ((0, 1), 3)]).counts, {})
+        self.assertEqual(solver.enumerate_component([
+            ((0, 1), 2), ((1, 2), 0)]).counts, {})
+
+    @given(st.lists(st.tuples(st.lists(st.integers(0, 11), min_size=1,
+                                       max_size=5, unique=True),
+                              st.integers(0, 5)),
+                    min_size=1, max_size=8))  # type: ignore
+    def test_count_matches_enumerate(self, groups: List[Tuple[
+            List[int], int]]) -> None:
+        solver: TankSolver = TankSolver()
+        constraints = [(tuple(sorted(cells)), need)
+                       for cells, need in groups]
+        for component in solver.split_components(constraints):
+            listed = solver.enumerate_component(component)
+            counted = solver.count_component(component)
+            self.assertEqual(counted.counts, listed.counts)
+            self.assertEqual(
+                {mines: dict(zip(counted.cells, row))
+                 for mines, row in counted.hits.items()},
+                {mines: dict(zip(listed.cells, row))
+                 for mines, row in listed.hits.items()})
+
+    def test_solve_component_counts_large_components(self) -> None:
+        solver: TankSolver = TankSolver()
+        # A row of 40 cells under a row of 1s: a long chain of constraints
+        constraints = [(tuple(range(max(i - 1, 0), min(i + 2, 40))), 1)
+                       for i in range(40)]
+        with patch.object(solver, 'enumerate_component') as enumerate_mock:
+            solutions = solver.solve_component(constraints)
+        enumerate_mock.assert_not_called()
+        self.assertEqual(solutions.counts, {14: 1})
+
+    @given(st.integers(3, 8), st.integers(3, 8), st.data())  # type: ignore
+    def test_certain_cells_are_right(self, rows: int, cols: int,
+                                     data: st.DataObject) -> None:
+        board: Board = first_click_board(rows, cols, data)
+        solver: TankSolver = TankSolver(board)
+        while not board.get_won():
+            safe, mines = solver.find_certain()
+            if not safe and not mines:
+                break
+            for index in safe:
+                self.assertFalse(board.get_state_at(index) & MINE)
+            for index in mines:
+                self.assertTrue(board.get_state_at(index) & MINE)
+            solver.find_findings()
+            solver.act_on_findings()
+        self.assertFalse(board.get_lost())
+
+    def test_compact_component(self) -> None:
+        cells, compact = compact_component([((40, 7), 1), ((7, 12), 1)])
+        self.assertEqual(cells, [7, 12, 40])
+        self.assertEqual(compact, [((2, 0), 1), ((0, 1), 1)])
+
+    def test_solve_components_in_workers(self) -> None:
+        components: List[List[Constraint]] = [
+            [((10, 11), 1), ((11, 12), 1)], [((20, 21, 22), 2)],
+            [((30,), 0)]]
+        serial = TankSolver(workers=1).solve_components(components)
+        parallel: TankSolver = TankSolver(workers=2)
+        parallel.PARALLEL_CELLS = 3
+        self.assertEqual(parallel.solve_components(components), serial)
+        self.assertEqual([solved.cells for solved in serial],
+                         [[10, 11, 12], [20, 21, 22], [30]])
+
+    def test_deadline(self) -> None:
+        # A row of 40 cells under a row of 1s, counted; two in workers
+        row: List[Constraint] = [
+            (tuple(range(max(i - 1, 0), min(i + 2, 40))), 1)
+            for i in range(40)]
+        solver: TankSolver = TankSolver(workers=2)
+        solver.deadline = time.monotonic() - 1.0
+        with self.assertRaises(TimeoutError):
+            solver.solve_component(row)
+        shifted: List[Constraint] = [
+            (tuple(cell + 100 for cell in group), need)
+            for group, need in row]
+        with self.assertRaises(TimeoutError):
+            solver.solve_components([row, shifted])
+        solver.deadline = time.monotonic() + 60.0
+        self.assertEqual(solver.solve_component(row).counts, {14: 1})
+
+    def test_one_worker_solves_in_process(self) -> None:
+        tank: TankSolver = TankSolver(workers=1)
+        tank.PARALLEL_CELLS = 1
+        with patch('tanksolver.get_pool') as get_pool:
+            tank.solve_components([[((0, 1), 1)], [((5, 6), 1)]])
+        get_pool.assert_not_called()
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -2,7 +2,9 @@ import unittest
 from unittest.mock import MagicMock, patch
 from hypothesis import given, strategies as st  # type: ignore
 from typing import Tuple
+from board import Board
 from trivialsolver import TrivialSolver
+from Tests.helpers import one_two_one
 
 
 class TestTrivialSolver(unittest.TestCase):
@@ -10,6 +12,8 @@ class TestTrivialSolver(unittest.TestCase):
         self.board = MagicMock()
         self.solver = TrivialSolver(self.board)
         self.board.get_size.return_value = (10, 10)
+        # No mines placed yet, so every tile is as risky as any other
+        self.board.initialized = False
 
     def test_find_potentially_safe_tile_no_safe_tiles(self) -> None:
         self.board.get_piece.return_value = MagicMock(get_clicked=lambda: True,
@@ -200,6 +204,17 @@ class TestTrivialSolver(unittest.TestCase):
             for expected_log in expected_logs:
                 self.assertIn(expected_log, log.output)
 
+    def test_select_least_risky_tile(self) -> None:
+        # 1 2 1 under three hidden cells: only the middle one is safe
+        board: Board = one_two_one()
+        solver: TrivialSolver = TrivialSolver(board)
+        for _ in range(5):
+            self.assertEqual(solver.select_random_tile(), (0, 1))
+        self.assertEqual(solver.least_risky([(0, 0), (0, 2)]),
+                         [(0, 0), (0, 2)])
+        board.flag_many([(0, 0), (0, 1)])
+        self.assertEqual(solver.least_risky([(0, 2)]), [(0, 2)])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
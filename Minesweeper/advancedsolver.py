@@ -1,16 +1,40 @@
-from typing import List, Tuple
+from typing import List, Optional, Set, Tuple
 from solverstrategy import SolverStrategy
-from board import Board
-from space import Space
+from board import Board, ChangeFeed
+from geometry import Geometry
+from linearsolver import LinearSolver
+from patterncache import CacheStats, PatternCache, PatternSolver
+from propagation import Propagator
+from space import Space, CLICKED, FLAGGED
+from tanksolver import TankSolver
 
 
 class AdvancedSolver(SolverStrategy):
-    def __init__(self, board: Board) -> None:
-        """ Initialize the Advanced Solver. """
+    def __init__(self, board: Board,
+                 patterns: Optional[PatternCache] = None) -> None:
+        """
+        Initialize the Advanced Solver.
+        board (Board): The gameboard to solve
+        patterns (PatternCache): Cache of local deductions to use (may be
+        shared or pre-warmed); a new one if None
+        """
         self.board: Board = board
         self.safe_squares_to_probe: List[Tuple[int, int]] = []
         self.mines_identified: List[Tuple[int, int]] = []
         self.flags_placed: int = 0
+        # Falls back on whole-frontier reasoning when single numbers are
+        # not enough
+        self.tank: TankSolver = TankSolver(board)
+        # Tried before the tank solver: much cheaper, and proves most of
+        # what the tank solver would
+        self.linear: LinearSolver = LinearSolver(board)
+        # Tried first: windows seen before cost a lookup
+        self.patterns: PatternSolver = PatternSolver(board, patterns)
+        # Border cells (flat indices), kept up to date from the cells that
+        # changed; None until the first full scan
+        self.frontier: Optional[Set[int]] = None
+        self.changes: ChangeFeed = board.track_changes()
+        self.propagator: Propagator = Propagator(board)
 
     def flag_mines(self) -> bool:
         """
@@ -90,34 +114,17 @@ class AdvancedSolver(SolverStrategy):
         Returns int - number of flags around the space
         """
         # print("In count_flags_around")
-        count: int = 0
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if self.is_valid_coord(nx, ny):
-                    neighbor = self.board.get_piece((nx, ny))
-                    if neighbor.get_flagged():
-                        count += 1
-        return count
+        return sum(1 for index in self.board.geometry.neighbors_of(x, y)
+                   if self.board.get_state_at(index) & FLAGGED)
 
     def find_hidden_tiles_around(self, x: int, y: int
                                  ) -> List[Tuple[int, int]]:
         """ Get a list of hidden tiles around the space """
         # print("In find_hidden_tiles_around")
-        hidden_tiles: List[Tuple[int, int]] = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if self.is_valid_coord(nx, ny):
-                    neighbor = self.board.get_piece((nx, ny))
-                    if not neighbor.get_clicked() \
-                            and not neighbor.get_flagged():
-                        hidden_tiles.append((nx, ny))
-        return hidden_tiles
+        geometry: Geometry = self.board.geometry
+        return [geometry.position_of(index)
+                for index in geometry.neighbors_of(x, y)
+                if not self.board.get_state_at(index) & (CLICKED | FLAGGED)]
 
     def is_valid_coord(self, x: int, y: int) -> bool:
         """ Check if a given coordinate is valid."""
@@ -132,70 +139,154 @@ class AdvancedSolver(SolverStrategy):
             if self.board.get_lost():
                 print("GAME OVER ADVANCED SOLVER")
                 return
+            # Single-number rules, worked from the changed cells only
+            revealed, flagged = self.propagator.run()
+            print(f"Propagation revealed {len(revealed)} and flagged "
+                  + f"{len(flagged)} tiles")
+            self.flags_placed += len(flagged)
+            if self.board.get_lost():
+                continue
             border_cells: List[Tuple[int, int]] = self.find_border_cells()
             if not border_cells:
+                self.report_pattern_stats()
                 print("No border cells to evaluate. Solver may be stuck or the"
                       + " puzzle is solved.")
                 break
-            if not self.evaluate_border_cells(border_cells):
-                # No more mines were flagged, we're stuck
-                if not self.flag_mines():
-                    print("No more certain moves to make. The solver is either"
-                          + " stuck or the puzzle is solved.")
-                    break
-                else:
-                    # Mines were flagged, re-evaluate the border cells
-                    continue
-
+            # No single number proves anything more, try the local
+            # patterns, the linear system and then the tank solver
+            if not self.use_pattern_findings() \
+                    and not self.use_linear_findings() \
+                    and not self.use_tank_findings():
+                self.report_pattern_stats()
+                print("No more certain moves to make. The solver is either"
+                      + " stuck or the puzzle is solved.")
+                break
             self.act_on_findings()
 
+    def use_pattern_findings(self) -> bool:
+        """
+        Queue the safe squares and mines the local windows prove.
+        Returns bool - True if anything was queued, False otherwise
+        """
+        safe, mines = self.patterns.find_certain()
+        self.safe_squares_to_probe.extend(
+            self.board.geometry.position_of(index) for index in safe)
+        self.mines_identified.extend(
+            self.board.geometry.position_of(index) for index in mines)
+        return bool(safe or mines)
+
+    def get_pattern_stats(self) -> CacheStats:
+        """ Get the hit and time-saved counters of the pattern cache. """
+        return self.patterns.cache.stats()
+
+    def report_pattern_stats(self) -> None:
+        """ Print how well the pattern cache did. """
+        stats: CacheStats = self.get_pattern_stats()
+        print(f"Pattern cache: {stats.hits} hits, {stats.misses} misses "
+              + f"({stats.hit_rate:.0%}), {stats.saved * 1e3:.1f} ms saved")
+
+    def use_linear_findings(self) -> bool:
+        """
+        Queue the safe squares and mines the linear system proves.
+        Returns bool - True if anything was queued, False otherwise
+        """
+        safe, mines = self.linear.find_certain()
+        self.safe_squares_to_probe.extend(
+            self.board.geometry.position_of(index) for index in safe)
+        self.mines_identified.extend(
+            self.board.geometry.position_of(index) for index in mines)
+        return bool(safe or mines)
+
+    def use_tank_findings(self) -> bool:
+        """
+        Queue the safe squares and mines the tank solver can prove.
+        Returns bool - True if anything was queued, False otherwise
+        """
+        if not self.tank.find_findings():
+            return False
+        self.safe_squares_to_probe.extend(self.tank.safe_squares_to_probe)
+        self.mines_identified.extend(self.tank.mines_identified)
+        self.tank.safe_squares_to_probe.clear()
+        self.tank.mines_identified.clear()
+        return True
+
     def get_flags_placed(self) -> int:
         """ Get the number of flags placed by the solver (display)"""
         return self.flags_placed
 
+    def close(self) -> None:
+        """
+        Stop following the board's changes, here and in the propagator and
+        pattern solver; the solver is not used after this.
+        """
+        self.board.unsubscribe(self.changes)
+        self.propagator.close()
+        self.patterns.close()
+
     def find_border_cells(self) -> List[Tuple[int, int]]:
-        """ Find border cells on board (immediate neighbors) """
-        border_cells: List[Tuple[int, int]] = []
-        for x in range(self.board.get_size()[0]):
-            for y in range(self.board.get_size()[1]):
-                if self.is_border_cell(x, y):
-                    border_cells.append((x, y))
-        return border_cells
+        """
+        Find border cells on board (immediate neighbors).
+        The board is only scanned on the first call (or after a new mine
+        layout); later calls look again at just the cells that changed
+        since and their neighbors.
+        """
+        return [self.board.geometry.position_of(index)
+                for index in sorted(self.update_frontier())]
+
+    def update_frontier(self) -> Set[int]:
+        """
+        Bring the frontier up to date with the changed cells.
+        Returns set - flat indices of the border cells
+        """
+        changed: Optional[Set[int]] = self.changes.drain()
+        geometry: Geometry = self.board.geometry
+        if self.frontier is None or changed is None:
+            # Read every state once and walk out from the revealed cells,
+            # rather than asking every cell about its neighbors
+            clicked: List[int] = [
+                self.board.get_state_at(index) & CLICKED
+                for index in range(geometry.cell_count)]
+            self.frontier = {
+                neighbor for index, revealed in enumerate(clicked)
+                if revealed for neighbor in geometry.neighbors(index)
+                if not clicked[neighbor]}
+            return self.frontier
+        # A cell's membership depends on it and its neighbors only
+        candidates: Set[int] = set(changed)
+        for index in changed:
+            candidates.update(geometry.neighbors(index))
+        for index in candidates:
+            if self.is_border_index(index):
+                self.frontier.add(index)
+            else:
+                self.frontier.discard(index)
+        return self.frontier
 
     def is_border_cell(self, x: int, y: int) -> bool:
         """ Check to see if a given space is a border space. """
-        cell: Space = self.board.get_piece((x, y))
-        if cell.get_clicked():
+        return self.is_border_index(self.board.geometry.index_of((x, y)))
+
+    def is_border_index(self, index: int) -> bool:
+        """
+        Check to see if the space at a flat index is a border space: not
+        revealed, with at least one revealed neighbor.
+        """
+        if self.board.get_state_at(index) & CLICKED:
             return False
-        # check adjacent cells for at least one revealed cell
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.board.get_size()[0] \
-                        and 0 <= ny < self.board.get_size()[1]:
-                    neighbor: Space = self.board.get_piece((nx, ny))
-                    if neighbor.get_clicked():
-                        return True
-        return False
+        return any(self.board.get_state_at(neighbor) & CLICKED
+                   for neighbor in self.board.geometry.neighbors(index))
 
     def act_on_findings(self) -> None:
         """ Reveal spaces or place flags after evaluating border cells. """
         print("In act_on_findings")
-        # Reveal safe squares
-        for mine_coords in self.mines_identified:
-            mine_cell: Space = self.board.get_piece(mine_coords)
-            if not mine_cell.get_flagged():
-                print(f"Flagging tile at {mine_coords}")
-                # FLAGGING FROM HERE TOO = PROBLEM!!
-                self.board.handle_click(mine_cell, True)
-                self.flags_placed += 1
-
-        for square_coords in self.safe_squares_to_probe:
-            safe_cell: Space = self.board.get_piece(square_coords)
-            if not safe_cell.get_clicked():
-                print(f"Revealing the tile at {square_coords}")
-                self.board.handle_click(safe_cell, False)
+        # Place flags, then reveal safe squares, one board move each
+        flagged: List[Tuple[int, int]] = self.board.flag_many(
+            self.mines_identified)
+        for mine_coords in flagged:
+            print(f"Flagging tile at {mine_coords}")
+        self.flags_placed += len(flagged)
+
+        print(f"Revealing the tiles at {self.safe_squares_to_probe}")
+        self.board.reveal_many(self.safe_squares_to_probe)
         self.safe_squares_to_probe.clear()
         self.mines_identified.clear()
@@ -0,0 +1,286 @@
+from typing import List, Tuple
+import numpy as np
+from board import Board, BoardSnapshot, count_mines_around, mine_mask
+from space import Space, MINE, CLICKED, FLAGGED
+
+
+class CellView(Space):
+    """
+    Lightweight view of one cell of an ArrayBoard.
+    The view owns no state of its own; every getter and setter reads or
+    writes the board's arrays, so it can be created and dropped freely.
+    """
+    __slots__ = ('_owner', '_index')
+
+    def __init__(self, owner: "ArrayBoard", index: int) -> None:
+        """
+        Initialize a view on a cell.
+        owner (ArrayBoard): Board that stores the cell
+        index (int): Flat (row-major) index of the cell
+        """
+        self._owner: "ArrayBoard" = owner
+        self._index: int = index
+
+    def __eq__(self, other: object) -> bool:
+        """ Views are equal when they look at the same cell. """
+        return isinstance(other, CellView) and other._owner is self._owner \
+            and other._index == self._index
+
+    def __hash__(self) -> int:
+        """ Hash on the viewed cell. """
+        return hash((id(self._owner), self._index))
+
+    def get_state(self) -> int:
+        """ Getter for the packed MINE/CLICKED/FLAGGED state bits. """
+        return int(self._owner.flat_state[self._index])
+
+    def write_state(self, state: int) -> None:
+        """ Store new state bits in the board array. """
+        self._owner.flat_state[self._index] = state
+
+    def get_index(self) -> int:
+        """ Getter for the flat (row-major) index on the owning board. """
+        return self._index
+
+    def get_board(self) -> "ArrayBoard":
+        """ Getter for the board that stores the cell. """
+        return self._owner
+
+    def get_num_around(self) -> int:
+        """ Getter for num_around. """
+        return int(self._owner.flat_around[self._index])
+
+    def get_has_bomb(self) -> bool:
+        """ Getter for has_bomb. """
+        return bool(self._owner.flat_state[self._index] & MINE)
+
+    def get_clicked(self) -> bool:
+        """ Getter for get_clicked. """
+        return bool(self._owner.flat_state[self._index] & CLICKED)
+
+    def get_flagged(self) -> bool:
+        """ Getter for get_flagged. """
+        return bool(self._owner.flat_state[self._index] & FLAGGED)
+
+    @property
+    def around(self) -> int:
+        return self.get_num_around()
+
+    @around.setter
+    def around(self, value: int) -> None:
+        self._owner.flat_around[self._index] = value
+
+    def reset(self, has_bomb: bool, around: int) -> None:
+        """
+        Put the cell back to unrevealed with a new mine layout.
+        has_bomb (bool): Does the cell contain a mine?
+        around (int): Number of mines around the cell
+        """
+        self.write_state(MINE if has_bomb else 0)
+        self.around = around
+
+    def set_num_around(self) -> None:
+        """ Recount the mines around this cell from the board arrays. """
+        self.around = sum(1 for index in self._owner.neighbor_indices(
+            self._index) if self._owner.flat_state[index] & MINE)
+
+    def set_neighbors(self, neighbors: List[Space]) -> None:
+        """ Neighbors are derived from the board geometry; nothing to set. """
+        pass
+
+    def get_neighbors(self) -> List[Space]:
+        """ Getter for neighbors (views on the adjacent cells). """
+        return self._owner.get_neighbors(self._index)
+
+
+class ArrayBoard(Board):
+    """
+    Board whose cells live in contiguous NumPy arrays instead of a grid of
+    Space objects. state holds the MINE/CLICKED/FLAGGED bits of every cell
+    and around holds its mine count, one byte each. get_piece() hands out
+    CellView objects so code written against Space keeps working.
+    """
+
+    def allocate_storage(self) -> None:
+        """ Allocate the state and around arrays (one byte per cell each). """
+        self.state: np.ndarray = np.zeros(self.size, dtype=np.uint8)
+        self.around: np.ndarray = np.zeros(self.size, dtype=np.uint8)
+        # Flat views share memory with the 2D arrays
+        self.flat_state: np.ndarray = self.state.reshape(-1)
+        self.flat_around: np.ndarray = self.around.reshape(-1)
+
+    def initialize_mines(self, positions: List[Tuple[int, int]]) -> None:
+        """
+        Initialize mines on the board.
+        positions (list): List of mine positions
+        """
+        mines: np.ndarray = mine_mask(self.size, positions)
+        self.state[:] = np.where(mines, MINE, 0)
+        self.around[:] = count_mines_around(mines)
+        self.safe_cells_left = int(mines.size - np.count_nonzero(mines))
+        self.flag_count = 0
+        self.opened_count = 0
+        self.generation += 1
+        self.reset_journal()
+        self.notify_all()
+        self.initialized = True
+
+    def reveal_all_non_flagged_squares(self) -> None:
+        """ Reveal unrevealed and unflagged spaces on the board. """
+        hidden: np.ndarray = np.flatnonzero(
+            (self.flat_state & (CLICKED | FLAGGED)) == 0)
+        cols: int = self.size[1]
+        self.reveal_many([divmod(index, cols) for index in hidden.tolist()])
+
+    def flood_fill(self, start: int) -> List[int]:
+        """
+        Reveal the opening around an already revealed empty cell.
+        Works on flat indices straight through memoryviews of the arrays,
+        so no cell views are created for the cells it visits.
+        start (int): Flat index of the revealed cell with no mines around
+        Returns list - flat indices of the cells newly revealed
+        """
+        state: memoryview = self.flat_state.data
+        around: memoryview = self.flat_around.data
+        neighbors = self.geometry.neighbors
+        revealed: List[int] = []
+        stack: List[int] = [start]
+        while stack:
+            for index in neighbors(stack.pop()):
+                if state[index] & (CLICKED | FLAGGED):
+                    continue
+                state[index] |= CLICKED
+                revealed.append(index)
+                if around[index] == 0:
+                    stack.append(index)
+                    self.opened_count += 1
+        # Cells next to an empty cell never hold a mine
+        self.safe_cells_left -= len(revealed)
+        self.generation += 1
+        if self.journal is not None:
+            for index in revealed:
+                self.record(index, state[index] & ~CLICKED, state[index])
+        if self.listeners:
+            self.notify(revealed)
+        return revealed
+
+    def print_board(self) -> None:
+        """ Print the current state of the board. """
+        for row in (self.state & MINE).astype(bool).tolist():
+            print(" ".join(str(has_bomb) for has_bomb in row), end=" ")
+            print()
+
+    def get_board(self) -> List[List[Space]]:
+        """
+        Get the game board as a grid of cell views.
+        This materializes one view per cell, so prefer get_piece() or the
+        arrays themselves on large boards.
+        """
+        cols: int = self.size[1]
+        return [[CellView(self, row * cols + col) for col in range(cols)]
+                for row in range(self.size[0])]
+
+    def get_piece(self, index: Tuple[int, int]) -> Space:
+        """
+        Get a piece at a given index.
+        index (tuple): Index of the piece (space)
+        Returns a CellView on the given index
+        """
+        rows, cols = self.size
+        row, col = index
+        if not (-rows <= row < rows and -cols <= col < cols):
+            raise IndexError(f"Index {index} is off the board")
+        return CellView(self, (row % rows) * cols + col % cols)
+
+    def get_neighbors(self, index: int) -> List[Space]:
+        """
+        Get views on the cells around a cell.
+        index (int): Flat (row-major) index of the cell
+        Returns list - views on the neighboring cells
+        """
+        return [CellView(self, neighbor)
+                for neighbor in self.geometry.neighbors(index)]
+
+    def set_neighbors(self) -> None:
+        """ Neighbors are computed from the geometry; nothing to store. """
+        pass
+
+    def add_to_neighbors_list(self, neighbors: List[Space], row: int, col: int
+                              ) -> None:
+        """
+        Add neighbors to a list for a given piece (Space).
+        neighbors (list): List to store neighbors
+        row (int): Row index of the piece
+        col (int): Column index of the piece
+        """
+        for index in self.geometry.neighbors_of(row, col):
+            neighbors.append(CellView(self, index))
+
+    def set_num_around(self) -> None:
+        """ Set the number of mines around each piece on the board. """
+        self.around[:] = count_mines_around((self.state & MINE).astype(bool))
+
+    def scan_counts(self) -> Tuple[int, int, int]:
+        """
+        Count the board state with a full (vectorized) scan.
+        Returns tuple - (safe cells left, flags, opened cells)
+        """
+        safe_cells_left: int = int(np.count_nonzero(
+            (self.state & (MINE | CLICKED)) == 0))
+        flag_count: int = int(np.count_nonzero(self.state & FLAGGED))
+        opened_count: int = int(np.count_nonzero(
+            ((self.state & CLICKED) != 0) & (self.around == 0)))
+        return safe_cells_left, flag_count, opened_count
+
+    def get_state_at(self, index: int) -> int:
+        """
+        Get the state bits of the cell at a flat index.
+        index (int): Flat (row-major) index of the cell
+        Returns int - the packed MINE/CLICKED/FLAGGED bits
+        """
+        return int(self.flat_state[index])
+
+    def get_around_at(self, index: int) -> int:
+        """
+        Get the number of mines around the cell at a flat index.
+        index (int): Flat (row-major) index of the cell
+        """
+        return int(self.flat_around[index])
+
+    def state_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the state bits and the mines around of every cell at once.
+        Returns tuple - (states, around), the board's own arrays (read them
+        only)
+        """
+        return self.state, self.around
+
+    def set_state_at(self, index: int, state: int) -> None:
+        """
+        Overwrite the state bits of the cell at a flat index.
+        index (int): Flat (row-major) index of the cell
+        state (int): New MINE/CLICKED/FLAGGED bits
+        """
+        self.flat_state[index] = state
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Save the state of every cell and of the game (two array copies).
+        Returns BoardSnapshot - pass it to restore() to come back here
+        """
+        self.sync_counts()
+        return self.make_snapshot((self.flat_state.tobytes(),
+                                   self.flat_around.tobytes()))
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        """
+        Put the board back to a state saved by snapshot().
+        snapshot (BoardSnapshot): Snapshot taken from an ArrayBoard
+        Raises ValueError if the snapshot is for a board of another size
+        """
+        self.check_snapshot(snapshot)
+        states, around = snapshot.cells
+        self.flat_state[:] = np.frombuffer(states, dtype=np.uint8)
+        self.flat_around[:] = np.frombuffer(around, dtype=np.uint8)
+        self.restore_game(snapshot)
+        self.notify_all()
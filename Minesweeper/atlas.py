@@ -0,0 +1,159 @@
+import hashlib
+import os
+from typing import Dict, List, Literal, Optional, Tuple
+import pygame  # type: ignore
+
+# Directory of the tile images
+IMAGES_DIR: str = "images"
+# Directory of the scaled atlases kept between runs
+CACHE_DIR: str = ".atlas-cache"
+# Pixel format of the cached atlases
+PIXEL_FORMAT: Literal["RGB"] = "RGB"
+
+
+class TileAtlas:
+    """
+    Every tile image, scaled to one tile size, side by side on a single
+    surface. A tile is drawn by blitting the part of the atlas it covers,
+    so the whole board is drawn from one source surface.
+    """
+
+    def __init__(self, surface: pygame.Surface, names: List[str],
+                 tile_size: Tuple[int, int]) -> None:
+        """
+        Initialize the atlas.
+        surface (Surface): The tiles in a row, in the order of names
+        names (list): Name of every tile (its file name without .png)
+        tile_size (tuple): (width, height) of a tile
+        """
+        self.surface: pygame.Surface = surface
+        self.tile_size: Tuple[int, int] = tile_size
+        self.rects: Dict[str, pygame.Rect] = {
+            name: pygame.Rect(slot * tile_size[0], 0, *tile_size)
+            for slot, name in enumerate(names)}
+        # The atlas was read from the cache rather than built
+        self.cached: bool = False
+
+    def blit(self, target: pygame.Surface, name: str,
+             position: Tuple[int, int]) -> None:
+        """
+        Draw a tile.
+        target (Surface): Surface to draw on
+        name (str): Name of the tile
+        position (tuple): Where to draw it on the target
+        """
+        target.blit(self.surface, position, self.rects[name])
+
+    def tiles(self) -> Dict[str, pygame.Surface]:
+        """
+        Get every tile as a surface of its own.
+        Returns a dictionary of subsurfaces, sharing the atlas's pixels
+        """
+        return {name: self.surface.subsurface(rect)
+                for name, rect in self.rects.items()}
+
+
+def list_tiles(images_dir: str = IMAGES_DIR) -> List[str]:
+    """
+    List the tile images.
+    images_dir (str): Directory of the images
+    Returns list - names of the .png files without the extension, sorted
+    """
+    return sorted(file_name[:-len(".png")]
+                  for file_name in os.listdir(images_dir)
+                  if file_name.endswith(".png"))
+
+
+def atlas_key(names: List[str], tile_size: Tuple[int, int],
+              images_dir: str = IMAGES_DIR) -> str:
+    """
+    Key of the cached atlas for a tile size and the images as they are
+    now: any image edited, added or removed gives another key.
+    names (list): Names of the tiles
+    tile_size (tuple): (width, height) of a tile
+    images_dir (str): Directory of the images
+    """
+    digest = hashlib.sha1(repr(tile_size).encode())
+    for name in names:
+        info: os.stat_result = os.stat(os.path.join(images_dir,
+                                                    name + ".png"))
+        digest.update(f"{name}:{info.st_mtime_ns}:{info.st_size};".encode())
+    return f"atlas-{tile_size[0]}x{tile_size[1]}-{digest.hexdigest()[:16]}"
+
+
+def build_atlas(names: List[str], tile_size: Tuple[int, int],
+                images_dir: str = IMAGES_DIR) -> pygame.Surface:
+    """
+    Load, convert and scale every tile image onto one surface.
+    names (list): Names of the tiles
+    tile_size (tuple): (width, height) of a tile
+    images_dir (str): Directory of the images
+    Returns the atlas surface
+    """
+    surface: pygame.Surface = pygame.Surface(
+        (tile_size[0] * len(names), tile_size[1])).convert()
+    for slot, name in enumerate(names):
+        image: pygame.Surface = pygame.image.load(
+            os.path.join(images_dir, name + ".png")).convert()
+        surface.blit(pygame.transform.scale(image, tile_size),
+                     (slot * tile_size[0], 0))
+    return surface
+
+
+def load_atlas(tile_size: Tuple[int, int], images_dir: str = IMAGES_DIR,
+               cache_dir: Optional[str] = CACHE_DIR) -> TileAtlas:
+    """
+    Get the atlas of a tile size: read from the cache if the images have
+    not changed since it was written, built and written to it otherwise.
+    A cache that cannot be read or written is skipped.
+    tile_size (tuple): (width, height) of a tile
+    images_dir (str): Directory of the images
+    cache_dir (str): Directory of the cache, None for no cache
+    Returns the atlas (with cached set if it came from the cache)
+    """
+    names: List[str] = list_tiles(images_dir)
+    size: Tuple[int, int] = (tile_size[0] * len(names), tile_size[1])
+    path: Optional[str] = None
+    if cache_dir is not None:
+        key: str = atlas_key(names, tile_size, images_dir)
+        path = os.path.join(cache_dir, key + ".raw")
+        try:
+            with open(path, "rb") as file:
+                pixels: bytes = file.read()
+            surface: pygame.Surface = pygame.image.frombytes(
+                pixels, size, PIXEL_FORMAT).convert()
+            atlas: TileAtlas = TileAtlas(surface, names, tile_size)
+            atlas.cached = True
+            return atlas
+        except (OSError, ValueError):
+            pass
+
+    atlas = TileAtlas(build_atlas(names, tile_size, images_dir), names,
+                      tile_size)
+    if path is not None:
+        try:
+            save_atlas(atlas, path)
+        except OSError:
+            pass
+    return atlas
+
+
+def save_atlas(atlas: TileAtlas, path: str) -> None:
+    """
+    Write an atlas to the cache, dropping the ones of the same tile size
+    made from older images.
+    atlas (TileAtlas): The atlas
+    path (str): File to write
+    """
+    cache_dir: str = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    prefix: str = f"atlas-{atlas.tile_size[0]}x{atlas.tile_size[1]}-"
+    for file_name in os.listdir(cache_dir):
+        if file_name.startswith(prefix) \
+                and file_name != os.path.basename(path):
+            os.remove(os.path.join(cache_dir, file_name))
+    # Written under another name first, so a reader never sees half a file
+    partial: str = path + ".part"
+    with open(partial, "wb") as file:
+        file.write(pygame.image.tobytes(atlas.surface, PIXEL_FORMAT))
+    os.replace(partial, path)
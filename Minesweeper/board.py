@@ -1,5 +1,106 @@
-from typing import List, Tuple
-from space import Space
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, \
+    Sequence, Set, Tuple, TYPE_CHECKING
+import numpy as np
+from geometry import Geometry, get_geometry
+from space import Space, SpaceRow, MINE, CLICKED, FLAGGED
+if TYPE_CHECKING:  # pragma: no cover
+    from boardfork import BoardFork
+
+# Journal entries are (flat index, old state, new state); changes to the
+# won/lost flags are recorded under the GAME index with these bits
+GAME: int = -1
+WON: int = 1
+LOST: int = 2
+JournalEntry = Tuple[int, int, int]
+# Change listeners are called with the flat indices of the cells changed
+ChangeListener = Callable[[Iterable[int]], None]
+
+
+def count_mines_around(mines: np.ndarray) -> np.ndarray:
+    """
+    Count the mines around every cell of a grid in one vectorized pass.
+    mines (ndarray): 2D boolean array, True where a mine is placed
+    Returns ndarray - 2D uint8 array with the number of neighboring mines
+    """
+    rows, cols = mines.shape
+    padded: np.ndarray = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = mines
+    around: np.ndarray = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in range(3):
+        for dc in range(3):
+            if dr == 1 and dc == 1:
+                continue
+            around += padded[dr:dr + rows, dc:dc + cols]
+    return around
+
+
+def mine_mask(size: Tuple[int, int], positions: List[Tuple[int, int]]
+              ) -> np.ndarray:
+    """
+    Build a boolean grid with True at every mine position.
+    size (tuple): Size of the board (rows, columns)
+    positions (list): List of mine positions
+    Raises IndexError if a position is off the board
+    """
+    mines: np.ndarray = np.zeros(size, dtype=bool)
+    if positions:
+        coords: np.ndarray = np.asarray(positions, dtype=np.intp)
+        mines[coords[:, 0], coords[:, 1]] = True
+    return mines
+
+
+class ChangeFeed:
+    """
+    Collects the flat indices of the cells changed on a board since the
+    last drain(). Made by Board.track_changes(); every consumer gets its
+    own feed, so draining one does not hide changes from another.
+    """
+
+    def __init__(self, cell_count: int = 0) -> None:
+        """
+        Initialize an empty feed.
+        cell_count (int): Number of cells on the board
+        """
+        self.dirty: Set[int] = set()
+        self.cell_count: int = cell_count
+        # Every cell may have changed (a new layout or a restore); dirty is
+        # not filled in then
+        self.everything: bool = False
+
+    def __call__(self, indices: Iterable[int]) -> None:
+        """ Mark cells as changed (the board calls this). """
+        if not self.everything:
+            self.dirty.update(indices)
+
+    def __len__(self) -> int:
+        """ Number of cells changed since the last drain. """
+        return self.cell_count if self.everything else len(self.dirty)
+
+    def mark_all(self) -> None:
+        """ Mark every cell as changed, without listing them. """
+        self.everything = True
+        self.dirty = set()
+
+    def drain(self) -> Optional[Set[int]]:
+        """
+        Take the changed cells and start collecting afresh.
+        Returns set - flat indices of the cells changed since the last
+        drain, or None if every cell may have changed
+        """
+        dirty: Optional[Set[int]] = None if self.everything else self.dirty
+        self.dirty = set()
+        self.everything = False
+        return dirty
+
+
+class BoardSnapshot(NamedTuple):
+    """ Saved state of a board, made by snapshot() and read by restore(). """
+    size: Tuple[int, int]
+    cells: Any  # Copy of the cells, in the format of the board that made it
+    won: bool
+    lost: bool
+    initialized: bool
+    counts: Tuple[int, int, int]  # (safe cells left, flags, opened cells)
 
 
 class Board:
@@ -9,47 +110,83 @@ class Board:
         size (tuple): Size of the board (rows, columns)
         mine_count (int): Number of mines on the board
         """
+        self.setup_fields(size, mine_count, get_geometry(size))
+        self.allocate_storage()
+        self.recount()
+
+    def setup_fields(self, size: Tuple[int, int], mine_count: int,
+                     geometry: Geometry) -> None:
+        """
+        Set up the fields every board has, before its cells are stored.
+        size (tuple): Size of the board (rows, columns)
+        mine_count (int): Number of mines on the board
+        geometry (Geometry): Neighbor tables of the size
+        """
         self.size: Tuple[int, int] = size
         self.board: List[List[Space]] = []
         self.won: bool = False
         self.lost: bool = False
         self.initialized: bool = False
         self.mine_count: int = mine_count
-        for row in range(size[0]):
-            new_row: List[Space] = []
-            for col in range(size[1]):
-                piece: Space = Space(False)  # Initialzie with no mines
-                new_row.append(piece)
-            self.board.append(new_row)
+        # Neighbor tables, shared by every board of this size
+        self.geometry: Geometry = geometry
+        # Verify the running counters against a full scan on every query
+        self.debug: bool = False
+        # Running counters, kept current by space_changed()
+        self.safe_cells_left: int = 0  # Cells without a mine, not revealed
+        self.flag_count: int = 0  # Cells flagged
+        self.opened_count: int = 0  # Revealed cells with no mines around
+        # Bumped on every change to the cells, so forks can tell that the
+        # board they share cells with has moved on
+        self.generation: int = 0
+        # Undo journal, None unless enable_journal() was called
+        self.journal: Optional[List[JournalEntry]] = None
+        self.undone: List[List[JournalEntry]] = []  # Batches for redo()
+        # Called with the indices of changed cells, see subscribe()
+        self.listeners: List[ChangeListener] = []
+        self.counted_grid: List[List[Space]] = self.board  # Grid counted
+
+    def allocate_storage(self) -> None:
+        """ Build the grid of Space objects that holds the board state. """
+        cols: int = self.size[1]
+        # Every row shares one column int per column and one SpaceRow, so a
+        # space holds nothing but references to shared objects
+        columns: List[int] = list(range(cols))
+        for row in range(self.size[0]):
+            space_row: SpaceRow = SpaceRow(self, row * cols)
+            # Initialzie with no mines
+            self.board.append([Space(False, space_row, col)
+                               for col in columns])
 
     def initialize_mines(self, positions: List[Tuple[int, int]]) -> None:
         """
         Initialize mines on the board.
         positions (list): List of mine positions
         """
-        # Reset mine settings
-        for row in self.board:
-            for space in row:
-                space.has_bomb = False
-                space.clicked = False
-                space.flagged = False
-                space.around = 0
-        # Set mines at given positions
-        for position in positions:
-            self.get_piece(position).has_bomb = True
-            print(f"Has Mine = {self.get_piece(position).has_bomb}")
-        # Call set up methods
-        self.set_neighbors()
-        self.set_num_around()
+        # Mine counts for the whole grid come from one vectorized pass, so
+        # no per-space neighbor lists are needed
+        mines: np.ndarray = mine_mask(self.size, positions)
+        around: np.ndarray = count_mines_around(mines)
+        # Reset every space and copy the new layout in
+        for row, mine_row, around_row in zip(self.board, mines.tolist(),
+                                             around.tolist()):
+            for space, has_bomb, count in zip(row, mine_row, around_row):
+                space.reset(has_bomb, count)
+        self.safe_cells_left = int(mines.size - np.count_nonzero(mines))
+        self.flag_count = 0
+        self.opened_count = 0
+        self.counted_grid = self.board
+        self.generation += 1
+        self.reset_journal()
+        self.notify_all()
         self.initialized = True
-        print("Mines placed and initialized")
 
     def reveal_all_non_flagged_squares(self) -> None:
         """ Reveal unrevealed and unflagged spaces on the board. """
-        for row in self.board:
-            for space in row:
-                if not space.get_flagged() and not space.get_clicked():
-                    self.handle_click(space, False)
+        self.reveal_many([(row, col) for row, pieces in enumerate(self.board)
+                          for col, space in enumerate(pieces)
+                          if not space.get_flagged()
+                          and not space.get_clicked()])
 
     def get_total_mine_count(self) -> int:
         """ Get total number of mines on board. """
@@ -57,12 +194,8 @@ class Board:
 
     def count_flags(self) -> int:
         """ Count number of flags on the board. """
-        flag_count: int = 0
-        for row in self.board:
-            for space in row:
-                if space.get_flagged():
-                    flag_count += 1
-        return flag_count
+        self.sync_counts()
+        return self.flag_count
 
     def print_board(self) -> None:
         """ Print the current state of the board. """
@@ -87,38 +220,152 @@ class Board:
         """
         return self.board[index[0]][index[1]]
 
-    def handle_click(self, piece: Space, flag: bool) -> None:
+    def get_neighbors(self, index: int) -> List[Space]:
+        """
+        Get the pieces around a piece, built on demand.
+        index (int): Flat (row-major) index of the piece
+        Returns list - the neighboring pieces
+        """
+        cols: int = self.size[1]
+        return [self.board[neighbor // cols][neighbor % cols]
+                for neighbor in self.geometry.neighbors(index)]
+
+    def neighbor_indices(self, index: int) -> Sequence[int]:
+        """
+        Get the flat indices of the cells around a cell.
+        index (int): Flat index of the cell
+        Returns sequence - flat indices of the neighbors, in row-major order
+        """
+        return self.geometry.neighbors(index)
+
+    def handle_click(self, piece: Space, flag: bool) -> List[Tuple[int, int]]:
         """
         Handle a click on a piece (Space).
         piece (Space): The piece that was clicked
         flag (bool): Was the click a flag?
+        Returns list - (row, col) of every piece revealed by this click
         """
         if self.get_lost():
             print("Click ignored: game already lost.")
-            return
+            return []
         if piece.get_clicked() or (piece.get_flagged() and not flag):
-            return
+            return []
         if flag:
             piece.toggle_flag()
-            return
+            return []
+        revealed: List[int] = self.reveal(piece)
+        if not self.lost:
+            # One win check once the whole opening is revealed
+            self.set_outcome(self.check_won(), self.lost)
+        cols: int = self.size[1]
+        return [divmod(index, cols) for index in revealed]
+
+    def reveal(self, piece: Space) -> List[int]:
+        """
+        Reveal a hidden piece and, if it is empty, its opening.
+        Does not check for a win; callers do that once per move.
+        piece (Space): The piece to reveal
+        Returns list - flat indices of every piece revealed
+        """
         piece.handle_click()
+        revealed: List[int] = [piece.get_index()]
         if piece.get_has_bomb():
-            self.lost = True
+            self.set_outcome(self.won, True)
             print("Mine revealed: game lost.")
-            return
         elif piece.get_num_around() == 0:
-            for neighbor in piece.get_neighbors():
-                self.handle_click(neighbor, False)
-        else:
-            self.won = self.check_won()
+            revealed.extend(self.flood_fill(piece.get_index()))
+        return revealed
+
+    def reveal_many(self, positions: Iterable[Tuple[int, int]]
+                    ) -> List[Tuple[int, int]]:
+        """
+        Reveal a set of pieces in one move.
+        Revealed and flagged pieces are skipped, revealing stops at the
+        first mine, and the win is checked once at the end.
+        positions (iterable): (row, col) of the pieces to reveal
+        Returns list - (row, col) of every piece revealed by the move
+        """
+        if self.get_lost():
+            print("Click ignored: game already lost.")
+            return []
+        revealed: List[int] = []
+        for position in positions:
+            piece: Space = self.get_piece(position)
+            if piece.get_clicked() or piece.get_flagged():
+                continue
+            revealed.extend(self.reveal(piece))
+            if self.lost:
+                break
+        if revealed and not self.lost:
+            self.set_outcome(self.check_won(), self.lost)
+        cols: int = self.size[1]
+        return [divmod(index, cols) for index in revealed]
+
+    def flag_many(self, positions: Iterable[Tuple[int, int]]
+                  ) -> List[Tuple[int, int]]:
+        """
+        Flag a set of pieces in one move.
+        Revealed and already flagged pieces are skipped.
+        positions (iterable): (row, col) of the pieces to flag
+        Returns list - (row, col) of every piece flagged by the move
+        """
+        if self.get_lost():
+            print("Click ignored: game already lost.")
+            return []
+        flagged: List[Tuple[int, int]] = []
+        for position in positions:
+            piece: Space = self.get_piece(position)
+            if piece.get_clicked() or piece.get_flagged():
+                continue
+            piece.toggle_flag()
+            flagged.append(position)
+        return flagged
+
+    def chord(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Reveal every hidden, unflagged neighbor of a revealed number whose
+        mines are all flagged.
+        position (tuple): (row, col) of the revealed number
+        Returns list - (row, col) of every piece revealed (empty if the
+        number is hidden or does not have as many flags around as mines)
+        """
+        piece: Space = self.get_piece(position)
+        if not piece.get_clicked() or self.get_lost():
+            return []
+        neighbors: List[Space] = self.get_neighbors(piece.get_index())
+        flags: int = sum(1 for neighbor in neighbors
+                         if neighbor.get_flagged())
+        if flags != piece.get_num_around():
+            return []
+        cols: int = self.size[1]
+        return self.reveal_many([
+            divmod(neighbor.get_index(), cols) for neighbor in neighbors
+            if not neighbor.get_clicked() and not neighbor.get_flagged()])
+
+    def flood_fill(self, start: int) -> List[int]:
+        """
+        Reveal the opening around an already revealed empty piece.
+        Uses an explicit stack, so the size of the opening is not limited by
+        the recursion limit, and each piece is visited once.
+        start (int): Flat index of the revealed piece with no mines around
+        Returns list - flat indices of the pieces newly revealed
+        """
+        revealed: List[int] = []
+        stack: List[int] = [start]
+        while stack:
+            for neighbor in self.get_neighbors(stack.pop()):
+                if neighbor.get_clicked() or neighbor.get_flagged():
+                    continue
+                neighbor.handle_click()
+                revealed.append(neighbor.get_index())
+                if neighbor.get_num_around() == 0:
+                    stack.append(neighbor.get_index())
+        return revealed
 
     def check_won(self) -> bool:
         """ Check if the game has been won. """
-        for row in self.board:
-            for piece in row:
-                if not piece.get_has_bomb() and not piece.get_clicked():
-                    return False
-        return True
+        self.sync_counts()
+        return self.safe_cells_left == 0
 
     def get_won(self) -> bool:
         """ Has the game been won? """
@@ -149,27 +396,349 @@ class Board:
         row (int): Row index of the piece
         col (int): Column index of the piece
         """
-        for r in range(row - 1, row + 2):
-            for c in range(col - 1, col + 2):
-                if r == row and c == col:
-                    continue
-                if r < 0 or r >= self.size[0] or c < 0 or c >= self.size[1]:
-                    continue
-                neighbors.append(self.board[r][c])
-        # print(f"Neighbors for ({row},{col}): {len(neighbors)}")
+        cols: int = self.size[1]
+        for index in self.geometry.neighbors_of(row, col):
+            neighbors.append(self.board[index // cols][index % cols])
 
     def set_num_around(self) -> None:
         """ Set the number of mines around each piece on the board. """
-        for rowIndex, row in enumerate(self.board):
-            for colIndex, piece in enumerate(row):
-                piece.set_num_around()
+        mines: np.ndarray = np.array([[piece.get_has_bomb() for piece in row]
+                                      for row in self.board], dtype=bool)
+        around: np.ndarray = count_mines_around(mines)
+        for row, around_row in zip(self.board, around.tolist()):
+            for piece, count in zip(row, around_row):
+                piece.around = count
 
     def is_board_opened(self) -> bool:
         """
         Check to see if the space that was selected opened up the board.
         Returns bool - True is board is fully opnened, False otherwise """
+        self.sync_counts()
+        return self.opened_count > 0
+
+    def space_changed(self, piece: Space, old_state: int) -> None:
+        """
+        Update the running counters after a piece changed state.
+        Called by the piece itself whenever it is clicked or (un)flagged.
+        piece (Space): The piece that changed
+        old_state (int): The piece's state bits before the change
+        """
+        new_state: int = piece.get_state()
+        self.count_change(old_state, new_state, piece.get_num_around())
+        self.generation += 1
+        if self.journal is not None:
+            self.record(piece.get_index(), old_state, new_state)
+        if self.listeners:
+            self.notify((piece.get_index(),))
+
+    def count_change(self, old_state: int, new_state: int, around: int
+                     ) -> None:
+        """
+        Update the running counters for one piece changing state.
+        old_state (int): The piece's state bits before the change
+        new_state (int): The piece's state bits after the change
+        around (int): Number of mines around the piece
+        """
+        changed: int = old_state ^ new_state
+        if changed & FLAGGED:
+            self.flag_count += 1 if new_state & FLAGGED else -1
+        if changed & (MINE | CLICKED):
+            self.safe_cells_left += (not new_state & (MINE | CLICKED)) \
+                - (not old_state & (MINE | CLICKED))
+        if changed & CLICKED and around == 0:
+            self.opened_count += 1 if new_state & CLICKED else -1
+
+    def scan_counts(self) -> Tuple[int, int, int]:
+        """
+        Count the board state with a full scan.
+        Returns tuple - (safe cells left, flags, opened cells)
+        """
+        safe_cells_left: int = 0
+        flag_count: int = 0
+        opened_count: int = 0
         for row in self.board:
             for space in row:
+                if not space.get_has_bomb() and not space.get_clicked():
+                    safe_cells_left += 1
+                if space.get_flagged():
+                    flag_count += 1
                 if space.get_clicked() and space.get_num_around() == 0:
-                    return True
-        return False
+                    opened_count += 1
+        return safe_cells_left, flag_count, opened_count
+
+    def recount(self) -> None:
+        """ Rebuild the running counters from a full scan. """
+        self.safe_cells_left, self.flag_count, self.opened_count = \
+            self.scan_counts()
+        self.counted_grid = self.board
+        self.generation += 1
+
+    def verify_counts(self) -> None:
+        """
+        Compare the running counters with a full scan.
+        Raises RuntimeError if they disagree
+        """
+        counters: Tuple[int, int, int] = (
+            self.safe_cells_left, self.flag_count, self.opened_count)
+        scanned: Tuple[int, int, int] = self.scan_counts()
+        if counters != scanned:
+            raise RuntimeError(f"Board counters {counters} do not match a "
+                               + f"full scan {scanned}")
+
+    def sync_counts(self) -> None:
+        """
+        Make sure the running counters describe the current grid.
+        They are rebuilt if the grid was replaced wholesale, and checked
+        against a full scan in debug mode.
+        """
+        if self.counted_grid is not self.board:
+            self.recount()
+        elif self.debug:
+            self.verify_counts()
+
+    def get_state_at(self, index: int) -> int:
+        """
+        Get the state bits of the piece at a flat index.
+        index (int): Flat (row-major) index of the piece
+        Returns int - the packed MINE/CLICKED/FLAGGED bits
+        """
+        cols: int = self.size[1]
+        return self.board[index // cols][index % cols].get_state()
+
+    def get_around_at(self, index: int) -> int:
+        """
+        Get the number of mines around the piece at a flat index.
+        index (int): Flat (row-major) index of the piece
+        """
+        cols: int = self.size[1]
+        return self.board[index // cols][index % cols].get_num_around()
+
+    def state_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the state bits and the mines around of every piece at once.
+        Every Space is read, about 0.1 s per million pieces; ArrayBoard
+        returns its storage instead, so large boards belong there.
+        Returns tuple - (states, around), uint8 arrays of the board's size
+        """
+        states: bytes = bytes(space.get_state() for row in self.board
+                              for space in row)
+        around: bytes = bytes(space.get_num_around() for row in self.board
+                              for space in row)
+        return (np.frombuffer(states, dtype=np.uint8).reshape(self.size),
+                np.frombuffer(around, dtype=np.uint8).reshape(self.size))
+
+    def set_state_at(self, index: int, state: int) -> None:
+        """
+        Overwrite the state bits of the piece at a flat index.
+        Nothing is reported; callers keep the counters right themselves.
+        index (int): Flat (row-major) index of the piece
+        state (int): New MINE/CLICKED/FLAGGED bits
+        """
+        cols: int = self.size[1]
+        self.board[index // cols][index % cols].write_state(state)
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Save the state of every piece and of the game.
+        Returns BoardSnapshot - pass it to restore() to come back here
+        """
+        self.sync_counts()
+        states: bytes = bytes(space.get_state() for row in self.board
+                              for space in row)
+        around: bytes = bytes(space.get_num_around() for row in self.board
+                              for space in row)
+        return self.make_snapshot((states, around))
+
+    def make_snapshot(self, cells: Any) -> BoardSnapshot:
+        """ Wrap a copy of the cells with the game state. """
+        return BoardSnapshot(self.size, cells, self.won, self.lost,
+                             self.initialized, (self.safe_cells_left,
+                                                self.flag_count,
+                                                self.opened_count))
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        """
+        Put the board back to a state saved by snapshot().
+        snapshot (BoardSnapshot): Snapshot taken from a board of this kind
+        Raises ValueError if the snapshot is for a board of another size
+        """
+        self.check_snapshot(snapshot)
+        states, around = snapshot.cells
+        cols: int = self.size[1]
+        for row_index, row in enumerate(self.board):
+            offset: int = row_index * cols
+            for col, space in enumerate(row):
+                space.reset(False, around[offset + col])
+                space.write_state(states[offset + col])
+        self.restore_game(snapshot)
+        self.counted_grid = self.board
+        self.notify_all()
+
+    def check_snapshot(self, snapshot: BoardSnapshot) -> None:
+        """ Make sure a snapshot fits this board. """
+        if snapshot.size != self.size:
+            raise ValueError(f"Snapshot of a {snapshot.size} board cannot be "
+                             + f"restored on a {self.size} board")
+
+    def restore_game(self, snapshot: BoardSnapshot) -> None:
+        """ Restore the game flags and counters of a snapshot. """
+        self.won = snapshot.won
+        self.lost = snapshot.lost
+        self.initialized = snapshot.initialized
+        self.safe_cells_left, self.flag_count, self.opened_count = \
+            snapshot.counts
+        self.generation += 1
+        self.reset_journal()
+
+    def fork(self) -> "BoardFork":
+        """
+        Make a copy-on-write copy of the board for speculative play.
+        The fork shares every piece with this board until it changes it,
+        so this board must not change while the fork is in use.
+        Returns BoardFork - the copy
+        """
+        from boardfork import BoardFork
+        return BoardFork(self)
+
+    def set_outcome(self, won: bool, lost: bool) -> None:
+        """
+        Set the won and lost flags, journaling the change.
+        won (bool): Has the game been won?
+        lost (bool): Has the game been lost?
+        """
+        if self.journal is not None and (won, lost) != (self.won, self.lost):
+            self.record(GAME, WON * self.won | LOST * self.lost,
+                        WON * won | LOST * lost)
+        self.won = won
+        self.lost = lost
+
+    def enable_journal(self) -> None:
+        """
+        Start journaling every change, so it can be undone.
+        The journal is append-only; undo_to() and redo() cost time
+        proportional to the changes they revert or replay.
+        """
+        if self.journal is None:
+            self.journal = []
+            self.undone = []
+
+    def disable_journal(self) -> None:
+        """ Stop journaling and drop the journal. """
+        self.journal = None
+        self.undone = []
+
+    def reset_journal(self) -> None:
+        """ Forget the journal after the whole board was replaced. """
+        if self.journal is not None:
+            self.journal = []
+            self.undone = []
+
+    def record(self, index: int, old_state: int, new_state: int) -> None:
+        """ Append a change to the journal; a new change ends redo. """
+        if self.journal is not None:
+            self.journal.append((index, old_state, new_state))
+            if self.undone:
+                self.undone = []
+
+    def mark(self) -> int:
+        """
+        Mark the current point in the journal.
+        Returns int - mark to pass to undo_to()
+        Raises RuntimeError if journaling is not enabled
+        """
+        if self.journal is None:
+            raise RuntimeError("Journaling is not enabled on this board")
+        return len(self.journal)
+
+    def undo_to(self, mark: int) -> int:
+        """
+        Revert every change made since a mark, newest first.
+        mark (int): Mark returned by mark()
+        Returns int - number of changes reverted
+        Raises ValueError if the mark is not in the journal
+        """
+        journal: Optional[List[JournalEntry]] = self.journal
+        if journal is None or not 0 <= mark <= len(journal):
+            raise ValueError(f"Mark {mark} is not in the journal")
+        reverted: List[JournalEntry] = journal[mark:]
+        del journal[mark:]
+        for index, old_state, new_state in reversed(reverted):
+            self.apply_change(index, new_state, old_state)
+        self.undone.append(reverted)
+        self.notify_entries(reverted)
+        return len(reverted)
+
+    def redo(self) -> int:
+        """
+        Replay the changes reverted by the latest undo_to().
+        Returns int - number of changes replayed (0 if nothing to redo)
+        """
+        if self.journal is None or not self.undone:
+            return 0
+        replayed: List[JournalEntry] = self.undone.pop()
+        for index, old_state, new_state in replayed:
+            self.apply_change(index, old_state, new_state)
+        self.journal.extend(replayed)
+        self.notify_entries(replayed)
+        return len(replayed)
+
+    def apply_change(self, index: int, current: int, target: int) -> None:
+        """
+        Move a piece (or the game flags) from one journaled state to
+        another, keeping the counters right.
+        index (int): Flat index of the piece, or GAME
+        current (int): State it is in now
+        target (int): State to put it in
+        """
+        if index == GAME:
+            self.won = bool(target & WON)
+            self.lost = bool(target & LOST)
+        else:
+            self.set_state_at(index, target)
+            self.count_change(current, target, self.get_around_at(index))
+        self.generation += 1
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """
+        Call a listener with the flat indices of the cells that change.
+        Clicks and flags report each cell, flood fills and undo/redo may
+        report a batch at once, and laying out mines or restoring a
+        snapshot reports every cell.
+        listener (callable): Called with an iterable of flat indices
+        """
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: ChangeListener) -> None:
+        """ Stop calling a listener added with subscribe(). """
+        self.listeners.remove(listener)
+
+    def track_changes(self) -> ChangeFeed:
+        """
+        Start collecting the cells that change into a new feed.
+        Returns ChangeFeed - drain() it to get the changed cells (None
+        after a new layout or a restore)
+        """
+        feed: ChangeFeed = ChangeFeed(self.geometry.cell_count)
+        self.subscribe(feed)
+        return feed
+
+    def notify(self, indices: Iterable[int]) -> None:
+        """ Tell every listener that cells changed. """
+        for listener in self.listeners:
+            listener(indices)
+
+    def notify_all(self) -> None:
+        """
+        Tell every listener that every cell changed. Feeds are only
+        flagged, rather than handed every index.
+        """
+        for listener in self.listeners:
+            if isinstance(listener, ChangeFeed):
+                listener.mark_all()
+            else:
+                listener(range(self.geometry.cell_count))
+
+    def notify_entries(self, entries: List[JournalEntry]) -> None:
+        """ Tell every listener about the cells in journal entries. """
+        if self.listeners:
+            self.notify([entry[0] for entry in entries if entry[0] != GAME])
@@ -0,0 +1,276 @@
+from typing import Dict, List, Optional, Set, Tuple
+from board import Board, BoardSnapshot
+from space import Space, MINE, CLICKED, FLAGGED
+
+
+class ForkCell(Space):
+    """
+    View of one cell of a BoardFork.
+    Reads fall through to the board the fork was made from until the fork
+    changes the cell; writes only ever go to the fork.
+    """
+    __slots__ = ('_owner', '_index')
+
+    def __init__(self, owner: "BoardFork", index: int) -> None:
+        """
+        Initialize a view on a cell.
+        owner (BoardFork): Fork the cell is seen through
+        index (int): Flat (row-major) index of the cell
+        """
+        self._owner: "BoardFork" = owner
+        self._index: int = index
+
+    def __eq__(self, other: object) -> bool:
+        """ Views are equal when they look at the same cell. """
+        return isinstance(other, ForkCell) and other._owner is self._owner \
+            and other._index == self._index
+
+    def __hash__(self) -> int:
+        """ Hash on the viewed cell. """
+        return hash((id(self._owner), self._index))
+
+    def get_state(self) -> int:
+        """ Getter for the packed MINE/CLICKED/FLAGGED state bits. """
+        return self._owner.get_state_at(self._index)
+
+    def write_state(self, state: int) -> None:
+        """ Store new state bits in the fork. """
+        self._owner.changed[self._index] = state
+
+    def get_index(self) -> int:
+        """ Getter for the flat (row-major) index on the owning board. """
+        return self._index
+
+    def get_board(self) -> "BoardFork":
+        """ Getter for the fork the cell is seen through. """
+        return self._owner
+
+    def get_num_around(self) -> int:
+        """ Getter for num_around. """
+        return self._owner.get_around_at(self._index)
+
+    def get_has_bomb(self) -> bool:
+        """ Getter for has_bomb. """
+        return self.get_state() & MINE != 0
+
+    def get_clicked(self) -> bool:
+        """ Getter for get_clicked. """
+        return self.get_state() & CLICKED != 0
+
+    def get_flagged(self) -> bool:
+        """ Getter for get_flagged. """
+        return self.get_state() & FLAGGED != 0
+
+    @property
+    def around(self) -> int:
+        return self.get_num_around()
+
+    @around.setter
+    def around(self, value: int) -> None:
+        raise TypeError("A fork shares the mine counts of its parent "
+                        + "board; they cannot be set on it")
+
+    def reset(self, has_bomb: bool, around: int) -> None:
+        """ A fork cannot lay out new mines. """
+        raise TypeError("A fork shares the mine layout of its parent "
+                        + "board; it cannot be reset")
+
+    def set_neighbors(self, neighbors: List[Space]) -> None:
+        """ Neighbors are derived from the board geometry; nothing to set. """
+        pass
+
+    def get_neighbors(self) -> List[Space]:
+        """ Getter for neighbors (views on the adjacent cells). """
+        return self._owner.get_neighbors(self._index)
+
+
+class BoardFork(Board):
+    """
+    Copy-on-write copy of a board, made by Board.fork().
+    The fork stores nothing but the state bits of the cells it changed
+    (changed maps flat index to state) and reads every other cell from the
+    board it was made from, its base. Forking and playing a hypothesis on
+    the fork therefore cost time proportional to the cells touched, not
+    to the size of the board. Forking a fork copies its changes and shares
+    the same base.
+    The base must not change while the fork is in use; the fork checks the
+    base's generation and raises RuntimeError if it did.
+    """
+
+    def __init__(self, parent: Board) -> None:
+        """
+        Fork a board.
+        parent (Board): Board (or fork) to start from
+        """
+        # Nothing is allocated or scanned: the fork starts out as a copy
+        # of the parent's flags and counters
+        self.setup_fields(parent.size, parent.mine_count, parent.geometry)
+        self.won = parent.won
+        self.lost = parent.lost
+        self.initialized = parent.initialized
+        self.debug = parent.debug
+        parent.sync_counts()
+        self.safe_cells_left = parent.safe_cells_left
+        self.flag_count = parent.flag_count
+        self.opened_count = parent.opened_count
+        self.changed: Dict[int, int] = {}
+        if isinstance(parent, BoardFork):
+            parent.check_base()
+            self.base: Board = parent.base
+            self.base_generation: int = parent.base_generation
+            self.changed.update(parent.changed)
+        else:
+            self.base = parent
+            self.base_generation = parent.generation
+
+    def check_base(self) -> None:
+        """
+        Make sure the base board has not changed since the fork was made.
+        Raises RuntimeError if it has
+        """
+        if self.base.generation != self.base_generation:
+            raise RuntimeError("The board this fork was made from has "
+                               + "changed since")
+
+    def get_state_at(self, index: int) -> int:
+        """
+        Get the state bits of the cell at a flat index.
+        index (int): Flat (row-major) index of the cell
+        Returns int - the packed MINE/CLICKED/FLAGGED bits
+        """
+        state: Optional[int] = self.changed.get(index)
+        if state is None:
+            self.check_base()
+            return self.base.get_state_at(index)
+        return state
+
+    def get_around_at(self, index: int) -> int:
+        """
+        Get the number of mines around the cell at a flat index.
+        index (int): Flat (row-major) index of the cell
+        """
+        return self.base.get_around_at(index)
+
+    def set_state_at(self, index: int, state: int) -> None:
+        """
+        Overwrite the state bits of the cell at a flat index (in the fork).
+        index (int): Flat (row-major) index of the cell
+        state (int): New MINE/CLICKED/FLAGGED bits
+        """
+        self.changed[index] = state
+
+    def allocate_storage(self) -> None:
+        """ A fork stores its changes only; nothing to allocate. """
+        pass
+
+    def initialize_mines(self, positions: List[Tuple[int, int]]) -> None:
+        """ A fork cannot lay out new mines. """
+        raise TypeError("A fork shares the mine layout of its parent "
+                        + "board; it cannot lay out new mines")
+
+    def set_num_around(self) -> None:
+        """ A fork shares the mine counts of its base; nothing to set. """
+        pass
+
+    def reveal_all_non_flagged_squares(self) -> None:
+        """ Reveal unrevealed and unflagged spaces on the board. """
+        self.reveal_many([
+            self.geometry.position_of(index)
+            for index in range(self.geometry.cell_count)
+            if not self.get_state_at(index) & (CLICKED | FLAGGED)])
+
+    def print_board(self) -> None:
+        """ Print the current state of the board. """
+        for row in self.get_board():
+            for piece in row:
+                print(piece, end=" ")
+            print()
+
+    def get_board(self) -> List[List[Space]]:
+        """
+        Get the game board as a grid of cell views.
+        This materializes one view per cell, so prefer get_piece().
+        """
+        cols: int = self.size[1]
+        return [[ForkCell(self, row * cols + col) for col in range(cols)]
+                for row in range(self.size[0])]
+
+    def get_piece(self, index: Tuple[int, int]) -> Space:
+        """
+        Get a piece at a given index.
+        index (tuple): Index of the piece (space)
+        Returns a ForkCell on the given index
+        """
+        rows, cols = self.size
+        row, col = index
+        if not (-rows <= row < rows and -cols <= col < cols):
+            raise IndexError(f"Index {index} is off the board")
+        return ForkCell(self, (row % rows) * cols + col % cols)
+
+    def get_neighbors(self, index: int) -> List[Space]:
+        """
+        Get views on the cells around a cell.
+        index (int): Flat (row-major) index of the cell
+        Returns list - views on the neighboring cells
+        """
+        return [ForkCell(self, neighbor)
+                for neighbor in self.geometry.neighbors(index)]
+
+    def set_neighbors(self) -> None:
+        """ Neighbors are computed from the geometry; nothing to store. """
+        pass
+
+    def add_to_neighbors_list(self, neighbors: List[Space], row: int, col: int
+                              ) -> None:
+        """
+        Add neighbors to a list for a given piece (Space).
+        neighbors (list): List to store neighbors
+        row (int): Row index of the piece
+        col (int): Column index of the piece
+        """
+        for index in self.geometry.neighbors_of(row, col):
+            neighbors.append(ForkCell(self, index))
+
+    def scan_counts(self) -> Tuple[int, int, int]:
+        """
+        Count the board state with a full scan through the fork.
+        Returns tuple - (safe cells left, flags, opened cells)
+        """
+        safe_cells_left: int = 0
+        flag_count: int = 0
+        opened_count: int = 0
+        for index in range(self.geometry.cell_count):
+            state: int = self.get_state_at(index)
+            if not state & (MINE | CLICKED):
+                safe_cells_left += 1
+            if state & FLAGGED:
+                flag_count += 1
+            if state & CLICKED and self.get_around_at(index) == 0:
+                opened_count += 1
+        return safe_cells_left, flag_count, opened_count
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Save the state of the fork; costs one copy of its changes.
+        Returns BoardSnapshot - pass it to restore() to come back here
+        """
+        self.sync_counts()
+        return self.make_snapshot(dict(self.changed))
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        """
+        Put the fork back to a state saved by snapshot().
+        snapshot (BoardSnapshot): Snapshot taken from a fork of the same base
+        Raises ValueError if the snapshot is for a board of another size or
+        was not taken from a fork
+        """
+        self.check_snapshot(snapshot)
+        if not isinstance(snapshot.cells, dict):
+            raise ValueError("Only a snapshot of a fork can be restored on "
+                             + "a fork")
+        self.check_base()
+        touched: Set[int] = set(self.changed)
+        self.changed = dict(snapshot.cells)
+        self.restore_game(snapshot)
+        if self.listeners:
+            self.notify(touched | set(self.changed))
@@ -0,0 +1,402 @@
+import heapq
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Clauses are lists of literals: variable v (numbered from 1) is the
+# literal v when true and -v when false
+Clause = List[int]
+
+# Largest number of clauses a cardinality constraint is spelled out with
+# directly; bigger ones use a totalizer with helper variables
+DIRECT_LIMIT: int = 70
+
+
+class CdclSolver:
+    """
+    Small conflict-driven clause learning SAT solver.
+    Unit propagation uses two watched literals per clause, so a clause is
+    only looked at when one of its two watched literals turns false.
+    Every conflict is analysed back to its first unique implication point;
+    the clause learnt from it is kept and the search jumps back to the
+    level where that clause forces a value. Branching follows the
+    variables most involved in recent conflicts (VSIDS) with saved
+    phases, and the search restarts on a growing conflict budget.
+    solve() takes assumptions, so one formula answers many "can this
+    literal be true" queries and keeps what it learnt between them.
+    """
+
+    def __init__(self) -> None:
+        """ Initialize an empty formula. """
+        self.clauses: List[Clause] = []
+        # Literal -> clauses watching it
+        self.watches: Dict[int, List[int]] = {}
+        # Per variable (slot 0 unused): 1 true, -1 false, 0 unassigned
+        self.values: List[int] = [0]
+        self.levels: List[int] = [0]
+        # Clause that forced the variable, -1 for decisions and facts
+        self.reasons: List[int] = [-1]
+        self.activity: List[float] = [0.0]
+        self.phases: List[bool] = [False]
+        self.decisions: List[bool] = [False]
+        self.order: List[Tuple[float, int]] = []
+        self.bump_step: float = 1.0
+        # Assigned literals in order, and where each decision level starts
+        self.trail: List[int] = []
+        self.trail_limits: List[int] = []
+        self.queue_head: int = 0
+        self.consistent: bool = True
+        self.model: List[bool] = [False]
+        self.conflicts: int = 0
+
+    def new_var(self, decision: bool = True) -> int:
+        """
+        Add a variable and return its number.
+        decision (bool): False for helper variables that propagation
+        settles once the others are assigned; the search never branches
+        on them and their values in the model are meaningless
+        """
+        self.values.append(0)
+        self.levels.append(0)
+        self.reasons.append(-1)
+        self.activity.append(0.0)
+        self.phases.append(False)
+        self.model.append(False)
+        self.decisions.append(decision)
+        var: int = len(self.values) - 1
+        if decision:
+            heapq.heappush(self.order, (0.0, var))
+        return var
+
+    def value(self, literal: int) -> int:
+        """ 1 if the literal is true, -1 if false, 0 if unassigned. """
+        value: int = self.values[abs(literal)]
+        return value if literal > 0 else -value
+
+    def add_clause(self, literals: Sequence[int]) -> bool:
+        """
+        Add a clause to the formula.
+        literals (list): Literals of the clause, at least one of them true
+        Returns bool - False if the formula has become unsatisfiable
+        """
+        self.backtrack(0)
+        if not self.consistent:
+            return False
+        clause: Clause = []
+        for literal in dict.fromkeys(literals):
+            if -literal in literals or self.value(literal) == 1:
+                return True
+            if self.value(literal) == 0:
+                clause.append(literal)
+        if not clause:
+            self.consistent = False
+        elif len(clause) == 1:
+            self.enqueue(clause[0], -1)
+            self.consistent = self.propagate() < 0
+        else:
+            self.attach(clause)
+        return self.consistent
+
+    def add_at_most(self, literals: Sequence[int], bound: int,
+                    guard: int = 0) -> bool:
+        """
+        Add the constraint that at most bound literals are true.
+        Small constraints are spelled out as one clause per set of bound+1
+        literals; bigger ones go through a totalizer, counting the true
+        literals or the false ones, whichever needs fewer outputs.
+        literals (list): Literals to count
+        bound (int): Most literals that may be true
+        guard (int): If given, the constraint only holds while this
+        literal is true, so solve([guard]) asks about it
+        Returns bool - False if the formula has become unsatisfiable
+        """
+        count: int = len(literals)
+        if bound >= count:
+            return self.consistent
+        if bound < 0:
+            return self.add_clause(self.guarded([], guard))
+        if bound == 0 or comb(count, bound + 1) <= DIRECT_LIMIT:
+            for chosen in combinations(literals, bound + 1):
+                self.add_clause(self.guarded(
+                    [-literal for literal in chosen], guard))
+        elif bound + 1 <= count - bound:
+            outputs: List[int] = self.add_totalizer(literals, bound + 1)
+            self.add_clause(self.guarded([-outputs[bound]], guard))
+        else:
+            outputs = self.add_totalizer([-literal for literal in literals],
+                                         count - bound)
+            self.add_clause(self.guarded([outputs[-1]], guard))
+        return self.consistent
+
+    def add_at_least(self, literals: Sequence[int], bound: int,
+                     guard: int = 0) -> bool:
+        """
+        Add the constraint that at least bound literals are true.
+        literals (list): Literals to count
+        bound (int): Fewest literals that may be true
+        guard (int): If given, the constraint only holds while this
+        literal is true
+        Returns bool - False if the formula has become unsatisfiable
+        """
+        return self.add_at_most([-literal for literal in literals],
+                                len(literals) - bound, guard)
+
+    def add_exactly(self, literals: Sequence[int], count: int) -> bool:
+        """
+        Add the constraint that exactly count literals are true.
+        literals (list): Literals to count
+        count (int): Number of literals that are true
+        Returns bool - False if the formula has become unsatisfiable
+        """
+        self.add_at_most(literals, count)
+        return self.add_at_least(literals, count)
+
+    def guarded(self, clause: Clause, guard: int) -> Clause:
+        """ A clause that only has to hold while guard is true. """
+        return clause + [-guard] if guard else clause
+
+    def add_totalizer(self, literals: Sequence[int], cap: int) -> List[int]:
+        """
+        Count literals in unary with a totalizer (Bailleux and Boufkhad
+        2003): a tree that merges the counts of its two halves.
+        Propagation keeps the outputs exact in both directions, so once
+        the literals are assigned the outputs are too, and an assumption
+        on an output asks for a bound on the count.
+        literals (list): Literals to count (at least one)
+        cap (int): Number of outputs wanted (at least one)
+        Returns list - outputs; output j is true exactly when more than j
+        of the literals are, for j below min(cap, number of literals)
+        """
+        if len(literals) == 1:
+            return [literals[0]]
+        half: int = len(literals) // 2
+        left: List[int] = self.add_totalizer(literals[:half], cap)
+        right: List[int] = self.add_totalizer(literals[half:], cap)
+        size: int = min(len(literals), cap)
+        outputs: List[int] = [self.new_var(False) for _ in range(size)]
+        for i in range(len(left) + 1):
+            for j in range(min(len(right), size - i) + 1):
+                # More than i - 1 on the left and j - 1 on the right
+                if i + j > 0:
+                    self.add_clause(
+                        [outputs[i + j - 1]]
+                        + ([-left[i - 1]] if i else [])
+                        + ([-right[j - 1]] if j else []))
+                # At most i on the left and j on the right
+                if i + j < size:
+                    self.add_clause(
+                        [-outputs[i + j]]
+                        + ([left[i]] if i < len(left) else [])
+                        + ([right[j]] if j < len(right) else []))
+        return outputs
+
+    def attach(self, clause: Clause) -> int:
+        """ Store a clause, watching its first two literals. """
+        index: int = len(self.clauses)
+        self.clauses.append(clause)
+        self.watches.setdefault(clause[0], []).append(index)
+        self.watches.setdefault(clause[1], []).append(index)
+        return index
+
+    def enqueue(self, literal: int, reason: int) -> None:
+        """ Make a literal true at the current decision level. """
+        var: int = abs(literal)
+        self.values[var] = 1 if literal > 0 else -1
+        self.levels[var] = len(self.trail_limits)
+        self.reasons[var] = reason
+        self.trail.append(literal)
+
+    def propagate(self) -> int:
+        """
+        Assign every literal the clauses force, from the watches of the
+        literals assigned since the last call.
+        Returns int - index of a clause with every literal false, or -1
+        """
+        # Literal values are read inline: this loop is where the time goes
+        values: List[int] = self.values
+        clauses: List[Clause] = self.clauses
+        trail: List[int] = self.trail
+        while self.queue_head < len(trail):
+            false_literal: int = -trail[self.queue_head]
+            self.queue_head += 1
+            watching: List[int] = self.watches.get(false_literal, [])
+            kept: List[int] = []
+            for slot, index in enumerate(watching):
+                clause: Clause = clauses[index]
+                # Keep the literal that turned false in the second place
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], false_literal
+                first: int = clause[0]
+                first_value: int = values[first] if first > 0 \
+                    else -values[-first]
+                if first_value == 1:
+                    kept.append(index)
+                    continue
+                for other in range(2, len(clause)):
+                    literal: int = clause[other]
+                    if (values[literal] if literal > 0
+                            else -values[-literal]) != -1:
+                        clause[1], clause[other] = literal, clause[1]
+                        self.watches.setdefault(literal, []).append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if first_value == -1:
+                        kept.extend(watching[slot + 1:])
+                        self.watches[false_literal] = kept
+                        self.queue_head = len(trail)
+                        return index
+                    self.enqueue(first, index)
+            self.watches[false_literal] = kept
+        return -1
+
+    def analyze(self, conflict: int) -> Tuple[Clause, int]:
+        """
+        Learn a clause from a conflict, cut at the first unique
+        implication point of the current level.
+        conflict (int): Index of the clause with every literal false
+        Returns tuple - (learnt clause with the literal it forces first and
+        a literal of the level to jump back to second, that level)
+        """
+        level: int = len(self.trail_limits)
+        seen: List[bool] = [False] * len(self.values)
+        learnt: Clause = [0]
+        pending: int = 0
+        implied: int = 0
+        position: int = len(self.trail) - 1
+        reason: int = conflict
+        while True:
+            for literal in self.clauses[reason]:
+                var: int = abs(literal)
+                if var == abs(implied) or seen[var] or self.levels[var] == 0:
+                    continue
+                seen[var] = True
+                self.bump(var)
+                if self.levels[var] == level:
+                    pending += 1
+                else:
+                    learnt.append(literal)
+            while not seen[abs(self.trail[position])]:
+                position -= 1
+            implied = self.trail[position]
+            position -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            reason = self.reasons[abs(implied)]
+        learnt[0] = -implied
+        if len(learnt) == 1:
+            return learnt, 0
+        deepest: int = max(range(1, len(learnt)),
+                           key=lambda slot: self.levels[abs(learnt[slot])])
+        learnt[1], learnt[deepest] = learnt[deepest], learnt[1]
+        return learnt, self.levels[abs(learnt[1])]
+
+    def bump(self, var: int) -> None:
+        """ Raise the branching priority of a variable seen in a conflict. """
+        self.activity[var] += self.bump_step
+        if self.activity[var] > 1e100:
+            self.activity = [activity * 1e-100 for activity in self.activity]
+            self.bump_step *= 1e-100
+            self.order = [(-self.activity[var], var)
+                          for var in range(1, len(self.values))
+                          if self.values[var] == 0 and self.decisions[var]]
+            heapq.heapify(self.order)
+
+    def backtrack(self, level: int) -> None:
+        """ Undo every assignment above a decision level. """
+        if len(self.trail_limits) <= level:
+            return
+        start: int = self.trail_limits[level]
+        for literal in self.trail[start:]:
+            var: int = abs(literal)
+            self.phases[var] = literal > 0
+            self.values[var] = 0
+            self.reasons[var] = -1
+            if self.decisions[var]:
+                heapq.heappush(self.order, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_limits[level:]
+        self.queue_head = start
+
+    def pick_branch(self) -> int:
+        """
+        Choose the next decision: the unassigned decision variable with
+        the highest activity, in its saved phase.
+        Returns int - the literal to make true, or 0 if all are assigned
+        """
+        while self.order:
+            key, var = heapq.heappop(self.order)
+            # Entries go stale when a variable is assigned or bumped
+            if self.values[var] == 0 and -key == self.activity[var]:
+                return var if self.phases[var] else -var
+        return 0
+
+    def solve(self, assumptions: Sequence[int] = ()) -> bool:
+        """
+        Look for an assignment satisfying every clause.
+        The assumptions are taken as the first decisions, so a False
+        answer under assumptions leaves the formula usable; clauses learnt
+        along the way are kept for later calls.
+        assumptions (list): Literals that must be true
+        Returns bool - True if satisfiable (the assignment is left in
+        model, by variable), False otherwise
+        """
+        return bool(self.solve_within(assumptions, None))
+
+    def solve_within(self, assumptions: Sequence[int],
+                     conflict_limit: Optional[int]) -> Optional[bool]:
+        """
+        Like solve(), giving up after a number of conflicts.
+        Some questions, such as bounds on how many of many literals can
+        be true, take resolution an exponential number of steps.
+        assumptions (list): Literals that must be true
+        conflict_limit (int): Conflicts allowed, None for no limit
+        Returns bool - True if satisfiable, False if not, None if the
+        limit was reached first
+        """
+        self.backtrack(0)
+        if not self.consistent or self.propagate() >= 0:
+            self.consistent = False
+            return False
+        conflicts: int = 0
+        budget: int = 100
+        since_restart: int = 0
+        while True:
+            conflict: int = self.propagate()
+            if conflict >= 0:
+                self.conflicts += 1
+                conflicts += 1
+                since_restart += 1
+                if not self.trail_limits:
+                    self.consistent = False
+                    return False
+                learnt, level = self.analyze(conflict)
+                self.backtrack(level)
+                if len(learnt) == 1:
+                    self.enqueue(learnt[0], -1)
+                else:
+                    self.enqueue(learnt[0], self.attach(learnt))
+                self.bump_step /= 0.95
+                if conflict_limit is not None and conflicts >= conflict_limit:
+                    self.backtrack(0)
+                    return None
+                if since_restart >= budget:
+                    self.backtrack(0)
+                    since_restart = 0
+                    budget += budget // 2
+                continue
+            if len(self.trail_limits) < len(assumptions):
+                literal: int = assumptions[len(self.trail_limits)]
+                if self.value(literal) == -1:
+                    return False
+                self.trail_limits.append(len(self.trail))
+                if self.value(literal) == 0:
+                    self.enqueue(literal, -1)
+                continue
+            decision: int = self.pick_branch()
+            if decision == 0:
+                self.model = [value == 1 for value in self.values]
+                return True
+            self.trail_limits.append(len(self.trail))
+            self.enqueue(decision, -1)
@@ -1,34 +1,72 @@
 import pygame  # type: ignore
 from time import sleep
-from typing import List, Tuple, Any
+from typing import Any, Dict, Iterable, Optional, Tuple
+from arrayboard import ArrayBoard
 from board import Board
-from renderer import Renderer
+from minegen import MinePositions
+from renderer import BOARD_VIEW, MIN_PIECE_SIZE, Renderer
 from initializingstate import InitializingState
 from playingstate import PlayingState
 from gameoverstate import GameOverState
 from SolverInterface import SolverInterface
 
+# Pixels the arrow keys move the camera
+PAN_STEP: int = 100
+# Camera moves of the arrow keys, as (x, y) directions
+PAN_KEYS: Dict[int, Tuple[int, int]] = {
+    pygame.K_LEFT: (-1, 0), pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1), pygame.K_DOWN: (0, 1)}
+# Zoom factor of one wheel notch or key press, and the zoom keys
+ZOOM_STEP: float = 1.25
+ZOOM_KEYS: Dict[int, float] = {
+    pygame.K_EQUALS: ZOOM_STEP, pygame.K_PLUS: ZOOM_STEP,
+    pygame.K_KP_PLUS: ZOOM_STEP, pygame.K_MINUS: 1 / ZOOM_STEP,
+    pygame.K_KP_MINUS: 1 / ZOOM_STEP}
+# Mouse buttons the wheel reports besides its wheel events
+WHEEL_BUTTONS: Tuple[int, int] = (4, 5)
+# Key switching between the tiles and the minimap of the whole board
+MINIMAP_KEY: int = pygame.K_m
+# Boards with more cells keep them in NumPy arrays (ArrayBoard) instead of
+# a Space object per cell, which takes seconds to build on such boards
+ARRAY_BOARD_CELLS: int = 100_000
+
 
 class Game:
-    def __init__(self, grid_size: Tuple[int, int], mine_count: int) -> None:
+    def __init__(self, grid_size: Tuple[int, int], mine_count: int,
+                 mine_positions: Optional[Iterable[Tuple[int, int]]] = None
+                 ) -> None:
         """
         Initialize the game.
         grid_size (tuple): Size of the game grid (rows, columns)
         mine_count (int): Number of mines in the game
-        """
-        self.board: Board = Board(grid_size, mine_count)
-        piece_size: Tuple[int, int] = (800 // grid_size[1],
-                                       800 // grid_size[0])
+        mine_positions (iterable): Mine layout to start playing from, e.g.
+        from a MineGenerator; None to place the mines by clicking
+        """
+        self.board: Board = \
+            ArrayBoard(grid_size, mine_count) \
+            if grid_size[0] * grid_size[1] > ARRAY_BOARD_CELLS \
+            else Board(grid_size, mine_count)
+        # Boards that do not fit the view at the smallest piece size scroll
+        piece_size: Tuple[int, int] = (
+            max(MIN_PIECE_SIZE, BOARD_VIEW[0] // grid_size[1]),
+            max(MIN_PIECE_SIZE, BOARD_VIEW[1] // grid_size[0]))
         self.renderer: Renderer = Renderer(grid_size=grid_size,
                                            piece_size=piece_size)
         # Store positions of mines from user input
-        self.mine_positions: List[Tuple[int, int]] = []
+        self.mine_positions: MinePositions = MinePositions()
         # expected num of mines to place
         self.expected_mine_count: int = mine_count
         self.show_message: bool = True
         self.state: InitializingState = InitializingState(self)
         self.initial_draw()
         self.solver_interface: SolverInterface = SolverInterface(self.board)
+        if mine_positions is not None:
+            # Start from the given layout, skipping mine placement
+            self.mine_positions.extend(mine_positions)
+            if len(self.mine_positions) != mine_count:
+                raise ValueError(f"Expected {mine_count} mine positions, got "
+                                 + f"{len(self.mine_positions)}")
+            self.change_state(PlayingState(self))
         # self.solver_interface.set_solver('trivial')
 
     def run_solver(self) -> None:
@@ -91,14 +129,27 @@ class Game:
         """
         running: bool = True
         while running:
-            self.renderer.clear_screen()
-
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.MOUSEWHEEL:
+                    self.renderer.zoom_by(ZOOM_STEP ** event.y,
+                                          pygame.mouse.get_pos())
+                elif event.type == pygame.MOUSEBUTTONDOWN \
+                        and self.renderer.minimap \
+                        and event.button not in WHEEL_BUTTONS:
+                    self.show_from_minimap(pygame.mouse.get_pos())
                 elif event.type == pygame.MOUSEBUTTONDOWN and not \
-                        self.board.get_lost():
+                        self.board.get_lost() \
+                        and event.button not in WHEEL_BUTTONS:
                     self.state.handle_click(pygame.mouse.get_pos())
+                elif event.type == pygame.KEYDOWN and event.key in PAN_KEYS:
+                    d_x, d_y = PAN_KEYS[event.key]
+                    self.renderer.pan(d_x * PAN_STEP, d_y * PAN_STEP)
+                elif event.type == pygame.KEYDOWN and event.key in ZOOM_KEYS:
+                    self.renderer.zoom_by(ZOOM_KEYS[event.key])
+                elif event.type == pygame.KEYDOWN and event.key == MINIMAP_KEY:
+                    self.renderer.toggle_minimap()
                 elif event.type == pygame.KEYDOWN:
                     if self.board.initialized and not self.board.get_lost():
                         self.solver.move()  # type: ignore
@@ -122,18 +173,26 @@ class Game:
         print("Calling pyamge quit")
         pygame.quit()
 
+    def show_from_minimap(self, pixel_position: Tuple[int, int]) -> None:
+        """
+        Leave the minimap for the tiles around the cell clicked on it.
+        pixel_position (tuple): Screen position of the click
+        """
+        cell: Optional[Tuple[int, int]] = \
+            self.renderer.minimap_cell(pixel_position)
+        if cell is not None:
+            self.renderer.center_on(cell)
+            self.renderer.toggle_minimap()
+
     def convert_pixel_to_grid(self, pixel_position: Tuple[int, int]
-                              ) -> Tuple[int, int]:
+                              ) -> Optional[Tuple[int, int]]:
         """
-        Convert pixel position to grid position.
+        Convert pixel position to grid position, through the renderer's
+        camera.
         pixel_position (tuple): pixel position (x, y)
-        Returns tuple - grid position (row, column)
+        Returns tuple - grid position (row, column), or None off the board
         """
-        header_height: int = 50
-        grid_x: int = pixel_position[0] // self.renderer.piece_size[0]
-        grid_y: int = (pixel_position[1] - header_height
-                       ) // self.renderer.piece_size[1]
-        return grid_y, grid_x  # return as (row, col)
+        return self.renderer.screen_to_cell(pixel_position)
 
     def handleClick(self, position: Tuple[int, int], flag: bool) -> None:
         """
@@ -141,10 +200,10 @@ class Game:
         position (tuple): Position of the click
         flag (bool): Is the click a flag?
         """
-        index_x: int = int(position[0] // self.renderer.piece_size[0])
-        index_y: int = int((position[1] - 50) // self.renderer.piece_size[1])
-        index: Tuple[int, int] = (index_y, index_x)
-
+        index: Optional[Tuple[int, int]] = self.convert_pixel_to_grid(
+            position)
+        if index is None:
+            return
         self.board.handle_click(self.board.get_piece(index), flag)
 
     def initialize_board(self) -> None:
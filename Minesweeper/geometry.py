@@ -0,0 +1,146 @@
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+# (row, col) steps from a cell to its neighbors, in row-major order
+OFFSETS: Tuple[Tuple[int, int], ...] = tuple(
+    (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc)
+
+
+class Geometry:
+    """
+    Neighbor tables for one board size, stored in CSR form: the neighbors
+    of the cell with flat (row-major) index i are
+    indices[indptr[i]:indptr[i + 1]], in row-major order.
+    The tables only depend on the size, so get_geometry() builds them once
+    and every board of that size shares them. They are built on the first
+    neighbor lookup, so boards that never ask for neighbors pay nothing.
+    """
+    # Boards with more cells than this compute neighbors on the fly instead
+    # of holding a table (the table costs about 36 bytes per cell)
+    TABLE_LIMIT: int = 1_000_000
+
+    def __init__(self, size: Tuple[int, int]) -> None:
+        """
+        Initialize the geometry of a board.
+        size (tuple): Size of the board (rows, columns)
+        """
+        self.size: Tuple[int, int] = size
+        self.rows: int = size[0]
+        self.cols: int = size[1]
+        self.cell_count: int = size[0] * size[1]
+        self.indptr: array[int] = array('i')
+        self.indices: array[int] = array('i')
+        # Whether the table may be built, and whether it has been
+        self.use_table: bool = self.cell_count <= self.TABLE_LIMIT
+        self.has_table: bool = False
+
+    def build_table(self) -> None:
+        """
+        Build the CSR neighbor table with vectorized NumPy passes, in C
+        ints (int32) throughout.
+        """
+        rows, cols = self.size
+        flat: np.ndarray = np.arange(self.cell_count, dtype=np.intc)
+        row: np.ndarray = flat // cols
+        col: np.ndarray = flat % cols
+        mask: np.ndarray = np.empty((self.cell_count, len(OFFSETS)),
+                                    dtype=bool)
+        candidates: np.ndarray = np.empty_like(mask, dtype=np.intc)
+        for slot, (dr, dc) in enumerate(OFFSETS):
+            r: np.ndarray = row + dr
+            c: np.ndarray = col + dc
+            mask[:, slot] = (r >= 0) & (r < rows) & (c >= 0) & (c < cols)
+            np.add(flat, dr * cols + dc, out=candidates[:, slot])
+        # Boolean indexing walks the (cell, offset) grid row by row, so each
+        # cell's neighbors stay together and in row-major order
+        indices: np.ndarray = candidates[mask]
+        del candidates
+        indptr: np.ndarray = np.zeros(self.cell_count + 1, dtype=np.intc)
+        np.cumsum(mask.sum(axis=1, dtype=np.intc), out=indptr[1:])
+        self.indptr.frombytes(indptr.data.cast('B'))
+        self.indices.frombytes(indices.data.cast('B'))
+        self.has_table = True
+
+    def neighbors(self, index: int) -> Sequence[int]:
+        """
+        Get the flat indices of the cells around a cell.
+        index (int): Flat index of the cell
+        Returns sequence - flat indices of the neighbors, in row-major order
+        """
+        if self.has_table:
+            return self.indices[self.indptr[index]:self.indptr[index + 1]]
+        if self.use_table:
+            self.build_table()
+            return self.indices[self.indptr[index]:self.indptr[index + 1]]
+        return self.compute_neighbors(*divmod(index, self.cols))
+
+    def neighbors_of(self, row: int, col: int) -> Sequence[int]:
+        """
+        Get the flat indices of the on-board cells around a position.
+        Unlike neighbors(), the position itself may be off the board.
+        row (int): Row of the position
+        col (int): Column of the position
+        """
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.neighbors(row * self.cols + col)
+        return self.compute_neighbors(row, col)
+
+    def compute_neighbors(self, row: int, col: int) -> List[int]:
+        """ Work out the neighbors of a position without the table. """
+        indices: List[int] = []
+        for r in range(max(row - 1, 0), min(row + 2, self.rows)):
+            for c in range(max(col - 1, 0), min(col + 2, self.cols)):
+                if r != row or c != col:
+                    indices.append(r * self.cols + c)
+        return indices
+
+    def index_of(self, position: Tuple[int, int]) -> int:
+        """ Convert a (row, col) position to a flat index. """
+        return position[0] * self.cols + position[1]
+
+    def position_of(self, index: int) -> Tuple[int, int]:
+        """ Convert a flat index to a (row, col) position. """
+        return divmod(index, self.cols)
+
+    def table_cells(self) -> int:
+        """ Cells the table covers once built (0 if it never is). """
+        return self.cell_count if self.use_table else 0
+
+    def indptr_array(self) -> np.ndarray:
+        """ The indptr table as a NumPy array (shares memory). """
+        if self.use_table and not self.has_table:
+            self.build_table()
+        return np.frombuffer(self.indptr, dtype=np.intc)
+
+    def indices_array(self) -> np.ndarray:
+        """ The indices table as a NumPy array (shares memory). """
+        if self.use_table and not self.has_table:
+            self.build_table()
+        return np.frombuffer(self.indices, dtype=np.intc)
+
+
+# Most table cells the shared geometries may cover together; the least
+# recently used ones are dropped past it (boards keep theirs)
+CACHE_CELLS: int = 2_000_000
+# Shared geometries by size, least recently used first
+geometries: "OrderedDict[Tuple[int, int], Geometry]" = OrderedDict()
+
+
+def get_geometry(size: Tuple[int, int]) -> Geometry:
+    """
+    Get the shared Geometry for a board size, building it on first use.
+    size (tuple): Size of the board (rows, columns)
+    """
+    geometry: Optional[Geometry] = geometries.get(size)
+    if geometry is not None:
+        geometries.move_to_end(size)
+        return geometry
+    geometry = Geometry(size)
+    geometries[size] = geometry
+    cells: int = sum(shared.table_cells() for shared in geometries.values())
+    while cells > CACHE_CELLS and len(geometries) > 1:
+        _, dropped = geometries.popitem(last=False)
+        cells -= dropped.table_cells()
+    return geometry
@@ -11,7 +11,11 @@ class InitializingState(State):
         """
         # Convert pixel position to grid coordinates
         grid_pos = self.game.convert_pixel_to_grid(position)
-        if grid_pos not in self.game.mine_positions:  # Prevent duplicate mines
+        if grid_pos is None:
+            return  # Off the board
+        # Prevent duplicate mines (Game keeps a MinePositions, so the check
+        # takes constant time)
+        if grid_pos not in self.game.mine_positions:
             # Add mine position to list
             self.game.mine_positions.append(grid_pos)
             print(f"Mine placed at: {grid_pos}")
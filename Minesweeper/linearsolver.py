@@ -0,0 +1,196 @@
+from math import gcd
+from typing import Dict, List, Optional, Set, Tuple
+from board import Board
+from space import CLICKED, FLAGGED
+from tanksolver import Constraint, TankSolver
+
+# One linear equation over 0/1 cells: (flat index -> coefficient, total)
+Row = Tuple[Dict[int, int], int]
+
+
+class LinearSolver:
+    """
+    Deductions from the frontier constraints as a linear system.
+    Every revealed number says that the sum of its hidden neighbors (each
+    0 or 1) equals the mines it still needs. The system is kept as sparse
+    integer rows and row-reduced without fractions; each reduced row is
+    then checked against the bounds its 0/1 cells allow, which proves
+    cells that no single number proves (1-2-1, 1-2-2-1 and the like).
+    Cells proven are substituted back and the system reduced again until
+    nothing more follows. This costs far less than enumerating the
+    frontier, so it runs between the single-number rules and TankSolver.
+    """
+
+    def __init__(self, board: Optional[Board] = None) -> None:
+        """
+        Initialize the solver.
+        board (Board): The gameboard (can be set later through tank)
+        """
+        self.tank: TankSolver = TankSolver(board)
+
+    def find_certain(self) -> Tuple[List[int], List[int]]:
+        """
+        Work out the cells the linear system proves.
+        Returns tuple - (flat indices of safe cells, flat indices of mines);
+        both are empty if the numbers contradict each other
+        """
+        board: Board = self.tank.get_board()
+        constraints: List[Constraint] = self.tank.find_constraints()
+        rows: List[Row] = self.build_rows(constraints)
+        frontier: Set[int] = {cell for cells, _ in constraints
+                              for cell in cells}
+        hidden: int = sum(
+            1 for index in range(board.geometry.cell_count)
+            if not board.get_state_at(index) & (CLICKED | FLAGGED))
+        if frontier and hidden == len(frontier):
+            # Every hidden cell is on the frontier, so they hold all the
+            # mines left between them
+            rows.append((dict.fromkeys(frontier, 1),
+                         board.get_total_mine_count() - board.count_flags()))
+        return self.deduce(rows)
+
+    def build_rows(self, constraints: List[Constraint]) -> List[Row]:
+        """
+        Turn constraints into rows of the linear system.
+        constraints (list): (hidden cells, mines among them) per number
+        """
+        return [(dict.fromkeys(cells, 1), need) for cells, need in constraints]
+
+    def deduce(self, rows: List[Row]) -> Tuple[List[int], List[int]]:
+        """
+        Reduce a system and read off every cell it proves, repeating after
+        each round of proven cells.
+        rows (list): Rows of the system
+        Returns tuple - (cells proven 0, cells proven 1); both empty if the
+        system has no 0/1 solution
+        """
+        known: Dict[int, int] = {}
+        while True:
+            reduced: Optional[List[Row]] = self.row_reduce(rows)
+            if reduced is None:
+                return [], []
+            found: Optional[Dict[int, int]] = self.bound_deductions(reduced)
+            if found is None:
+                return [], []
+            if not found:
+                break
+            known.update(found)
+            rows = self.substitute(reduced, found)
+        return sorted(cell for cell, value in known.items() if value == 0), \
+            sorted(cell for cell, value in known.items() if value == 1)
+
+    def row_reduce(self, rows: List[Row]) -> Optional[List[Row]]:
+        """
+        Bring a system to reduced row echelon form with integer row
+        operations, each row divided by the gcd of its entries.
+        rows (list): Rows of the system (left unchanged)
+        Returns list - the non-empty reduced rows, or None if a row reads
+        0 = a non-zero total
+        """
+        work: List[Row] = [(dict(coefficients), total)
+                           for coefficients, total in rows]
+        # Rows holding each cell, to find the rows to eliminate from
+        holding: Dict[int, Set[int]] = {}
+        for slot, (coefficients, _) in enumerate(work):
+            for cell in coefficients:
+                holding.setdefault(cell, set()).add(slot)
+        pivoted: Set[int] = set()
+        for cell in sorted(holding):
+            candidates: List[int] = [slot for slot in holding[cell]
+                                     if slot not in pivoted]
+            if not candidates:
+                continue
+            # The shortest row spreads the fewest new entries
+            pivot: int = min(candidates, key=lambda slot: len(work[slot][0]))
+            pivoted.add(pivot)
+            pivot_row: Dict[int, int] = work[pivot][0]
+            pivot_total: int = work[pivot][1]
+            scale: int = pivot_row[cell]
+            for slot in list(holding[cell]):
+                if slot == pivot:
+                    continue
+                coefficients, total = work[slot]
+                factor: int = coefficients[cell]
+                merged: Dict[int, int] = {
+                    key: value * scale for key, value in coefficients.items()}
+                for key, value in pivot_row.items():
+                    merged[key] = merged.get(key, 0) - factor * value
+                merged_total: int = total * scale - factor * pivot_total
+                for key in set(coefficients) | set(pivot_row):
+                    if merged.get(key, 0) == 0:
+                        merged.pop(key, None)
+                        holding[key].discard(slot)
+                    else:
+                        holding.setdefault(key, set()).add(slot)
+                work[slot] = self.normalize(merged, merged_total)
+
+        reduced: List[Row] = []
+        for coefficients, total in work:
+            if coefficients:
+                reduced.append((coefficients, total))
+            elif total != 0:
+                return None
+        return reduced
+
+    def normalize(self, coefficients: Dict[int, int], total: int) -> Row:
+        """ Divide a row by the gcd of its entries. """
+        divisor: int = abs(total)
+        for value in coefficients.values():
+            divisor = gcd(divisor, value)
+        if divisor <= 1:
+            return coefficients, total
+        return {cell: value // divisor
+                for cell, value in coefficients.items()}, total // divisor
+
+    def bound_deductions(self, rows: List[Row]) -> Optional[Dict[int, int]]:
+        """
+        Find the cells a row forces, from the smallest and largest sums
+        its 0/1 cells allow. A cell is forced to a value when the other
+        value would put the total out of reach.
+        rows (list): Rows to check
+        Returns dict - forced cell -> value, or None if a row cannot be met
+        """
+        found: Dict[int, int] = {}
+        for coefficients, total in rows:
+            low: int = sum(value for value in coefficients.values()
+                           if value < 0)
+            high: int = sum(value for value in coefficients.values()
+                            if value > 0)
+            if not low <= total <= high:
+                return None
+            for cell, value in coefficients.items():
+                forced: Optional[int] = None
+                if value > 0:
+                    if high - value < total:
+                        forced = 1
+                    elif low + value > total:
+                        forced = 0
+                else:
+                    if high + value < total:
+                        forced = 0
+                    elif low - value > total:
+                        forced = 1
+                if forced is not None:
+                    if found.get(cell, forced) != forced:
+                        return None
+                    found[cell] = forced
+        return found
+
+    def substitute(self, rows: List[Row], values: Dict[int, int]
+                   ) -> List[Row]:
+        """
+        Put known cell values into a system.
+        rows (list): Rows of the system
+        values (dict): Cell -> value
+        Returns list - the rows without the known cells
+        """
+        result: List[Row] = []
+        for coefficients, total in rows:
+            remaining: Dict[int, int] = {}
+            for cell, value in coefficients.items():
+                if cell in values:
+                    total -= value * values[cell]
+                else:
+                    remaining[cell] = value
+            result.append((remaining, total))
+        return result
@@ -1,17 +1,25 @@
 import sys
-from typing import Tuple
+from typing import List, Optional, Tuple
 from game import Game
+from minegen import MineGenerator
 
 
 def main() -> None:
-    """ Get command line arguments: size x, size y, mine count """
-    if len(sys.argv) != 4:
-        print("Usage: python3 main.py grid_width grid_height mine_count")
+    """
+    Get command line arguments: size x, size y, mine count and optionally
+    a seed. With a seed the mines are placed by a MineGenerator instead of
+    by clicking.
+    """
+    if len(sys.argv) not in (4, 5):
+        print("Usage: python3 main.py grid_width grid_height mine_count "
+              + "[seed]")
         sys.exit(1)
     try:
         grid_width: int = int(sys.argv[1])
         grid_height: int = int(sys.argv[2])
         mine_count: int = int(sys.argv[3])
+        seed: Optional[int] = int(sys.argv[4]) if len(sys.argv) == 5 \
+            else None
 
         if grid_width <= 0 or grid_height <= 0 or mine_count <= 0:
             raise ValueError("Grid dimensions and mine count must be positive \
@@ -22,7 +30,15 @@ def main() -> None:
         sys.exit(1)
 
     size: Tuple[int, int] = (grid_width, grid_height)
-    g = Game(size, mine_count)  # Create a game with arguments
+    mine_positions: Optional[List[Tuple[int, int]]] = None
+    if seed is not None:
+        try:
+            generator: MineGenerator = MineGenerator(size, mine_count, seed)
+        except ValueError as e:
+            print("Invalid input:", e)
+            sys.exit(1)
+        mine_positions = generator.positions(generator.uniform())
+    g = Game(size, mine_count, mine_positions)  # Create a game with arguments
     g.run()
 
 
@@ -0,0 +1,197 @@
+from typing import Any, Iterable, List, Optional, Set, Tuple
+import numpy as np
+
+Position = Tuple[int, int]
+
+
+class MineGenerator:
+    """
+    Seeded, reproducible mine layouts for one board size and mine count.
+    A layout is a sorted NumPy array of flat (row-major) cell indices;
+    positions() turns one into the list Board.initialize_mines() takes.
+    Sampling is vectorized, so no board is needed to make a layout and
+    the same seed always gives the same sequence of layouts.
+    """
+
+    def __init__(self, size: Tuple[int, int], mine_count: int,
+                 seed: Optional[int] = None) -> None:
+        """
+        Initialize the generator.
+        size (tuple): Size of the board (rows, columns)
+        mine_count (int): Number of mines in every layout
+        seed (int): Seed of the random stream (None for a fresh one)
+        Raises ValueError if the mines do not fit on the board
+        """
+        self.size: Tuple[int, int] = size
+        self.mine_count: int = mine_count
+        self.cell_count: int = size[0] * size[1]
+        if not 0 <= mine_count <= self.cell_count:
+            raise ValueError(f"Cannot place {mine_count} mines on a {size} "
+                             + "board")
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+
+    def uniform(self) -> np.ndarray:
+        """
+        Place the mines uniformly at random.
+        Returns ndarray - sorted flat indices of the mines
+        """
+        return self.sample(np.empty(0, dtype=np.intp))
+
+    def first_click_safe(self, first: Position) -> np.ndarray:
+        """
+        Place the mines anywhere but the first clicked cell.
+        first (tuple): (row, col) of the first click
+        Returns ndarray - sorted flat indices of the mines
+        """
+        return self.sample(np.array([self.index_of(first)], dtype=np.intp))
+
+    def first_click_opening(self, first: Position) -> np.ndarray:
+        """
+        Place the mines away from the first clicked cell and its
+        neighbors, so the first click always opens an area.
+        first (tuple): (row, col) of the first click
+        Returns ndarray - sorted flat indices of the mines
+        Raises ValueError if the mines do not fit outside that area
+        """
+        self.index_of(first)
+        row, col = first
+        # The clear area is a block of up to 3x3 cells; working it out here
+        # saves building the neighbor table of a board nobody plays on
+        rows: np.ndarray = np.arange(max(row - 1, 0),
+                                     min(row + 2, self.size[0]))
+        cols: np.ndarray = np.arange(max(col - 1, 0),
+                                     min(col + 2, self.size[1]))
+        excluded: np.ndarray = (rows[:, None] * self.size[1]
+                                + cols[None, :]).ravel()
+        return self.sample(excluded.astype(np.intp))
+
+    def uniform_batch(self, boards: int) -> np.ndarray:
+        """
+        Make many uniform layouts in one vectorized pass.
+        boards (int): Number of layouts to make
+        Returns ndarray - boards x mine_count array, one sorted layout per
+        row
+        """
+        if self.mine_count == 0:
+            return np.empty((boards, 0), dtype=np.intp)
+        # The mine_count smallest of cell_count random keys are a uniform
+        # sample without replacement
+        keys: np.ndarray = self.rng.random((boards, self.cell_count))
+        chosen: np.ndarray = np.argpartition(
+            keys, self.mine_count - 1, axis=1)[:, :self.mine_count]
+        return np.sort(chosen, axis=1)
+
+    def sample(self, excluded: np.ndarray) -> np.ndarray:
+        """
+        Place the mines uniformly on every cell but some.
+        excluded (ndarray): Sorted flat indices of the cells to keep clear
+        Returns ndarray - sorted flat indices of the mines
+        Raises ValueError if the mines do not fit on the remaining cells
+        """
+        free: int = self.cell_count - len(excluded)
+        if self.mine_count > free:
+            raise ValueError(f"Cannot place {self.mine_count} mines on "
+                             + f"{free} free cells")
+        picks: np.ndarray = np.sort(self.rng.choice(
+            free, self.mine_count, replace=False))
+        # Pick k among the free cells maps to cell k plus the number of
+        # excluded cells at or before it
+        shifted: np.ndarray = excluded - np.arange(len(excluded))
+        return picks + np.searchsorted(shifted, picks, side='right')
+
+    def index_of(self, position: Position) -> int:
+        """
+        Convert a (row, col) position to a flat index.
+        Raises IndexError if the position is off the board
+        """
+        row, col = position
+        if not (0 <= row < self.size[0] and 0 <= col < self.size[1]):
+            raise IndexError(f"Position {position} is off the board")
+        return row * self.size[1] + col
+
+    def positions(self, layout: np.ndarray) -> List[Position]:
+        """
+        Convert a layout to (row, col) positions.
+        layout (ndarray): Flat indices of the mines
+        Returns list - (row, col) of every mine
+        """
+        rows, cols = np.divmod(layout, self.size[1])
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def mask(self, layout: np.ndarray) -> np.ndarray:
+        """
+        Convert a layout to a boolean grid, True where a mine is placed.
+        layout (ndarray): Flat indices of the mines
+        """
+        mines: np.ndarray = np.zeros(self.cell_count, dtype=bool)
+        mines[layout] = True
+        return mines.reshape(self.size)
+
+
+class MinePositions(List[Position]):
+    """
+    List of mine positions that also keeps a set of them, so checking
+    whether a cell already holds a mine takes constant time.
+    """
+
+    def __init__(self, positions: Iterable[Position] = ()) -> None:
+        """
+        Initialize the list.
+        positions (iterable): Positions to start with
+        """
+        super().__init__(positions)
+        self.lookup: Set[Position] = set(self)
+
+    def __contains__(self, position: object) -> bool:
+        """ Is there a mine at the position? """
+        return position in self.lookup
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """ Replace positions, then rebuild the lookup. """
+        super().__setitem__(index, value)
+        self.lookup = set(self)
+
+    def __delitem__(self, index: Any) -> None:
+        """ Delete positions, then rebuild the lookup. """
+        super().__delitem__(index)
+        self.lookup = set(self)
+
+    def __iadd__(  # type: ignore[override, misc]
+            self, positions: Iterable[Position]) -> "MinePositions":
+        """ Add positions in place. """
+        self.extend(positions)
+        return self
+
+    def append(self, position: Position) -> None:
+        """ Add a position. """
+        super().append(position)
+        self.lookup.add(position)
+
+    def extend(self, positions: Iterable[Position]) -> None:
+        """ Add several positions. """
+        start: int = len(self)
+        super().extend(positions)
+        self.lookup.update(self[start:])
+
+    def insert(self, index: Any, position: Position) -> None:
+        """ Insert a position. """
+        super().insert(index, position)
+        self.lookup.add(position)
+
+    def remove(self, position: Position) -> None:
+        """ Remove the first occurrence of a position. """
+        super().remove(position)
+        if not super().__contains__(position):
+            self.lookup.discard(position)
+
+    def pop(self, index: Any = -1) -> Position:
+        """ Remove and return a position. """
+        position: Position = super().pop(index)
+        if not super().__contains__(position):
+            self.lookup.discard(position)
+        return position
+
+    def clear(self) -> None:
+        """ Remove every position. """
+        super().clear()
+        self.lookup.clear()
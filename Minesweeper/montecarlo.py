@@ -0,0 +1,476 @@
+import math
+import random
+import time
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+from board import Board
+from cdcl import CdclSolver
+from probability import MineProbabilities, log_binomial
+from space import CLICKED, FLAGGED
+from tanksolver import Constraint
+
+# Most cells one Gibbs step resamples together
+BLOCK_CELLS: int = 24
+# Most counting states spent on a block; a block that needs more is
+# halved
+STATE_LIMIT: int = 4000
+# Batches the samples are split into for the confidence intervals
+BATCHES: int = 20
+# Sweeps (about one resampling of every cell each) a chain runs before it
+# is sampled, to move away from its starting layout
+BURN_IN: int = 50
+# Share of a time budget exact counting may take before sampling takes
+# over with the rest
+EXACT_SHARE: float = 0.5
+
+
+class SampledProbabilities(MineProbabilities):
+    """
+    Mine probabilities estimated by sampling when the frontier is too
+    large to count exactly.
+    Up to frontier_limit frontier cells this is MineProbabilities, as long
+    as the count fits in EXACT_SHARE of the time budget (if there is one):
+    how long counting takes depends on how the frontier splits into
+    components more than on its size. Past either, several Markov chains
+    walk over frontier layouts that meet every revealed number. Each chain
+    starts from a layout the CDCL solver finds (with random phases, so
+    the chains start apart) and repeatedly picks a random cell and
+    resamples it together with the cells that share a number with it:
+    every way to fill that block that keeps the numbers met is weighed by
+    the ways to spread the mines left over the interior, C(interior, mines
+    left - frontier mines), as the exact engine does, so the chains sample
+    layouts in proportion to the whole-board layouts they stand for.
+    Estimates are the share of samples with a mine, and the confidence
+    intervals come from batch means, which allow for samples of one chain
+    being alike.
+    Chains move between layouts a block at a time, so where layouts differ
+    along long runs of numbers they swing between them slowly (hundreds
+    of sweeps on hard expert positions); the estimates of such cells are
+    off by more than the intervals say until many samples are drawn.
+    """
+    # Frontier cells up to which probabilities are counted exactly
+    FRONTIER_LIMIT: int = 1000
+
+    def __init__(self, board: Board, samples: int = 400,
+                 time_budget: Optional[float] = None, chains: int = 4,
+                 seed: Optional[int] = None,
+                 frontier_limit: int = FRONTIER_LIMIT,
+                 confidence: float = 0.95) -> None:
+        """
+        Initialize the estimator.
+        board (Board): The gameboard to work on
+        samples (int): Samples to draw, over all chains
+        time_budget (float): Seconds to spend, counting exactly or
+        estimating (then as many samples as fit, at least one per chain);
+        samples is used if None
+        chains (int): Independent chains
+        seed (int): Seed of the chains, None for a random one
+        frontier_limit (int): Frontier cells up to which probabilities are
+        exact
+        confidence (float): Level of the confidence intervals
+        """
+        super().__init__(board)
+        self.samples: int = samples
+        self.time_budget: Optional[float] = time_budget
+        self.chains: int = chains
+        self.rng: random.Random = random.Random(seed)
+        self.frontier_limit: int = frontier_limit
+        # Two-sided normal quantile of the confidence level
+        self.z: float = float(np.sqrt(2.0) * erfinv(confidence))
+        self.low: Optional[np.ndarray] = None
+        self.high: Optional[np.ndarray] = None
+        self.sampled: int = 0
+
+    def get_intervals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the confidence interval of every cell's probability.
+        Returns tuple - (lower bounds, upper bounds) by flat index, equal
+        to the probabilities where they are exact
+        """
+        self.get_probabilities()
+        assert self.low is not None and self.high is not None
+        return self.low, self.high
+
+    def compute(self) -> np.ndarray:
+        """
+        Work out the mine probability of every cell, by sampling if the
+        frontier is larger than frontier_limit or counting it runs past
+        its share of the time budget.
+        Returns ndarray - probabilities by flat (row-major) index
+        Raises ValueError if no layout fits what the board shows
+        """
+        start: float = time.monotonic()
+        constraints: List[Constraint] = self.tank.find_constraints()
+        if any(need != 0 for cells, need in constraints if not cells):
+            raise ValueError("No mine layout fits the board as shown")
+        constraints = [constraint for constraint in constraints
+                       if constraint[0]]
+        frontier: Set[int] = {cell for cells, _ in constraints
+                              for cell in cells}
+        if len(frontier) <= self.frontier_limit:
+            if self.time_budget is not None:
+                self.tank.deadline = start + self.time_budget * EXACT_SHARE
+            try:
+                probabilities: np.ndarray = super().compute()
+            except TimeoutError:
+                # Too slow to count: sample for the time left
+                pass
+            else:
+                self.low, self.high = probabilities, probabilities
+                self.sampled = 0
+                return probabilities
+            finally:
+                self.tank.deadline = None
+        budget: Optional[float] = None
+        if self.time_budget is not None:
+            budget = start + self.time_budget - time.monotonic()
+        return self.estimate(constraints, sorted(frontier), budget)
+
+    def estimate(self, constraints: List[Constraint], cells: List[int],
+                 time_budget: Optional[float]) -> np.ndarray:
+        """
+        Estimate the probabilities by sampling.
+        constraints (list): Frontier constraints with hidden cells
+        cells (list): Flat indices of the frontier cells
+        time_budget (float): Seconds to spend, None to draw samples
+        Returns ndarray - probabilities by flat (row-major) index
+        Raises ValueError if no layout fits what the board shows
+        """
+        states: np.ndarray = self.state_array()
+        hidden: np.ndarray = states & (CLICKED | FLAGGED) == 0
+        interior: int = int(np.count_nonzero(hidden)) - len(cells)
+        mines_left: int = self.board.get_total_mine_count() \
+            - int(np.count_nonzero(states & FLAGGED))
+        local: Dict[int, int] = {cell: slot for slot, cell in
+                                 enumerate(cells)}
+        start: float = time.perf_counter()
+        chain: LayoutChain = LayoutChain(
+            [([local[cell] for cell in group], need)
+             for group, need in constraints],
+            len(cells), interior, mines_left, self.rng)
+
+        layouts: List[bytearray] = chain.starting_layouts(self.chains)
+        # Samples per chain; with a budget, the fewest to take
+        per_chain: int = 1 if time_budget is not None \
+            else max(1, -(-self.samples // len(layouts)))
+        # Samples of every chain: frontier layouts and interior mines
+        draws: List[Tuple[np.ndarray, int]] = []
+        for number, layout in enumerate(layouts):
+            budget: Optional[float] = None
+            if time_budget is not None:
+                # Share the time left between the chains left
+                budget = (start + time_budget - time.perf_counter()) \
+                    / (len(layouts) - number)
+            draws.extend(chain.run(layout, per_chain, budget))
+
+        sampled: np.ndarray = np.array([layout for layout, _ in draws],
+                                       dtype=float)
+        interior_mines: np.ndarray = np.array([mines for _, mines in draws],
+                                              dtype=float)
+        probabilities: np.ndarray = np.where(states & FLAGGED, 1.0, 0.0)
+        low: np.ndarray = probabilities.copy()
+        high: np.ndarray = probabilities.copy()
+        frontier_mean, frontier_error = self.batch_means(sampled)
+        index: np.ndarray = np.array(cells)
+        probabilities[index] = frontier_mean
+        low[index] = np.clip(frontier_mean - frontier_error, 0.0, 1.0)
+        high[index] = np.clip(frontier_mean + frontier_error, 0.0, 1.0)
+        if interior > 0:
+            interior_cells: np.ndarray = hidden.copy()
+            interior_cells[index] = False
+            mean, error = self.batch_means(
+                interior_mines[:, None] / interior)
+            probabilities[interior_cells] = mean[0]
+            low[interior_cells] = max(mean[0] - error[0], 0.0)
+            high[interior_cells] = min(mean[0] + error[0], 1.0)
+        self.low, self.high = low, high
+        self.sampled = len(draws)
+        return probabilities
+
+    def batch_means(self, values: np.ndarray
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean of every column of samples and the half width of its
+        confidence interval, from the spread of the means of consecutive
+        batches of samples.
+        values (ndarray): One row per sample
+        Returns tuple - (means, half widths)
+        """
+        mean: np.ndarray = values.mean(axis=0)
+        batches: int = min(BATCHES, len(values))
+        if batches < 2:
+            return mean, np.ones_like(mean)
+        batch_means: np.ndarray = np.array([
+            part.mean(axis=0) for part in np.array_split(values, batches)])
+        error: np.ndarray = self.z * batch_means.std(axis=0, ddof=1) \
+            / math.sqrt(batches)
+        return mean, error
+
+
+class LayoutChain:
+    """
+    Block Gibbs sampler over the frontier layouts that meet every number,
+    weighed by the ways to spread the other mines over the interior.
+    Cells are numbered 0, 1, ... (local to the frontier).
+    """
+
+    def __init__(self, constraints: List[Tuple[List[int], int]], cells: int,
+                 interior: int, mines_left: int,
+                 rng: random.Random) -> None:
+        """
+        Initialize the chain.
+        constraints (list): (local cells, mines among them) per number
+        cells (int): Number of frontier cells
+        interior (int): Number of interior cells
+        mines_left (int): Mines not yet flagged
+        rng (Random): Source of randomness
+        """
+        self.members: List[List[int]] = [group for group, _ in constraints]
+        self.needs: List[int] = [need for _, need in constraints]
+        self.touching: List[List[int]] = [[] for _ in range(cells)]
+        for slot, group in enumerate(self.members):
+            for cell in group:
+                self.touching[cell].append(slot)
+        self.cells: int = cells
+        self.interior: int = interior
+        self.mines_left: int = mines_left
+        self.rng: random.Random = rng
+        self.block_cells: int = BLOCK_CELLS
+
+    def starting_layouts(self, chains: int) -> List[bytearray]:
+        """
+        Find layouts to start the chains from, with the CDCL solver.
+        chains (int): Number of layouts wanted
+        Returns list - layouts (1 for a mine per local cell)
+        Raises ValueError if no layout fits the numbers and the mine count
+        """
+        formula: CdclSolver = CdclSolver()
+        variables: List[int] = [formula.new_var() for _ in range(self.cells)]
+        for group, need in zip(self.members, self.needs):
+            formula.add_exactly([variables[cell] for cell in group], need)
+        # The frontier holds what the interior cannot, and no more than the
+        # mines left; encoding that costs a totalizer over the whole
+        # frontier, so it is only added once a layout breaks it
+        fewest: int = self.mines_left - self.interior
+        counted: bool = False
+        layouts: List[bytearray] = []
+        while len(layouts) < chains:
+            for var in variables:
+                formula.phases[var] = self.rng.random() < 0.5
+            if not formula.solve():
+                raise ValueError("No mine layout fits the board as shown")
+            layout: bytearray = bytearray(formula.model[var]
+                                          for var in variables)
+            if fewest <= sum(layout) <= self.mines_left:
+                layouts.append(layout)
+            elif counted:
+                raise ValueError("No mine layout fits the board as shown")
+            else:
+                counted = True
+                if fewest > 0:
+                    formula.add_at_least(variables, fewest)
+                formula.add_at_most(variables, max(self.mines_left, 0))
+        return layouts
+
+    def run(self, layout: bytearray, samples: int,
+            budget: Optional[float]) -> List[Tuple[np.ndarray, int]]:
+        """
+        Run the chain from a layout and take a sample after every sweep
+        (about one resampling of every cell), once BURN_IN sweeps are
+        done.
+        layout (bytearray): Starting layout (changed in place)
+        samples (int): Samples to take, or the fewest to take with a budget
+        budget (float): Seconds to run for, None to take samples; the
+        burn-in stops early at half of it
+        Returns list - (frontier layout, interior mines) per sample
+        """
+        sums: List[int] = [sum(layout[cell] for cell in group)
+                           for group in self.members]
+        total: int = sum(layout)
+        # Steps between samples: about one resampling of every cell
+        steps: int = max(1, self.cells // self.block_cells)
+        deadline: float = time.perf_counter() + (budget or 0.0)
+        halfway: float = deadline - (budget or 0.0) / 2
+        for _ in range(BURN_IN):
+            if budget is not None and time.perf_counter() >= halfway:
+                break
+            for _ in range(steps):
+                total = self.step(layout, sums, total)
+        taken: List[Tuple[np.ndarray, int]] = []
+        while True:
+            for _ in range(steps):
+                total = self.step(layout, sums, total)
+            taken.append((np.frombuffer(bytes(layout), dtype=np.uint8),
+                          self.mines_left - total))
+            if len(taken) >= samples and (
+                    budget is None or time.perf_counter() >= deadline):
+                return taken
+
+    def step(self, layout: bytearray, sums: List[int], total: int) -> int:
+        """
+        Resample a block of cells grown from a random cell through the
+        numbers they share.
+        layout (bytearray): The layout (changed in place)
+        sums (list): Mines in every constraint's cells (kept up to date)
+        total (int): Mines in the layout
+        Returns int - mines in the new layout
+        """
+        start: int = self.rng.randrange(self.cells)
+        block: List[int] = [start]
+        chosen: Set[int] = {start}
+        # Grow the block from the cell through shared numbers
+        position: int = 0
+        while position < len(block) and len(block) < self.block_cells:
+            around: List[int] = list(self.touching[block[position]])
+            self.rng.shuffle(around)
+            for slot in around:
+                for cell in self.members[slot]:
+                    if cell not in chosen and len(block) < self.block_cells:
+                        chosen.add(cell)
+                        block.append(cell)
+            position += 1
+
+        filling: Optional[List[int]] = self.sample_block(block, layout,
+                                                         sums, total)
+        while filling is None:
+            # Too loose: resample the first half of the block instead. What
+            # decides this only depends on the cells outside the smaller
+            # block, so the step still leaves the chain's target alone
+            block = block[:len(block) // 2]
+            filling = self.sample_block(block, layout, sums, total)
+        for cell, value in zip(block, filling):
+            if layout[cell] != value:
+                layout[cell] = value
+                total += 1 if value else -1
+                for slot in self.touching[cell]:
+                    sums[slot] += 1 if value else -1
+        return total
+
+    def sample_block(self, block: List[int], layout: bytearray,
+                     sums: List[int], total: int) -> Optional[List[int]]:
+        """
+        Draw new values for a block of cells, given the cells outside it:
+        every way to fill the block that keeps the numbers met, weighed by
+        the ways to spread the mines left over the interior. The ways are
+        counted by the mines every constraint still needs after each
+        block cell (memoized, as TankSolver.count_component does for whole
+        components) and then drawn cell by cell.
+        block (list): Cells of the block
+        layout (bytearray): The layout
+        sums (list): Mines in every constraint's cells
+        total (int): Mines in the layout
+        Returns list - the new value of every block cell, or None if more
+        than STATE_LIMIT counting states are needed
+        """
+        # Constraints the block touches, numbered in order, with the mines
+        # each still needs from the block
+        numbering: Dict[int, int] = {}
+        needed: List[int] = []
+        for cell in block:
+            for slot in self.touching[cell]:
+                if slot not in numbering:
+                    numbering[slot] = len(needed)
+                    needed.append(self.needs[slot] - sums[slot])
+                needed[numbering[slot]] += layout[cell]
+        # Per block cell: its constraints, and their block cells after it
+        touched: List[List[int]] = [
+            [numbering[slot] for slot in self.touching[cell]]
+            for cell in block]
+        later: List[int] = [0] * len(needed)
+        after: List[List[int]] = [[] for _ in block]
+        for position in range(len(block) - 1, -1, -1):
+            after[position] = [later[number] for number in touched[position]]
+            for number in touched[position]:
+                later[number] += 1
+        if any(need < 0 or need > count
+               for need, count in zip(needed, later)):
+            return None
+
+        # (position, mines still needed) -> block mines from the position
+        # on -> ways
+        memo: Dict[Tuple[int, Tuple[int, ...]], Dict[int, int]] = {}
+
+        def fits(position: int, value: int) -> bool:
+            for number, rest in zip(touched[position], after[position]):
+                left: int = needed[number] - value
+                if left < 0 or left > rest:
+                    return False
+            return True
+
+        def ways(position: int) -> Optional[Dict[int, int]]:
+            if position == len(block):
+                return {0: 1}
+            key: Tuple[int, Tuple[int, ...]] = (position, tuple(needed))
+            if key in memo:
+                return memo[key]
+            if len(memo) >= STATE_LIMIT:
+                return None
+            result: Dict[int, int] = {}
+            for value in (0, 1):
+                if not fits(position, value):
+                    continue
+                for number in touched[position]:
+                    needed[number] -= value
+                rest: Optional[Dict[int, int]] = ways(position + 1)
+                for number in touched[position]:
+                    needed[number] += value
+                if rest is None:
+                    return None
+                for mines, count in rest.items():
+                    result[mines + value] = result.get(mines + value, 0) \
+                        + count
+            memo[key] = result
+            return result
+
+        if ways(0) is None:
+            return None
+        # Relative weight of the whole layout by the mines in the block
+        outside: int = total - sum(layout[cell] for cell in block)
+        logs: List[float] = [
+            log_binomial(self.interior, self.mines_left - outside - mines)
+            if 0 <= self.mines_left - outside - mines <= self.interior
+            else -math.inf for mines in range(len(block) + 1)]
+        peak: float = max(logs)
+        if peak == -math.inf:
+            return [layout[cell] for cell in block]
+        weight: List[float] = [math.exp(log - peak) for log in logs]
+
+        values: List[int] = []
+        placed: int = 0
+        for position in range(len(block)):
+            options: List[float] = []
+            for value in (0, 1):
+                total_weight: float = 0.0
+                if fits(position, value):
+                    for number in touched[position]:
+                        needed[number] -= value
+                    rest = ways(position + 1)
+                    for number in touched[position]:
+                        needed[number] += value
+                    assert rest is not None
+                    total_weight = sum(
+                        count * weight[placed + value + mines]
+                        for mines, count in rest.items())
+                options.append(total_weight)
+            value = 1 if self.rng.random() * (options[0] + options[1]) \
+                >= options[0] else 0
+            for number in touched[position]:
+                needed[number] -= value
+            values.append(value)
+            placed += value
+        return values
+
+
+def erfinv(level: float) -> float:
+    """
+    Inverse of the error function, by Newton's method.
+    level (float): A value in (-1, 1)
+    """
+    guess: float = 0.0
+    for _ in range(60):
+        step: float = (math.erf(guess) - level) \
+            / (2.0 / math.sqrt(math.pi) * math.exp(-guess * guess))
+        guess -= step
+        if abs(step) < 1e-12:
+            break
+    return guess
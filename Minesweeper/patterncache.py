@@ -0,0 +1,334 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from board import Board, ChangeFeed
+from space import CLICKED, FLAGGED
+from tanksolver import ComponentSolutions, Constraint, TankSolver
+
+# Side of the window around a number; the numbers in its inner 3x3 have
+# every neighbor inside it
+SIDE: int = 5
+# Window cells: hidden, not a variable (revealed, flagged or off the
+# board), and a number in the inner 3x3 that its flags already exceed
+HIDDEN: str = "#"
+OPEN: str = "."
+BROKEN: str = "!"
+# Deductions of one window: (safe window cells, mine window cells), as
+# indices of its canonical key
+Deductions = Tuple[Tuple[int, ...], Tuple[int, ...]]
+# Window cells are read from row - 2 to row + 2 and col - 2 to col + 2
+OFFSETS: List[Tuple[int, int]] = [
+    (row - SIDE // 2, col - SIDE // 2)
+    for row in range(SIDE) for col in range(SIDE)]
+# Inner window cells, with their neighbors inside the window
+INNER: Dict[int, List[int]] = {
+    row * SIDE + col: [(row + d_row) * SIDE + col + d_col
+                       for d_row in (-1, 0, 1) for d_col in (-1, 0, 1)
+                       if d_row or d_col]
+    for row in range(1, SIDE - 1) for col in range(1, SIDE - 1)}
+
+
+def build_symmetries() -> List[Tuple[int, ...]]:
+    """
+    List the 8 rotations and reflections of the window.
+    Returns list - per symmetry, the window cell shown at every position
+    """
+    last: int = SIDE - 1
+    symmetries: List[Tuple[int, ...]] = []
+    for turn in range(4):
+        for mirror in (False, True):
+            order: List[int] = []
+            for row in range(SIDE):
+                for col in range(SIDE):
+                    source_row, source_col = row, last - col if mirror \
+                        else col
+                    for _ in range(turn):
+                        source_row, source_col = last - source_col, \
+                            source_row
+                    order.append(source_row * SIDE + source_col)
+            symmetries.append(tuple(order))
+    return symmetries
+
+
+SYMMETRIES: List[Tuple[int, ...]] = build_symmetries()
+
+
+def canonical(key: str) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Pick the form of a window key that all its rotations and reflections
+    share (the smallest).
+    key (str): The window key
+    Returns tuple - (canonical key, window cell at every canonical index)
+    """
+    best: Optional[Tuple[str, Tuple[int, ...]]] = None
+    for order in SYMMETRIES:
+        candidate: str = "".join([key[source] for source in order])
+        if best is None or candidate < best[0]:
+            best = candidate, order
+    assert best is not None
+    return best
+
+
+class CacheStats(NamedTuple):
+    """
+    Counters of a pattern cache.
+    hits (int): Lookups answered from the cache
+    misses (int): Lookups that had to solve their window
+    evictions (int): Entries dropped to stay within the capacity
+    size (int): Entries held
+    saved (float): Seconds of solving the hits avoided, from the time each
+    entry took to solve
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    saved: float
+
+    @property
+    def hit_rate(self) -> float:
+        """ Share of the lookups answered from the cache. """
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PatternCache:
+    """
+    Memo of the deductions of local windows.
+    A window is the 5x5 square around a revealed number, written as a key
+    of one character per cell: hidden, a number in the inner 3x3 (as the
+    mines it still needs), or neither. Windows that are rotations or
+    reflections of each other share one canonical key and entry, so a
+    pattern met in any orientation is solved once. The least recently
+    used entries are dropped past the capacity, and the table can be
+    saved and loaded to start warm.
+    """
+    # Entries kept by default
+    CAPACITY: int = 65536
+
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        """
+        Initialize an empty cache.
+        capacity (int): Most entries kept (0 keeps none)
+        """
+        self.capacity: int = capacity
+        # Canonical key -> (deductions, seconds it took to solve)
+        self.entries: OrderedDict[str, Tuple[Deductions, float]] = \
+            OrderedDict()
+        self.tank: TankSolver = TankSolver()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.saved: float = 0.0
+
+    def lookup(self, key: str) -> Deductions:
+        """
+        Get the deductions of a canonical window key, solving it on a miss.
+        key (str): The canonical key
+        Returns tuple - (safe, mine) indices of the key
+        """
+        entry: Optional[Tuple[Deductions, float]] = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            self.saved += entry[1]
+            return entry[0]
+        self.misses += 1
+        start: float = time.perf_counter()
+        deductions: Deductions = self.solve_window(key)
+        self.store(key, deductions, time.perf_counter() - start)
+        return deductions
+
+    def store(self, key: str, deductions: Deductions, cost: float) -> None:
+        """
+        Add an entry, dropping the least recently used ones past the
+        capacity.
+        key (str): The canonical key
+        deductions (tuple): Its (safe, mine) indices
+        cost (float): Seconds it took to solve
+        """
+        self.entries[key] = (deductions, cost)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def solve_window(self, key: str) -> Deductions:
+        """
+        Work out the cells a window proves from the numbers in its inner
+        3x3.
+        key (str): The window key
+        Returns tuple - (safe, mine) indices of the key; both empty if the
+        numbers contradict each other
+        """
+        constraints: List[Constraint] = []
+        for index, around in INNER.items():
+            char: str = key[index]
+            if char == BROKEN:
+                return (), ()
+            if not char.isdigit():
+                continue
+            cells: Tuple[int, ...] = tuple(
+                cell for cell in around if key[cell] == HIDDEN)
+            need: int = int(char)
+            if need > len(cells):
+                return (), ()
+            if cells:
+                constraints.append((cells, need))
+        safe: List[int] = []
+        mines: List[int] = []
+        for component in self.tank.split_components(constraints):
+            solved: ComponentSolutions = self.tank.solve_component(component)
+            total: int = sum(solved.counts.values())
+            if total == 0:
+                return (), ()
+            for slot, cell in enumerate(solved.cells):
+                hits: int = sum(tally[slot] for tally in solved.hits.values())
+                if hits == 0:
+                    safe.append(cell)
+                elif hits == total:
+                    mines.append(cell)
+        return tuple(sorted(safe)), tuple(sorted(mines))
+
+    def stats(self) -> CacheStats:
+        """ Get the counters of the cache. """
+        return CacheStats(self.hits, self.misses, self.evictions,
+                          len(self.entries), self.saved)
+
+    def save(self, path: str) -> None:
+        """
+        Write the entries to a JSON table, least recently used first.
+        path (str): File to write
+        """
+        table: List[object] = [
+            [key, list(safe), list(mines), cost]
+            for key, ((safe, mines), cost) in self.entries.items()]
+        with open(path, "w") as file:
+            json.dump({"side": SIDE, "patterns": table}, file)
+
+    def load(self, path: str) -> int:
+        """
+        Add the entries of a table written by save() (loading counts as
+        neither hits nor misses).
+        path (str): File to read
+        Returns int - the number of entries read
+        Raises ValueError if the table is for another window size
+        """
+        with open(path) as file:
+            data = json.load(file)
+        if data.get("side") != SIDE:
+            raise ValueError(f"Pattern table {path} is not for {SIDE}x{SIDE}"
+                             + " windows")
+        for key, safe, mines, cost in data["patterns"]:
+            self.store(key, (tuple(safe), tuple(mines)), cost)
+        return len(data["patterns"])
+
+
+class PatternSolver:
+    """
+    Local deductions looked up in a PatternCache.
+    Every revealed number next to a hidden cell is the center of a window;
+    the cells its window proves are mapped back onto the board. Only
+    windows that may have changed are looked at again: the first call
+    looks at every one, later calls at those within two cells of a cell
+    that changed since.
+    """
+
+    def __init__(self, board: Board,
+                 cache: Optional[PatternCache] = None) -> None:
+        """
+        Initialize the solver.
+        board (Board): The gameboard to work on
+        cache (PatternCache): Cache to use (may be shared between boards);
+        a new one if None
+        """
+        self.board: Board = board
+        self.cache: PatternCache = cache if cache is not None \
+            else PatternCache()
+        self.changes: ChangeFeed = board.track_changes()
+        # Window centers (flat indices) to look at again
+        self.pending: Set[int] = set()
+        self.seeded: bool = False
+
+    def close(self) -> None:
+        """ Stop collecting the board's changes; the solver is done. """
+        self.board.unsubscribe(self.changes)
+
+    def find_certain(self) -> Tuple[List[int], List[int]]:
+        """
+        Work out the cells the windows that may have changed prove.
+        Returns tuple - (flat indices of safe cells, flat indices of
+        mines); a cell claimed both ways (wrong flags) is left out
+        """
+        board: Board = self.board
+        self.collect_changes()
+        safe: Set[int] = set()
+        mines: Set[int] = set()
+        for center in self.pending:
+            # A revealed 0 next to a hidden cell only follows wrong flags
+            if not board.get_state_at(center) & CLICKED \
+                    or board.get_around_at(center) == 0:
+                continue
+            if all(board.get_state_at(neighbor) & (CLICKED | FLAGGED)
+                   for neighbor in board.geometry.neighbors(center)):
+                continue
+            cells: List[int] = self.window_cells(center)
+            states: List[int] = [board.get_state_at(cell) if cell >= 0
+                                 else FLAGGED for cell in cells]
+            key, order = canonical(self.window_key(cells, states))
+            safe_slots, mine_slots = self.cache.lookup(key)
+            safe.update(cells[order[slot]] for slot in safe_slots)
+            mines.update(cells[order[slot]] for slot in mine_slots)
+        self.pending = set()
+        return sorted(safe - mines), sorted(mines - safe)
+
+    def collect_changes(self) -> None:
+        """ Put the window centers around every changed cell on the list. """
+        board: Board = self.board
+        changed: Optional[Set[int]] = self.changes.drain()
+        if not self.seeded or changed is None:
+            # First run, or a new layout: every number may be a center
+            self.seeded = True
+            self.pending = set(range(board.geometry.cell_count))
+            return
+        for index in changed:
+            self.pending.update(self.window_cells(index))
+        self.pending.discard(-1)
+
+    def window_cells(self, center: int) -> List[int]:
+        """
+        List the cells of the window around a cell.
+        center (int): Flat index of the center
+        Returns list - flat index of every window cell, -1 off the board
+        """
+        rows: int = self.board.geometry.rows
+        cols: int = self.board.geometry.cols
+        row, col = divmod(center, cols)
+        if 2 <= row < rows - 2 and 2 <= col < cols - 2:
+            return [center + d_row * cols + d_col for d_row, d_col in OFFSETS]
+        return [(row + d_row) * cols + col + d_col
+                if 0 <= row + d_row < rows and 0 <= col + d_col < cols
+                else -1 for d_row, d_col in OFFSETS]
+
+    def window_key(self, cells: List[int], states: List[int]) -> str:
+        """
+        Write the key of a window.
+        cells (list): Flat index of every window cell, -1 off the board
+        states (list): State bits of every window cell, FLAGGED off the
+        board
+        """
+        board: Board = self.board
+        chars: List[str] = []
+        for slot, state in enumerate(states):
+            if not state & (CLICKED | FLAGGED):
+                chars.append(HIDDEN)
+            elif slot in INNER and state & CLICKED:
+                flags: int = sum(1 for neighbor in INNER[slot]
+                                 if states[neighbor] & FLAGGED
+                                 and cells[neighbor] >= 0)
+                need: int = board.get_around_at(cells[slot]) - flags
+                chars.append(str(need) if need >= 0 else BROKEN)
+            else:
+                chars.append(OPEN)
+        return "".join(chars)
@@ -0,0 +1,200 @@
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from board import Board
+from space import CLICKED, FLAGGED
+from tanksolver import ComponentSolutions, TankSolver
+
+# Mines used -> relative weight of the assignments using that many
+Weights = Dict[int, float]
+
+
+@lru_cache(maxsize=65536)
+def log_binomial(n: int, k: int) -> float:
+    """
+    Natural log of the binomial coefficient n choose k.
+    n (int): Size of the set
+    k (int): Size of the subsets (0 <= k <= n)
+    """
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+
+class MineProbabilities:
+    """
+    Exact mine probability of every cell of a board.
+    Every frontier component's solutions are counted by the number of
+    mines they use (see TankSolver). A whole-board assignment picks one
+    solution per component and spreads the remaining mines over the
+    interior (hidden cells next to no number), which can be done in
+    C(interior, remaining) ways. Weighting by that count makes every
+    layout consistent with what is shown equally likely, so the
+    probabilities are exact.
+    Results are cached until the board changes, so asking after every
+    move costs one computation per move.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """
+        Initialize the engine.
+        board (Board): The gameboard to work on
+        """
+        self.board: Board = board
+        self.tank: TankSolver = TankSolver(board)
+        self.cached: Optional[np.ndarray] = None
+        self.cached_generation: int = -1
+
+    def get_probabilities(self) -> np.ndarray:
+        """
+        Get the mine probability of every cell.
+        Revealed cells are 0 and flagged cells are taken to be mines (1).
+        Returns ndarray - probabilities by flat (row-major) index; do not
+        modify it, it is shared until the board changes
+        Raises ValueError if the revealed numbers contradict each other or
+        the mine count
+        """
+        if self.cached is None \
+                or self.cached_generation != self.board.generation:
+            self.cached = self.compute()
+            self.cached_generation = self.board.generation
+        return self.cached
+
+    def probability_at(self, position: Tuple[int, int]) -> float:
+        """
+        Get the mine probability of one cell.
+        position (tuple): (row, col) of the cell
+        """
+        return float(self.get_probabilities()[
+            self.board.geometry.index_of(position)])
+
+    def safest_cells(self) -> List[Tuple[int, int]]:
+        """
+        Get the hidden cells least likely to hold a mine.
+        Returns list - (row, col) of every hidden cell that ties for the
+        lowest probability
+        """
+        probabilities: np.ndarray = self.get_probabilities()
+        hidden: np.ndarray = np.flatnonzero(
+            self.state_array() & (CLICKED | FLAGGED) == 0)
+        if len(hidden) == 0:
+            return []
+        lowest: float = float(probabilities[hidden].min())
+        return [self.board.geometry.position_of(int(index))
+                for index in hidden
+                if probabilities[index] <= lowest + 1e-12]
+
+    def state_array(self) -> np.ndarray:
+        """ The state bits of every cell, by flat (row-major) index. """
+        return np.fromiter(
+            (self.board.get_state_at(index)
+             for index in range(self.board.geometry.cell_count)),
+            dtype=np.uint8, count=self.board.geometry.cell_count)
+
+    def compute(self) -> np.ndarray:
+        """
+        Work out the mine probability of every cell from scratch.
+        Returns ndarray - probabilities by flat (row-major) index
+        Raises ValueError if no layout fits what the board shows
+        """
+        cell_count: int = self.board.geometry.cell_count
+        states: np.ndarray = self.state_array()
+        hidden: np.ndarray = states & (CLICKED | FLAGGED) == 0
+        probabilities: np.ndarray = np.where(states & FLAGGED, 1.0, 0.0)
+
+        solved: List[ComponentSolutions] = self.tank.solve_components(
+            self.tank.split_components(self.tank.find_constraints()))
+        frontier: int = sum(len(component.cells) for component in solved)
+        interior: int = int(np.count_nonzero(hidden)) - frontier
+        mines_left: int = self.board.get_total_mine_count() \
+            - int(np.count_nonzero(states & FLAGGED))
+
+        weights: List[Weights] = [self.relative_weights(component)
+                                  for component in solved]
+        # Products of the components before and after each one
+        before: List[Weights] = [{0: 1.0}]
+        for weight in weights:
+            before.append(self.combine(before[-1], weight, mines_left))
+        after: List[Weights] = [{0: 1.0}]
+        for weight in reversed(weights):
+            after.append(self.combine(after[-1], weight, mines_left))
+        after.reverse()
+
+        spread: Weights = self.interior_weights(before[-1], interior,
+                                                mines_left)
+        total: float = sum(before[-1][mines] * spread[mines]
+                           for mines in spread)
+        if total <= 0.0:
+            raise ValueError("No mine layout fits the board as shown")
+
+        for slot, component in enumerate(solved):
+            others: Weights = self.combine(before[slot], after[slot + 1],
+                                           mines_left)
+            cell_weights: np.ndarray = np.zeros(len(component.cells))
+            for mines, count in component.counts.items():
+                # Weight of every whole-board layout whose component part
+                # uses this many mines, shared by its solutions
+                share: float = weights[slot][mines] / count * sum(
+                    others[rest] * spread.get(rest + mines, 0.0)
+                    for rest in others)
+                cell_weights += share * np.array(component.hits[mines],
+                                                 dtype=float)
+            probabilities[component.cells] = cell_weights / total
+
+        if interior > 0:
+            interior_mines: float = sum(
+                before[-1][mines] * spread[mines] * (mines_left - mines)
+                for mines in spread)
+            frontier_cells: np.ndarray = np.zeros(cell_count, dtype=bool)
+            for component in solved:
+                frontier_cells[component.cells] = True
+            probabilities[hidden & ~frontier_cells] = \
+                interior_mines / total / interior
+        return probabilities
+
+    def relative_weights(self, component: ComponentSolutions) -> Weights:
+        """
+        Scale a component's solution counts so the largest is 1.
+        Only ratios matter, and scaling keeps products of many components
+        within float range.
+        component (ComponentSolutions): The component
+        """
+        if not component.counts:
+            raise ValueError("No mine layout fits the board as shown")
+        largest: int = max(component.counts.values())
+        return {mines: count / largest
+                for mines, count in component.counts.items()}
+
+    def combine(self, first: Weights, second: Weights, limit: int
+                ) -> Weights:
+        """
+        Weights of two independent groups taken together.
+        first (dict): Mines used -> weight of the first group
+        second (dict): Mines used -> weight of the second group
+        limit (int): Most mines worth keeping
+        """
+        combined: Weights = {}
+        for mines, weight in first.items():
+            for more, other in second.items():
+                if mines + more <= limit:
+                    combined[mines + more] = combined.get(mines + more, 0.0) \
+                        + weight * other
+        return combined
+
+    def interior_weights(self, frontier: Weights, interior: int,
+                         mines_left: int) -> Weights:
+        """
+        Relative number of ways to place the mines the frontier leaves
+        over on the interior cells, C(interior, mines_left - mines).
+        frontier (dict): Mines used on the frontier (only the keys are used)
+        interior (int): Number of interior cells
+        mines_left (int): Mines not yet flagged
+        Returns dict - frontier mines -> weight scaled so the largest is 1,
+        for the frontier totals that leave a placeable number of mines
+        """
+        logs: Dict[int, float] = {
+            mines: log_binomial(interior, mines_left - mines)
+            for mines in frontier if 0 <= mines_left - mines <= interior}
+        if not logs:
+            return {}
+        peak: float = max(logs.values())
+        return {mines: math.exp(log - peak) for mines, log in logs.items()}
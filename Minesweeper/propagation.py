@@ -0,0 +1,102 @@
+from typing import List, Optional, Set, Tuple
+from board import Board, ChangeFeed
+from space import CLICKED, FLAGGED
+
+
+class Propagator:
+    """
+    Worklist-driven single-number rules.
+    A revealed number whose flags already match it clears its other
+    hidden neighbors; one with exactly as many hidden neighbors as mines
+    left flags them. Only numbers that may have something new to say are
+    looked at: the worklist starts with every revealed cell once per game,
+    then every cell a move changes puts itself and its revealed neighbors
+    back on it. Running to a fixed point therefore costs work in
+    proportion to the cells that change, not to the size of the board.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """
+        Initialize the propagator.
+        board (Board): The gameboard to play on
+        """
+        self.board: Board = board
+        self.changes: ChangeFeed = board.track_changes()
+        # Revealed cells (flat indices) to look at again
+        self.pending: Set[int] = set()
+        self.seeded: bool = False
+
+    def close(self) -> None:
+        """ Stop collecting the board's changes; the propagator is done. """
+        self.board.unsubscribe(self.changes)
+
+    def run(self) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """
+        Apply the single-number rules until nothing more follows.
+        Every wave of deductions is played as one flag_many() and one
+        reveal_many() move.
+        Returns tuple - ((row, col) revealed, (row, col) flagged)
+        """
+        board: Board = self.board
+        revealed: List[Tuple[int, int]] = []
+        flagged: List[Tuple[int, int]] = []
+        while not board.get_lost() and not board.get_won():
+            self.collect_changes()
+            if not self.pending:
+                break
+            safe, mines = self.deduce(self.pending)
+            self.pending = set()
+            # Never place more flags than there are mines
+            room: int = board.get_total_mine_count() - board.count_flags()
+            flagged.extend(board.flag_many(
+                board.geometry.position_of(index)
+                for index in sorted(mines)[:max(room, 0)]))
+            revealed.extend(board.reveal_many(
+                board.geometry.position_of(index) for index in sorted(safe)))
+        return revealed, flagged
+
+    def collect_changes(self) -> None:
+        """ Put the revealed cells around every changed cell on the list. """
+        board: Board = self.board
+        changed: Optional[Set[int]] = self.changes.drain()
+        if not self.seeded or changed is None:
+            # First run, or a new layout: every revealed cell may count
+            self.seeded = True
+            self.pending = {
+                index for index in range(board.geometry.cell_count)
+                if board.get_state_at(index) & CLICKED}
+            return
+        for index in changed:
+            if board.get_state_at(index) & CLICKED:
+                self.pending.add(index)
+            for neighbor in board.geometry.neighbors(index):
+                if board.get_state_at(neighbor) & CLICKED:
+                    self.pending.add(neighbor)
+
+    def deduce(self, cells: Set[int]) -> Tuple[Set[int], Set[int]]:
+        """
+        Apply the single-number rules to some revealed cells.
+        cells (set): Flat indices of the revealed cells to look at
+        Returns tuple - (flat indices proven safe, flat indices proven to
+        be mines); a cell both rules claim (wrong flags) is left out
+        """
+        board: Board = self.board
+        safe: Set[int] = set()
+        mines: Set[int] = set()
+        for index in cells:
+            hidden: List[int] = []
+            flags: int = 0
+            for neighbor in board.geometry.neighbors(index):
+                state: int = board.get_state_at(neighbor)
+                if state & FLAGGED:
+                    flags += 1
+                elif not state & CLICKED:
+                    hidden.append(neighbor)
+            if not hidden:
+                continue
+            need: int = board.get_around_at(index) - flags
+            if need == 0:
+                safe.update(hidden)
+            elif need == len(hidden):
+                mines.update(hidden)
+        return safe - mines, mines - safe
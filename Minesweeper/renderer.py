@@ -1,8 +1,62 @@
 import pygame  # type: ignore
-import os
-from typing import Dict, Tuple, List
-from space import Space
-from board import Board
+import numpy as np
+from typing import Dict, Tuple, List, Optional, Set
+from atlas import TileAtlas, load_atlas
+from space import CLICKED, FLAGGED, MINE, Space
+from board import Board, ChangeFeed
+
+# Height of the header above the board, in pixels
+HEADER_HEIGHT: int = 50
+# Colors of the header and of its text
+HEADER_COLOR: Tuple[int, int, int] = (200, 200, 200)
+TEXT_COLOR: Tuple[int, int, int] = (0, 0, 0)
+# Size of the smiley face in the header
+SMILEY_SIZE: Tuple[int, int] = (30, 30)
+# Share of the cells in view changed past which one full flip of the
+# screen is cheaper than updating a rectangle per cell
+FULL_UPDATE_SHARE: float = 0.25
+# Minimap areas changed past which one blit of the whole minimap is
+# cheaper than a blit per area
+MINIMAP_AREAS: int = 512
+# Largest board area on the screen, in pixels; larger boards scroll
+BOARD_VIEW: Tuple[int, int] = (800, 800)
+# Smallest tile side a board starts with (Game fits smaller boards to the
+# view)
+MIN_PIECE_SIZE: int = 8
+# Smallest and largest tile side zooming allows
+TILE_SIZE_RANGE: Tuple[int, int] = (4, 128)
+# Minimap color of every cell code: revealed with 0 to 8 mines around,
+# then flagged, exploded mine, hidden and mine shown (see minimap_code())
+MINIMAP_COLORS: List[Tuple[int, int, int]] = [
+    (224, 224, 224), (170, 190, 250), (130, 200, 130), (240, 130, 130),
+    (110, 110, 200), (180, 90, 90), (80, 170, 170), (60, 60, 60),
+    (110, 110, 110), (255, 60, 0), (0, 0, 0), (140, 140, 140),
+    (120, 0, 0)]
+FLAG_CODE: int = 9
+EXPLODED_CODE: int = 10
+HIDDEN_CODE: int = 11
+SHOWN_MINE_CODE: int = 12
+# Color of the outline of the tile view drawn on the minimap
+VIEW_OUTLINE_COLOR: Tuple[int, int, int] = (255, 255, 0)
+
+
+def minimap_code(state: int, around: int) -> int:
+    """
+    Get the minimap code of a cell, as image_key_at() gets its tile.
+    state (int): MINE/CLICKED/FLAGGED bits of the cell
+    around (int): Mines around the cell
+    Returns int - index into MINIMAP_COLORS
+    """
+    if state & CLICKED:
+        return around if not state & MINE else EXPLODED_CODE
+    if state & FLAGGED:
+        return FLAG_CODE
+    return HIDDEN_CODE
+
+
+# Minimap code of every (state bits << 4 | mines around)
+MINIMAP_CODES: np.ndarray = np.array(
+    [minimap_code(key >> 4, key & 15) for key in range(256)], dtype=np.uint8)
 
 
 class Renderer:
@@ -18,87 +72,510 @@ class Renderer:
         pygame.font.init()  # initalize the font module
         self.piece_size: Tuple[int, int] = piece_size
         self.screen_size: Tuple[int, int] = (
-            grid_size[0] * piece_size[0],
-            grid_size[1] * piece_size[1] + extra_height)
+            min(grid_size[0] * piece_size[0], BOARD_VIEW[0]),
+            min(grid_size[1] * piece_size[1], BOARD_VIEW[1]) + extra_height)
         self.extra_height: int = extra_height
         self.screen: pygame.Surface = pygame.display.set_mode(self.screen_size)
+        # Screen area the board is seen through
+        self.view: pygame.Rect = pygame.Rect(
+            0, HEADER_HEIGHT, self.screen_size[0],
+            self.screen_size[1] - extra_height)
+        # Camera: the tile size (the piece size times the zoom) and the
+        # board pixel, at that size, in the top left corner of the view
+        self.zoom: float = 1.0
+        self.tile_size: Tuple[int, int] = (int(piece_size[0]),
+                                           int(piece_size[1]))
+        self.camera: Tuple[int, int] = (0, 0)
+        # Tile atlases by tile size, for zooming back and forth
+        self.atlases: Dict[Tuple[int, int], TileAtlas] = {}
         # Load game assets
         self.assets: Dict[str, pygame.Surface] = self.load_assets()
+        self.header_assets: Dict[str, pygame.Surface] = \
+            self.load_header_assets()
         # Initialize font
         self.font: pygame.font.Font = pygame.font.Font(None, 36)
+        # Rendered text by (text, color)
+        self.text_cache: Dict[Tuple[str, Tuple[int, int, int]],
+                              pygame.Surface] = {}
+        # Header as last composed, and the mine count it shows
+        self.header: Optional[pygame.Surface] = None
+        self.header_text: Optional[str] = None
+        # Board on the screen, with a feed of the cells changed on it since
+        # it was drawn; None until a board is drawn
+        self.drawn: Optional[Board] = None
+        self.changes: Optional[ChangeFeed] = None
+        # The screen has been cleared since the board was drawn
+        self.cleared: bool = False
+        # Mine positions and header values on the screen
+        self.shown_mines: Set[Tuple[int, int]] = set()
+        self.shown_header: Optional[Tuple[int, int]] = None
+        # Screen areas drawn since the last update_display(); None for the
+        # whole screen
+        self.dirty: Optional[List[pygame.Rect]] = None
+        # Minimap mode: the whole board drawn scaled into the view on an
+        # 8-bit surface (its palette is MINIMAP_COLORS) instead of tiles;
+        # None until drawn
+        self.minimap: bool = False
+        self.overview: Optional[pygame.Surface] = None
+        self.overview_rect: pygame.Rect = pygame.Rect(self.view)
+        # The tile view's outline on the minimap, relative to it
+        self.outline: Optional[pygame.Rect] = None
 
     def load_assets(self) -> Dict[str, pygame.Surface]:
         """
-        Load game assets.
-        Returns a dictionary that contains the game assets
-        """
-        assets: Dict[str, pygame.Surface] = {}
-        images_dir: str = "images"
-        for fileName in os.listdir(images_dir):
-            if not fileName.endswith(".png"):
-                continue
-            path: str = images_dir + r"/" + fileName
-            img: pygame.Surface = pygame.image.load(path)
-            img = img.convert()
-            img = pygame.transform.scale(img, (int(self.piece_size[0]),
-                                               int(self.piece_size[1])))
-            assets[fileName.split(".")[0]] = img
-        return assets
+        Load game assets: the tile atlas for the piece size, read from the
+        on-disk cache when the images have not changed.
+        Returns a dictionary that contains the game assets (views into the
+        atlas)
+        """
+        self.atlas: TileAtlas = self.get_atlas(self.tile_size)
+        return self.atlas.tiles()
+
+    def get_atlas(self, tile_size: Tuple[int, int]) -> TileAtlas:
+        """
+        Get the tile atlas of a tile size, loading it on first use.
+        tile_size (tuple): (width, height) of a tile
+        """
+        if tile_size not in self.atlases:
+            self.atlases[tile_size] = load_atlas(tile_size)
+        return self.atlases[tile_size]
+
+    def load_header_assets(self) -> Dict[str, pygame.Surface]:
+        """
+        Load the header images, scaled to their size in the header once.
+        Returns a dictionary that contains the header assets
+        """
+        smiley: pygame.Surface = pygame.image.load('images/smiley.png')
+        smiley = pygame.transform.scale(smiley.convert(), SMILEY_SIZE)
+        return {'smiley': smiley}
+
+    def render_text(self, text: str,
+                    color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render text with the font, once per (text, color).
+        text (str): Text to render
+        color (tuple): Its RGB color
+        Returns the rendered surface (shared; do not draw on it)
+        """
+        key: Tuple[str, Tuple[int, int, int]] = (text, color)
+        surface: Optional[pygame.Surface] = self.text_cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
 
     def draw_header(self, mine_count: int, flags_placed: int) -> None:
         """
         Draw the game header (mine count & smiley face).
+        The header is composed once on its own surface and only composed
+        again when the mine count shown changes.
         mine_count (int): Total number of mines
         flags_placed (int): Total number of flags placed
         """
-        header_height: int = 50
-        header_rect: pygame.Rect = pygame.Rect(0, 0, self.screen_size[0],
-                                               header_height)
-        pygame.draw.rect(self.screen, (200, 200, 200), header_rect)
+        text: str = str(mine_count - flags_placed)
+        if self.header is None or text != self.header_text:
+            self.header = self.compose_header(text)
+            self.header_text = text
+        self.screen.blit(self.header, (0, 0))
+
+    def compose_header(self, text: str) -> pygame.Surface:
+        """
+        Draw the header on a surface of its own.
+        text (str): Mine count to print
+        Returns the header surface
+        """
+        header: pygame.Surface = pygame.Surface((self.screen_size[0],
+                                                 HEADER_HEIGHT))
+        header.fill(HEADER_COLOR)
 
         # Draw the smiley face
-        smiley_img: pygame.Surface = pygame.image.load('images/smiley.png')
-        smiley_img = pygame.transform.scale(smiley_img, (30, 30))
+        smiley_img: pygame.Surface = self.header_assets['smiley']
         smiley_x: int = self.screen_size[0] // 2 - smiley_img.get_width() // 2
-        smiley_y: int = header_height // 2 - smiley_img.get_height() // 2
-        self.screen.blit(smiley_img, (smiley_x, smiley_y))
+        smiley_y: int = HEADER_HEIGHT // 2 - smiley_img.get_height() // 2
+        header.blit(smiley_img, (smiley_x, smiley_y))
 
         # Print the mine count
-        text: str = str(mine_count - flags_placed)
-        # print(f"Text: ",{text})
-        text_surface: pygame.Surface = self.font.render(text, True, (0, 0, 0))
+        text_surface: pygame.Surface = self.render_text(text, TEXT_COLOR)
         text_x: int = 10
-        text_y: int = header_height // 2 - text_surface.get_height() // 2
-        self.screen.blit(text_surface, (text_x, text_y))
+        text_y: int = HEADER_HEIGHT // 2 - text_surface.get_height() // 2
+        header.blit(text_surface, (text_x, text_y))
+        return header
 
     def draw_board(self, board: Board,
                    mine_positions: List[Tuple[int, int]] = [],
                    flags_placed: int = 0) -> None:
         """
-        Draw the game board.
+        Draw the game board, as far as it is in view.
+        The first time a board is drawn (and after clear_screen(), panning,
+        zooming or a new layout) every tile in view is drawn; after that
+        only the tiles in view of cells that changed since, from a change
+        feed on the board, and of mine positions added or removed, so a
+        frame costs as much as what changed in view, however large the
+        board. In minimap
+        mode the whole board is drawn as the minimap instead.
         board (Board): The game board
         mine_positions (list): List of mine positions. Defaults to []
         flags_placed (int): Number of flags placed. Defaults to 0
         """
-        header_height: int = 50
-        total_header_height: int = header_height
-        top_left: Tuple[int, int] = (0, total_header_height)
-
-        # self.screen.fill((0, 0, 0))
-        # top_left = (0, 0)
-
-        # Draw the board grid
-        for y, row in enumerate(board.get_board()):
-            for x, piece in enumerate(row):
-                position = (top_left[0] + x * self.piece_size[0], top_left[1]
-                            + y * self.piece_size[1])
-                if (y, x) in mine_positions:
-                    # draw bomb image for selected mine positions
-                    self.screen.blit(self.assets['unclicked-bomb'], position)
+        mines: Set[Tuple[int, int]] = set(mine_positions)
+        # Cells changed since the last draw; None to draw every cell
+        changed: Optional[Set[int]] = None
+        if board is not self.drawn or self.changes is None or self.cleared:
+            self.watch(board)
+            self.cleared = False
+            self.clamp_camera()
+        else:
+            changed = self.changes.drain()
+        if self.minimap:
+            self.draw_minimap(board, mines, changed)
+        elif changed is None:
+            first_row, last_row, first_col, last_col = self.visible_range()
+            # Draw the board grid
+            self.draw_cells(board, [(y, x) for y in range(first_row, last_row)
+                                    for x in range(first_col, last_col)],
+                            mines)
+            self.dirty = None
+        else:
+            first_row, last_row, first_col, last_col = self.visible_range()
+            cells: Set[Tuple[int, int]] = {
+                board.geometry.position_of(index) for index in changed}
+            cells.update(mines ^ self.shown_mines)
+            in_view: List[Tuple[int, int]] = [
+                cell for cell in cells
+                if first_row <= cell[0] < last_row
+                and first_col <= cell[1] < last_col]
+            self.draw_cells(board, in_view, mines)
+            if self.dirty is not None:
+                if len(in_view) > FULL_UPDATE_SHARE * (
+                        last_row - first_row) * (last_col - first_col):
+                    self.dirty = None
                 else:
-                    self.draw_piece(piece, position)
+                    self.dirty.extend(
+                        pygame.Rect(self.cell_position(cell),
+                                    self.tile_size).clip(self.view)
+                        for cell in in_view)
+        self.shown_mines = mines
         # Draw the header
-        self.draw_header(board.get_total_mine_count(), flags_placed)
+        header: Tuple[int, int] = (board.get_total_mine_count(),
+                                   flags_placed)
+        if header != self.shown_header or self.dirty is None:
+            self.draw_header(*header)
+            self.shown_header = header
+            if self.dirty is not None:
+                self.dirty.append(pygame.Rect(0, 0, self.screen_size[0],
+                                              HEADER_HEIGHT))
+
+    def watch(self, board: Board) -> None:
+        """
+        Follow the cells that change on a board, instead of the board
+        drawn before.
+        board (Board): The board about to be drawn in full
+        """
+        if board is self.drawn and self.changes is not None:
+            self.changes.drain()
+            return
+        if self.drawn is not None and self.changes is not None:
+            self.drawn.unsubscribe(self.changes)
+        self.changes = board.track_changes()
+        self.drawn = board
+
+    def visible_range(self) -> Tuple[int, int, int, int]:
+        """
+        Find the cells of the drawn board that are in view.
+        Returns tuple - (first row, row after the last, first column,
+        column after the last)
+        """
+        if self.drawn is None:
+            return 0, 0, 0, 0
+        rows, cols = self.drawn.get_size()
+        width, height = self.tile_size
+        return (self.camera[1] // height,
+                min(rows, -(-(self.camera[1] + self.view.height) // height)),
+                self.camera[0] // width,
+                min(cols, -(-(self.camera[0] + self.view.width) // width)))
+
+    def cell_position(self, cell: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Get where a cell's tile goes on the screen.
+        cell (tuple): (row, column) of the cell
+        Returns tuple - screen position (x, y) of its top left corner
+        """
+        return (self.view.x + cell[1] * self.tile_size[0] - self.camera[0],
+                self.view.y + cell[0] * self.tile_size[1] - self.camera[1])
+
+    def screen_to_cell(self, pixel: Tuple[int, int]
+                       ) -> Optional[Tuple[int, int]]:
+        """
+        Find the cell under a screen position, through the camera.
+        pixel (tuple): Screen position (x, y)
+        Returns tuple - (row, column) of the cell, or None outside the
+        view or the board, or in minimap mode
+        """
+        if self.minimap or not self.view.collidepoint(pixel):
+            return None
+        row: int = (pixel[1] - self.view.y + self.camera[1]) \
+            // self.tile_size[1]
+        col: int = (pixel[0] - self.view.x + self.camera[0]) \
+            // self.tile_size[0]
+        if self.drawn is not None:
+            rows, cols = self.drawn.get_size()
+            if not (row < rows and col < cols):
+                return None
+        return row, col
+
+    def pan(self, d_x: int, d_y: int) -> None:
+        """
+        Move the camera (the next draw_board() draws every tile in view).
+        d_x (int): Pixels to move right (negative for left)
+        d_y (int): Pixels to move down (negative for up)
+        """
+        self.camera = (self.camera[0] + d_x, self.camera[1] + d_y)
+        self.clamp_camera()
+        self.clear_screen()
+
+    def zoom_by(self, factor: float,
+                anchor: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Zoom the camera, keeping the board point under a screen position
+        in place (the next draw_board() draws every tile in view).
+        factor (float): Zoom factor (above 1 to zoom in)
+        anchor (tuple): Screen position to zoom around, the middle of the
+        view if None
+        """
+        least: float = min(1.0, TILE_SIZE_RANGE[0] / min(self.piece_size))
+        most: float = max(1.0, TILE_SIZE_RANGE[1] / max(self.piece_size))
+        self.zoom = min(most, max(least, self.zoom * factor))
+        tile_size: Tuple[int, int] = (
+            max(1, round(self.piece_size[0] * self.zoom)),
+            max(1, round(self.piece_size[1] * self.zoom)))
+        if anchor is None:
+            anchor = self.view.center
+        # Offset of the anchor in the view, and the board point under it
+        # in tiles
+        offset: Tuple[int, int] = (anchor[0] - self.view.x,
+                                   anchor[1] - self.view.y)
+        point: Tuple[float, float] = (
+            (self.camera[0] + offset[0]) / self.tile_size[0],
+            (self.camera[1] + offset[1]) / self.tile_size[1])
+        self.tile_size = tile_size
+        self.atlas = self.get_atlas(tile_size)
+        self.camera = (round(point[0] * tile_size[0]) - offset[0],
+                       round(point[1] * tile_size[1]) - offset[1])
+        self.clamp_camera()
+        self.clear_screen()
+
+    def clamp_camera(self) -> None:
+        """ Keep the camera on the drawn board. """
+        if self.drawn is None:
+            return
+        rows, cols = self.drawn.get_size()
+        most: Tuple[int, int] = (
+            max(0, cols * self.tile_size[0] - self.view.width),
+            max(0, rows * self.tile_size[1] - self.view.height))
+        self.camera = (min(max(self.camera[0], 0), most[0]),
+                       min(max(self.camera[1], 0), most[1]))
+
+    def toggle_minimap(self) -> None:
+        """
+        Switch between tiles and the minimap (the next draw_board() draws
+        the view in full).
+        """
+        self.minimap = not self.minimap
+        self.clear_screen()
+
+    def center_on(self, cell: Tuple[int, int]) -> None:
+        """
+        Move the camera so a cell is in the middle of the view.
+        cell (tuple): (row, column) of the cell
+        """
+        self.camera = (
+            cell[1] * self.tile_size[0] + self.tile_size[0] // 2
+            - self.view.width // 2,
+            cell[0] * self.tile_size[1] + self.tile_size[1] // 2
+            - self.view.height // 2)
+        self.clamp_camera()
+        self.clear_screen()
+
+    def minimap_cell(self, pixel: Tuple[int, int]
+                     ) -> Optional[Tuple[int, int]]:
+        """
+        Find the cell under a screen position on the minimap.
+        pixel (tuple): Screen position (x, y)
+        Returns tuple - (row, column) of the cell, or None off the minimap
+        """
+        if self.overview is None or self.drawn is None \
+                or not self.overview_rect.collidepoint(pixel):
+            return None
+        rows, cols = self.drawn.get_size()
+        return ((pixel[1] - self.overview_rect.y) * rows
+                // self.overview_rect.height,
+                (pixel[0] - self.overview_rect.x) * cols
+                // self.overview_rect.width)
+
+    def draw_minimap(self, board: Board, mines: Set[Tuple[int, int]],
+                     changed: Optional[Set[int]]) -> None:
+        """
+        Draw the whole board scaled into the view.
+        The minimap is kept as an 8-bit surface of its size on the screen,
+        each pixel showing the cell it falls in. On a full draw the colors
+        of every cell come from the board's state arrays in one table
+        lookup and the pixels are picked from them and pushed to the
+        surface with one surfarray blit. After that only the pixels of
+        changed cells are written (straight into the pixel array when the
+        board is scaled down, so a cell is one pixel or none) and only
+        they are blitted to the screen, so a frame costs as much as what
+        changed, however large the board. Full draws are cheap on an
+        ArrayBoard, whose state arrays are its storage; the list-backed
+        Board builds them cell by cell, which is why the game keeps large
+        grids in ArrayBoards.
+        board (Board): The game board
+        mines (set): Mine positions to show as mines
+        changed (set): Flat indices of the cells changed since the last
+        draw; None to draw every cell
+        """
+        rows, cols = board.get_size()
+        # Fit the board in the view, keeping its shape
+        scale: float = min(self.view.width / cols, self.view.height / rows)
+        size: Tuple[int, int] = (max(1, round(cols * scale)),
+                                 max(1, round(rows * scale)))
+        if changed is not None:
+            changed.update(row * cols + col
+                           for row, col in mines ^ self.shown_mines)
+        overview: Optional[pygame.Surface] = self.overview
+        if changed is not None and overview is not None \
+                and overview.get_size() == size \
+                and len(changed) <= FULL_UPDATE_SHARE * rows * cols:
+            if not changed:
+                return
+            areas: List[pygame.Rect] = self.update_overview(
+                overview, board, mines, changed)
+            if len(areas) > MINIMAP_AREAS:
+                areas = [overview.get_rect()]
+            areas.extend(self.outline_edges())
+            x, y = self.overview_rect.topleft
+            self.screen.blits([(overview, area.move(x, y), area)
+                               for area in areas], doreturn=False)
+            self.draw_outline(rows, cols)
+            if self.dirty is not None:
+                self.dirty.extend(area.move(x, y) for area in areas)
+                self.dirty.extend(edge.move(x, y)
+                                  for edge in self.outline_edges())
+            return
+
+        overview = pygame.Surface(size, depth=8)
+        overview.set_palette(MINIMAP_COLORS)
+        states, around = board.state_arrays()
+        codes: np.ndarray = MINIMAP_CODES[(states & 7) << 4 | around]
+        if mines:
+            codes[tuple(np.array(sorted(mines)).T)] = SHOWN_MINE_CODE
+        # The cell every pixel falls in; surface arrays are indexed (x, y)
+        pygame.surfarray.blit_array(overview, codes[np.ix_(
+            np.arange(size[1]) * rows // size[1],
+            np.arange(size[0]) * cols // size[0])].T)
+        self.overview = overview
+        self.overview_rect = overview.get_rect(center=self.view.center)
+        self.screen.fill((0, 0, 0), self.view)
+        self.screen.blit(overview, self.overview_rect)
+        self.draw_outline(rows, cols)
+        self.dirty = None
+
+    def update_overview(self, overview: pygame.Surface, board: Board,
+                        mines: Set[Tuple[int, int]], changed: Set[int]
+                        ) -> List[pygame.Rect]:
+        """
+        Write the pixels of changed cells on the minimap surface.
+        A cell covers the pixels from the first that falls in it to the
+        first that falls in the next cell, as on a full draw.
+        overview (Surface): The minimap surface
+        board (Board): The game board
+        mines (set): Mine positions to show as mines
+        changed (set): Flat indices of the cells changed
+        Returns list - the areas of the surface written
+        """
+        rows, cols = board.get_size()
+        width, height = overview.get_size()
+        indices: np.ndarray = np.fromiter(changed, dtype=np.intp,
+                                          count=len(changed))
+        codes: np.ndarray = np.array([
+            SHOWN_MINE_CODE if (index // cols, index % cols) in mines
+            else minimap_code(board.get_state_at(index),
+                              board.get_around_at(index))
+            for index in changed], dtype=np.uint8)
+        row: np.ndarray = indices // cols
+        col: np.ndarray = indices % cols
+        left: np.ndarray = -(-col * width // cols)
+        right: np.ndarray = -(-(col + 1) * width // cols)
+        top: np.ndarray = -(-row * height // rows)
+        bottom: np.ndarray = -(-(row + 1) * height // rows)
+        shown: np.ndarray = (left < right) & (top < bottom)
+        if width <= cols and height <= rows:
+            # Scaled down: a cell is one pixel or none
+            pixels: np.ndarray = pygame.surfarray.pixels2d(overview)
+            pixels[left[shown], top[shown]] = codes[shown]
+            # The surface stays locked while its pixel array lives
+            del pixels
+            return [pygame.Rect(x, y, 1, 1) for x, y in
+                    zip(left[shown].tolist(), top[shown].tolist())]
+        areas: List[pygame.Rect] = [
+            pygame.Rect(x, y, x_end - x, y_end - y)
+            for x, y, x_end, y_end in zip(
+                left[shown].tolist(), top[shown].tolist(),
+                right[shown].tolist(), bottom[shown].tolist())]
+        for area, code in zip(areas, codes[shown].tolist()):
+            # An 8-bit surface is filled with a palette index
+            overview.fill(code, area)
+        return areas
+
+    def draw_outline(self, rows: int, cols: int) -> None:
+        """
+        Outline the part of the board the tile view shows on the minimap.
+        rows (int): Rows of the board
+        cols (int): Columns of the board
+        """
+        first_row, last_row, first_col, last_col = self.visible_range()
+        width, height = self.overview_rect.size
+        self.outline = pygame.Rect(
+            first_col * width // cols, first_row * height // rows,
+            max(1, (last_col - first_col) * width // cols),
+            max(1, (last_row - first_row) * height // rows))
+        pygame.draw.rect(self.screen, VIEW_OUTLINE_COLOR,
+                         self.outline.move(self.overview_rect.topleft), 1)
+
+    def outline_edges(self) -> List[pygame.Rect]:
+        """
+        Get the minimap areas under the outline's four edges.
+        Returns list - rectangles relative to the minimap
+        """
+        outline: Optional[pygame.Rect] = self.outline
+        if outline is None:
+            return []
+        return [pygame.Rect(outline.x, outline.y, outline.width, 1),
+                pygame.Rect(outline.x, outline.bottom - 1, outline.width, 1),
+                pygame.Rect(outline.x, outline.y, 1, outline.height),
+                pygame.Rect(outline.right - 1, outline.y, 1, outline.height)]
+
+    def draw_cells(self, board: Board, cells: List[Tuple[int, int]],
+                   mines: Set[Tuple[int, int]]) -> None:
+        """
+        Draw the tiles of cells, clipped to the view, in one blits() call.
+        board (Board): The game board
+        cells (list): (row, column) of every cell to draw
+        mines (set): Mine positions to show as mines
+        """
+        cols: int = board.get_size()[1]
+        surface: pygame.Surface = self.atlas.surface
+        rects: Dict[str, pygame.Rect] = self.atlas.rects
+        left: int = self.view.x - self.camera[0]
+        top: int = self.view.y - self.camera[1]
+        width, height = self.tile_size
+        self.screen.set_clip(self.view)
+        self.screen.blits([
+            (surface, (left + col * width, top + row * height),
+             # draw bomb image for selected mine positions
+             rects['unclicked-bomb'] if mines and (row, col) in mines
+             else rects[self.image_key_at(board, row * cols + col)])
+            for row, col in cells], False)
+        self.screen.set_clip(None)
 
     def draw_piece(self, piece: Space, position: Tuple[int, int]) -> None:
         """
@@ -107,8 +584,23 @@ class Renderer:
         position (tuple): Where to draw the piece
         """
         image_key: str = self.get_image_key(piece)
-        image: pygame.Surface = self.assets[image_key]
-        self.screen.blit(image, position)
+        self.atlas.blit(self.screen, image_key, position)
+
+    def image_key_at(self, board: Board, index: int) -> str:
+        """
+        Get the image key of a cell from its state bits, as get_image_key()
+        does from its piece.
+        board (Board): The game board
+        index (int): Flat (row-major) index of the cell
+        Returns the image key (str)
+        """
+        state: int = board.get_state_at(index)
+        if state & CLICKED:
+            return str(board.get_around_at(index)) if not state & MINE \
+                else 'bomb-at-clicked-block'
+        if state & FLAGGED:
+            return 'flag'
+        return 'empty-block'
 
     def get_image_key(self, piece: Space) -> str:
         """
@@ -124,9 +616,19 @@ class Renderer:
         return 'empty-block'
 
     def update_display(self) -> None:
-        """ Update the display. """
-        pygame.display.flip()
+        """
+        Update the display: only the areas drawn since the last update, or
+        the whole screen after a full redraw.
+        """
+        if self.dirty is None:
+            pygame.display.flip()
+        elif self.dirty:
+            pygame.display.update(self.dirty)
+        self.dirty = []
 
     def clear_screen(self) -> None:
-        """ Clear the screen. """
+        """ Clear the screen (the next draw_board() draws every tile). """
         self.screen.fill((0, 0, 0))
+        self.cleared = True
+        self.shown_header = None
+        self.dirty = None
@@ -0,0 +1,236 @@
+from typing import Dict, List, Optional, Set, Tuple
+from board import Board
+from cdcl import CdclSolver
+from space import CLICKED, FLAGGED
+from tanksolver import Constraint, TankSolver
+
+# Most frontier cells times totalizer outputs the mine count may cost;
+# past this it is left out, which keeps every answer right but may miss
+# some
+COUNT_LIMIT: int = 100000
+# Conflicts allowed per question about the mine count; proving a bound on
+# how many mines many cells can hold is hard for clause learning, and
+# leaving a question unanswered only costs deductions
+COUNT_CONFLICTS: int = 200
+
+
+class SatSolver(TankSolver):
+    """
+    Frontier reasoning with the CDCL SAT solver instead of enumeration.
+    Every frontier cell is a variable, true for a mine, and each revealed
+    number says exactly how many of its hidden neighbors are mines. A
+    cell is certain when the formula cannot be satisfied with the cell
+    assumed the other way. Every model found rules out the queries for
+    the values it shows, and the clauses learnt carry over from one query
+    to the next, so the cost follows how tangled the frontier is rather
+    than how many layouts fit it.
+    Components are asked about one by one. The mine count only comes in
+    when cheap bounds say it could matter: a totalizer over the whole
+    frontier then checks whether the count rules anything out, and if it
+    does, the cells still open are asked about again under it. It also
+    settles the interior (hidden cells next to no number) when the
+    frontier must leave it no mines or one per cell. Plays like
+    TankSolver otherwise.
+    """
+
+    def find_certain(self) -> Tuple[List[int], List[int]]:
+        """
+        Work out the cells that are certain in the current position.
+        Returns tuple - (flat indices of safe cells, flat indices of mines);
+        both are empty if the position is inconsistent
+        """
+        board: Board = self.get_board()
+        constraints: List[Constraint] = self.find_constraints()
+        certain: Dict[int, bool] = {}
+        for component in self.split_components(constraints):
+            formula, variables = self.build_formula(component)
+            found: Optional[Dict[int, bool]] = self.query_cells(
+                formula, variables, certain)
+            if found is None:
+                return [], []
+            certain.update(found)
+
+        frontier_cells: Set[int] = {cell for cells, _ in constraints
+                                    for cell in cells}
+        frontier: int = len(frontier_cells)
+        hidden: int = sum(
+            1 for index in range(board.geometry.cell_count)
+            if not board.get_state_at(index) & (CLICKED | FLAGGED))
+        interior: int = hidden - frontier
+        mines_left: int = board.get_total_mine_count() - board.count_flags()
+        # Fewest and most mines the frontier can hold
+        low: int = mines_left - interior
+        high: int = mines_left
+        if low > frontier or high < 0:
+            return [], []
+        interior_mine: Optional[bool] = None
+        fewest, most = self.mine_bounds(constraints)
+        if (fewest <= low or most >= high) \
+                and frontier * min(frontier, high + 1) <= COUNT_LIMIT:
+            counted: Optional[Tuple[Dict[int, bool], Optional[bool]]] = \
+                self.query_count(constraints, certain, low, high)
+            if counted is None:
+                return [], []
+            certain.update(counted[0])
+            interior_mine = counted[1]
+
+        safe: List[int] = [cell for cell, mine in certain.items()
+                           if not mine]
+        mines: List[int] = [cell for cell, mine in certain.items() if mine]
+        if interior > 0 and interior_mine is not None:
+            interior_cells: List[int] = self.find_interior_cells(
+                frontier_cells)
+            (mines if interior_mine else safe).extend(interior_cells)
+        return sorted(safe), sorted(mines)
+
+    def mine_bounds(self, constraints: List[Constraint]) -> Tuple[int, int]:
+        """
+        Cheap bounds on the mines the frontier holds, to skip the count
+        when it cannot matter. Numbers with no hidden cells in common hold
+        at least the sum of their needs, and numbers that touch every
+        frontier cell between them hold at most that sum (and never more
+        than one per cell); both sets are picked greedily.
+        constraints (list): Every frontier constraint
+        Returns tuple - (fewest, most) mines the frontier can hold
+        """
+        fewest: int = 0
+        used: Set[int] = set()
+        for cells, need in sorted(constraints, key=lambda constraint:
+                                  (-constraint[1], len(constraint[0]))):
+            if used.isdisjoint(cells):
+                fewest += need
+                used.update(cells)
+        most: int = 0
+        uncovered: Set[int] = {cell for cells, _ in constraints
+                               for cell in cells}
+        size: int = len(uncovered)
+        for cells, need in sorted(constraints, key=lambda constraint:
+                                  constraint[1] / (len(constraint[0]) or 1)):
+            if not uncovered.isdisjoint(cells):
+                most += need
+                uncovered.difference_update(cells)
+        return fewest, min(most, size)
+
+    def build_formula(self, constraints: List[Constraint]
+                      ) -> Tuple[CdclSolver, Dict[int, int]]:
+        """
+        Encode constraints as a formula.
+        constraints (list): The constraints
+        Returns tuple - (the formula, frontier cell -> its variable)
+        """
+        formula: CdclSolver = CdclSolver()
+        variables: Dict[int, int] = {}
+        for cells, need in constraints:
+            for cell in cells:
+                if cell not in variables:
+                    variables[cell] = formula.new_var()
+            formula.add_exactly([variables[cell] for cell in cells], need)
+        return formula, variables
+
+    def query_cells(self, formula: CdclSolver, variables: Dict[int, int],
+                    known: Dict[int, bool],
+                    conflict_limit: Optional[int] = None
+                    ) -> Optional[Dict[int, bool]]:
+        """
+        Find the cells whose value every model of a formula agrees on.
+        formula (CdclSolver): The formula
+        variables (dict): Frontier cell -> its variable
+        known (dict): Cells already known to be certain (not asked about)
+        conflict_limit (int): Conflicts allowed per question, None for no
+        limit; a cell whose question runs out is left uncertain
+        Returns dict - cell -> True for a mine, False for safe, for the
+        certain cells not already known; None if the formula has no model
+        """
+        if not formula.solve():
+            return None
+        # Values each variable takes in the models found
+        seen: Dict[int, Set[bool]] = {var: set()
+                                      for var in variables.values()}
+        self.record_model(formula, seen)
+        found: Dict[int, bool] = {}
+        for cell, var in variables.items():
+            if len(seen[var]) == 2 or cell in known:
+                continue
+            value: bool = next(iter(seen[var]))
+            answer: Optional[bool] = formula.solve_within(
+                [-var if value else var], conflict_limit)
+            if answer:
+                self.record_model(formula, seen)
+            elif answer is False:
+                found[cell] = value
+                formula.add_clause([var if value else -var])
+        return found
+
+    def query_count(self, constraints: List[Constraint],
+                    known: Dict[int, bool], low: int, high: int
+                    ) -> Optional[Tuple[Dict[int, bool], Optional[bool]]]:
+        """
+        Bring in the mine count: the frontier holds between low and high
+        mines.
+        constraints (list): Every frontier constraint
+        known (dict): Cells already known to be certain
+        low (int): Fewest mines the frontier may hold
+        high (int): Most mines the frontier may hold
+        Returns tuple - (cells the count makes certain, True if the
+        interior must be all mines, False if it must be clear, None if
+        neither), or None if no layout fits the count
+        """
+        formula, variables = self.build_formula(constraints)
+        for cell, mine in known.items():
+            formula.add_clause([variables[cell] if mine
+                                else -variables[cell]])
+        frontier: List[int] = list(variables.values())
+        # counts[j] - the frontier holds more than j mines
+        counts: List[int] = formula.add_totalizer(
+            frontier, min(len(frontier), high + 1)) if frontier else []
+        # Only ask about every cell again if the count rules layouts out
+        binding: Optional[bool] = False
+        if high < len(frontier):
+            binding = formula.solve_within([counts[high]], COUNT_CONFLICTS)
+            formula.add_clause([-counts[high]])
+        if low > 0 and binding is False:
+            binding = formula.solve_within([-counts[low - 1]],
+                                           COUNT_CONFLICTS)
+            formula.add_clause([counts[low - 1]])
+        if binding is None:
+            return {}, None
+        found: Optional[Dict[int, bool]] = {}
+        if binding:
+            found = self.query_cells(formula, variables, known,
+                                     COUNT_CONFLICTS)
+        elif not formula.solve():
+            found = None
+        if found is None:
+            return None
+
+        interior_mine: Optional[bool] = None
+        if high == 0 or high - 1 < len(counts) and formula.solve_within(
+                [-counts[high - 1]], COUNT_CONFLICTS) is False:
+            # The frontier takes every mine left
+            interior_mine = False
+        elif low >= 0 and (low >= len(frontier) or formula.solve_within(
+                [counts[low]], COUNT_CONFLICTS) is False):
+            # The frontier leaves a mine for every interior cell
+            interior_mine = True
+        return found, interior_mine
+
+    def record_model(self, formula: CdclSolver,
+                     seen: Dict[int, Set[bool]]) -> None:
+        """
+        Note the value every variable takes in the last model, and steer
+        the next search towards the opposite values.
+        """
+        for var, values in seen.items():
+            values.add(formula.model[var])
+            formula.phases[var] = not formula.model[var]
+
+    def find_interior_cells(self, frontier: Set[int]) -> List[int]:
+        """
+        Find the hidden cells that no revealed number touches.
+        frontier (set): Flat indices of the frontier cells
+        Returns list - flat indices of the interior cells
+        """
+        board: Board = self.get_board()
+        return [index for index in range(board.geometry.cell_count)
+                if not board.get_state_at(index) & (CLICKED | FLAGGED)
+                and index not in frontier]
@@ -55,13 +55,13 @@ class Solver:
     def open_unflagged(self, neighbors: List[Space]) -> None:
         """ Open unflagged tiles in the given spaces.
         neighbors (list): List of neighboring spaces """
-        for piece in neighbors:
-            if not piece.get_flagged():
-                self.board.handle_click(piece, False)
+        self.board.reveal_many([self.board.geometry.position_of(
+            piece.get_index()) for piece in neighbors
+            if not piece.get_flagged()])
 
     # MAKE SURE THIS LOGIC CHANGES FLAG COUNT!
     def flag_all(self, neighbors: List[Space]) -> None:
         """ Flag all unflagged tiles in given neighbors. """
-        for piece in neighbors:
-            if not piece.get_flagged():
-                self.board.handle_click(piece, True)
+        self.board.flag_many([self.board.geometry.position_of(
+            piece.get_index()) for piece in neighbors
+            if not piece.get_flagged()])
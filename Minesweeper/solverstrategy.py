@@ -5,3 +5,6 @@ class SolverStrategy(ABC):
     @abstractmethod
     def solve(self) -> None:
         pass
+
+    def close(self) -> None:
+        """ Stop following the board's changes (nothing to stop here). """
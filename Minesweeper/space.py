@@ -1,52 +1,162 @@
-from typing import List
+from typing import List, NamedTuple, Optional, TYPE_CHECKING
+if TYPE_CHECKING:  # pragma: no cover
+    from board import Board
+
+# Bit flags of a cell's state, as boards and snapshots store it
+MINE: int = 1
+CLICKED: int = 2
+FLAGGED: int = 4
+STATE_BITS: int = MINE | CLICKED | FLAGGED
+AROUND_SHIFT: int = 3  # Mines around are stored above the state bits
+
+
+class SpaceRow(NamedTuple):
+    """ Where a row of spaces sits; one instance is shared by the row. """
+    board: "Board"
+    offset: int  # Flat index of the row's first space
 
 
 class Space:
     # States: Has bomb, clicked, flagged
-    def __init__(self, has_bomb: bool) -> None:
+    # Everything about a space is packed into one small int (_state), and
+    # the board, row and column objects are shared with other spaces, so a
+    # space costs one small object and nothing else.
+    __slots__ = ('_state', '_row', '_col', '_neighbors')
+
+    def __init__(self, has_bomb: bool, row: Optional[SpaceRow] = None,
+                 col: int = 0) -> None:
         """
         Initialize a space on the game board.
         has_bomb (bool): Does the space contain a mine?
+        row (SpaceRow): Row of the board the space belongs to, if any
+        col (int): Column of the space in its row
         """
-        self.has_bomb: bool = has_bomb
-        self.around: int = 0  # Num of mines around this space
-        self.clicked: bool = False  # Space been clicked?
-        self.flagged: bool = False  # Space been flagged?
-        self.neighbors: List["Space"] = []  # List of neighboring spaces
+        self._state: int = MINE if has_bomb else 0
+        self._row: Optional[SpaceRow] = row
+        self._col: int = col
+        # Neighbors stored with set_neighbors(); spaces on a board ask the
+        # board instead
+        self._neighbors: Optional[List["Space"]] = None
 
     def __str__(self) -> str:
         """ Return a string representation of the Space. """
-        return str(self.has_bomb)
+        return str(self.get_has_bomb())
+
+    @property
+    def has_bomb(self) -> bool:
+        return self.get_has_bomb()
+
+    @has_bomb.setter
+    def has_bomb(self, value: bool) -> None:
+        self.set_state_bit(MINE, value)
+
+    @property
+    def clicked(self) -> bool:
+        return self.get_clicked()
+
+    @clicked.setter
+    def clicked(self, value: bool) -> None:
+        self.set_state_bit(CLICKED, value)
+
+    @property
+    def flagged(self) -> bool:
+        return self.get_flagged()
+
+    @flagged.setter
+    def flagged(self, value: bool) -> None:
+        self.set_state_bit(FLAGGED, value)
+
+    @property
+    def around(self) -> int:
+        return self.get_num_around()
+
+    @around.setter
+    def around(self, value: int) -> None:
+        self._state = (self._state & STATE_BITS) | value << AROUND_SHIFT
+
+    @property
+    def neighbors(self) -> List["Space"]:
+        return self.get_neighbors()
+
+    @neighbors.setter
+    def neighbors(self, value: List["Space"]) -> None:
+        self.set_neighbors(value)
 
     def get_num_around(self) -> int:
         """ Getter for num_around. """
-        return self.around
+        return self._state >> AROUND_SHIFT
 
     def get_has_bomb(self) -> bool:
         """ Getter for has_bomb. """
-        return self.has_bomb
+        return self._state & MINE != 0
 
     def get_clicked(self) -> bool:
         """ Getter for get_clicked. """
-        return self.clicked
+        return self._state & CLICKED != 0
 
     def get_flagged(self) -> bool:
         """ Getter for get_flagged. """
-        return self.flagged
+        return self._state & FLAGGED != 0
+
+    def get_index(self) -> int:
+        """ Getter for the flat (row-major) index on the owning board. """
+        if self._row is None:
+            return self._col
+        return self._row.offset + self._col
+
+    def get_board(self) -> Optional["Board"]:
+        """ Getter for the board the space belongs to, if any. """
+        return self._row.board if self._row is not None else None
+
+    def get_state(self) -> int:
+        """ Getter for the packed MINE/CLICKED/FLAGGED state bits. """
+        return self._state & STATE_BITS
+
+    def write_state(self, state: int) -> None:
+        """ Store new state bits, keeping the mines around. """
+        self._state = (self._state & ~STATE_BITS) | state
+
+    def change_state(self, state: int) -> None:
+        """
+        Set the state bits and report the change to the board.
+        state (int): New MINE/CLICKED/FLAGGED bits
+        """
+        old_state: int = self.get_state()
+        if state == old_state:
+            return
+        self.write_state(state)
+        board: Optional["Board"] = self.get_board()
+        if board is not None:
+            board.space_changed(self, old_state)
+
+    def set_state_bit(self, bit: int, value: bool) -> None:
+        """ Set or clear one state bit. """
+        state: int = self.get_state()
+        self.change_state(state | bit if value else state & ~bit)
+
+    def reset(self, has_bomb: bool, around: int) -> None:
+        """
+        Put the space back to unrevealed with a new mine layout.
+        The board recounts after a reset, so nothing is reported.
+        has_bomb (bool): Does the space contain a mine?
+        around (int): Number of mines around the space
+        """
+        self._state = (MINE if has_bomb else 0) | around << AROUND_SHIFT
 
     def toggle_flag(self) -> None:
         """ Tottle the flagged state of the space. """
-        if not self.clicked:
-            self.flagged = not self.flagged
+        state: int = self.get_state()
+        if not state & CLICKED:
+            self.change_state(state ^ FLAGGED)
 
     def handle_click(self) -> None:
         """ Setter for clicked. """
-        self.clicked = True
+        self.change_state(self.get_state() | CLICKED)
 
     def set_num_around(self) -> None:
         """ Setter for num_around. """
         num: int = 0
-        for neighbor in self.neighbors:
+        for neighbor in self.get_neighbors():
             if neighbor.get_has_bomb():
                 num += 1
                 # print("Neighbor with Mine found")
@@ -55,8 +165,17 @@ class Space:
 
     def set_neighbors(self, neighbors: List["Space"]) -> None:
         """ Setter for neighbors. """
-        self.neighbors = neighbors
+        self._neighbors = neighbors
 
     def get_neighbors(self) -> List["Space"]:
-        """ Getter for neighbors. """
-        return self.neighbors
+        """
+        Getter for neighbors.
+        Spaces on a board get their neighbors from the board on demand
+        unless a list was stored with set_neighbors().
+        """
+        if self._neighbors:
+            return self._neighbors
+        board: Optional["Board"] = self.get_board()
+        if board is None:
+            return []
+        return board.get_neighbors(self.get_index())
@@ -1,6 +1,622 @@
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from board import Board
 from solverstrategy import SolverStrategy
+from space import CLICKED, FLAGGED
+
+# One revealed number seen as a constraint: the flat indices of the hidden
+# cells around it and how many of them hold a mine
+Constraint = Tuple[Tuple[int, ...], int]
+# Mines still needed by each active constraint, while counting assignments
+Needs = Tuple[int, ...]
+# Mines used -> number of assignments
+Tally = Dict[int, int]
+
+
+class ComponentSolutions(NamedTuple):
+    """
+    Every mine assignment of one frontier component that satisfies its
+    constraints, tallied by the number of mines the assignment uses.
+    cells (list): Flat indices of the component's frontier cells
+    counts (dict): Mines used -> number of assignments using that many
+    hits (dict): Mines used -> for each cell (in cells order), the number
+    of those assignments that put a mine on it
+    """
+    cells: List[int]
+    counts: Dict[int, int]
+    hits: Dict[int, List[int]]
 
 
 class TankSolver(SolverStrategy):
+    """
+    Frontier backtracking ("tank") solver.
+    Every revealed number is a constraint on the hidden cells around it.
+    The frontier (hidden cells next to a number) is split into independent
+    components, every component's consistent mine assignments are
+    enumerated by a backtracking search that propagates forced cells, and
+    the assignments are combined with the number of mines left. A cell
+    that is safe (or mined) in every consistent assignment is certain.
+    Large components are counted by dynamic programming instead, since
+    a loosely constrained frontier can have far too many assignments to
+    visit one by one.
+    Counting can be given a deadline (on the time.monotonic() clock, which
+    worker processes share), past which it stops with a TimeoutError.
+    """
+    # Components with more cells are counted, not enumerated
+    ENUMERATE_LIMIT: int = 24
+    # Components with at least this many cells are solved in worker
+    # processes when there are two or more of them; smaller ones cost less
+    # to solve than to send
+    PARALLEL_CELLS: int = 40
+    # Search branches enumerate_component() takes between deadline checks
+    CHECK_BRANCHES: int = 4096
+
+    def __init__(self, board: Optional[Board] = None,
+                 workers: Optional[int] = None) -> None:
+        """
+        Initialize the Tank Solver.
+        board (Board): The gameboard (can be set later)
+        workers (int): Worker processes for large components (1 solves
+        everything in this process); one per core if None
+        """
+        self.board: Optional[Board] = board
+        self.workers: int = workers if workers is not None \
+            else os.cpu_count() or 1
+        self.safe_squares_to_probe: List[Tuple[int, int]] = []
+        self.mines_identified: List[Tuple[int, int]] = []
+        self.flags_placed: int = 0
+        # time.monotonic() time past which counting gives up, None for none
+        self.deadline: Optional[float] = None
+
+    def get_board(self) -> Board:
+        """
+        Getter for the board being solved.
+        Raises ValueError if no board is set
+        """
+        if self.board is None:
+            raise ValueError("No board set for the tank solver")
+        return self.board
+
     def solve(self) -> None:
-        pass
+        """ Solve the board using the Tank Solver strategy. """
+        print("Solving with TankSolver")
+        board: Board = self.get_board()
+        while not board.get_lost() and not board.get_won():
+            if not self.find_findings():
+                print("No more certain moves to make. The solver is either "
+                      + "stuck or the puzzle is solved.")
+                break
+            self.act_on_findings()
+
+    def act_on_findings(self) -> None:
+        """ Flag the mines and reveal the safe squares that were found. """
+        board: Board = self.get_board()
+        self.flags_placed += len(board.flag_many(self.mines_identified))
+        board.reveal_many(self.safe_squares_to_probe)
+        self.safe_squares_to_probe.clear()
+        self.mines_identified.clear()
+
+    def find_findings(self) -> bool:
+        """
+        Queue every certain cell in safe_squares_to_probe and
+        mines_identified.
+        Returns bool - True if anything was found, False otherwise
+        """
+        board: Board = self.get_board()
+        safe, mines = self.find_certain()
+        self.safe_squares_to_probe.extend(
+            board.geometry.position_of(index) for index in safe)
+        self.mines_identified.extend(
+            board.geometry.position_of(index) for index in mines)
+        return bool(safe or mines)
+
+    def find_certain(self) -> Tuple[List[int], List[int]]:
+        """
+        Work out the cells that are certain in the current position.
+        Returns tuple - (flat indices of safe cells, flat indices of mines);
+        both are empty if the position is inconsistent
+        """
+        board: Board = self.get_board()
+        constraints: List[Constraint] = self.find_constraints()
+        solved: List[ComponentSolutions] = self.solve_components(
+            self.split_components(constraints))
+        frontier: int = sum(len(component.cells) for component in solved)
+        hidden: int = sum(
+            1 for index in range(board.geometry.cell_count)
+            if not board.get_state_at(index) & (CLICKED | FLAGGED))
+        interior: int = hidden - frontier
+        mines_left: int = board.get_total_mine_count() - board.count_flags()
+        feasible: Optional[List[Set[int]]] = self.feasible_mine_counts(
+            solved, interior, mines_left)
+        if feasible is None:
+            return [], []
+
+        safe: List[int] = []
+        mines: List[int] = []
+        for component, counts in zip(solved, feasible):
+            total: int = sum(component.counts[count] for count in counts)
+            for slot, cell in enumerate(component.cells):
+                hits: int = sum(component.hits[count][slot]
+                                for count in counts)
+                if hits == 0:
+                    safe.append(cell)
+                elif hits == total:
+                    mines.append(cell)
+
+        # The cells off the frontier share whatever mines are left over
+        if interior > 0:
+            totals: Set[int] = self.total_mine_counts(feasible, interior,
+                                                      mines_left)
+            if min(totals) == mines_left or max(totals) == mines_left \
+                    - interior:
+                interior_cells: List[int] = self.find_interior(solved)
+                if min(totals) == mines_left:
+                    safe.extend(interior_cells)
+                else:
+                    mines.extend(interior_cells)
+        return sorted(safe), sorted(mines)
+
+    def find_constraints(self) -> List[Constraint]:
+        """
+        Turn every revealed number next to a hidden cell into a constraint.
+        A number whose flags do not match it and that has no hidden cell
+        left is kept as a constraint no assignment can satisfy.
+        Returns list - (hidden neighbors, mines among them) per number
+        """
+        board: Board = self.get_board()
+        constraints: List[Constraint] = []
+        for index in range(board.geometry.cell_count):
+            if not board.get_state_at(index) & CLICKED:
+                continue
+            hidden: List[int] = []
+            flags: int = 0
+            for neighbor in board.geometry.neighbors(index):
+                state: int = board.get_state_at(neighbor)
+                if state & FLAGGED:
+                    flags += 1
+                elif not state & CLICKED:
+                    hidden.append(neighbor)
+            need: int = board.get_around_at(index) - flags
+            if hidden or need != 0:
+                constraints.append((tuple(hidden), need))
+        return constraints
+
+    def find_interior(self, solved: List[ComponentSolutions]) -> List[int]:
+        """
+        Find the hidden cells that no revealed number touches.
+        solved (list): The frontier components
+        Returns list - flat indices of the interior cells
+        """
+        board: Board = self.get_board()
+        frontier: Set[int] = {cell for component in solved
+                              for cell in component.cells}
+        return [index for index in range(board.geometry.cell_count)
+                if not board.get_state_at(index) & (CLICKED | FLAGGED)
+                and index not in frontier]
+
+    def split_components(self, constraints: List[Constraint]
+                         ) -> List[List[Constraint]]:
+        """
+        Split constraints into groups that share no cells, so each group
+        can be solved on its own.
+        constraints (list): Constraints to split
+        Returns list - the constraints of each component
+        """
+        parent: Dict[int, int] = {}
+
+        def find(cell: int) -> int:
+            root: int = cell
+            while parent[root] != root:
+                root = parent[root]
+            while parent[cell] != root:
+                parent[cell], cell = root, parent[cell]
+            return root
+
+        for cells, _ in constraints:
+            for cell in cells:
+                parent.setdefault(cell, cell)
+            for cell in cells[1:]:
+                parent[find(cell)] = find(cells[0])
+
+        components: Dict[int, List[Constraint]] = {}
+        for slot, constraint in enumerate(constraints):
+            # A number with no hidden cells left stands alone (negative keys
+            # cannot clash with cells)
+            key: int = find(constraint[0][0]) if constraint[0] else -1 - slot
+            components.setdefault(key, []).append(constraint)
+        return list(components.values())
+
+    def order_cells(self, constraints: List[Constraint]) -> List[int]:
+        """
+        Order the cells of a component so each next cell shares as many
+        constraints as possible with the cells before it. Constraints then
+        fill up (and prune) early in the search.
+        constraints (list): Constraints of one component
+        Returns list - flat indices of the component's cells
+        """
+        touching: Dict[int, List[int]] = {}
+        for slot, (cells, _) in enumerate(constraints):
+            for cell in cells:
+                touching.setdefault(cell, []).append(slot)
+        ordered: List[int] = []
+        # Number of already placed cells in each constraint
+        filled: List[int] = [0] * len(constraints)
+        remaining: Set[int] = set(touching)
+        while remaining:
+            chosen: int = max(remaining, key=lambda candidate: (
+                sum(filled[slot] for slot in touching[candidate]),
+                -candidate))
+            remaining.discard(chosen)
+            ordered.append(chosen)
+            for slot in touching[chosen]:
+                filled[slot] += 1
+        return ordered
+
+    def check_deadline(self) -> None:
+        """
+        Stop counting if the deadline has passed.
+        Raises TimeoutError past the deadline
+        """
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise TimeoutError("Counting ran past its deadline")
+
+    def enumerate_component(self, constraints: List[Constraint]
+                            ) -> ComponentSolutions:
+        """
+        Enumerate the mine assignments that satisfy a component.
+        constraints (list): Constraints of one component
+        Returns ComponentSolutions - the tallied assignments (counts is
+        empty if there are none)
+        Raises TimeoutError past the deadline
+        """
+        cells: List[int] = self.order_cells(constraints)
+        slot_of: Dict[int, int] = {cell: slot for slot, cell
+                                   in enumerate(cells)}
+        size: int = len(cells)
+        members: List[List[int]] = [[slot_of[cell] for cell in group]
+                                    for group, _ in constraints]
+        need: List[int] = [mines for _, mines in constraints]
+        free: List[int] = [len(group) for group in members]
+        touching: List[List[int]] = [[] for _ in range(size)]
+        for slot, group in enumerate(members):
+            for member in group:
+                touching[member].append(slot)
+        value: List[int] = [-1] * size
+        trail: List[int] = []
+        counts: Dict[int, int] = {}
+        hits: Dict[int, List[int]] = {}
+
+        def assign(cell: int, mine: int) -> bool:
+            value[cell] = mine
+            trail.append(cell)
+            consistent: bool = True
+            for slot in touching[cell]:
+                free[slot] -= 1
+                need[slot] -= mine
+                if need[slot] < 0 or need[slot] > free[slot]:
+                    consistent = False
+            return consistent
+
+        def undo(mark: int) -> None:
+            while len(trail) > mark:
+                cell: int = trail.pop()
+                mine: int = value[cell]
+                value[cell] = -1
+                for slot in touching[cell]:
+                    free[slot] += 1
+                    need[slot] += mine
+
+        def propagate(pending: List[int]) -> bool:
+            # A constraint with no mines left to place clears its other
+            # cells; one with as many mines as free cells fills them
+            while pending:
+                slot: int = pending.pop()
+                if free[slot] == 0 or 0 < need[slot] < free[slot]:
+                    continue
+                mine: int = 1 if need[slot] else 0
+                for member in members[slot]:
+                    if value[member] < 0:
+                        if not assign(member, mine):
+                            return False
+                        pending.extend(touching[member])
+            return True
+
+        def next_open(position: int) -> int:
+            while position < size and value[position] >= 0:
+                position += 1
+            return position
+
+        def record() -> None:
+            mines: int = sum(value)
+            counts[mines] = counts.get(mines, 0) + 1
+            row: Optional[List[int]] = hits.get(mines)
+            if row is None:
+                hits[mines] = list(value)
+            else:
+                for slot, mine in enumerate(value):
+                    row[slot] += mine
+
+        if all(0 <= need[slot] <= free[slot] for slot in range(len(need))) \
+                and propagate(list(range(len(members)))):
+            start: int = next_open(0)
+            if start == size:
+                record()
+            else:
+                # Depth-first search without recursion, so large frontiers
+                # do not hit the recursion limit:
+                # (cell, trail length before it, value to try)
+                branches: List[Tuple[int, int, int]] = [
+                    (start, len(trail), 0)]
+                taken: int = 0
+                while branches:
+                    taken += 1
+                    if taken % self.CHECK_BRANCHES == 0:
+                        self.check_deadline()
+                    cell, mark, mine = branches.pop()
+                    undo(mark)
+                    if mine == 0:
+                        branches.append((cell, mark, 1))
+                    if not assign(cell, mine) \
+                            or not propagate(list(touching[cell])):
+                        continue
+                    following: int = next_open(cell + 1)
+                    if following == size:
+                        record()
+                    else:
+                        branches.append((following, len(trail), 0))
+        return ComponentSolutions(cells, counts, hits)
+
+    def solve_component(self, constraints: List[Constraint]
+                        ) -> ComponentSolutions:
+        """
+        Tally the mine assignments of a component, enumerating small ones
+        and counting large ones without visiting every assignment.
+        constraints (list): Constraints of one component
+        Raises TimeoutError past the deadline
+        """
+        cells: Set[int] = {cell for group, _ in constraints for cell in group}
+        if len(cells) <= self.ENUMERATE_LIMIT:
+            return self.enumerate_component(constraints)
+        return self.count_component(constraints)
+
+    def solve_components(self, components: List[List[Constraint]]
+                         ) -> List[ComponentSolutions]:
+        """
+        Solve every component, the large ones in worker processes (while
+        this process solves the rest) if there are two or more of them.
+        components (list): Constraints of each component
+        Returns list - the tallied assignments of each component, in order
+        Raises TimeoutError past the deadline
+        """
+        large: List[int] = [
+            slot for slot, component in enumerate(components)
+            if len({cell for cells, _ in component for cell in cells})
+            >= self.PARALLEL_CELLS]
+        if len(large) < 2 or self.workers < 2:
+            return [self.solve_component(component)
+                    for component in components]
+        pool: ProcessPoolExecutor = get_pool(self.workers)
+        futures: Dict[int, Tuple[List[int], Future[ComponentSolutions]]] = {}
+        for slot in large:
+            cells, compact = compact_component(components[slot])
+            futures[slot] = cells, pool.submit(solve_compact, compact,
+                                               self.deadline)
+        solved: List[Optional[ComponentSolutions]] = [
+            None if slot in futures else self.solve_component(component)
+            for slot, component in enumerate(components)]
+        for slot, (cells, future) in futures.items():
+            result: ComponentSolutions = future.result()
+            solved[slot] = result._replace(
+                cells=[cells[cell] for cell in result.cells])
+        return [component for component in solved if component is not None]
+
+    def count_component(self, constraints: List[Constraint]
+                        ) -> ComponentSolutions:
+        """
+        Tally the mine assignments of a component by dynamic programming
+        over its cells in order_cells() order. Only the constraints that
+        have some cells decided and some not ("active" ones) matter for
+        what can follow, so the assignments of the first cells are merged
+        by the mines their active constraints still need. A forward pass
+        counts the ways to reach each such state, a backward pass the ways
+        to finish from it, and their products give the per-cell hits.
+        constraints (list): Constraints of one component
+        Returns ComponentSolutions - the same tallies enumerate_component()
+        gives
+        Raises TimeoutError past the deadline
+        """
+        cells: List[int] = self.order_cells(constraints)
+        size: int = len(cells)
+        slot_of: Dict[int, int] = {cell: slot for slot, cell
+                                   in enumerate(cells)}
+        if any(not 0 <= need <= len(group) for group, need in constraints):
+            return ComponentSolutions(cells, {}, {})
+        members: List[List[int]] = [sorted(slot_of[cell] for cell in group)
+                                    for group, _ in constraints]
+        touching: List[List[int]] = [[] for _ in range(size)]
+        opening: List[List[int]] = [[] for _ in range(size)]
+        for slot, group in enumerate(members):
+            for member in group:
+                touching[member].append(slot)
+            opening[group[0]].append(slot)
+        # Active constraints at each cell, in the order their needs are
+        # stored in a state
+        active: List[List[int]] = []
+        current: List[int] = []
+        for position in range(size):
+            current = [slot for slot in current
+                       if members[slot][-1] >= position] + opening[position]
+            active.append(current)
+        # Cells of each constraint decided after each of its cells
+        left: Dict[Tuple[int, int], int] = {
+            (slot, member): len(group) - rank - 1
+            for slot, group in enumerate(members)
+            for rank, member in enumerate(group)}
+
+        # steps[position][state] -> (mine, next state) moves
+        steps: List[Dict[Needs, List[Tuple[int, Needs]]]] = []
+        start: Needs = tuple(constraints[slot][1] for slot in active[0]) \
+            if size else ()
+        forward: List[Dict[Needs, Tally]] = [{start: {0: 1}}]
+        for position in range(size):
+            self.check_deadline()
+            following: List[int] = active[position + 1] \
+                if position + 1 < size else []
+            moves: Dict[Needs, List[Tuple[int, Needs]]] = {}
+            reached: Dict[Needs, Tally] = {}
+            for state, tally in forward[position].items():
+                moves[state] = []
+                for mine in (0, 1):
+                    needs: Dict[int, int] = dict(zip(active[position],
+                                                     state))
+                    fits: bool = True
+                    for slot in touching[position]:
+                        needs[slot] -= mine
+                        if not 0 <= needs[slot] <= left[(slot, position)]:
+                            fits = False
+                    if not fits:
+                        continue
+                    for slot in opening[position + 1] \
+                            if position + 1 < size else []:
+                        needs[slot] = constraints[slot][1]
+                    after: Needs = tuple(needs[slot] for slot in following)
+                    moves[state].append((mine, after))
+                    target: Tally = reached.setdefault(after, {})
+                    for mines, count in tally.items():
+                        target[mines + mine] = target.get(mines + mine, 0) \
+                            + count
+            steps.append(moves)
+            forward.append(reached)
+
+        # backward[position][state]: mines in the remaining cells -> ways
+        backward: List[Dict[Needs, Tally]] = [{} for _ in range(size + 1)]
+        backward[size] = {(): {0: 1}}
+        for position in range(size - 1, -1, -1):
+            self.check_deadline()
+            for state, moves_from in steps[position].items():
+                tally = {}
+                for mine, after in moves_from:
+                    for mines, count in backward[position + 1].get(
+                            after, {}).items():
+                        tally[mines + mine] = tally.get(mines + mine, 0) \
+                            + count
+                if tally:
+                    backward[position][state] = tally
+
+        counts: Tally = dict(backward[0].get(start, {}))
+        hits: Dict[int, List[int]] = {mines: [0] * size for mines in counts}
+        for position in range(size):
+            self.check_deadline()
+            for state, moves_from in steps[position].items():
+                for mine, after in moves_from:
+                    if not mine:
+                        continue
+                    rest: Tally = backward[position + 1].get(after, {})
+                    for before, ways in forward[position][state].items():
+                        for mines, count in rest.items():
+                            hits[before + 1 + mines][position] += \
+                                ways * count
+        return ComponentSolutions(cells, counts, hits)
+
+    def feasible_mine_counts(self, solved: List[ComponentSolutions],
+                             interior: int, mines_left: int
+                             ) -> Optional[List[Set[int]]]:
+        """
+        Work out which mine counts of each component fit the mines left,
+        given the other components and the interior cells.
+        solved (list): The frontier components
+        interior (int): Number of hidden cells off the frontier
+        mines_left (int): Mines not yet flagged
+        Returns list - the usable mine counts of each component, or None if
+        no combination fits
+        """
+        low: int = max(mines_left - interior, 0)
+        # Sums reachable by the components before and after each one
+        before: List[Set[int]] = [{0}]
+        for component in solved:
+            before.append(self.add_counts(before[-1], component.counts,
+                                          mines_left))
+        after: List[Set[int]] = [{0}]
+        for component in reversed(solved):
+            after.append(self.add_counts(after[-1], component.counts,
+                                         mines_left))
+        after.reverse()
+        if not any(low <= total <= mines_left for total in before[-1]):
+            return None
+        feasible: List[Set[int]] = []
+        for slot, component in enumerate(solved):
+            others: Set[int] = self.add_counts(before[slot], dict.fromkeys(
+                after[slot + 1], 1), mines_left)
+            feasible.append({count for count in component.counts
+                             if any(low <= count + other <= mines_left
+                                    for other in others)})
+        return feasible
+
+    def total_mine_counts(self, feasible: List[Set[int]], interior: int,
+                          mines_left: int) -> Set[int]:
+        """
+        Work out the possible numbers of mines on the whole frontier.
+        feasible (list): Usable mine counts of each component
+        interior (int): Number of hidden cells off the frontier
+        mines_left (int): Mines not yet flagged
+        """
+        totals: Set[int] = {0}
+        for counts in feasible:
+            totals = self.add_counts(totals, dict.fromkeys(counts, 1),
+                                     mines_left)
+        return {total for total in totals
+                if mines_left - interior <= total <= mines_left}
+
+    def add_counts(self, totals: Set[int], counts: Dict[int, int],
+                   limit: int) -> Set[int]:
+        """
+        Add every mine count of a component to every running total.
+        totals (set): Running totals
+        counts (dict): Mine counts to add (only the keys are used)
+        limit (int): Largest total worth keeping
+        """
+        return {total + count for total in totals for count in counts
+                if total + count <= limit}
+
+
+def compact_component(constraints: List[Constraint]
+                      ) -> Tuple[List[int], List[Constraint]]:
+    """
+    Number the cells of a component 0, 1, ... in the order of their flat
+    indices, so it travels to a worker as small integers (and is solved
+    in the same cell order).
+    constraints (list): Constraints of one component
+    Returns tuple - (flat index of every local cell, the constraints over
+    local cells)
+    """
+    cells: List[int] = sorted({cell for group, _ in constraints
+                               for cell in group})
+    local: Dict[int, int] = {cell: slot for slot, cell in enumerate(cells)}
+    return cells, [(tuple(local[cell] for cell in group), need)
+                   for group, need in constraints]
+
+
+def solve_compact(constraints: List[Constraint], deadline: Optional[float]
+                  ) -> ComponentSolutions:
+    """
+    Solve a component in a worker process.
+    constraints (list): Constraints of one component over local cells
+    deadline (float): time.monotonic() time to give up at, None for none
+    Returns ComponentSolutions - its tallied assignments, over local cells
+    Raises TimeoutError past the deadline
+    """
+    solver: TankSolver = TankSolver(workers=1)
+    solver.deadline = deadline
+    return solver.solve_component(constraints)
+
+
+@lru_cache(maxsize=None)
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the shared worker pool of a size, starting it on first use.
+    workers (int): Number of worker processes
+    """
+    return ProcessPoolExecutor(max_workers=workers)
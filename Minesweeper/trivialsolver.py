@@ -1,8 +1,11 @@
 import random
 import logging
 from typing import Tuple, Optional, List
+import numpy as np
 from solverstrategy import SolverStrategy
 from board import Board
+from montecarlo import SampledProbabilities
+from probability import MineProbabilities
 
 
 class TrivialSolver(SolverStrategy):
@@ -13,13 +16,18 @@ class TrivialSolver(SolverStrategy):
         """
         self.board: Board = board
         self.flags_placed: int = 0
+        # Mine probabilities, to guess the least risky tile: exact, or
+        # sampled when the frontier is too large to count within a second
+        self.probabilities: MineProbabilities = SampledProbabilities(
+            board, time_budget=1.0)
         self.logger: logging.Logger = logging.getLogger('trivialsolver')
         self.logger.setLevel(logging.INFO)
-        handler: logging.Handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - '
-                                               + '%(levelname)s - %(message)s'
-                                               ))
-        self.logger.addHandler(handler)
+        # The logger is shared by every trivial solver; one handler will do
+        if not self.logger.handlers:
+            handler: logging.Handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+            self.logger.addHandler(handler)
 
     def get_flags_placed(self) -> int:
         """ Return the number of flags placed by the solver (display)"""
@@ -27,7 +35,8 @@ class TrivialSolver(SolverStrategy):
 
     def select_random_tile(self) -> Optional[Tuple[int, int]]:
         """
-        Select a random unrevealed tile from the board.
+        Select a random unrevealed tile from the board, among the tiles
+        least likely to hold a mine.
         Returns tuple or None - Coordinates of the selected tile, or None if
         no unrevealed tiles
         """
@@ -42,7 +51,8 @@ class TrivialSolver(SolverStrategy):
 
         if unrevealed_tiles:
             print(f"UNREVEALED TILES: {len(unrevealed_tiles)}")  # Debugging
-            selected_tile: Tuple[int, int] = random.choice(unrevealed_tiles)
+            selected_tile: Tuple[int, int] = random.choice(
+                self.least_risky(unrevealed_tiles))
             print(f"SELECTED TILE: {selected_tile}")  # Debugging
             return selected_tile
         else:
@@ -52,7 +62,8 @@ class TrivialSolver(SolverStrategy):
     def find_potentially_safe_tile(self, revealed_x: int, revealed_y: int
                                    ) -> Optional[Tuple[int, int]]:
         """
-        Find a potentiall safe tile in the safe neighbors (+1/-1).
+        Find a potentiall safe tile in the safe neighbors (+1/-1), the one
+        least likely to hold a mine.
         revealed_x (int): x-coordinate of revealed tile
         revealed_y (int): y-coordinate of revealed tile
         Returns tuple or None - Coordinates of potentially safe tile or None
@@ -82,14 +93,34 @@ class TrivialSolver(SolverStrategy):
                 if not tile.get_clicked() and not tile.get_flagged():
                     potentially_safe_tiles.append((new_x, new_y))
 
-                # Prioritize selection
-                if potentially_safe_tiles:
-                    # could add additional logic -> just return first one for
-                    # now
-                    return potentially_safe_tiles[0]
-
+        # Prioritize selection
+        if potentially_safe_tiles:
+            return self.least_risky(potentially_safe_tiles)[0]
         return None  # no safe tile found
 
+    def least_risky(self, tiles: List[Tuple[int, int]]
+                    ) -> List[Tuple[int, int]]:
+        """
+        Keep the tiles with the lowest mine probability.
+        tiles (list): Unrevealed tiles to choose from
+        Returns list - the tiles that tie for the lowest probability, in the
+        given order (all of them if the board has no mines yet)
+        """
+        if not tiles or not self.board.initialized:
+            return tiles
+        try:
+            probabilities: np.ndarray = \
+                self.probabilities.get_probabilities()
+        except ValueError:
+            # A wrong flag contradicts the numbers; no tile is known better
+            return tiles
+        risks: List[float] = [
+            float(probabilities[self.board.geometry.index_of(tile)])
+            for tile in tiles]
+        lowest: float = min(risks)
+        return [tile for tile, risk in zip(tiles, risks)
+                if risk <= lowest + 1e-12]
+
     def solve(self) -> None:
         """ Solve the game using the trivial solver strategy. """
         self.logger.info("In TrivialSolver solve()")